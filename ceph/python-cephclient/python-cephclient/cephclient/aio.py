@@ -0,0 +1,256 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import asyncio
+import functools
+import ssl
+import time
+
+import aiohttp
+
+from cephclient import client
+from cephclient import exception
+
+CEPH_CLIENT_POOL_SIZE = 16
+
+LOG = client.LOG
+
+
+class AsyncCephClient(client.CephClient):
+    """asyncio variant of CephClient
+
+    Command methods are those of CephClient: they check their arguments
+    when called and return a coroutine that sends the command, so that
+    independent commands can be awaited together:
+
+        async with AsyncCephClient() as ceph:
+            health, df = await asyncio.gather(ceph.health(), ceph.df())
+
+    Requests share a pool of at most pool_size connections. timeout is
+    the default limit, in seconds, of a request whose command has no
+    timeout. Failed requests are retried like CephClient does; the
+    credentials refresh a failure calls for is made once for all the
+    requests that failed together. A client belongs to the event loop
+    it is first used in.
+    """
+
+    def __init__(self,
+                 username=client.CEPH_MON_RESTFUL_USER,
+                 password=None,
+                 retry_count=client.CEPH_CLIENT_RETRY_COUNT,
+                 retry_timeout=client.CEPH_CLIENT_RETRY_TIMEOUT_SEC,
+                 read_cache=None,
+                 credentials=None,
+                 log_sampling=None,
+                 pool_size=CEPH_CLIENT_POOL_SIZE,
+                 timeout=None):
+        super(AsyncCephClient, self).__init__(
+            username=username,
+            password=password,
+            retry_count=retry_count,
+            retry_timeout=retry_timeout,
+            read_cache=read_cache,
+            credentials=credentials,
+            log_sampling=log_sampling)
+        self.pool_size = pool_size
+        self.timeout = timeout
+        # per request auth and TLS settings, see _refresh_session()
+        self._auth = None
+        self._ssl = None
+        # bumped by each refresh, to tell the requests that failed
+        # before it from those that failed after it
+        self._generation = 0
+        self._lock = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    @staticmethod
+    async def _run(func, *args, **kwargs):
+        """Run blocking work, like the ceph CLI, off the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(func, *args, **kwargs))
+
+    def _refresh_session(self, force_certificate_refresh=False):
+        # the aiohttp session and its connection pool are kept; only
+        # the auth and TLS settings of the next requests change
+        self._auth = aiohttp.BasicAuth(self.username, self.password)
+        if not self.cert_file or force_certificate_refresh:
+            self._get_certificate(refresh=force_certificate_refresh)
+            self._ssl = ssl.create_default_context(
+                cafile=self.cert_file.name)
+        else:
+            self._ssl = False
+        self._generation += 1
+
+    def _connect(self):
+        if not self.password:
+            self._get_password()
+        if not self.service_url:
+            self._get_service_url()
+        if self._auth is None:
+            self._refresh_session()
+
+    def _recover(self, password=False, service_url=False,
+                 certificate=False):
+        if password:
+            self._get_password(refresh=True)
+        if service_url:
+            self._get_service_url(refresh=True)
+        self._refresh_session(force_certificate_refresh=certificate)
+
+    async def _ensure_session(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self.session is None:
+                self.session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=self.pool_size),
+                    timeout=aiohttp.ClientTimeout(total=self.timeout))
+            if self._auth is None or not self.service_url:
+                await self._run(self._connect)
+
+    async def _refresh(self, generation, **kwargs):
+        """Recover from a request failure, unless a request that failed
+        with the same settings already did"""
+        async with self._lock:
+            if generation == self._generation:
+                await self._run(self._recover, **kwargs)
+
+    async def _post_request(self, req_json, timeout):
+        LOG.debug('Request params: url=%s, json=%s',
+                  self.service_url + 'request?wait=1', req_json)
+        if timeout is not None:
+            timeout = aiohttp.ClientTimeout(total=timeout)
+        result = None
+        credit = self.retry_count + 1
+        while credit > 0:
+            credit -= 1
+            generation = self._generation
+            try:
+                started = time.time()
+                async with self.session.post(
+                        self.service_url + 'request?wait=1',
+                        json=req_json,
+                        auth=self._auth,
+                        ssl=self._ssl,
+                        timeout=timeout) as response:
+                    result = await response.json(content_type=None)
+                self._log_result(req_json, result, started)
+                if 'is_finished' in result:
+                    async with self.session.delete(
+                            self.service_url + 'request?id=' + result['id'],
+                            auth=self._auth,
+                            ssl=self._ssl):
+                        pass
+                else:
+                    if 'message' not in result:
+                        raise exception.CephMgrRestfulResponseError(result)
+                    if 'auth: No such user' in result['message']:
+                        raise exception.CephClientNoSuchUser(
+                            user=self.username)
+                    elif 'auth: Incorrect password' in result['message']:
+                        raise exception.CephClientIncorrectPassword(
+                            user=self.username)
+                break
+            except exception.CephClientIncorrectPassword:
+                if not credit:
+                    raise
+                LOG.warning('Incorrect password for user \'{}\'. '
+                            'Fetch user password via list-keys '
+                            'and retry.'.format(self.username))
+                await self._refresh(generation, password=True)
+            except aiohttp.ClientSSLError as e:
+                if not credit:
+                    raise IOError(str(e))
+                if isinstance(e, aiohttp.ClientConnectorCertificateError):
+                    LOG.warning('Request SSL error: %s. '
+                                'Refresh session and retry', e)
+                    await self._refresh(generation)
+                else:
+                    LOG.warning('Request SSL error: %s. '
+                                'Refresh restful service URL and retry', e)
+                    await self._refresh(generation, service_url=True)
+            except (aiohttp.ClientConnectionError,
+                    aiohttp.ClientResponseError,
+                    asyncio.TimeoutError) as e:
+                if not credit:
+                    raise IOError(str(e))
+                LOG.warning(
+                    'Request error: {}. '
+                    'Refresh restful service URL and retry'.format(e))
+                await self._refresh(generation, service_url=True)
+            except (aiohttp.ClientError, IOError) as e:
+                if not credit:
+                    raise
+                LOG.warning(
+                    'Request error: {}. '
+                    'Recovering TLS CA certificate and retrying'.format(e))
+                await self._refresh(generation, certificate=True)
+            if self.retry_timeout > 0:
+                await asyncio.sleep(self.retry_timeout)
+        return result
+
+    def _request(self, prefix, *args, **kwargs):
+        commands = getattr(self._recording, 'commands', None)
+        if commands is not None:
+            commands.append((prefix, kwargs))
+            return client._RECORDED
+        req_json, format, timeout = self._make_request_json(prefix, kwargs)
+        return self._send(prefix, req_json, format, timeout)
+
+    async def _send(self, prefix, req_json, format, timeout):
+        if self.read_cache is not None:
+            cached = self.read_cache.lookup(req_json)
+            if cached is not None:
+                return cached
+        return await self._fetch(prefix, req_json, format, timeout)
+
+    async def _fetch(self, prefix, req_json, format, timeout):
+        await self._ensure_session()
+        result = await self._post_request(req_json, timeout)
+        result = self._make_result(prefix, format, result)
+        if self.read_cache is not None:
+            self.read_cache.update(req_json, result)
+        return result
+
+    async def execute_many(self, commands):
+        """Run several read-only commands with a single mgr restful request.
+
+        See CephClient.execute_many(). Read-only commands that can't be
+        part of a batch are sent concurrently; other commands are sent
+        one at a time, in list order.
+        """
+        entries = [client._batch_entry(entry) for entry in commands]
+        results = [None] * len(entries)
+        for step in self._plan_batch(entries):
+            if isinstance(step, list):
+                await self._run_batch(step, results)
+            else:
+                name, args, kwargs = entries[step]
+                results[step] = await getattr(self, name)(*args, **kwargs)
+        return results
+
+    async def _run_batch(self, batch, results):
+        batch = self._batch_pending(batch, results)
+        if len(batch) > 1:
+            await self._ensure_session()
+            result = await self._post_request(*self._batch_request(batch))
+            self._split_batch_result(batch, result, results)
+        # a single command, or those of a batch the mgr did not run
+        pending = [item for item in batch if results[item[0]] is None]
+        done = await asyncio.gather(*[self._fetch(*item[1:])
+                                      for item in pending])
+        for item, result in zip(pending, done):
+            results[item[0]] = result
@@ -0,0 +1,172 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import copy
+import json
+import threading
+import time
+
+import requests
+
+
+# Read-only commands answered from the cache, and for how many seconds
+DEFAULT_TTLS = {
+    'df': 2,
+    'fs ls': 5,
+    'fsid': 60,
+    'health': 1,
+    'mds stat': 2,
+    'mgr dump': 5,
+    'mon dump': 5,
+    'mon_status': 2,
+    'osd crush rule dump': 5,
+    'osd crush rule ls': 5,
+    'osd crush tree': 5,
+    'osd df': 2,
+    'osd dump': 2,
+    'osd ls': 2,
+    'osd pool application get': 5,
+    'osd pool get': 5,
+    'osd pool ls': 5,
+    'osd pool stats': 1,
+    'osd stat': 1,
+    'osd tree': 2,
+    'pg stat': 1,
+    'quorum_status': 2,
+    'status': 1,
+    'version': 60,
+    'versions': 60,
+}
+
+# Commands that don't change the cluster. Any other command empties
+# the cache. Only those that also have a TTL are cached: safety checks
+# like 'osd ok-to-stop' and the auth and config-key secrets never are.
+READ_ONLY_PREFIXES = frozenset([
+    'auth export', 'auth get', 'auth get-key', 'auth list', 'auth ls',
+    'auth print-key', 'config dump', 'config get', 'config help',
+    'config log', 'config show', 'config show-with-defaults',
+    'config-key dump', 'config-key exists', 'config-key get',
+    'config-key list', 'config-key ls', 'df', 'features', 'fs dump',
+    'fs get', 'fs ls', 'fsid', 'health', 'log last', 'mds compat show',
+    'mds count-metadata', 'mds dump', 'mds getmap', 'mds metadata',
+    'mds stat', 'mds versions', 'mgr count-metadata', 'mgr dump',
+    'mgr metadata', 'mgr module ls', 'mgr services', 'mgr versions',
+    'mon count-metadata', 'mon dump', 'mon feature ls', 'mon getmap',
+    'mon metadata', 'mon stat', 'mon versions', 'mon_status', 'node ls',
+    'osd blacklist ls', 'osd blocked-by', 'osd count-metadata',
+    'osd crush class ls', 'osd crush class ls-osd', 'osd crush dump',
+    'osd crush get-tunable', 'osd crush ls', 'osd crush rule dump',
+    'osd crush rule list', 'osd crush rule ls', 'osd crush rule ls-by-class',
+    'osd crush show-tunables', 'osd crush tree', 'osd crush weight-set dump',
+    'osd crush weight-set ls', 'osd df', 'osd dump',
+    'osd erasure-code-profile get', 'osd erasure-code-profile ls',
+    'osd find', 'osd getcrushmap', 'osd getmap', 'osd getmaxosd',
+    'osd last-stat-seq', 'osd ls', 'osd ls-tree', 'osd lspools', 'osd map',
+    'osd metadata', 'osd ok-to-stop', 'osd perf', 'osd pool application get',
+    'osd pool get', 'osd pool ls', 'osd pool stats', 'osd safe-to-destroy',
+    'osd stat', 'osd test-reweight-by-pg', 'osd test-reweight-by-utilization',
+    'osd tree', 'osd tree-from', 'osd utilization', 'osd versions',
+    'pg dump', 'pg dump_json', 'pg dump_pools_json', 'pg dump_stuck',
+    'pg getmap', 'pg ls', 'pg ls-by-osd', 'pg ls-by-pool',
+    'pg ls-by-primary', 'pg map', 'pg stat', 'quorum_status', 'report',
+    'service dump', 'service status', 'status', 'time-sync-status',
+    'version', 'versions',
+])
+
+_now = getattr(time, 'monotonic', time.time)
+
+
+class ResponseCache(object):
+    """Time limited cache of read-only command responses
+
+    Responses are keyed by command prefix, arguments and format and
+    kept for the TTL of their prefix. Commands that are not read-only
+    empty the cache. Only successful responses are cached; callers
+    get their own copy of the response and its body.
+    """
+
+    def __init__(self, ttls=None):
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            for prefix in ttls:
+                if prefix not in READ_ONLY_PREFIXES:
+                    raise ValueError(
+                        "Command '{}' is not read-only".format(prefix))
+            self.ttls.update(ttls)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # key -> (expires, status_code, reason, body)
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(req_json):
+        args = dict((arg, val) for arg, val in req_json.items()
+                    if arg not in ('prefix', 'format'))
+        return (req_json['prefix'],
+                json.dumps(args, sort_keys=True),
+                req_json['format'])
+
+    def lookup(self, req_json):
+        """Return the cached (response, body) of a request, or None
+
+        A request that is not read-only empties the cache.
+        """
+        prefix = req_json['prefix']
+        if prefix not in READ_ONLY_PREFIXES:
+            self.invalidate()
+            return None
+        if not self.ttls.get(prefix):
+            return None
+        key = self._key(req_json)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= _now():
+                self.misses += 1
+                return None
+            self.hits += 1
+        response = requests.Response()
+        response.status_code = entry[1]
+        response.reason = entry[2]
+        return response, copy.deepcopy(entry[3])
+
+    def update(self, req_json, result):
+        """Cache the (response, body) result of a request
+
+        A request that is not read-only empties the cache instead.
+        """
+        prefix = req_json['prefix']
+        if prefix not in READ_ONLY_PREFIXES:
+            self.invalidate()
+            return
+        ttl = self.ttls.get(prefix)
+        response, body = result
+        if not ttl or response.status_code != requests.codes.ok:
+            return
+        now = _now()
+        with self._lock:
+            for key in [key for key, entry in self._entries.items()
+                        if entry[0] <= now]:
+                del self._entries[key]
+            self._entries[self._key(req_json)] = (
+                now + ttl, response.status_code, response.reason,
+                copy.deepcopy(body))
+
+    def invalidate(self):
+        """Drop all cached responses"""
+        with self._lock:
+            if self._entries:
+                self._entries = {}
+                self.invalidations += 1
+
+    def stats(self):
+        """Return the cache hit, miss and invalidation counters"""
+        with self._lock:
+            return dict(hits=self.hits,
+                        misses=self.misses,
+                        invalidations=self.invalidations,
+                        entries=len(self._entries))
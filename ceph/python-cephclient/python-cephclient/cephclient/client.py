@@ -10,34 +10,93 @@ import json
 import logging
 import os
 import re
-import subprocess
 import tempfile
+import threading
 import time
 
 import requests
 import six
 
+from cephclient import credentials as ceph_credentials
 from cephclient import exception
+from cephclient.cache import READ_ONLY_PREFIXES
+from cephclient.cache import ResponseCache
 
 
 CEPH_MON_RESTFUL_USER = 'admin'
-CEPH_MON_RESTFUL_SERVICE = 'restful'
 CEPH_CLIENT_RETRY_COUNT = 2
-CEPH_GET_SERVICE_RETRY_COUNT = 15
 CEPH_CLIENT_RETRY_TIMEOUT_SEC = 5
-CEPH_CLI_TIMEOUT_SEC = 15
 API_SUPPORTED_RESPONSE_FORMATS = [
     'text', 'json', 'xml', 'binary'
 ]
 
+# Requests are logged at INFO as a one line summary, and with their
+# full parameters and results at DEBUG
 LOG = logging.getLogger('ceph_client')
-LOG.setLevel(logging.DEBUG)
+LOG.setLevel(logging.INFO)
 ch = logging.StreamHandler()
 ch.setLevel(logging.DEBUG)
 ch.setFormatter(logging.Formatter(
     '%(asctime)s %(levelname)s %(name)s %(message)s'))
 LOG.addHandler(ch)
 
+# Returned by _request() while execute_many() records the commands of
+# the methods it calls instead of sending them
+_RECORDED = object()
+
+
+def _batch_entry(entry):
+    """Normalize an execute_many() entry to (name, args, kwargs)
+
+    An entry is a method name or a (name,), (name, kwargs),
+    (name, args) or (name, args, kwargs) tuple.
+    """
+    if isinstance(entry, six.string_types):
+        return entry, (), {}
+    entry = tuple(entry)
+    name, args, kwargs = entry[0], (), {}
+    if len(entry) == 2 and isinstance(entry[1], dict):
+        kwargs = entry[1]
+    elif len(entry) >= 2:
+        args = tuple(entry[1])
+        if len(entry) == 3:
+            kwargs = entry[2]
+    if len(entry) > 3 or not isinstance(name, six.string_types):
+        raise exception.CephClientTypeError(
+            name='commands',
+            actual=entry,
+            expected='method name or (name, args, kwargs) tuple')
+    return name, args, dict(kwargs)
+
+
+def _summarize_result(req_json, result):
+    """Return the (prefix, status, size) summary of a request result
+
+    size is the length of the command output, which is counted rather
+    than formatted.
+    """
+    if isinstance(req_json, list):
+        prefix = ', '.join(command['prefix'] for command in req_json[0])
+    else:
+        prefix = req_json['prefix']
+    if 'is_finished' not in result:
+        return prefix, 'error', 0
+    size = 0
+    for key in ('finished', 'failed'):
+        for entry in result.get(key) or []:
+            if isinstance(entry, dict):
+                size += len(entry.get('outb') or '')
+    return prefix, 'failed' if result.get('has_failed') else 'ok', size
+
+
+def _humanify_command(command):
+    """Render a command the way ceph-mgr restful names it in results"""
+    out = [command['prefix']]
+    for arg, val in command.items():
+        if arg != 'prefix':
+            out.append('%s=%s' % (str(arg), str(val)))
+    return ' '.join(out)
+
 
 class CephClient(object):
 
@@ -45,7 +104,10 @@ class CephClient(object):
                  username=CEPH_MON_RESTFUL_USER,
                  password=None,
                  retry_count=CEPH_CLIENT_RETRY_COUNT,
-                 retry_timeout=CEPH_CLIENT_RETRY_TIMEOUT_SEC):
+                 retry_timeout=CEPH_CLIENT_RETRY_TIMEOUT_SEC,
+                 read_cache=None,
+                 credentials=None,
+                 log_sampling=None):
         self.username = username
         self.password = password
         self.cert_file = None
@@ -53,6 +115,22 @@ class CephClient(object):
         self.session = None
         self.retry_count = retry_count
         self.retry_timeout = retry_timeout
+        # commands recorded by execute_many(), per thread
+        self._recording = threading.local()
+        # cleared when the mgr results can't be matched to commands
+        self._batch_supported = True
+        # opt-in cache of read-only command responses: a ResponseCache,
+        # or True for one with the default TTLs
+        if read_cache is True:
+            read_cache = ResponseCache()
+        self.read_cache = read_cache or None
+        # password, service URL and certificate provider; by default
+        # the ceph CLI backed one shared by all clients in the process
+        self.credentials = (credentials or
+                            ceph_credentials.default_provider())
+        # prefix -> N: log the summary of one in N successful requests
+        self.log_sampling = log_sampling or {}
+        self._log_counts = {}
         atexit.register(
             self._cleanup_certificate)
 
@@ -60,92 +138,22 @@ class CephClient(object):
         self.session = requests.Session()
         self.session.auth = (self.username, self.password)
         if not self.cert_file or force_certificate_refresh:
-            self._get_certificate()
+            self._get_certificate(refresh=force_certificate_refresh)
             self.session.verify = self.cert_file.name
         else:
             self.session.verify = False
 
-    def _get_password(self):
-        try:
-            output = subprocess.check_output(
-                'ceph restful list-keys',
-                timeout=CEPH_CLI_TIMEOUT_SEC,
-                shell=True)
-        except subprocess.CalledProcessError as e:
-            raise exception.CephMonRestfulListKeysError(str(e))
-        except subprocess.TimeoutExpired as e:
-            raise exception.CephCliTimeoutExpired(str(e))
-        try:
-            keys = json.loads(output)
-        except (KeyError, ValueError):
-            raise exception.CephMonRestfulJsonError(output)
-        try:
-            self.password = keys[self.username]
-        except KeyError:
-            raise exception.CephMonRestfulMissingUserCredentials(self.username)
+    def _get_password(self, refresh=False):
+        self.password = self.credentials.password(
+            self.username, refresh=refresh)
 
-    def _get_service_url(self):
-        attempts = 1
-        while attempts <= CEPH_GET_SERVICE_RETRY_COUNT:
-            try:
-                output = subprocess.check_output(
-                    'ceph mgr services',
-                    timeout=CEPH_CLI_TIMEOUT_SEC,
-                    shell=True)
-            except subprocess.CalledProcessError as e:
-                raise exception.CephMgrDumpError(str(e))
-            except subprocess.TimeoutExpired as e:
-                raise exception.CephCliTimeoutExpired(str(e))
-            try:
-                status = json.loads(output)
-                if not status:
-                    LOG.info("Unable to get service url")
-                    time.sleep(CEPH_CLIENT_RETRY_TIMEOUT_SEC)
-                    attempts += 1
-                    continue
-            except (KeyError, ValueError):
-                raise exception.CephMgrJsonError(output)
-            LOG.info("Service url retrieved successfully")
-            break
-        try:
-            self.service_url = status[CEPH_MON_RESTFUL_SERVICE]
-        except (KeyError, TypeError):
-            raise exception.CephMgrMissingRestfulService(
-                status.get('services', ''))
+    def _get_service_url(self, refresh=False):
+        self.service_url = self.credentials.service_url(refresh=refresh)
 
-    def _get_service_active_mgr(self):
-        try:
-            output = subprocess.check_output(
-                'ceph mgr dump',
-                timeout=CEPH_CLI_TIMEOUT_SEC,
-                shell=True)
-        except subprocess.CalledProcessError as e:
-            raise exception.CephMgrDumpError(str(e))
-        except subprocess.TimeoutExpired as e:
-            raise exception.CephCliTimeoutExpired(str(e))
-        try:
-            dump = json.loads(output)
-        except (KeyError, ValueError):
-            raise exception.CephMgrJsonError(output)
-        return dump["active_name"]
-
-    def _get_certificate(self):
+    def _get_certificate(self, refresh=False):
         self._cleanup_certificate()
-        try:
-            key = 'mgr/restful/crt'
-            result = subprocess.run('ceph config-key exists {}'.format(key).split(),
-                                    timeout=CEPH_CLI_TIMEOUT_SEC,
-                                    stdout=subprocess.DEVNULL,
-                                    stderr=subprocess.DEVNULL,)
-            if result.returncode != 0:
-                active_mgr = self._get_service_active_mgr()
-                key = 'mgr/restful/{}/crt'.format(active_mgr)
-            LOG.info("Getting the certificate from '{}'.".format(key))
-            certificate = subprocess.check_output(
-                'ceph config-key get {}'.format(key),
-                timeout=CEPH_CLI_TIMEOUT_SEC,
-                shell=True)
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        certificate = self.credentials.certificate(refresh=refresh)
+        if not certificate:
             return
 
         with tempfile.NamedTemporaryFile(delete=False) as self.cert_file:
@@ -204,13 +212,24 @@ class CephClient(object):
             except (ValueError, TypeError):
                 raise exception.CephMgrJsonError(outb)
 
-    def _request(self, prefix, *args, **kwargs):
+    def _make_result(self, prefix, format, result):
+        if format == 'json':
+            return self._make_json_result(prefix, result)
+        elif format == 'text':
+            return self._make_text_result(prefix, result)
+        else:
+            raise exception.CephClientResponseFormatNotImplemented(
+                format=format, reason=result["finished"][0]["outb"])
+
+    def _ensure_session(self):
         if not self.password:
             self._get_password()
         if not self.service_url:
             self._get_service_url()
         if not self.session:
             self._refresh_session()
+
+    def _make_request_json(self, prefix, kwargs):
         format = kwargs.get('body', 'json').lower()
         if format not in API_SUPPORTED_RESPONSE_FORMATS:
             raise exception.CephClientFormatNotSupported(
@@ -225,17 +244,35 @@ class CephClient(object):
             del req_json['timeout']
         else:
             timeout = None
-        LOG.info('Request params: url={}, json={}'.format(
-            self.service_url + 'request?wait=1', req_json))
+        return req_json, format, timeout
+
+    def _log_result(self, req_json, result, started):
+        LOG.debug('Result: %s', result)
+        if not LOG.isEnabledFor(logging.INFO):
+            return
+        prefix, status, size = _summarize_result(req_json, result)
+        every = self.log_sampling.get(prefix)
+        if status == 'ok' and every and every > 1:
+            count = self._log_counts.get(prefix, 0)
+            self._log_counts[prefix] = count + 1
+            if count % every:
+                return
+        LOG.info("Request '%s': %s in %.3fs, %d bytes",
+                 prefix, status, time.time() - started, size)
+
+    def _post_request(self, req_json, timeout):
+        LOG.debug('Request params: url=%s, json=%s',
+                  self.service_url + 'request?wait=1', req_json)
         credit = self.retry_count + 1
         while credit > 0:
             credit -= 1
             try:
+                started = time.time()
                 result = self.session.post(
                     self.service_url + 'request?wait=1',
                     json=req_json,
                     timeout=timeout).json()
-                LOG.info('Result: {}'.format(result))
+                self._log_result(req_json, result, started)
                 if 'is_finished' in result:
                     self.session.delete(
                         self.service_url + 'request?id=' + result['id'])
@@ -254,7 +291,7 @@ class CephClient(object):
                 LOG.warning('Incorrect password for user \'{}\'. '
                             'Fetch user password via list-keys '
                             'and retry.'.format(self.username))
-                self._get_password()
+                self._get_password(refresh=True)
                 self._refresh_session()
             except requests.exceptions.SSLError as e:
                 if "CERTIFICATE_VERIFY_FAILED" in str(e):
@@ -264,7 +301,7 @@ class CephClient(object):
                     LOG.warning(
                         'Request SSL error: %s. '
                         'Refresh restful service URL and retry', e, exc_info=0)
-                    self._get_service_url()
+                    self._get_service_url(refresh=True)
                     self._refresh_session()
             except (requests.ConnectionError,
                     requests.Timeout,
@@ -274,7 +311,7 @@ class CephClient(object):
                 LOG.warning(
                     'Request error: {}. '
                     'Refresh restful service URL and retry'.format(e))
-                self._get_service_url()
+                self._get_service_url(refresh=True)
                 self._refresh_session()
             except IOError as e:
                 if not credit:
@@ -285,13 +322,188 @@ class CephClient(object):
                 self._refresh_session(force_certificate_refresh=True)
             if self.retry_timeout > 0:
                 time.sleep(self.retry_timeout)
-        if format == 'json':
-            return self._make_json_result(prefix, result)
-        elif format == 'text':
-            return self._make_text_result(prefix, result)
-        else:
-            raise exception.CephClientResponseFormatNotImplemented(
-                format=format, reason=result["finished"][0]["outb"])
+        return result
+
+    def _request(self, prefix, *args, **kwargs):
+        commands = getattr(self._recording, 'commands', None)
+        if commands is not None:
+            commands.append((prefix, kwargs))
+            return _RECORDED
+        req_json, format, timeout = self._make_request_json(prefix, kwargs)
+        if self.read_cache is not None:
+            cached = self.read_cache.lookup(req_json)
+            if cached is not None:
+                return cached
+        return self._fetch(prefix, req_json, format, timeout)
+
+    def _fetch(self, prefix, req_json, format, timeout):
+        self._ensure_session()
+        result = self._post_request(req_json, timeout)
+        result = self._make_result(prefix, format, result)
+        if self.read_cache is not None:
+            self.read_cache.update(req_json, result)
+        return result
+
+    def _record(self, name, args, kwargs):
+        """Return the (prefix, kwargs) a method would request, or None
+
+        None when the method does not make exactly one request or does
+        more with its result than return it.
+        """
+        self._recording.commands = []
+        try:
+            returned = getattr(self, name)(*args, **kwargs)
+        except exception.CephClientException:
+            raise
+        except Exception:
+            returned = None
+        finally:
+            commands = self._recording.commands
+            self._recording.commands = None
+        if returned is not _RECORDED or len(commands) != 1:
+            return None
+        return commands[0]
+
+    def execute_many(self, commands):
+        """Run several read-only commands with a single mgr restful request.
+
+        Consecutive read-only commands are submitted together, as one
+        group of commands the mgr runs in parallel, and the request is
+        waited for and deleted once for all of them, instead of one
+        post and one delete per command. Any other command is sent on
+        its own, after the commands before it and before the commands
+        after it, so commands take effect in list order.
+
+        Each command is the name of a command method of this client
+        with its arguments, as a name or a (name, args, kwargs),
+        (name, args) or (name, kwargs) tuple, for example:
+
+            client.execute_many([
+                'health',
+                ('osd_tree', {'body': 'json'}),
+                ('osd_pool_get', ('kube-rbd', 'size')),
+            ])
+
+        Arguments of all the commands are checked by the methods, as
+        usual, before any command is sent. Methods that do not map to a
+        single mgr command are called on their own. A command of a
+        batch the mgr ran is never sent again: if the mgr result has no
+        entry for it, its result is an internal server error.
+
+        Returns a list of (response, body) results in commands order,
+        as the methods return them.
+        """
+        entries = [_batch_entry(entry) for entry in commands]
+        results = [None] * len(entries)
+        for step in self._plan_batch(entries):
+            if isinstance(step, list):
+                self._run_batch(step, results)
+            else:
+                name, args, kwargs = entries[step]
+                results[step] = getattr(self, name)(*args, **kwargs)
+        return results
+
+    def _plan_batch(self, entries):
+        """Split execute_many() entries into steps run in list order
+
+        A step is either a list of (index, prefix, req_json, format,
+        timeout) read-only commands that can be requested together, or
+        the index of an entry whose method is called on its own.
+        """
+        steps = []
+        batch = []
+        for index, (name, args, kwargs) in enumerate(entries):
+            recorded = None
+            if self._batch_supported:
+                recorded = self._record(name, args, kwargs)
+            if recorded is None or recorded[0] not in READ_ONLY_PREFIXES:
+                if batch:
+                    steps.append(batch)
+                    batch = []
+                steps.append(index)
+                continue
+            prefix, request_kwargs = recorded
+            req_json, format, timeout = self._make_request_json(
+                prefix, request_kwargs)
+            batch.append((index, prefix, req_json, format, timeout))
+        if batch:
+            steps.append(batch)
+        return steps
+
+    def _batch_pending(self, batch, results):
+        """Return the batch commands the read cache does not answer;
+        results of the others are stored in results"""
+        if self.read_cache is None:
+            return batch
+        pending = []
+        for item in batch:
+            results[item[0]] = self.read_cache.lookup(item[2])
+            if results[item[0]] is None:
+                pending.append(item)
+        return pending
+
+    @staticmethod
+    def _batch_request(batch):
+        """Return the (req_json, timeout) of a batch request"""
+        timeouts = [timeout for _, _, _, _, timeout in batch]
+        timeout = None if None in timeouts else max(timeouts)
+        return [[req_json for _, _, req_json, _, _ in batch]], timeout
+
+    def _run_batch(self, batch, results):
+        batch = self._batch_pending(batch, results)
+        if len(batch) > 1:
+            self._ensure_session()
+            result = self._post_request(*self._batch_request(batch))
+            self._split_batch_result(batch, result, results)
+        # a single command, or those of a batch the mgr did not run
+        for index, prefix, req_json, format, timeout in batch:
+            if results[index] is None:
+                results[index] = self._fetch(prefix, req_json, format,
+                                             timeout)
+
+    def _split_batch_result(self, batch, result, results):
+        """Store the result of each batch command, as _request() would
+        return it, in results
+
+        Nothing is stored if the mgr did not run the batch. Commands
+        the mgr ran but whose result can't be found get an internal
+        server error result.
+        """
+        if 'is_finished' not in result:
+            return
+        # _plan_batch() only batches read-only commands: the mgr runs
+        # them in parallel, so their results can all be cached
+        assert all(prefix in READ_ONLY_PREFIXES
+                   for _, prefix, _, _, _ in batch)
+        outcomes = {}   # humanified command -> [(failed, entry)]
+        for failed, key in ((False, 'finished'), (True, 'failed')):
+            for entry in result.get(key) or []:
+                if isinstance(entry, dict) and 'command' in entry:
+                    outcomes.setdefault(
+                        entry['command'], []).append((failed, entry))
+        matched = 0
+        for index, prefix, req_json, format, _ in batch:
+            entries = outcomes.get(_humanify_command(req_json))
+            if not entries:
+                missing = dict(outs='No result for command in batch '
+                                    'response', outb='')
+                results[index] = self._make_result(
+                    prefix, format,
+                    dict(has_failed=True, failed=[missing], finished=[]))
+                continue
+            failed, entry = entries.pop(0)
+            if failed:
+                single = dict(has_failed=True, failed=[entry], finished=[])
+            else:
+                single = dict(has_failed=False, failed=[], finished=[entry])
+            results[index] = self._make_result(prefix, format, single)
+            if self.read_cache is not None:
+                self.read_cache.update(req_json, results[index])
+            matched += 1
+        if not matched:
+            LOG.warning('Unable to match batch results to commands. '
+                        'Sending commands one at a time')
+            self._batch_supported = False
 
     def pg_stat(self, body='json', timeout=None):
         """show placement group status."""
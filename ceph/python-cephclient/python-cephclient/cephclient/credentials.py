@@ -0,0 +1,232 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+
+from cephclient import exception
+
+
+CEPH_MON_RESTFUL_SERVICE = 'restful'
+CEPH_GET_SERVICE_RETRY_COUNT = 15
+CEPH_GET_SERVICE_RETRY_TIMEOUT_SEC = 5
+CEPH_CLI_TIMEOUT_SEC = 15
+
+LOG = logging.getLogger('ceph_client')
+
+
+class CephCliSource(object):
+    """Credential source backed by the ceph CLI
+
+    A credential source is any object with the password(username),
+    service_url() and certificate() methods of this class.
+    certificate() returns the PEM bytes, or None when they are not
+    available.
+    """
+
+    def password(self, username):
+        try:
+            output = subprocess.check_output(
+                'ceph restful list-keys',
+                timeout=CEPH_CLI_TIMEOUT_SEC,
+                shell=True)
+        except subprocess.CalledProcessError as e:
+            raise exception.CephMonRestfulListKeysError(str(e))
+        except subprocess.TimeoutExpired as e:
+            raise exception.CephCliTimeoutExpired(str(e))
+        try:
+            keys = json.loads(output)
+        except (KeyError, ValueError):
+            raise exception.CephMonRestfulJsonError(output)
+        try:
+            return keys[username]
+        except KeyError:
+            raise exception.CephMonRestfulMissingUserCredentials(username)
+
+    def service_url(self):
+        attempts = 1
+        while attempts <= CEPH_GET_SERVICE_RETRY_COUNT:
+            try:
+                output = subprocess.check_output(
+                    'ceph mgr services',
+                    timeout=CEPH_CLI_TIMEOUT_SEC,
+                    shell=True)
+            except subprocess.CalledProcessError as e:
+                raise exception.CephMgrDumpError(str(e))
+            except subprocess.TimeoutExpired as e:
+                raise exception.CephCliTimeoutExpired(str(e))
+            try:
+                status = json.loads(output)
+                if not status:
+                    LOG.info("Unable to get service url")
+                    time.sleep(CEPH_GET_SERVICE_RETRY_TIMEOUT_SEC)
+                    attempts += 1
+                    continue
+            except (KeyError, ValueError):
+                raise exception.CephMgrJsonError(output)
+            LOG.info("Service url retrieved successfully")
+            break
+        try:
+            return status[CEPH_MON_RESTFUL_SERVICE]
+        except (KeyError, TypeError):
+            raise exception.CephMgrMissingRestfulService(
+                status.get('services', ''))
+
+    def _active_mgr(self):
+        try:
+            output = subprocess.check_output(
+                'ceph mgr dump',
+                timeout=CEPH_CLI_TIMEOUT_SEC,
+                shell=True)
+        except subprocess.CalledProcessError as e:
+            raise exception.CephMgrDumpError(str(e))
+        except subprocess.TimeoutExpired as e:
+            raise exception.CephCliTimeoutExpired(str(e))
+        try:
+            dump = json.loads(output)
+        except (KeyError, ValueError):
+            raise exception.CephMgrJsonError(output)
+        return dump["active_name"]
+
+    def certificate(self):
+        try:
+            key = 'mgr/restful/crt'
+            result = subprocess.run(
+                'ceph config-key exists {}'.format(key).split(),
+                timeout=CEPH_CLI_TIMEOUT_SEC,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,)
+            if result.returncode != 0:
+                key = 'mgr/restful/{}/crt'.format(self._active_mgr())
+            LOG.info("Getting the certificate from '{}'.".format(key))
+            return subprocess.check_output(
+                'ceph config-key get {}'.format(key),
+                timeout=CEPH_CLI_TIMEOUT_SEC,
+                shell=True)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            return None
+
+
+class CredentialProvider(object):
+    """Cache of the restful password, service URL and certificate
+
+    Values come from the credential source (the ceph CLI by default)
+    the first time they are needed and are then reused until the
+    caller asks for a refresh, i.e. after a request failed auth or
+    could not reach the service. A new service URL also drops the
+    cached certificate: the active mgr moved and may serve another one.
+
+    With cache_file the values are also saved to, and first loaded
+    from, that file so they survive process restarts. The file holds
+    the password and is only readable by its owner.
+    """
+
+    def __init__(self, source=None, cache_file=None):
+        self.source = source or CephCliSource()
+        self.cache_file = cache_file
+        self._passwords = {}
+        self._service_url = None
+        self._certificate = None
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def _load(self):
+        self._loaded = True
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file) as f:
+                data = json.load(f)
+            self._passwords = dict(data.get('passwords') or {})
+            self._service_url = data.get('service_url')
+            certificate = data.get('certificate')
+            if certificate:
+                self._certificate = certificate.encode('ascii')
+        except (IOError, OSError):
+            pass
+        except (AttributeError, TypeError, ValueError) as e:
+            LOG.warning("Ignoring credentials cache '{}': {}".format(
+                self.cache_file, e))
+
+    def _save(self):
+        if not self.cache_file:
+            return
+        data = dict(passwords=self._passwords,
+                    service_url=self._service_url,
+                    certificate=(self._certificate.decode('ascii')
+                                 if self._certificate else None))
+        tmp = '{}.{}.tmp'.format(self.cache_file, os.getpid())
+        try:
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.rename(tmp, self.cache_file)
+        except (IOError, OSError) as e:
+            LOG.warning("Unable to save credentials cache '{}': {}".format(
+                self.cache_file, e))
+
+    def password(self, username, refresh=False):
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if refresh or not self._passwords.get(username):
+                self._passwords[username] = self.source.password(username)
+                self._save()
+            return self._passwords[username]
+
+    def service_url(self, refresh=False):
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if refresh or not self._service_url:
+                service_url = self.source.service_url()
+                if service_url != self._service_url:
+                    if self._service_url:
+                        LOG.info("Service url moved from '{}' to '{}'".format(
+                            self._service_url, service_url))
+                    self._certificate = None
+                self._service_url = service_url
+                self._save()
+            return self._service_url
+
+    def certificate(self, refresh=False):
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if refresh or not self._certificate:
+                self._certificate = self.source.certificate()
+                self._save()
+            return self._certificate
+
+    def invalidate(self):
+        """Drop all cached values, including the cache file"""
+        with self._lock:
+            self._passwords = {}
+            self._service_url = None
+            self._certificate = None
+            self._loaded = True
+            if self.cache_file:
+                try:
+                    os.unlink(self.cache_file)
+                except OSError:
+                    pass
+
+
+_default_provider = None
+_default_provider_lock = threading.Lock()
+
+
+def default_provider():
+    """Return the CLI backed provider shared by clients in this process"""
+    global _default_provider
+    with _default_provider_lock:
+        if _default_provider is None:
+            _default_provider = CredentialProvider()
+        return _default_provider
@@ -45,6 +45,10 @@ class CephMgrMissingRestfulService(CephClientException):
     message = "Missing restful service. Available services: {}"
 
 
+class CephMgrRestfulResponseError(CephClientException):
+    message = "Unexpected ceph-mgr restful plugin response: {}"
+
+
 class CephClientFormatNotSupported(CephClientException):
     message = "Command '{prefix}' does not support request format '{format}'"
 
@@ -0,0 +1,241 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import re
+
+from cephclient import credentials
+from cephclient import exception
+from cephclient.tests import fakes
+
+
+class ClientCases(object):
+    """Cases run against each client class
+
+    Test classes mix this into unittest.TestCase and define
+    new_client(**kwargs), which makes a client posting to self.mgr,
+    wait(value), which returns what a client call returned, once
+    awaited for the async client, and connection_error(), which
+    returns an error the client retries with a new service URL.
+    """
+
+    def setUp(self):
+        super(ClientCases, self).setUp()
+        self.mgr = fakes.FakeMgr()
+        self.source = fakes.FakeSource()
+
+    def make_client(self, **kwargs):
+        kwargs.setdefault('retry_timeout', 0)
+        kwargs.setdefault(
+            'credentials', credentials.CredentialProvider(self.source))
+        client = self.new_client(**kwargs)
+        self.addCleanup(client._cleanup_certificate)
+        return client
+
+    def test_command(self):
+        client = self.make_client()
+        response, body = self.wait(client.health())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body, dict(status='', output=dict(prefix='health')))
+        self.assertEqual(self.mgr.requests, [
+            dict(prefix='health', format='json')])
+        self.assertEqual(self.mgr.deletes, 1)
+
+    def test_failed_command(self):
+        self.mgr.failing.add('health')
+        client = self.make_client()
+        response, body = self.wait(client.health())
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(body['status'], 'Error EINVAL: health failed')
+
+    def test_credentials_fetched_once(self):
+        client = self.make_client()
+        self.wait(client.health())
+        self.wait(client.df())
+        self.assertEqual(self.source.calls, [
+            'password', 'service_url', 'certificate'])
+
+    def test_retry_refreshes_service_url(self):
+        self.mgr.errors.append(self.connection_error())
+        client = self.make_client()
+        response, _ = self.wait(client.health())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.mgr.prefixes(), ['health', 'health'])
+        self.assertEqual(self.source.calls.count('service_url'), 2)
+        self.assertEqual(self.source.calls.count('password'), 1)
+
+    def test_retry_refreshes_password(self):
+        self.mgr.messages.append('auth: Incorrect password')
+        client = self.make_client()
+        response, _ = self.wait(client.health())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.source.calls.count('password'), 2)
+        self.assertEqual(client.password, 'secret-2')
+
+    def test_retries_exhausted(self):
+        self.mgr.errors.extend(self.connection_error() for _ in range(3))
+        client = self.make_client(retry_count=2)
+        with self.assertRaises(IOError):
+            self.wait(client.health())
+        self.assertEqual(len(self.mgr.requests), 3)
+
+    def summaries(self, logs):
+        return [re.sub(r' in \d+\.\d+s', '', record.getMessage())
+                for record in logs.records]
+
+    def test_log_summary(self):
+        client = self.make_client()
+        with self.assertLogs('ceph_client', 'INFO') as logs:
+            self.wait(client.health())
+            self.wait(client.df())
+        self.assertEqual(self.summaries(logs), [
+            "Request 'health': ok, 20 bytes",
+            "Request 'df': ok, 16 bytes"])
+
+    def test_log_sampling(self):
+        client = self.make_client(log_sampling={'health': 3})
+        with self.assertLogs('ceph_client', 'INFO') as logs:
+            for _ in range(5):
+                self.wait(client.health())
+            self.mgr.failing.add('health')
+            self.wait(client.health())
+            self.wait(client.df())
+        self.assertEqual(self.summaries(logs), [
+            "Request 'health': ok, 20 bytes",
+            "Request 'health': ok, 20 bytes",
+            "Request 'health': failed, 20 bytes",
+            "Request 'df': ok, 16 bytes"])
+
+    def test_execute_many_batches_read_only_commands(self):
+        client = self.make_client()
+        results = self.wait(client.execute_many([
+            'health',
+            ('osd_tree', {'body': 'text'}),
+            ('osd_pool_get', ('kube-rbd', 'size')),
+        ]))
+        self.assertEqual(self.mgr.prefixes(), [
+            ['health', 'osd tree', 'osd pool get']])
+        self.assertEqual(self.mgr.deletes, 1)
+        self.assertEqual([body for _, body in results], [
+            dict(status='', output=dict(prefix='health')),
+            'text osd tree',
+            dict(status='', output=dict(prefix='osd pool get')),
+        ])
+
+    def test_execute_many_sends_mutations_in_order(self):
+        client = self.make_client()
+        results = self.wait(client.execute_many([
+            'health',
+            'df',
+            ('osd_pool_set', ('kube-rbd', 'size', '3')),
+            'status',
+            ('osd_pool_set', ('kube-rbd', 'min_size', '2')),
+            'osd_tree',
+            'status',
+        ]))
+        self.assertEqual(self.mgr.prefixes(), [
+            ['health', 'df'],
+            'osd pool set',
+            'status',
+            'osd pool set',
+            ['osd tree', 'status'],
+        ])
+        self.assertEqual([body['output']['prefix'] for _, body in results], [
+            'health', 'df', 'osd pool set', 'status', 'osd pool set',
+            'osd tree', 'status'])
+
+    def test_execute_many_failed_command(self):
+        self.mgr.failing.add('df')
+        client = self.make_client()
+        results = self.wait(client.execute_many(['health', 'df']))
+        self.assertEqual([response.status_code for response, _ in results],
+                         [200, 500])
+        self.assertEqual(results[1][1]['status'], 'Error EINVAL: df failed')
+        self.assertEqual(len(self.mgr.requests), 1)
+
+    def test_execute_many_does_not_resend_missing_result(self):
+        self.mgr.dropped.add('df')
+        client = self.make_client()
+        results = self.wait(client.execute_many(['health', 'df', 'status']))
+        self.assertEqual(self.mgr.prefixes(), [['health', 'df', 'status']])
+        self.assertEqual([response.status_code for response, _ in results],
+                         [200, 500, 200])
+        self.assertEqual(results[1][1]['status'],
+                         'No result for command in batch response')
+        self.assertTrue(client._batch_supported)
+
+    def test_execute_many_unmatched_results_disable_batching(self):
+        self.mgr.rename = True
+        client = self.make_client()
+        results = self.wait(client.execute_many(['health', 'df']))
+        self.assertEqual([response.status_code for response, _ in results],
+                         [500, 500])
+        self.assertFalse(client._batch_supported)
+        self.wait(client.execute_many(['health', 'df']))
+        self.assertEqual(self.mgr.prefixes(), [
+            ['health', 'df'], 'health', 'df'])
+
+    def test_execute_many_batch_not_run(self):
+        self.mgr.messages.append('Internal Server Error')
+        client = self.make_client()
+        results = self.wait(client.execute_many(['health', 'df']))
+        self.assertEqual(self.mgr.prefixes(), [
+            ['health', 'df'], 'health', 'df'])
+        self.assertEqual([body['output']['prefix'] for _, body in results],
+                         ['health', 'df'])
+
+    def test_execute_many_checks_arguments_first(self):
+        client = self.make_client()
+        with self.assertRaises(exception.CephClientInvalidChoice):
+            self.wait(client.execute_many([
+                'health',
+                ('osd_pool_set', ('kube-rbd', 'no-such-var', '1'))]))
+        self.assertEqual(self.mgr.requests, [])
+
+    def test_execute_many_logs_batch_once(self):
+        self.mgr.messages.append('Internal Server Error')
+        client = self.make_client()
+        with self.assertLogs('ceph_client', 'INFO') as logs:
+            self.wait(client.execute_many(['health', 'df']))
+            self.wait(client.execute_many(['health', 'df']))
+        self.assertEqual(self.summaries(logs), [
+            "Request 'health, df': error, 0 bytes",
+            "Request 'health': ok, 20 bytes",
+            "Request 'df': ok, 16 bytes",
+            "Request 'health, df': ok, 36 bytes"])
+
+    def test_read_cache(self):
+        client = self.make_client(read_cache=True)
+        self.wait(client.health())
+        response, body = self.wait(client.health())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body['output'], dict(prefix='health'))
+        self.assertEqual(self.mgr.prefixes(), ['health'])
+        self.wait(client.osd_pool_set('kube-rbd', 'size', '3'))
+        self.wait(client.health())
+        self.assertEqual(self.mgr.prefixes(), [
+            'health', 'osd pool set', 'health'])
+        self.assertEqual(client.read_cache.stats(), dict(
+            hits=1, misses=2, invalidations=1, entries=1))
+
+    def test_execute_many_read_cache(self):
+        client = self.make_client(read_cache=True)
+        self.wait(client.health())
+        results = self.wait(client.execute_many(['health', 'df', 'status']))
+        self.assertEqual(self.mgr.prefixes(), ['health', ['df', 'status']])
+        self.wait(client.execute_many(['health', 'df', 'status']))
+        self.assertEqual(len(self.mgr.requests), 2)
+        self.assertEqual([body['output']['prefix'] for _, body in results],
+                         ['health', 'df', 'status'])
+
+    def test_execute_many_read_after_mutation_not_cached(self):
+        client = self.make_client(read_cache=True)
+        self.wait(client.execute_many([
+            'health', 'df',
+            ('osd_pool_set', ('kube-rbd', 'size', '3')),
+            'health', 'df']))
+        self.assertEqual(self.mgr.prefixes(), [
+            ['health', 'df'], 'osd pool set', ['health', 'df']])
+        self.assertEqual(client.read_cache.stats()['entries'], 2)
@@ -0,0 +1,153 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import asyncio
+import copy
+import json
+
+from unittest import mock
+
+
+def mgr_command_name(command):
+    """Name a command the way ceph-mgr restful does in its results"""
+    out = [command['prefix']]
+    for arg, val in command.items():
+        if arg != 'prefix':
+            out.append('%s=%s' % (str(arg), str(val)))
+    return ' '.join(out)
+
+
+class FakeMgr(object):
+    """Answers 'request?wait=1' posts like the ceph-mgr restful module
+
+    A post is a command, or a [[command, ...]] batch the mgr runs in
+    parallel. Errors queued in errors are raised by the next posts and
+    messages are returned by them, as for authentication failures.
+    """
+
+    def __init__(self):
+        self.requests = []      # posted commands and batches
+        self.deletes = 0
+        self.errors = []
+        self.messages = []
+        self.failing = set()    # prefixes whose commands fail
+        self.dropped = set()    # prefixes left out of batch results
+        self.rename = False     # name batch commands unlike the client
+
+    def post(self, req_json):
+        self.requests.append(copy.deepcopy(req_json))
+        if self.errors:
+            raise self.errors.pop(0)
+        if self.messages:
+            return dict(message=self.messages.pop(0))
+        batch = isinstance(req_json, list)
+        finished = []
+        failed = []
+        for command in (req_json[0] if batch else [req_json]):
+            prefix = command['prefix']
+            if batch and prefix in self.dropped:
+                continue
+            name = mgr_command_name(command)
+            if batch and self.rename:
+                name = '{} ({})'.format(prefix, len(self.requests))
+            if command['format'] == 'json':
+                outb = json.dumps(dict(prefix=prefix))
+            else:
+                outb = 'text {}\n'.format(prefix)
+            entry = dict(command=name, outb=outb, outs='')
+            if prefix in self.failing:
+                entry['outs'] = 'Error EINVAL: {} failed'.format(prefix)
+                failed.append(entry)
+            else:
+                finished.append(entry)
+        return dict(id=str(len(self.requests)), is_finished=True,
+                    has_failed=bool(failed), finished=finished,
+                    failed=failed)
+
+    def delete(self):
+        self.deletes += 1
+
+    def prefixes(self):
+        """Return the prefixes of each post: a string for a command and
+        a list of strings for a batch"""
+        return [[command['prefix'] for command in req_json[0]]
+                if isinstance(req_json, list) else req_json['prefix']
+                for req_json in self.requests]
+
+
+class FakeSource(object):
+    """Credential source counting its calls instead of running the CLI"""
+
+    def __init__(self):
+        self.calls = []
+        self.url = 'https://mgr-0:7999/'
+
+    def password(self, username):
+        self.calls.append('password')
+        return 'secret-{}'.format(self.calls.count('password'))
+
+    def service_url(self):
+        self.calls.append('service_url')
+        return self.url
+
+    def certificate(self):
+        self.calls.append('certificate')
+        return b'CERTIFICATE'
+
+
+class FakeSession(object):
+    """requests.Session posting to a FakeMgr"""
+
+    def __init__(self, mgr):
+        self.mgr = mgr
+        self.auth = None
+        self.verify = None
+
+    def post(self, url, json=None, timeout=None):
+        response = mock.Mock()
+        response.json.return_value = self.mgr.post(json)
+        return response
+
+    def delete(self, url):
+        self.mgr.delete()
+
+
+class FakeAioSession(object):
+    """aiohttp.ClientSession posting to a FakeMgr"""
+
+    def __init__(self, mgr):
+        self.mgr = mgr
+        self.closed = False
+
+    def post(self, url, json=None, **kwargs):
+        return _FakeAioResponse(self.mgr.post, json)
+
+    def delete(self, url, **kwargs):
+        return _FakeAioResponse(self.mgr.delete)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeAioResponse(object):
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+        self.result = None
+
+    async def __aenter__(self):
+        # let other requests start, as they would while this one waits
+        # for the mgr
+        await asyncio.sleep(0)
+        self.result = self.func(*self.args)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def json(self, content_type=None):
+        return self.result
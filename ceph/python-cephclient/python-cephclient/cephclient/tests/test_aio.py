@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import asyncio
+import unittest
+from unittest import mock
+
+import aiohttp
+
+from cephclient import aio
+from cephclient import exception
+from cephclient.tests import client_cases
+from cephclient.tests import fakes
+
+
+class TestAsyncCephClient(client_cases.ClientCases, unittest.TestCase):
+
+    def setUp(self):
+        super(TestAsyncCephClient, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.sessions = []
+        for target, name, side_effect in (
+                (aio.aiohttp, 'ClientSession', self._new_session),
+                (aio.aiohttp, 'TCPConnector', None),
+                (aio.ssl, 'create_default_context', None)):
+            patcher = mock.patch.object(target, name,
+                                        side_effect=side_effect)
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
+
+    def _new_session(self, **kwargs):
+        session = fakes.FakeAioSession(self.mgr)
+        self.sessions.append(session)
+        return session
+
+    def new_client(self, **kwargs):
+        client = aio.AsyncCephClient(**kwargs)
+        self.addCleanup(self.wait, client.close())
+        return client
+
+    def wait(self, value):
+        if asyncio.iscoroutine(value):
+            return self.loop.run_until_complete(value)
+        return value
+
+    def connection_error(self):
+        return aiohttp.ClientConnectionError('Connection refused')
+
+    def gather(self, *coroutines):
+        async def gather():
+            return await asyncio.gather(*coroutines)
+        return self.wait(gather())
+
+    def test_concurrent_requests_share_session(self):
+        client = self.make_client(pool_size=4)
+        results = self.gather(client.health(), client.df(), client.status())
+        self.assertEqual([body['output']['prefix'] for _, body in results],
+                         ['health', 'df', 'status'])
+        self.assertEqual(len(self.sessions), 1)
+        self.TCPConnector.assert_called_once_with(limit=4)
+        self.assertEqual(self.source.calls, [
+            'password', 'service_url', 'certificate'])
+
+    def test_failures_refresh_once(self):
+        self.mgr.errors.extend(self.connection_error() for _ in range(3))
+        client = self.make_client()
+        results = self.gather(client.health(), client.df(), client.status())
+        self.assertEqual([response.status_code for response, _ in results],
+                         [200, 200, 200])
+        self.assertEqual(len(self.mgr.requests), 6)
+        self.assertEqual(self.source.calls.count('service_url'), 2)
+        self.assertEqual(client._generation, 2)
+
+    def test_refresh_skipped_for_stale_generation(self):
+        client = self.make_client()
+        self.wait(client._ensure_session())
+        generation = client._generation
+        self.gather(client._refresh(generation, password=True),
+                    client._refresh(generation, password=True))
+        self.assertEqual(self.source.calls.count('password'), 2)
+        self.assertEqual(client._generation, generation + 1)
+        self.wait(client._refresh(generation, password=True))
+        self.assertEqual(self.source.calls.count('password'), 2)
+
+    def test_context_manager_closes_session(self):
+        async def run():
+            async with self.make_client() as client:
+                await client.health()
+        self.wait(run())
+        self.assertTrue(self.sessions[0].closed)
+
+    def test_unexpected_reply(self):
+        client = self.make_client()
+        with mock.patch.object(self.mgr, 'post',
+                               return_value=dict(status='unknown')):
+            with self.assertRaises(exception.CephMgrRestfulResponseError):
+                self.wait(client.health())
+
+    def test_no_retries(self):
+        client = self.make_client(retry_count=0)
+        response, _ = self.wait(client.health())
+        self.assertEqual(response.status_code, 200)
+        self.mgr.messages.append('auth: No such user')
+        with self.assertRaises(exception.CephClientNoSuchUser):
+            self.wait(client.health())
+        self.mgr.errors.append(self.connection_error())
+        with self.assertRaises(IOError):
+            self.wait(client.health())
+        self.assertEqual(len(self.mgr.requests), 3)
@@ -0,0 +1,104 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import unittest
+from unittest import mock
+
+import requests
+
+from cephclient import cache
+
+
+def _result(status_code=requests.codes.ok, body=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = 'OK'
+    return response, body
+
+
+HEALTH = dict(prefix='health', format='json')
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        super(TestResponseCache, self).setUp()
+        self.now = 1000.0
+        patcher = mock.patch.object(cache, '_now', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = cache.ResponseCache()
+
+    def test_hit_until_ttl_expires(self):
+        self.assertIsNone(self.cache.lookup(HEALTH))
+        self.cache.update(HEALTH, _result(body=dict(status='HEALTH_OK')))
+        self.now += cache.DEFAULT_TTLS['health'] - 0.5
+        response, body = self.cache.lookup(HEALTH)
+        self.assertEqual(response.status_code, requests.codes.ok)
+        self.assertEqual(body, dict(status='HEALTH_OK'))
+        self.now += 0.5
+        self.assertIsNone(self.cache.lookup(HEALTH))
+        self.assertEqual(self.cache.stats(), dict(
+            hits=1, misses=2, invalidations=0, entries=1))
+
+    def test_custom_ttl(self):
+        cache_ = cache.ResponseCache(ttls={'health': 10})
+        cache_.update(HEALTH, _result(body={}))
+        self.now += 9
+        self.assertIsNotNone(cache_.lookup(HEALTH))
+
+    def test_ttl_of_mutating_command_rejected(self):
+        self.assertRaises(ValueError, cache.ResponseCache,
+                          ttls={'osd pool set': 10})
+
+    def test_keyed_by_arguments_and_format(self):
+        self.cache.update(HEALTH, _result(body='json'))
+        self.assertIsNone(self.cache.lookup(
+            dict(prefix='health', format='text')))
+        self.assertIsNone(self.cache.lookup(
+            dict(prefix='health', format='json', detail='detail')))
+        self.assertEqual(self.cache.lookup(
+            dict(format='json', prefix='health'))[1], 'json')
+
+    def test_mutating_command_invalidates(self):
+        self.cache.update(HEALTH, _result(body={}))
+        set_size = dict(prefix='osd pool set', format='json',
+                        pool='kube-rbd', var='size', val='3')
+        self.assertIsNone(self.cache.lookup(set_size))
+        self.assertIsNone(self.cache.lookup(HEALTH))
+        self.cache.update(HEALTH, _result(body={}))
+        self.cache.update(set_size, _result(body={}))
+        self.assertIsNone(self.cache.lookup(HEALTH))
+        self.assertEqual(self.cache.stats()['invalidations'], 2)
+
+    def test_only_successful_responses_cached(self):
+        self.cache.update(HEALTH, _result(
+            status_code=requests.codes.internal_server_error, body={}))
+        self.assertIsNone(self.cache.lookup(HEALTH))
+
+    def test_read_only_command_without_ttl_not_cached(self):
+        auth_get = dict(prefix='auth get', format='json', entity='admin')
+        self.cache.update(auth_get, _result(body=dict(key='secret')))
+        self.assertIsNone(self.cache.lookup(auth_get))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_lookup_returns_copies(self):
+        result = _result(body=dict(checks=[]))
+        self.cache.update(HEALTH, result)
+        result[1]['checks'].append('changed by caller')
+        first = self.cache.lookup(HEALTH)
+        first[0].status_code = requests.codes.not_found
+        first[1]['checks'].append('changed by caller')
+        second = self.cache.lookup(HEALTH)
+        self.assertIsNot(second[0], result[0])
+        self.assertEqual(second[0].status_code, requests.codes.ok)
+        self.assertEqual(second[1], dict(checks=[]))
+
+    def test_update_drops_expired_entries(self):
+        self.cache.update(HEALTH, _result(body={}))
+        self.now += 60
+        self.cache.update(dict(prefix='df', format='json'), _result(body={}))
+        self.assertEqual(self.cache.stats()['entries'], 1)
@@ -0,0 +1,97 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import unittest
+from unittest import mock
+
+import requests
+
+from cephclient import client
+from cephclient import exception
+from cephclient.tests import client_cases
+from cephclient.tests import fakes
+
+
+class TestHumanifyCommand(unittest.TestCase):
+
+    def test_prefix_only(self):
+        self.assertEqual(client._humanify_command(dict(prefix='health')),
+                         'health')
+
+    def test_arguments_in_request_order(self):
+        command = dict(prefix='osd pool get', format='json',
+                       pool='kube-rbd', var='size')
+        self.assertEqual(client._humanify_command(command),
+                         'osd pool get format=json pool=kube-rbd var=size')
+        self.assertEqual(client._humanify_command(command),
+                         fakes.mgr_command_name(command))
+
+
+class TestBatchEntry(unittest.TestCase):
+
+    def test_forms(self):
+        self.assertEqual(client._batch_entry('health'),
+                         ('health', (), {}))
+        self.assertEqual(client._batch_entry(('df', {'detail': 'detail'})),
+                         ('df', (), {'detail': 'detail'}))
+        self.assertEqual(client._batch_entry(('osd_pool_get',
+                                              ['kube-rbd', 'size'])),
+                         ('osd_pool_get', ('kube-rbd', 'size'), {}))
+        self.assertEqual(client._batch_entry(('osd_pool_get',
+                                              ('kube-rbd', 'size'),
+                                              {'body': 'text'})),
+                         ('osd_pool_get', ('kube-rbd', 'size'),
+                          {'body': 'text'}))
+
+    def test_invalid(self):
+        self.assertRaises(exception.CephClientTypeError,
+                          client._batch_entry, ('health', (), {}, None))
+        self.assertRaises(exception.CephClientTypeError,
+                          client._batch_entry, (None,))
+
+
+class TestSummarizeResult(unittest.TestCase):
+
+    def test_command(self):
+        result = dict(id='1', is_finished=True, has_failed=False,
+                      finished=[dict(outb='12345', outs='')], failed=[])
+        self.assertEqual(
+            client._summarize_result(dict(prefix='health'), result),
+            ('health', 'ok', 5))
+
+    def test_batch(self):
+        req_json = [[dict(prefix='health'), dict(prefix='df')]]
+        result = dict(id='1', is_finished=True, has_failed=True,
+                      finished=[dict(outb='123', outs='')],
+                      failed=[dict(outb='', outs='Error EINVAL')])
+        self.assertEqual(client._summarize_result(req_json, result),
+                         ('health, df', 'failed', 3))
+
+    def test_error(self):
+        result = dict(message='auth: Incorrect password')
+        self.assertEqual(
+            client._summarize_result(dict(prefix='health'), result),
+            ('health', 'error', 0))
+
+
+class TestCephClient(client_cases.ClientCases, unittest.TestCase):
+
+    def setUp(self):
+        super(TestCephClient, self).setUp()
+        patcher = mock.patch.object(
+            client.requests, 'Session',
+            side_effect=lambda: fakes.FakeSession(self.mgr))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def new_client(self, **kwargs):
+        return client.CephClient(**kwargs)
+
+    def wait(self, value):
+        return value
+
+    def connection_error(self):
+        return requests.ConnectionError('Connection refused')
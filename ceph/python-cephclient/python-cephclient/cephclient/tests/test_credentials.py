@@ -0,0 +1,85 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from cephclient import credentials
+from cephclient.tests import fakes
+
+
+class TestCredentialProvider(unittest.TestCase):
+
+    def setUp(self):
+        super(TestCredentialProvider, self).setUp()
+        self.source = fakes.FakeSource()
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.cache_file = os.path.join(self.tmpdir, 'credentials.json')
+
+    def test_values_reused_until_refresh(self):
+        provider = credentials.CredentialProvider(self.source)
+        self.assertEqual(provider.password('admin'), 'secret-1')
+        self.assertEqual(provider.password('admin'), 'secret-1')
+        self.assertEqual(provider.password('admin', refresh=True),
+                         'secret-2')
+        provider.service_url()
+        provider.service_url()
+        provider.certificate()
+        provider.certificate()
+        self.assertEqual(self.source.calls, [
+            'password', 'password', 'service_url', 'certificate'])
+
+    def test_moved_service_url_drops_certificate(self):
+        provider = credentials.CredentialProvider(self.source)
+        provider.service_url()
+        provider.certificate()
+        provider.service_url(refresh=True)
+        provider.certificate()
+        self.assertEqual(self.source.calls.count('certificate'), 1)
+        self.source.url = 'https://mgr-1:7999/'
+        self.assertEqual(provider.service_url(refresh=True),
+                         'https://mgr-1:7999/')
+        provider.certificate()
+        self.assertEqual(self.source.calls.count('certificate'), 2)
+
+    def test_cache_file(self):
+        provider = credentials.CredentialProvider(
+            self.source, cache_file=self.cache_file)
+        provider.password('admin')
+        provider.service_url()
+        provider.certificate()
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_file).st_mode),
+                         0o600)
+        self.assertEqual(os.listdir(self.tmpdir), ['credentials.json'])
+
+        source = fakes.FakeSource()
+        provider = credentials.CredentialProvider(
+            source, cache_file=self.cache_file)
+        self.assertEqual(provider.password('admin'), 'secret-1')
+        self.assertEqual(provider.service_url(), 'https://mgr-0:7999/')
+        self.assertEqual(provider.certificate(), b'CERTIFICATE')
+        self.assertEqual(source.calls, [])
+
+    def test_corrupt_cache_file_ignored(self):
+        with open(self.cache_file, 'w') as f:
+            json.dump(['not', 'a', 'dict'], f)
+        provider = credentials.CredentialProvider(
+            self.source, cache_file=self.cache_file)
+        self.assertEqual(provider.password('admin'), 'secret-1')
+        self.assertEqual(self.source.calls, ['password'])
+
+    def test_invalidate(self):
+        provider = credentials.CredentialProvider(
+            self.source, cache_file=self.cache_file)
+        provider.password('admin')
+        provider.invalidate()
+        self.assertFalse(os.path.exists(self.cache_file))
+        self.assertEqual(provider.password('admin'), 'secret-2')
@@ -11,6 +11,7 @@ from kubernetes import client
 from kubernetes import config
 import six
 
+from cephclient.client import _batch_entry
 from cephclient.client import CephClient
 from cephclient.exception import CephClientFunctionNotImplemented
 from cephclient.exception import CephClientInvalidOsdIdValue
@@ -279,6 +280,18 @@ class RookCephWrapper(RookCephClient):
     def _build_response(self, output):
         return {"output": output}
 
+    def execute_many(self, commands):
+        """Run several commands, as CephClient.execute_many does
+
+        The dashboard API has no batch request so the commands are
+        run one after the other.
+        """
+        results = []
+        for entry in commands:
+            name, args, kwargs = _batch_entry(entry)
+            results.append(getattr(self, name)(*args, **kwargs))
+        return results
+
     def health(self, detail=None, body='json', timeout=None):
         response, body_data = self.health_minimal(timeout=timeout)
         health = body_data.get("output", {}).get("health", {})
@@ -23,6 +23,8 @@ setuptools.setup(
     license='Apache-2.0',
     keywords='ceph rest api ceph-rest-api client library',
     install_requires=['ipaddress', 'requests', 'six'],
+    # cephclient.aio (AsyncCephClient)
+    extras_require={'async': ['aiohttp']},
     classifiers=[
         'License :: OSI Approved :: Apache Software License',
         'Development Status :: 1 - Alpha',
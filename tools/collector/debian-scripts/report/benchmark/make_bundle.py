@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# Synthetic collect bundle generator for the report tool benchmarks.
+#
+# Writes a bundle directory holding one host tgz per host, as collect
+# leaves them, of a configurable size: the number of controllers,
+# workers and storage hosts, the log lines each log file gets per
+# second, the seconds each log generation covers, how many rotated .gz
+# generations each log has and how many rows the fm database event_log
+# table holds.
+#
+# Most log lines are routine noise ; one in match_every is a message
+# one of the built-in plugins looks for, so the plugin outputs and the
+# correlator have work in proportion to the bundle size. The content
+# only depends on the parameters and the seed.
+#
+# Usage:
+#     ./make_bundle.py /tmp/bench                       # default size
+#     ./make_bundle.py /tmp/bench --workers 20 --rate 10 --rotations 4
+#
+########################################################################
+
+import argparse
+import gzip
+import os
+import random
+import shutil
+import sys
+import tarfile
+import tempfile
+import time
+
+# All generated logs end at the bundle collect time
+BUNDLE_TIME = "20250101.120000"
+BUNDLE_EPOCH = 1735732800  # 2025-01-01T12:00:00 UTC
+
+# Log files of each node type, relative to the host directory, with the
+# messages the plugins look for in them ; {peer} is another host
+CONTROLLER_LOGS = {
+    "var/log/sm.log": [
+        "sm: 00001 | Swact has started, host will be active",
+        "sm: 00002 | Swact update: this host is now active",
+        "sm: 00003 | Uncontrolled swact, Host from active to failed, "
+        "Peer from standby to active",
+        "sm: 00004 | Neighbor ({peer}) received event down ; "
+        "Neighbor {peer} is now in the down state",
+        "sm: 00005 | ERROR: sm_service_audit failed for service "
+        "(drbd-platform)",
+    ],
+    "var/log/sm-customer.log": [
+        "| swact | controller-0 | active | swact requested |",
+        "| service | active-failed  | disabling-failed  | "
+        "go-active-failed  |",
+    ],
+    "var/log/mtcAgent.log": [
+        "mtcAgent: Error : {peer} got GOENABLED Failed",
+        "mtcAgent: Error : {peer} configuration failed or incomplete",
+        "mtcAgent: Error : {peer} Mgmnt Heartbeat Loss",
+        "mtcAgent: {peer} Loss Of Communication for 5 seconds",
+        "mtcAgent: Info : {peer} is ENABLED",
+        "mtcAgent: allStateChange (update) Info : {peer} "
+        "locked-disabled-offline",
+        "mtcAgent: {peer} Graceful Recovery Wait (1200 secs)",
+        "mtcAgent: {peer} mtcCmd send operation failed ; "
+        "Failed to send message",
+    ],
+    "var/log/mtcClient.log": [
+        "mtcClient: Error : goenabled test FAILED",
+        "mtcClient: Connectivity Recovered ; mgmt network",
+    ],
+    "var/log/hbsAgent.log": [
+        "hbsAgent: {peer} Mgmnt Heartbeat Loss (1000 msec)",
+    ],
+    "var/log/hbsClient.log": [
+        "hbsClient: Error: pulse response FAILED",
+    ],
+    "var/log/pmond.log": [
+        "pmond: Error : process (sshd) failed ; restarting",
+        "pmond: sshd FAILED to restart",
+    ],
+    "var/log/lmond.log": [
+        "lmond: Error: link state query FAILED",
+    ],
+    "var/log/daemon.log": [
+        "systemd: Failed to run the puppet manifest",
+    ],
+    "var/log/puppet/latest/puppet.log": [
+        "puppet: Error: Could not apply the platform manifest",
+    ],
+}
+
+HOST_LOGS = {
+    name: CONTROLLER_LOGS[name]
+    for name in ("var/log/mtcClient.log", "var/log/hbsClient.log",
+                 "var/log/pmond.log", "var/log/lmond.log",
+                 "var/log/daemon.log", "var/log/puppet/latest/puppet.log")
+}
+
+# Routine lines the plugins do not look for
+NOISE = [
+    "kernel: eth0: link up ; rx {n} packets",
+    "systemd: Started session {n} of user sysadmin.",
+    "sm: {n} | audit of service (platform) complete",
+    "mtcAgent: {peer} inventory audit {n} ok",
+    "collectd: cpu usage {n} within threshold",
+    "sshd: Accepted publickey for sysadmin port {n}",
+]
+
+ALARM_IDS = ["100.101", "100.103", "200.001", "200.004", "200.011",
+             "400.001", "401.005", "750.002", "800.001", "900.001"]
+ACTIONS = ["set", "clear", "log"]
+SEVERITIES = ["critical", "major", "minor", "warning", "not-applicable"]
+
+
+def _timestamps(first, count, rate):
+    """Yields count "YYYY-MM-DDTHH:MM:SS.mmm" timestamps, rate a second,
+    from the epoch second first"""
+    second, text = None, None
+    for i in range(count):
+        if first + i // rate != second:
+            second = first + i // rate
+            text = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        yield "%s.%03d" % (text, i % rate * 1000 // rate)
+
+
+def _log_lines(rng, hostname, peers, messages, first, count, rate,
+               match_every):
+    """Yields the lines of one log generation"""
+    for stamp in _timestamps(first, count, rate):
+        if rng.randrange(match_every):
+            text = rng.choice(NOISE)
+        else:
+            text = rng.choice(messages)
+        text = text.format(peer=rng.choice(peers), n=rng.randrange(100000))
+        yield f"{stamp} {hostname} {text}\n"
+
+
+def _write_log(path, lines, compressed=False):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    opener = gzip.open if compressed else open
+    with opener(path, "wt") as file:
+        file.writelines(lines)
+
+
+def _write_fm_database(path, rng, hostnames, rows, first, last):
+    """Writes a fm database dump with rows event_log rows dated from
+    first to last, after an alarm table the reader has to skip"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write("--\n-- PostgreSQL database dump\n--\n\n")
+        file.write("COPY public.alarm (created_at, id, uuid, alarm_id) "
+                   "FROM stdin;\n")
+        for i in range(min(rows, 1000)):
+            file.write(f"2025-01-01\t{i}\tuuid-a{i}\t"
+                       f"{rng.choice(ALARM_IDS)}\n")
+        file.write("\\.\n\n")
+        file.write("COPY public.event_log (created_at, updated_at, "
+                   "deleted_at, id, uuid, event_log_id, state, "
+                   "reason_text, entity_instance_id, timestamp, "
+                   "severity, event_log_type) FROM stdin;\n")
+        step = (last - first) / max(rows, 1)
+        for i in range(rows):
+            date = time.strftime("%Y-%m-%d %H:%M:%S",
+                                 time.gmtime(first + int(i * step)))
+            if rng.randrange(10):
+                entity = f"host={rng.choice(hostnames)}"
+            else:
+                entity = "subsystem=vim"
+            file.write(f"{date}\t\\N\t\\N\t{i}\tuuid-e{i}\t"
+                       f"{rng.choice(ALARM_IDS)}\t{rng.choice(ACTIONS)}\t"
+                       f"synthetic event {i}\t{entity}\t{date}.000000\t"
+                       f"{rng.choice(SEVERITIES)}\tprocessing-error\n")
+        file.write("\\.\n")
+
+
+def _write_host(host_dir, rng, hostname, node_type, hostnames, logs,
+                active, options):
+    """Writes the files of one host directory"""
+    def write(name, text):
+        path = os.path.join(host_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            file.write(text)
+
+    write("var/extra/host.info",
+          f'  hostname => "{hostname}",\n'
+          f'  subfunction => "{node_type}",\n')
+    write("etc/platform/platform.conf",
+          "system_type=Standard\n"
+          "sw_version=25.09\n"
+          "system_mode=duplex\n"
+          f"nodetype={node_type}\n"
+          f"subfunction={node_type}\n"
+          "management_interface=vlan166\n")
+    write("etc/os-release", 'PRETTY_NAME="Debian GNU/Linux 11"\n')
+    write("etc/build.info",
+          'BUILD_TYPE="Formal"\n'
+          'BUILD_DATE="2024-12-01 00:00:00 +0000"\n')
+
+    rate = options["rate"]
+    period = options["period"]
+    count = rate * period
+    peers = [h for h in hostnames if h != hostname] or [hostname]
+    for name, messages in logs.items():
+        path = os.path.join(host_dir, name)
+        # the live log covers the last period, older generations the
+        # periods before it
+        for generation in range(options["rotations"] + 1):
+            first = BUNDLE_EPOCH - (generation + 1) * period
+            lines = _log_lines(rng, hostname, peers, messages, first,
+                               count, rate, options["match_every"])
+            if generation:
+                _write_log(f"{path}.{generation}.gz", lines, True)
+            else:
+                _write_log(path, lines)
+
+    if active:
+        first = BUNDLE_EPOCH - (options["rotations"] + 1) * period
+        _write_fm_database(
+            os.path.join(host_dir, "var/extra/database/fm.db.sql.txt"),
+            rng, hostnames, options["fm_rows"], first, BUNDLE_EPOCH)
+
+
+def make_bundle(directory, controllers=2, workers=2, storages=0,
+                rate=2, period=3600, rotations=2, fm_rows=20000,
+                match_every=500, seed=0, name="bench"):
+    """Writes a synthetic collect bundle
+
+    Parameters:
+        directory   (string): where to create the bundle directory
+        controllers (int): number of controller hosts
+        workers     (int): number of worker hosts
+        storages    (int): number of storage hosts
+        rate        (int): log lines per second in each log file
+        period      (int): seconds of log in each log generation
+        rotations   (int): rotated .gz generations of each log
+        fm_rows     (int): event_log rows of the active controller
+        match_every (int): one log line in this many is a plugin match
+        seed        (int): random seed
+        name        (string): bundle name, before its date
+
+    Returns:
+        bundle_dir (string): the bundle directory with the host tgz
+                             files, ready for 'report.py -b'
+    """
+    if controllers < 1:
+        raise ValueError("a bundle needs at least one controller")
+    if rate < 1 or period < 1 or match_every < 1:
+        raise ValueError("rate, period and match_every must be 1 or more")
+    options = {"rate": rate, "period": period, "rotations": rotations,
+               "fm_rows": fm_rows, "match_every": match_every}
+    rng = random.Random(seed)
+    hosts = ([(f"controller-{i}", "controller") for i in range(controllers)]
+             + [(f"compute-{i}", "worker") for i in range(workers)]
+             + [(f"storage-{i}", "storage") for i in range(storages)])
+    hostnames = [hostname for hostname, _ in hosts]
+
+    bundle_dir = os.path.join(directory, f"{name}_{BUNDLE_TIME}")
+    os.makedirs(bundle_dir)
+    staging = tempfile.mkdtemp(dir=directory)
+    try:
+        for hostname, node_type in hosts:
+            host_name = f"{hostname}_{BUNDLE_TIME}"
+            host_dir = os.path.join(staging, host_name)
+            logs = CONTROLLER_LOGS if node_type == "controller" else HOST_LOGS
+            _write_host(host_dir, rng, hostname, node_type, hostnames,
+                        logs, hostname == hostnames[0], options)
+            with tarfile.open(os.path.join(bundle_dir, host_name + ".tgz"),
+                              "w:gz", compresslevel=6) as tar:
+                tar.add(host_dir, arcname=host_name)
+            shutil.rmtree(host_dir)
+    finally:
+        shutil.rmtree(staging)
+    return bundle_dir
+
+
+def add_arguments(parser):
+    """Adds the bundle size options to an argparse parser"""
+    parser.add_argument("--controllers", type=int, default=2,
+                        help="Number of controller hosts (default: 2)")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="Number of worker hosts (default: 2)")
+    parser.add_argument("--storages", type=int, default=0,
+                        help="Number of storage hosts (default: 0)")
+    parser.add_argument("--rate", type=int, default=2,
+                        help="Log lines per second in each log file "
+                        "(default: 2)")
+    parser.add_argument("--period", type=int, default=3600,
+                        help="Seconds of log in each log generation "
+                        "(default: 3600)")
+    parser.add_argument("--rotations", type=int, default=2,
+                        help="Rotated .gz generations of each log "
+                        "(default: 2)")
+    parser.add_argument("--fm-rows", type=int, default=20000,
+                        help="Rows in the fm database event_log table "
+                        "(default: 20000)")
+    parser.add_argument("--match-every", type=int, default=500,
+                        help="One log line in this many is a plugin match "
+                        "(default: 500)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Random seed (default: 0)")
+
+
+def bundle_options(args):
+    """Returns the make_bundle() keyword arguments of parsed options"""
+    return {"controllers": args.controllers, "workers": args.workers,
+            "storages": args.storages, "rate": args.rate,
+            "period": args.period, "rotations": args.rotations,
+            "fm_rows": args.fm_rows, "match_every": args.match_every,
+            "seed": args.seed}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic collect bundle for the report "
+        "tool benchmarks")
+    parser.add_argument("directory",
+                        help="Directory to create the bundle in")
+    add_arguments(parser)
+    args = parser.parse_args()
+    os.makedirs(args.directory, exist_ok=True)
+    try:
+        bundle_dir = make_bundle(args.directory, **bundle_options(args))
+    except (ValueError, FileExistsError) as e:
+        sys.exit(f"Error: {e}")
+    print(bundle_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# Report tool benchmark harness.
+#
+# Runs the report tool on a synthetic collect bundle (see make_bundle.py)
+# or on an existing bundle directory of host tgz files, and records for
+# each stage its wall time, peak RSS and the bytes it read:
+#
+#   pipeline         ... report.py -b on a fresh copy of the bundle
+#   extract          ... host tgz extraction of the plugin files
+#   plugin:<name>    ... one built-in plugin on its own
+#   correlator       ... the correlator on the pipeline plugin outputs
+#   render           ... the html report of the pipeline output
+#
+# Each stage runs in a forked process, so its peak RSS is its own. The
+# bytes read are the 'rchar' count of /proc/self/io, which includes the
+# worker processes a stage waits for ; the peak RSS is that of the
+# largest process. With --repeat the fastest run of each stage is kept.
+#
+# The results are written as JSON and can be compared with an earlier
+# run, typically one of another commit, with --compare.
+#
+# Usage:
+#     ./run_benchmark.py -o base.json                 # default bundle
+#     ./run_benchmark.py -o new.json --compare base.json
+#     ./run_benchmark.py --bundle /path/to/bundle -j 4 --repeat 3
+#
+########################################################################
+
+import argparse
+import contextlib
+from datetime import datetime
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import traceback
+
+# don't generate __pycache__ dir and files
+sys.dont_write_bytecode = True
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPORT_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, REPORT_DIR)
+
+import bundle_reader  # noqa: E402
+from correlator import Correlator  # noqa: E402
+from execution_engine import ExecutionEngine  # noqa: E402
+from make_bundle import add_arguments  # noqa: E402
+from make_bundle import bundle_options  # noqa: E402
+from make_bundle import make_bundle  # noqa: E402
+from plugin import Plugin  # noqa: E402
+import render  # noqa: E402
+
+RESULTS_VERSION = 1
+
+# The analysis window covers any bundle
+START = "20000101"
+END = "20991231"
+
+# Metrics compared with --compare
+METRICS = ["wall_s", "peak_rss_kb", "read_bytes"]
+
+# Wall time changes smaller than this are timing noise, not regressions
+MIN_WALL_S_CHANGE = 0.05
+
+
+def _read_chars():
+    """Returns the bytes read by this process and its waited for
+    children, or None where /proc/self/io is not available"""
+    try:
+        with open("/proc/self/io") as file:
+            for line in file:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _peak_rss_kb():
+    """Returns the peak RSS of this process or its largest child"""
+    return max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+
+def _stage_process(conn, func, args):
+    """Runs func(*args) and sends its measurements through conn"""
+    try:
+        chars = _read_chars()
+        start = time.perf_counter()
+        with open(os.devnull, "w") as null:
+            with contextlib.redirect_stdout(null):
+                func(*args)
+        result = {"wall_s": round(time.perf_counter() - start, 4),
+                  "peak_rss_kb": _peak_rss_kb(),
+                  "read_bytes": None}
+        if chars is not None:
+            result["read_bytes"] = _read_chars() - chars
+    except BaseException:
+        result = {"error": traceback.format_exc(limit=-1).strip()}
+    conn.send(result)
+    conn.close()
+
+
+def measure(func, *args):
+    """Runs func(*args) in a forked process
+
+    Returns:
+        result (dict): the 'wall_s', 'peak_rss_kb' and 'read_bytes' of
+                       the run, or its 'error'
+    """
+    mp_context = multiprocessing.get_context("fork")
+    receiver, sender = mp_context.Pipe(duplex=False)
+    process = mp_context.Process(target=_stage_process,
+                                 args=(sender, func, args))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = {"error": "stage process died"}
+    process.join()
+    if process.exitcode and "error" not in result:
+        result = {"error": f"stage process exit code {process.exitcode}"}
+    return result
+
+
+def _best(results):
+    """Returns the fastest of the results of repeated runs"""
+    good = [result for result in results if "error" not in result]
+    if not good:
+        return results[-1]
+    return min(good, key=lambda result: result["wall_s"])
+
+
+def _copy_bundle(bundle, directory):
+    """Copies the host tgz files of a bundle into a new directory"""
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+    for entry in os.scandir(bundle):
+        if entry.is_file() and tarfile.is_tarfile(entry.path):
+            shutil.copy(entry.path, directory)
+
+
+def _du(path):
+    """Returns the bytes of the files under path"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def _run_pipeline(bundle_dir, jobs):
+    command = [sys.executable, os.path.join(REPORT_DIR, "report.py"),
+               "-b", bundle_dir, "--start", START, "--end", END,
+               "--jobs", str(jobs)]
+    result = subprocess.run(command, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, universal_newlines=True)
+    if result.returncode:
+        raise RuntimeError("report.py failed: " +
+                           result.stderr.strip()[-2000:])
+
+
+def _run_extract(bundle_dir, members, jobs):
+    tarballs = [entry.path for entry in os.scandir(bundle_dir)
+                if entry.is_file() and tarfile.is_tarfile(entry.path)]
+    bundle_reader.extract_hosts(tarballs, bundle_dir, members, jobs)
+
+
+def _run_plugin(engine, plugin, plugin_output_dir):
+    engine.run_plugins([plugin], plugin_output_dir,
+                       os.path.join(plugin_output_dir, "dropped_logs"))
+
+
+def _run_correlator(plugin_output_dir):
+    Correlator(plugin_output_dir).run("all")
+
+
+def _isoformat(date):
+    """Returns a YYYYMMDD date as report.py passes it to the engine"""
+    return datetime.strptime(date, "%Y%m%d").strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _git_commit():
+    """Returns the commit the report tool is run from, if known"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPORT_DIR,
+            stderr=subprocess.DEVNULL, universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _builtin_plugins():
+    plugins_dir = os.path.join(REPORT_DIR, "plugins")
+    return [Plugin(os.path.join(plugins_dir, name))
+            for name in sorted(os.listdir(plugins_dir))
+            if not name.startswith("_")]
+
+
+def run_benchmark(bundle, work_dir, jobs=1, repeat=1, log=print):
+    """Runs the benchmark stages on a bundle
+
+    Parameters:
+        bundle   (string): directory with the host tgz files
+        work_dir (string): scratch directory for the stage runs
+        jobs     (int): --jobs of the stages that run work in parallel
+        repeat   (int): runs of each stage ; the fastest is kept
+        log      (function): called with a progress line per stage
+
+    Returns:
+        stages (dict): stage name -> measurements, in run order
+    """
+    stages = {}
+
+    def run(name, setup, func, *args):
+        results = []
+        for _ in range(repeat):
+            if setup:
+                setup()
+            results.append(measure(func, *args))
+        stages[name] = _best(results)
+        log(format_stage(name, stages[name]))
+        return "error" not in stages[name]
+
+    plugins = _builtin_plugins()
+    members = bundle_reader.plugin_members(plugins)
+
+    # the full report ; its output feeds the correlator and render
+    pipeline_dir = os.path.join(work_dir, "pipeline")
+    pipeline_ok = run("pipeline",
+                      lambda: _copy_bundle(bundle, pipeline_dir),
+                      _run_pipeline, pipeline_dir, jobs)
+
+    extract_dir = os.path.join(work_dir, "extract")
+    run("extract", lambda: _copy_bundle(bundle, extract_dir),
+        _run_extract, extract_dir, members, jobs)
+
+    # plugins on their own, on the extracted copy
+    opts = argparse.Namespace(
+        start=_isoformat(START), end=_isoformat(END), jobs=jobs,
+        verbose=False, debug=False, hostname="all", no_cache=True)
+    engine_output_dir = os.path.join(work_dir, "plugin_output")
+    os.makedirs(engine_output_dir, exist_ok=True)
+    engine = ExecutionEngine(opts, extract_dir, engine_output_dir, members)
+    plugin_output_dir = os.path.join(engine_output_dir, "plugins")
+
+    def clean_plugin_output():
+        shutil.rmtree(plugin_output_dir, ignore_errors=True)
+        os.makedirs(plugin_output_dir)
+
+    for plugin in plugins:
+        run("plugin:" + os.path.basename(plugin.file), clean_plugin_output,
+            _run_plugin, engine, plugin, plugin_output_dir)
+
+    if pipeline_ok:
+        output_dir = os.path.join(pipeline_dir, "report_analysis")
+        run("correlator", None, _run_correlator,
+            os.path.join(output_dir, "plugins"))
+        run("render", None, render.main, pipeline_dir, output_dir)
+    return stages
+
+
+def format_stage(name, result):
+    if "error" in result:
+        return f"{name:<28} error: {result['error'].splitlines()[-1]}"
+    read_bytes = result["read_bytes"]
+    read_mb = "-" if read_bytes is None else f"{read_bytes / 2**20:.1f}"
+    return (f"{name:<28} {result['wall_s']:9.3f} s "
+            f"{result['peak_rss_kb'] / 1024:9.1f} MB rss "
+            f"{read_mb:>9} MB read")
+
+
+def compare(baseline, current, threshold):
+    """Compares the stages of two benchmark results
+
+    Parameters:
+        baseline  (dict): the earlier results
+        current   (dict): the results to check
+        threshold (float): percent increase of a metric that counts as
+                           a regression ; wall time also has to grow by
+                           MIN_WALL_S_CHANGE
+
+    Returns:
+        lines (list): a line per stage and metric with both values
+        regressions (list): the "stage metric" that regressed
+    """
+    lines, regressions = [], []
+    if baseline.get("bundle") != current.get("bundle"):
+        lines.append("warning: the results are of different bundles")
+    for name, result in current["stages"].items():
+        base = baseline["stages"].get(name)
+        if base is None or "error" in base or "error" in result:
+            continue
+        for metric in METRICS:
+            old, new = base.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) * 100.0 / old if old else 0.0
+            flag = ""
+            if change > threshold and (
+                    metric != "wall_s" or new - old >= MIN_WALL_S_CHANGE):
+                flag = " REGRESSION"
+                regressions.append(f"{name} {metric}")
+            lines.append(f"{name:<28} {metric:<12} {old:>14} -> "
+                         f"{new:<14} {change:+7.1f}%{flag}")
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the report tool stages on a synthetic or "
+        "given collect bundle")
+    parser.add_argument("--bundle", "-b",
+                        help="Bundle directory with host tgz files to use "
+                        "instead of generating one")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="--jobs of the report stages (default: 1)")
+    parser.add_argument("--repeat", "-r", type=int, default=1,
+                        help="Runs of each stage, keeping the fastest "
+                        "(default: 1)")
+    parser.add_argument("--output", "-o",
+                        help="File to write the JSON results to")
+    parser.add_argument("--compare", "-c",
+                        help="Earlier JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Percent increase that --compare reports as "
+                        "a regression (default: 10)")
+    parser.add_argument("--work-dir",
+                        help="Scratch directory, kept after the run "
+                        "(default: a temporary directory)")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.jobs < 1 or args.repeat < 1:
+        sys.exit("Error: --jobs and --repeat must be 1 or more")
+
+    # plugin algorithm warnings would interleave with the results
+    logging.basicConfig(level=logging.ERROR)
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="report_bench_")
+    os.makedirs(work_dir, exist_ok=True)
+    try:
+        if args.bundle:
+            bundle = os.path.abspath(args.bundle)
+            bundle_info = {"path": bundle}
+        else:
+            options = bundle_options(args)
+            print("Generating bundle: %s" % options)
+            bundle = make_bundle(os.path.join(work_dir, "bundle"), **options)
+            bundle_info = dict(options)
+        bundle_info["tgz_bytes"] = _du(bundle)
+
+        stages = run_benchmark(bundle, work_dir, args.jobs, args.repeat)
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    results = {
+        "version": RESULTS_VERSION,
+        "date": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "jobs": args.jobs,
+        "repeat": args.repeat,
+        "bundle": bundle_info,
+        "stages": stages,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+        print("Results: %s" % args.output)
+
+    errors = [name for name, result in stages.items() if "error" in result]
+    regressions = []
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        print("")
+        print("Compared with %s (commit %s):" %
+              (args.compare, baseline.get("commit")))
+        lines, regressions = compare(baseline, results, args.threshold)
+        for line in lines:
+            print(line)
+
+    if errors:
+        print("Failed stages: %s" % ", ".join(errors))
+    if regressions:
+        print("Regressions over %g%%: %s" %
+              (args.threshold, ", ".join(regressions)))
+    sys.exit(1 if errors or regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# This file contains the streaming collect bundle reader.
+#
+# Bundle and host tar files are read front to back with tarfile in
+# stream mode. Host tgz files are decompressed in parallel, one per
+# worker process, and only the members the loaded plugins and the
+# conftool domains read are written to disk: the plugin log files and
+# their rotations, the database dump used for alarms and the active
+# controller, and the var/extra .info files.
+#
+# A host directory extracted this way holds a MEMBERS_MARKER file that
+# records what was selected; a later run that needs more re-extracts
+# the host tgz, and a run with --extract-all extracts it in full.
+#
+########################################################################
+
+from concurrent.futures import ProcessPoolExecutor
+import json
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import tarfile
+
+import algorithms
+
+logger = logging.getLogger(__name__)
+
+# Records the member selection of a selectively extracted host dir
+MEMBERS_MARKER = ".report_members"
+
+# Files read for every host, whatever plugins are loaded:
+# host type, active controller and system info
+BASE_FILES = [
+    "var/extra/host.info",
+    "var/extra/database/fm.db.sql.txt",
+    "etc/platform/platform.conf",
+    "etc/os-release",
+    "etc/build.info",
+]
+
+# Files and directories read by the built-in algorithms
+ALGORITHM_FILES = {
+    algorithms.AUDIT: ["var/log/dcmanager/audit.log"],
+    algorithms.DAEMON_FAILURES: ["var/log/daemon.log"],
+    algorithms.HEARTBEAT_LOSS: ["var/log/hbsAgent.log"],
+    algorithms.MAINTENANCE_ERR: ["var/log/mtcAgent.log",
+                                 "var/log/mtcClient.log"],
+    algorithms.PROCESS_FAILURES: ["var/log/pmond.log"],
+    algorithms.STATE_CHANGES: ["var/log/mtcAgent.log"],
+    algorithms.SWACT_ACTIVITY: ["var/log/sm.log", "var/log/sm-customer.log"],
+}
+ALGORITHM_DIRS = {
+    algorithms.PUPPET_ERRORS: ["var/log/puppet"],
+}
+
+# The conftool domains also parse var/extra .info files that are not
+# in their INPUT_FILES (sm.info, coredump.info, alarms.info)
+CONFTOOL_PATTERNS = [r"var/extra/[^/]+\.info"]
+
+conftool_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "conftool")
+
+
+class MemberFilter:
+    """Selects host tgz members by their path below the host directory.
+
+    files    : exact paths ; rotations (file.N, file.N.gz) also match
+    dirs     : directories whose whole subtree matches
+    patterns : regular expressions matched against the full path
+    """
+
+    def __init__(self, files=(), dirs=(), patterns=()):
+        self.files = set(files)
+        self.dirs = set(dirs)
+        self.patterns = set(patterns)
+        alternatives = (
+            [re.escape(f) + r"(\.\d+(\.gz)?)?" for f in sorted(self.files)] +
+            [re.escape(d.rstrip("/")) + r"/.*" for d in sorted(self.dirs)] +
+            sorted(self.patterns))
+        self._regex = re.compile("|".join(alternatives) or r"(?!)")
+
+    def match(self, path):
+        """True if path (relative to the host dir) is selected"""
+        return self._regex.fullmatch(path) is not None
+
+    def covers(self, other):
+        """True if every selection of other is also one of this filter"""
+        return (other.files <= self.files and other.dirs <= self.dirs and
+                other.patterns <= self.patterns)
+
+    def union(self, other):
+        return MemberFilter(self.files | other.files,
+                            self.dirs | other.dirs,
+                            self.patterns | other.patterns)
+
+    def to_dict(self):
+        return {"files": sorted(self.files), "dirs": sorted(self.dirs),
+                "patterns": sorted(self.patterns)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("files", ()), data.get("dirs", ()),
+                   data.get("patterns", ()))
+
+
+def conftool_input_files():
+    """Returns the INPUT_FILES paths of all conftool domains"""
+
+    if not os.path.isdir(os.path.join(conftool_dir, "domains")):
+        return []
+    if conftool_dir not in sys.path:
+        sys.path.insert(0, conftool_dir)
+    try:
+        from domains import get_all_domains
+        return [path for _, domain in get_all_domains()
+                for _, path in domain.INPUT_FILES]
+    except ImportError as e:
+        logger.debug("conftool domains not loaded: %s", e)
+        return []
+
+
+def plugin_members(plugins):
+    """Returns the MemberFilter for what plugins and conftool read
+
+    Parameters:
+        plugins (Plugin list): the plugins that will run
+    """
+    files = list(BASE_FILES) + conftool_input_files()
+    dirs = []
+    for plugin in plugins:
+        alg = plugin.state["algorithm"]
+        if alg == algorithms.SUBSTRING:
+            files += plugin.state["files"]
+        files += ALGORITHM_FILES.get(alg, [])
+        dirs += ALGORITHM_DIRS.get(alg, [])
+    return MemberFilter([f.strip().lstrip("/") for f in files], dirs,
+                        CONFTOOL_PATTERNS)
+
+
+def list_members(tar_path):
+    """Returns the member names of a tar file, as 'tar tf' lists them
+
+    Directory names end with '/'.
+    """
+    with tarfile.open(tar_path, "r|*") as tar:
+        return [member.name + "/" if member.isdir() else member.name
+                for member in tar]
+
+
+def _safe_name(name):
+    """True if name stays inside the extraction directory"""
+    parts = name.split("/")
+    return not (name.startswith("/") or ".." in parts)
+
+
+def _extract_member(tar, member, dest_dir):
+    """Extracts the current member of a stream mode tar file"""
+    if hasattr(tarfile, "tar_filter"):
+        tar.extract(member, dest_dir, set_attrs=True, filter="tar")
+    else:
+        tar.extract(member, dest_dir, set_attrs=True)
+
+
+def _same_file(member, path):
+    """True if path already holds the regular file member"""
+    return (member.isreg() and os.path.isfile(path) and
+            os.path.getsize(path) == member.size)
+
+
+def extract_tar(tar_path, dest_dir, members=None):
+    """Extracts a tar file front to back into dest_dir
+
+    Regular files already present with the same size are skipped, so
+    extracting a bundle again only writes what is missing.
+
+    Parameters:
+        tar_path (string): the tar or tgz file
+        dest_dir (string): the directory to extract to
+        members (MemberFilter): select members by their path below
+                                the top level directory ; None for all
+
+    Returns:
+        messages (list): a line per member that could not be extracted
+    """
+    messages = []
+    with tarfile.open(tar_path, "r|*") as tar:
+        for member in tar:
+            if not _safe_name(member.name):
+                messages.append(f"{tar_path}: skipping unsafe member "
+                                f"{member.name}\n")
+                continue
+            if members is not None:
+                if not member.isreg():
+                    continue
+                relpath = member.name.split("/", 1)[-1]
+                if not members.match(relpath):
+                    continue
+            if _same_file(member, os.path.join(dest_dir, member.name)):
+                continue
+            try:
+                _extract_member(tar, member, dest_dir)
+            except (tarfile.TarError, OSError) as e:
+                messages.append(f"{tar_path}: {member.name}: {e}\n")
+    return messages
+
+
+def _read_marker(host_dir):
+    """Returns the MemberFilter a host dir was extracted with
+
+    None if the host dir was extracted in full.
+    """
+    try:
+        with open(os.path.join(host_dir, MEMBERS_MARKER)) as f:
+            return MemberFilter.from_dict(json.load(f))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("unreadable %s in %s: %s", MEMBERS_MARKER, host_dir, e)
+        return MemberFilter()
+
+
+def _extract_host(tar_path, dest_dir, members):
+    """Extracts or completes one host tgz ; a work unit
+
+    Parameters:
+        tar_path (string): the host tgz file
+        dest_dir (string): the bundle directory holding the host dirs
+        members (dict): MemberFilter.to_dict() ; None for all members
+
+    Returns:
+        messages (list): lines for untar.log
+    """
+    host_dir = os.path.join(dest_dir,
+                            os.path.splitext(os.path.basename(tar_path))[0])
+    wanted = MemberFilter.from_dict(members) if members is not None else None
+    if os.path.isdir(host_dir):
+        extracted = _read_marker(host_dir)
+        if extracted is None:
+            return []
+        if wanted is not None:
+            if extracted.covers(wanted):
+                return []
+            wanted = extracted.union(wanted)
+
+    logger.info("extracting : %s", tar_path)
+    try:
+        messages = extract_tar(tar_path, dest_dir, wanted)
+    except (tarfile.TarError, OSError) as e:
+        return [f"{tar_path}: {e}\n"]
+
+    marker = os.path.join(host_dir, MEMBERS_MARKER)
+    if wanted is None:
+        if os.path.exists(marker):
+            os.remove(marker)
+    elif os.path.isdir(host_dir):
+        with open(marker, "w") as f:
+            json.dump(wanted.to_dict(), f)
+    return messages
+
+
+def extract_hosts(tar_paths, dest_dir, members=None, jobs=1, logfile=None):
+    """Extracts host tgz files, in parallel with jobs > 1
+
+    Host dirs already extracted with everything members selects are
+    left alone.
+
+    Parameters:
+        tar_paths (list): the host tgz files
+        dest_dir (string): the bundle directory to extract them to
+        members (MemberFilter): what to extract ; None for everything
+        jobs (int): number of worker processes
+        logfile (file): where to log members that failed to extract
+    """
+    spec = members.to_dict() if members is not None else None
+    units = [(tar_path, dest_dir, spec) for tar_path in tar_paths]
+    if jobs <= 1 or len(units) <= 1:
+        results = [_extract_host(*unit) for unit in units]
+    else:
+        mp_context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=min(jobs, len(units)),
+                                 mp_context=mp_context) as pool:
+            futures = [pool.submit(_extract_host, *unit) for unit in units]
+            results = [future.result() for future in futures]
+
+    for messages in results:
+        for message in messages:
+            logger.debug(message.rstrip())
+            if logfile:
+                logfile.write(message)
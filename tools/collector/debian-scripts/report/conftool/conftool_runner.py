@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+# Conftool Library Entry Point
+#
+# Runs the load -> summarize -> output pipeline in-process, for one
+# host (process_host) or for all hosts of a bundle, each on a worker
+# process when they run in parallel or with a timeout (process_bundle). The domains of a host share one parse of
+# each .info file through host_utils.read_info_sections. A bundle run
+# also writes index.json, listing the outputs and cross-check results
+# of every host.
+########################################################################
+
+import json
+import multiprocessing
+from multiprocessing import connection
+import os
+import sys
+import time
+
+# Don't produce a __pycache__ dir
+sys.dont_write_bytecode = True
+
+from domains import get_all_domains           # noqa: E402
+from domains import get_domain                # noqa: E402
+from host_utils import clear_info_cache       # noqa: E402
+from host_utils import extract_host_identity  # noqa: E402
+from host_utils import find_host_dir          # noqa: E402
+from host_utils import get_verbose_level      # noqa: E402
+
+INDEX_FILE = 'index.json'
+
+
+def resolve_domains(domain_names=None):
+    """Return (name, domain) pairs for domain_names, or all domains."""
+    if domain_names:
+        return [(name, get_domain(name))
+                for name in dict.fromkeys(domain_names)]
+    return get_all_domains()
+
+
+def process_host(bundle, hostname, domain_names=None, output_base=None):
+    """Load, summarize and write the configuration of one host.
+
+    Args:
+        bundle: Path to the collect bundle directory.
+        hostname: Hostname to load (e.g. "controller-0").
+        domain_names: Domains to process (default: all).
+        output_base: Output base directory (default: <bundle>/config).
+            Files are written to <output_base>/<hostname>/.
+
+    Returns:
+        dict with the host 'host_dir', 'collected' timestamp, the
+        'files' written, the combined 'text_lines' of all domains, the
+        number of 'warnings' and the domains with 'failed_checks'.
+        'host_dir' is None, and nothing written, if the host has no
+        directory in the bundle.
+    """
+    result = {'hostname': hostname, 'host_dir': None, 'collected': '',
+              'files': [], 'text_lines': [], 'warnings': 0,
+              'failed_checks': []}
+    host_dir = find_host_dir(bundle, hostname)
+    if not host_dir:
+        return result
+    result['host_dir'] = host_dir
+    domains = resolve_domains(domain_names)
+
+    # Build raw config (shared across domains)
+    clear_info_cache()
+    host_name, collected = extract_host_identity(host_dir)
+    config = {'hostname': host_name, 'collected': collected, 'warnings': []}
+    result['collected'] = collected
+
+    # Load all requested domains
+    for _name, domain in domains:
+        domain.load_config(host_dir, config)
+    clear_info_cache()
+
+    if get_verbose_level() >= 2:
+        ifaces = [i for i in config.get('interfaces', []) if i['name'] != 'lo']
+        pods = config.get('pod_interfaces', [])
+        up = sum(1 for i in ifaces if i['state'] == 'UP')
+        print(f"  Parsed: {len(ifaces)} interfaces ({up} UP), "
+              f"{len(pods)} pod veths, "
+              f"{len(config.get('warnings', []))} warnings")
+    result['warnings'] = len(config.get('warnings', []))
+
+    # Build summaries and write outputs
+    output_base = output_base or os.path.join(bundle, 'config')
+    output_dir = os.path.join(output_base, hostname)
+    os.makedirs(output_dir, exist_ok=True)
+
+    for name, domain in domains:
+        summary = domain.build_summary(config)
+
+        # JSON
+        json_path = os.path.join(output_dir, f'{domain.FILE_PREFIX}.json')
+        domain.write_json(summary, json_path)
+
+        # Text
+        text_lines = []
+        domain.write_text(summary, text_lines)
+        result['text_lines'].extend(text_lines)
+
+        text_path = os.path.join(output_dir, f'{domain.FILE_PREFIX}.txt')
+        text_content = '\n'.join(text_lines) + '\n'
+        with open(text_path, 'w') as f:
+            f.write(text_content)
+        result['files'] += [json_path, text_path]
+
+        # Track cross-check failures
+        checks = summary.get('cross_check', [])
+        if any(c['status'] == 'FAIL' for c in checks):
+            result['failed_checks'].append(name)
+
+    return result
+
+
+def _process_host(bundle, hostname, domain_names, output_base):
+    """process_host() as a work unit: errors are returned, not raised."""
+    try:
+        return process_host(bundle, hostname, domain_names, output_base)
+    except Exception as e:
+        return {'hostname': hostname, 'error': f"{type(e).__name__}: {e}"}
+
+
+def process_bundle(bundle, hostnames, domain_names=None, output_base=None,
+                   jobs=1, timeout=None):
+    """Process several hosts of a bundle and write the bundle index.
+
+    Without a timeout and with jobs <= 1 the hosts are processed in
+    this process, one after the other. Otherwise each host runs on its
+    own forked worker process, jobs at a time, and a worker still
+    running timeout seconds after it started is terminated. A host that
+    fails or times out is recorded in the index with its 'error' rather
+    than stopping the others.
+
+    Args:
+        bundle: Path to the collect bundle directory.
+        hostnames: Hostnames to process.
+        domain_names: Domains to process (default: all).
+        output_base: Output base directory (default: <bundle>/config).
+        jobs: Number of worker processes.
+        timeout: Seconds each host may run (default: no limit).
+
+    Returns:
+        List of the process_host() results, in hostnames order, without
+        their 'text_lines'.
+    """
+    output_base = output_base or os.path.join(bundle, 'config')
+    units = [(bundle, hostname, domain_names, output_base)
+             for hostname in hostnames]
+    if timeout is None and (jobs <= 1 or len(units) <= 1):
+        results = [_process_host(*unit) for unit in units]
+    else:
+        results = _run_workers(units, max(1, jobs), timeout)
+
+    for result in results:
+        result.pop('text_lines', None)
+    write_index(results, bundle, domain_names, output_base)
+    return results
+
+
+def _host_worker(sender, *unit):
+    """Worker process entry point: send the _process_host() result."""
+    sender.send(_process_host(*unit))
+    sender.close()
+
+
+def _run_workers(units, jobs, timeout):
+    """Run _process_host() for each unit on its own forked worker, at
+    most jobs at a time, and return the results in units order.
+
+    A worker still running timeout seconds after it started is
+    terminated and its host gets an error result, as does a worker
+    that exits without a result.
+    """
+    mp_context = multiprocessing.get_context('fork')
+    results = [None] * len(units)
+    waiting = list(enumerate(units))
+    running = {}    # index -> (process, receiver, started)
+    while waiting or running:
+        while waiting and len(running) < jobs:
+            index, unit = waiting.pop(0)
+            receiver, sender = mp_context.Pipe(duplex=False)
+            process = mp_context.Process(target=_host_worker,
+                                         args=(sender,) + unit)
+            process.start()
+            sender.close()
+            running[index] = (process, receiver, time.monotonic())
+
+        wait_for = None
+        if timeout is not None:
+            first = min(started for _, _, started in running.values())
+            wait_for = max(0, first + timeout - time.monotonic())
+        ready = connection.wait([receiver for _, receiver, _
+                                 in running.values()], wait_for)
+
+        now = time.monotonic()
+        for index, (process, receiver, started) in list(running.items()):
+            hostname = units[index][1]
+            if receiver in ready:
+                try:
+                    results[index] = receiver.recv()
+                except EOFError:
+                    process.join()
+                    results[index] = {
+                        'hostname': hostname,
+                        'error': f"worker exited with code "
+                                 f"{process.exitcode}"}
+            elif timeout is not None and now - started >= timeout:
+                process.terminate()
+                results[index] = {
+                    'hostname': hostname,
+                    'error': f"timed out after {timeout} seconds"}
+            else:
+                continue
+            process.join()
+            receiver.close()
+            del running[index]
+    return results
+
+
+def write_index(results, bundle, domain_names, output_base):
+    """Write the bundle-level index of process_bundle() results.
+
+    File paths are relative to output_base.
+    """
+    hosts = []
+    for result in results:
+        entry = dict(result)
+        if 'files' in entry:
+            entry['files'] = [os.path.relpath(path, output_base)
+                              for path in entry['files']]
+        hosts.append(entry)
+    index = {
+        'bundle': os.path.abspath(bundle),
+        'domains': [name for name, _ in resolve_domains(domain_names)],
+        'hosts': hosts,
+    }
+    os.makedirs(output_base, exist_ok=True)
+    with open(os.path.join(output_base, INDEX_FILE), 'w') as f:
+        json.dump(index, f, indent=2)
+        f.write('\n')
@@ -24,7 +24,7 @@ import sys
 sys.dont_write_bytecode = True
 
 from host_utils import note_source          # noqa: E402
-from host_utils import parse_info_sections  # noqa: E402
+from host_utils import read_info_sections   # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -168,8 +168,7 @@ def _parse_node_conditions(text, config):
 def _load_kube_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -221,8 +220,7 @@ def _parse_helm_list(text, config):
 def _load_helm_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -274,8 +272,7 @@ def _parse_crictl_info(text, config):
 def _load_host_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -364,8 +361,7 @@ def _parse_kube_events_table(text, config):
 def _load_events_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -391,8 +387,7 @@ def _load_images_info(path, config):
     """Parse containerization_images.info for disk usage."""
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -27,7 +27,7 @@ sys.dont_write_bytecode = True
 
 from host_utils import human_bytes          # noqa: E402
 from host_utils import note_source          # noqa: E402
-from host_utils import parse_info_sections  # noqa: E402
+from host_utils import read_info_sections   # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -360,8 +360,7 @@ def _note_source(config, path):
 def _load_networking_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if sections:
         _note_source(config, path)
         _dispatch_network_sections(sections, config)
@@ -418,8 +417,7 @@ def _load_interface_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
     _note_source(config, path)
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     phys_names = {i['name'] for i in config.get('interfaces', [])}
     for cmd, output in sections.items():
         m = re.match(r'ethtool (\S+)$', cmd)
@@ -626,8 +624,7 @@ def _load_sm_info_fallback(path, config):
     """
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if sections:
         _note_source(config, path)
         _dispatch_network_sections(sections, config)
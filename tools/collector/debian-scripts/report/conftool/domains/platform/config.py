@@ -23,7 +23,7 @@ sys.dont_write_bytecode = True
 
 from host_utils import human_bytes          # noqa: E402
 from host_utils import note_source          # noqa: E402
-from host_utils import parse_info_sections  # noqa: E402
+from host_utils import read_info_sections   # noqa: E402
 
 
 def _note_source(config, path):
@@ -185,8 +185,7 @@ def _parse_sensor_list(text, config):
 def _load_bmc_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
     for cmd, output in sections.items():
@@ -202,8 +201,7 @@ def _load_bmc_info(path, config):
 def _load_host_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -238,8 +236,7 @@ def _load_host_info(path, config):
 def _load_memory_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -272,8 +269,7 @@ def _load_process_info(path, config):
         return
     if 'top_rss_procs' in config:
         return  # already got from memory.info
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -290,8 +286,7 @@ def _load_process_info(path, config):
 def _load_sm_info_fallback(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -329,8 +324,7 @@ def _load_sm_services(path, config):
     """Parse sm-dump from sm.info for service group states."""
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -380,8 +374,7 @@ def _load_alarms_info(path, config):
     """Parse fm alarm-list from alarms.info for active alarms."""
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -23,7 +23,7 @@ import sys
 sys.dont_write_bytecode = True
 
 from host_utils import note_source          # noqa: E402
-from host_utils import parse_info_sections  # noqa: E402
+from host_utils import read_info_sections   # noqa: E402
 
 
 def _note_source(config, path):
@@ -121,8 +121,7 @@ def _parse_software_show(text, release_id, config):
 def _load_usm_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -170,8 +169,7 @@ def _load_ostree_info(path, config):
     """Parse ostree admin status for active/rollback deployments."""
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -22,7 +22,7 @@ import sys
 sys.dont_write_bytecode = True
 
 from host_utils import note_source          # noqa: E402
-from host_utils import parse_info_sections  # noqa: E402
+from host_utils import read_info_sections   # noqa: E402
 
 
 def _note_source(config, path):
@@ -150,8 +150,7 @@ def _parse_ceph_osd_dump(text, config):
 def _load_ceph_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -308,8 +307,7 @@ def _parse_pvs(text, config):
 def _load_filesystem_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -405,8 +403,7 @@ def _parse_smartctl(text, device, config):
 def _load_disk_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -468,8 +465,7 @@ def _parse_lsblk_scsi(text, config):
 def _load_blockdev_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -492,8 +488,7 @@ def _load_blockdev_info(path, config):
 def _load_iscsi_info(path, config):
     if not os.path.isfile(path) or os.path.getsize(path) == 0:
         return
-    with open(path) as f:
-        sections = parse_info_sections(f.read())
+    sections = read_info_sections(path)
     if not sections:
         return
 
@@ -12,7 +12,9 @@
 # helpers, and host directory discovery for collect bundles.
 ########################################################################
 
+from collections.abc import Mapping
 import glob
+import mmap
 import os
 import re
 import sys
@@ -42,6 +44,64 @@ def get_verbose_level():
 # ---------------------------------------------------------------------------
 
 
+# Match any line containing " : ... : <command>" with a leading
+# date-like prefix (3-letter weekday followed by date tokens).
+_CMD_LINE = re.compile(r'^\w{3}\s+.+?\s+:\s+\S*\s*:\s+(.+)$')
+
+
+def _separator_lines(buf):
+    """Return (start, end) of each separator line of a .info buffer.
+
+    A separator line is four or more dashes, surrounding whitespace
+    ignored. Only the lines holding a '----' are looked at.
+    """
+    if isinstance(buf, str):
+        newline, dashes = '\n', '----'
+    else:
+        newline, dashes = b'\n', b'----'
+    seps = []
+    pos = buf.find(dashes)
+    while pos >= 0:
+        start = buf.rfind(newline, 0, pos) + 1
+        end = buf.find(newline, pos)
+        if end < 0:
+            end = len(buf)
+        if not buf[start:end].strip().strip(dashes[0:1]):
+            seps.append((start, end))
+        pos = buf.find(dashes, end)
+    return seps
+
+
+def _index_sections(buf, decode):
+    """Yield (command, start, end) for each section of a .info buffer.
+
+    A section is a header line between two separator lines, followed by
+    its output up to the next separator line. buf is a str, or bytes or
+    an mmap with decode() turning a header line into a str; start and
+    end delimit the output text in buf. Only the separator and header
+    lines are looked at, not the output lines.
+    """
+    newline = '\n' if isinstance(buf, str) else b'\n'
+    size = len(buf)
+    seps = _separator_lines(buf)
+    k = 0
+    while k + 1 < len(seps):
+        header_start = seps[k][1] + 1
+        header_end = buf.find(newline, header_start)
+        next_start, next_end = seps[k + 1]
+        m = None
+        if header_end >= 0 and header_end + 1 == next_start:
+            m = _CMD_LINE.match(decode(buf[header_start:header_end]).strip())
+        if not m:
+            k += 1
+            continue
+        start = next_end + 1
+        # The output ends at the newline before the next separator line
+        end = seps[k + 2][0] - 1 if k + 2 < len(seps) else size
+        yield m.group(1).strip(), start, max(start, end)
+        k += 2
+
+
 def parse_info_sections(text):
     """Split a ---- delimited .info file into {command_string: output_text}.
 
@@ -58,33 +118,86 @@ def parse_info_sections(text):
     Returns:
         dict mapping command strings to their output text.
     """
-    sections = {}
-    lines = text.split('\n')
-    i = 0
-    sep = re.compile(r'^-{4,}$')
-    # Match any line containing " : ... : <command>" with a leading
-    # date-like prefix (3-letter weekday followed by date tokens).
-    cmd_re = re.compile(
-        r'^\w{3}\s+.+?\s+:\s+\S*\s*:\s+(.+)$'
-    )
+    return {cmd: text[start:end]
+            for cmd, start, end in _index_sections(text, str)}
+
+
+def _decode(data):
+    return data.decode('utf-8', 'replace')
+
+
+class InfoSections(Mapping):
+    """The sections of a .info file, as parse_info_sections() returns them.
+
+    The file is memory mapped and scanned once for its section headers,
+    giving {command: (offset, length)}; the output text of a section is
+    only decoded when it is first looked up.
+    """
+
+    def __init__(self, path):
+        self._index = {}  # command -> (start, end) in self._buf
+        self._text = {}   # command -> output text decoded so far
+        self._buf = None
+        if not os.path.getsize(path):
+            return
+        with open(path, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if buf.find(b'\r') >= 0:
+            # Text mode reads a \r as a line break; parse as it does
+            buf.close()
+            with open(path) as f:
+                self._text = parse_info_sections(f.read())
+            self._index = dict.fromkeys(self._text)
+            return
+        self._buf = buf
+        for cmd, start, end in _index_sections(buf, _decode):
+            self._index[cmd] = (start, end)
+
+    def __getitem__(self, cmd):
+        text = self._text.get(cmd)
+        if text is None:
+            start, end = self._index[cmd]
+            text = self._text[cmd] = _decode(self._buf[start:end])
+        return text
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return f"InfoSections({dict(self)!r})"
+
+
+# Sections of the .info files read so far, so that all domains of a
+# host share one index of each file: path -> (stat key, InfoSections)
+_info_cache = {}
+
+
+def read_info_sections(path):
+    """Return the sections of a .info file, indexing it once.
+
+    Later calls for the same path return the same InfoSections, as long
+    as the file size and modification time are unchanged.
+
+    Args:
+        path: Path to the .info file.
+
+    Returns:
+        InfoSections mapping command strings to their output text.
+    """
+    st = os.stat(path)
+    key = (st.st_size, st.st_mtime_ns)
+    cached = _info_cache.get(path)
+    if cached is None or cached[0] != key:
+        cached = _info_cache[path] = (key, InfoSections(path))
+    return cached[1]
+
 
-    while i < len(lines):
-        if sep.match(lines[i].strip()):
-            if i + 2 < len(lines) and sep.match(lines[i + 2].strip()):
-                m = cmd_re.match(lines[i + 1].strip())
-                if m:
-                    cmd = m.group(1).strip()
-                    i += 3
-                    output_lines = []
-                    while i < len(lines) and not sep.match(
-                            lines[i].strip()):
-                        output_lines.append(lines[i])
-                        i += 1
-                    sections[cmd] = '\n'.join(output_lines)
-                    continue
-        i += 1
-
-    return sections
+def clear_info_cache():
+    """Forget the files read_info_sections() has indexed."""
+    _info_cache.clear()
 
 # ---------------------------------------------------------------------------
 # Formatting helpers
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# This file contains the unit tests for the conftool library entry
+# point (conftool_runner.py).
+#
+#
+########################################################################
+"""Tests for in-process, multi-host conftool runs (conftool_runner.py)."""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+CONFTOOL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CONFTOOL_DIR)
+sys.path.insert(0, os.path.join(CONFTOOL_DIR, 'test'))
+
+import conftool_runner                      # noqa: E402
+from conftool_runner import INDEX_FILE      # noqa: E402
+from conftool_runner import process_bundle  # noqa: E402
+from conftool_runner import process_host    # noqa: E402
+from mock_factory import create_bundle      # noqa: E402
+
+HOSTNAMES = ['controller-0', 'controller-1', 'compute-0']
+
+_process_host = conftool_runner.process_host
+
+
+def _hang_on_compute(bundle, hostname, *args):
+    if hostname == 'compute-0':
+        time.sleep(60)
+    return _process_host(bundle, hostname, *args)
+
+
+def _slow_host(bundle, hostname, *args):
+    time.sleep(1.5)
+    return _process_host(bundle, hostname, *args)
+
+
+def _exit_on_compute(bundle, hostname, *args):
+    if hostname == 'compute-0':
+        os._exit(3)
+    return _process_host(bundle, hostname, *args)
+
+
+class TestRunner(unittest.TestCase):
+    """Test process_host and process_bundle."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.bundle_dir = self.temp_dir
+        for hostname in HOSTNAMES:
+            create_bundle(self.bundle_dir, hostname=hostname)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _read_outputs(self, output_base):
+        outputs = {}
+        for root, _, names in os.walk(output_base):
+            for name in names:
+                if name == INDEX_FILE:
+                    continue
+                path = os.path.join(root, name)
+                with open(path) as f:
+                    outputs[os.path.relpath(path, output_base)] = f.read()
+        return outputs
+
+    def test_process_host(self):
+        """One host is written under <bundle>/config/<hostname>."""
+        result = process_host(self.bundle_dir, 'controller-1', ['network'])
+        self.assertTrue(result['host_dir'].endswith('controller-1_'
+                                                    '20250211.212225'))
+        self.assertEqual(result['collected'], '20250211.212225')
+        self.assertEqual(
+            [os.path.relpath(path, self.bundle_dir)
+             for path in result['files']],
+            ['config/controller-1/network_config.json',
+             'config/controller-1/network_config.txt'])
+        self.assertTrue(result['text_lines'])
+
+    def test_missing_host(self):
+        """A host without a directory writes nothing."""
+        result = process_host(self.bundle_dir, 'storage-0')
+        self.assertIsNone(result['host_dir'])
+        self.assertEqual(result['files'], [])
+
+    def test_bundle_index(self):
+        """process_bundle writes a host entry per host to index.json."""
+        results = process_bundle(self.bundle_dir, HOSTNAMES + ['storage-0'])
+        self.assertEqual([r['hostname'] for r in results],
+                         HOSTNAMES + ['storage-0'])
+        with open(os.path.join(self.bundle_dir, 'config', INDEX_FILE)) as f:
+            index = json.load(f)
+        self.assertEqual(index['domains'], ['network', 'container',
+                                            'software', 'platform',
+                                            'storage'])
+        hosts = {host['hostname']: host for host in index['hosts']}
+        self.assertIn('controller-0/platform_config.json',
+                      hosts['controller-0']['files'])
+        self.assertEqual(len(hosts['compute-0']['files']), 10)
+        self.assertIsNone(hosts['storage-0']['host_dir'])
+
+    def test_parallel_matches_serial(self):
+        """Hosts processed on worker processes give the same outputs."""
+        serial = os.path.join(self.temp_dir, 'serial')
+        parallel = os.path.join(self.temp_dir, 'parallel')
+        process_bundle(self.bundle_dir, HOSTNAMES, output_base=serial)
+        process_bundle(self.bundle_dir, HOSTNAMES, output_base=parallel,
+                       jobs=3)
+        outputs = self._read_outputs(serial)
+        self.assertEqual(len(outputs), 30)
+        self.assertEqual(self._read_outputs(parallel), outputs)
+
+    def test_parallel_timeout(self):
+        """A host still running after timeout is recorded as an error."""
+        started = time.time()
+        with mock.patch.object(conftool_runner, 'process_host',
+                               _hang_on_compute):
+            results = process_bundle(self.bundle_dir, HOSTNAMES, jobs=3,
+                                     timeout=2)
+        self.assertLess(time.time() - started, 30)
+        errors = {r['hostname']: r.get('error') for r in results}
+        self.assertEqual(errors, {'controller-0': None,
+                                  'controller-1': None,
+                                  'compute-0': 'timed out after 2 seconds'})
+        with open(os.path.join(self.bundle_dir, 'config', INDEX_FILE)) as f:
+            hosts = json.load(f)['hosts']
+        self.assertEqual(hosts[2]['error'], 'timed out after 2 seconds')
+
+    def test_serial_timeout(self):
+        """With jobs=1 a timeout still runs hosts on worker processes."""
+        started = time.time()
+        with mock.patch.object(conftool_runner, 'process_host',
+                               _hang_on_compute):
+            results = process_bundle(self.bundle_dir, HOSTNAMES, timeout=2)
+        self.assertLess(time.time() - started, 30)
+        errors = {r['hostname']: r.get('error') for r in results}
+        self.assertEqual(errors, {'controller-0': None,
+                                  'controller-1': None,
+                                  'compute-0': 'timed out after 2 seconds'})
+
+    def test_timeout_counts_from_host_start(self):
+        """Each host gets timeout seconds from when its worker starts."""
+        with mock.patch.object(conftool_runner, 'process_host',
+                               _slow_host):
+            results = process_bundle(self.bundle_dir, HOSTNAMES, jobs=2,
+                                     timeout=2.5)
+        self.assertEqual([r.get('error') for r in results],
+                         [None, None, None])
+        self.assertEqual([r['hostname'] for r in results], HOSTNAMES)
+
+    def test_worker_exit(self):
+        """A worker that dies without a result is recorded as an error."""
+        with mock.patch.object(conftool_runner, 'process_host',
+                               _exit_on_compute):
+            results = process_bundle(self.bundle_dir, HOSTNAMES, jobs=2,
+                                     timeout=30)
+        errors = {r['hostname']: r.get('error') for r in results}
+        self.assertEqual(errors, {'controller-0': None,
+                                  'controller-1': None,
+                                  'compute-0': 'worker exited with code 3'})
+
+
+if __name__ == '__main__':
+    unittest.main()
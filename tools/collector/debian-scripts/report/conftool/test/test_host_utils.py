@@ -24,8 +24,10 @@ sys.path.insert(0, CONFTOOL_DIR)
 from host_utils import extract_host_identity   # noqa: E402
 from host_utils import find_host_dir           # noqa: E402
 from host_utils import human_bytes             # noqa: E402
+from host_utils import InfoSections            # noqa: E402
 from host_utils import note_source             # noqa: E402
 from host_utils import parse_info_sections     # noqa: E402
+from host_utils import read_info_sections      # noqa: E402
 from host_utils import set_verbose_level       # noqa: E402
 
 
@@ -188,6 +190,65 @@ class TestHumanBytes(unittest.TestCase):
         self.assertEqual(human_bytes(0), '0B')
 
 
+class TestReadInfoSections(unittest.TestCase):
+    """Test the shared parse of .info files."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'test.info')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, output):
+        with open(self.path, 'w') as f:
+            f.write("----\n"
+                    "Tue 16 Dec 2025 11:58:55 AM KST :  : uptime\n"
+                    "----\n"
+                    f"{output}\n")
+
+    def test_parsed_once(self):
+        self._write("up 1 day")
+        first = read_info_sections(self.path)
+        self.assertEqual(first, {'uptime': 'up 1 day\n'})
+        self.assertIs(read_info_sections(self.path), first)
+
+    def test_sections_decoded_on_first_lookup(self):
+        with open(self.path, 'wb') as f:
+            f.write(b"----\n"
+                    b"Tue 16 Dec 2025 11:58:55 AM KST :  : uptime\n"
+                    b"----\n"
+                    b"up \xff\n"
+                    b"----\n"
+                    b"Tue 16 Dec 2025 11:58:55 AM KST :  : date\n"
+                    b"----\n"
+                    b"today\n")
+        sections = InfoSections(self.path)
+        self.assertEqual(list(sections), ['uptime', 'date'])
+        self.assertEqual(sections._text, {})
+        self.assertEqual(sections['date'], 'today\n')
+        self.assertEqual(sections._text, {'date': 'today\n'})
+        self.assertEqual(sections['uptime'], 'up \ufffd')
+
+    def test_carriage_returns_as_text_mode(self):
+        with open(self.path, 'w', newline='') as f:
+            f.write("----\r\n"
+                    "Tue 16 Dec 2025 11:58:55 AM KST :  : uptime\r\n"
+                    "----\r\n"
+                    "up 1 day\r\n")
+        with open(self.path) as f:
+            expected = parse_info_sections(f.read())
+        self.assertEqual(dict(InfoSections(self.path)), expected)
+        self.assertEqual(expected, {'uptime': 'up 1 day\n'})
+
+    def test_changed_file_parsed_again(self):
+        self._write("up 1 day")
+        read_info_sections(self.path)
+        self._write("up 22 days")
+        self.assertEqual(read_info_sections(self.path),
+                         {'uptime': 'up 22 days\n'})
+
+
 class TestNoteSource(unittest.TestCase):
     """Test shared note_source helper."""
 
@@ -0,0 +1,151 @@
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# This file contains the EventStore class.
+#
+# Plugin work units return their output as Event records: one line of
+# output text and the timestamp it starts with, parsed once where the
+# unit runs. The ExecutionEngine keeps the records of every output in
+# an EventStore, renders them to the plugin output files and hands the
+# store to the Correlator, which reads the records instead of parsing
+# the files again.
+#
+########################################################################
+
+import bisect
+from collections import namedtuple
+from datetime import datetime
+import os
+import re
+
+# One line of plugin output ; time is None for lines that do not
+# start with a "YYYY-MM-DDTHH:MM:SS" timestamp
+Event = namedtuple("Event", ["time", "text"])
+
+_TIMESTAMP = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d")
+
+
+def _event_time(text):
+    """Returns the datetime text starts with, or None"""
+    if not _TIMESTAMP.match(text):
+        return None
+    try:
+        return datetime.fromisoformat(text[0:19])
+    except ValueError:
+        return None
+
+
+def to_events(data):
+    """Returns the Event records of a list of output strings
+
+    Strings are split into lines as the output file would hold them,
+    each ending with a newline.
+    """
+    events = []
+    for item in data:
+        for line in item.splitlines(keepends=True):
+            if line[-1] != "\n":
+                line += "\n"
+            events.append(Event(_event_time(line), line))
+    return events
+
+
+class EventStore:
+    def __init__(self, directory=None):
+        """Constructor for the EventStore class
+
+        Parameters:
+            directory (string): plugin output directory to load sources
+                                that were not put in the store from ;
+                                None for an in-memory store only
+        """
+        self.directory = directory
+        self._events = {}   # source -> [Event] in output order
+        # source -> {keys: {key: ([time], [Event])}} sorted by time
+        self._index = {}
+
+    def put(self, source, events):
+        """Sets the records of a source, replacing any it had
+
+        Parameters:
+            source (string): the plugin output (file) name
+            events (Event list): the records in output order
+        """
+        self._events[source] = list(events)
+        self._index.pop(source, None)
+
+    def _path(self, source):
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, source)
+
+    def __contains__(self, source):
+        if source in self._events:
+            return True
+        path = self._path(source)
+        return path is not None and os.path.isfile(path)
+
+    def get(self, source):
+        """Returns the records of a source in output order
+
+        An empty list if the source has no records.
+        """
+        if source not in self._events:
+            path = self._path(source)
+            if path is None or not os.path.isfile(path):
+                return []
+            with open(path, "r") as file:
+                self._events[source] = to_events(file.readlines())
+        return self._events[source]
+
+    def lines(self, source):
+        """Returns the output text of a source, a line per record"""
+        return [event.text for event in self.get(source)]
+
+    def _time_index(self, source, keys):
+        """Returns the time index of a source, built on first use
+
+        Parameters:
+            keys (function): returns the keys (eg. hosts) of a record
+                             text ; None to index all records under None
+
+        Returns:
+            index (dict): key -> ([time], [Event]) sorted by time
+        """
+        indexes = self._index.setdefault(source, {})
+        index = indexes.get(keys)
+        if index is None:
+            index = {}
+            timed = sorted((event.time, i, event)
+                           for i, event in enumerate(self.get(source))
+                           if event.time is not None)
+            for time, _, event in timed:
+                for key in (keys(event.text) if keys else (None,)):
+                    times, events = index.setdefault(key, ([], []))
+                    times.append(time)
+                    events.append(event)
+            indexes[keys] = index
+        return index
+
+    def window(self, source, start, end, key=None, keys=None):
+        """Returns the timestamped records of a source from start to end
+
+        Parameters:
+            start (datetime): earliest record time, inclusive
+            end (datetime): latest record time, inclusive
+            key (string): only the records keys returns key for
+            keys (function): returns the keys of a record text ; the
+                             index it builds is kept for later calls
+                             with the same function
+
+        Returns:
+            events (Event list): in time order, then output order
+        """
+        times, events = self._time_index(source, keys).get(key, ([], []))
+        return events[bisect.bisect_left(times, start):
+                      bisect.bisect_right(times, end)]
@@ -12,26 +12,35 @@
 # The ExecutionEngine class runs plugins and gathers relevant logs and
 # information, creating output files in the report directory.
 #
+# Plugins are split into independent work units that run serially or,
+# with --jobs, on a pool of worker processes.
+#
+# Host tgz files are extracted with the streaming bundle reader, in
+# parallel with --jobs and, unless --extract-all is given, only for
+# the files the plugins read.
+#
 # Futures:
 #
 # 1. Improve how report determines the active controller.
 #    Specifically what controller was active at the time of detected
 #    failure rather than what controller was active when collect ran.
 #
-# 2. Consider running plugins in parallel threads
-#
 ########################################################################
 
+from concurrent.futures import ProcessPoolExecutor
 import logging
 import mmap
+import multiprocessing
 import os
 import re
-import subprocess
 import sys
 import tarfile
 
 import algorithms
+import bundle_reader
 from correlator import Correlator
+from event_store import EventStore
+from event_store import to_events
 from plugin_algs.alarm import alarm
 from plugin_algs.audit import audit
 from plugin_algs.daemon_failures import daemon_failures
@@ -40,7 +49,9 @@ from plugin_algs.maintenance_errors import maintenance_errors
 from plugin_algs.process_failures import process_failures
 from plugin_algs.puppet_errors import puppet_errors
 from plugin_algs.state_changes import state_changes
+from plugin_algs.substring import ScanCache
 from plugin_algs.substring import substring
+from plugin_algs.substring import SubstringScanner
 from plugin_algs.swact_activity import swact_activity
 from plugin_algs.system_info import system_info
 
@@ -56,12 +67,14 @@ regex_get_bundle_date = r".*_\d{8}\.?\d{6}$"
 
 
 class ExecutionEngine:
-    def __init__(self, opts, input_dir, output_dir):
+    def __init__(self, opts, input_dir, output_dir, members=None):
         """Constructor for the ExecutionEngine class
 
         Parameters:
             opts (dictionary): Options from command line
             output_dir (string): directory to put output files
+            members (MemberFilter): host tgz members to extract ;
+                                    None to extract them in full
         """
         # don't generate __pycache__ dir and files
         sys.dont_write_bytecode = True
@@ -71,6 +84,7 @@ class ExecutionEngine:
         self.active_controller_hostname = None
         self.host_dirs = []
         self.hostnames = []
+        self.events = EventStore()
 
         if not os.path.isdir(input_dir):
             logger.error("Error: Invalid input directory: %s", input_dir)
@@ -82,24 +96,16 @@ class ExecutionEngine:
         self.output_dir = output_dir
 
         # Uncompresses host tar files if not already done
+        tarballs = []
+        for obj in (os.scandir(self.input_dir)):
+            # files to ignore
+            if obj.name == "report_tool.tgz":
+                continue
+            if obj.is_file() and tarfile.is_tarfile(obj.path):
+                tarballs.append(obj.path)
         with open(os.path.join(output_dir, "untar.log"), "a") as logfile:
-
-            # Now extract the tarballs
-            for obj in (os.scandir(self.input_dir)):
-                # files to ignore
-                if obj.name == "report_tool.tgz":
-                    continue
-
-                info = os.path.splitext(obj.name)
-                if (obj.is_file() and tarfile.is_tarfile(obj.path) and not
-                        os.path.isdir(os.path.join(self.input_dir, info[0]))):
-                    try:
-                        logger.info("extracting : %s", obj.path)
-                        subprocess.run(["tar", "xzfC", obj.path,
-                                        self.input_dir],
-                                       stderr=logfile, check=True)
-                    except subprocess.CalledProcessError as e:
-                        logger.error(e)
+            bundle_reader.extract_hosts(tarballs, self.input_dir, members,
+                                        getattr(opts, "jobs", 1), logfile)
 
         # Determine the active controller and load system info from it.
         for folder in (f.path for f in os.scandir(self.input_dir)):
@@ -196,6 +202,104 @@ class ExecutionEngine:
         if self.opts.debug:
             logger.debug("Processing Plugins for hosts: %s", self.host_dirs)
 
+        # substring scan results are kept across runs in output_dir/cache
+        cache = None
+        if not getattr(self.opts, "no_cache", False):
+            cache = ScanCache(os.path.join(output_dir, "cache"))
+
+        self.run_plugins(plugins, plugin_output_dir, dropped_logs_file,
+                         cache)
+
+        # Dump a summary of data found by the plugins
+        if os.path.exists(plugin_output_dir):
+
+            # Print a summary of the logs/data gathers by the plugins
+            empty_files = ""
+            logger.info("")
+            logger.info("Plugin Results:")
+            logger.info("")
+            lines = []
+            for fn in os.listdir(plugin_output_dir):
+                filename = os.path.join(plugin_output_dir, fn)
+                with open(filename, "r+") as f:
+                    # Show how much data is in each plugins output file
+                    if os.path.isfile(filename) and os.path.getsize(filename):
+                        buf = mmap.mmap(f.fileno(), 0)
+                        entries = 0
+                        readline = buf.readline
+                        while readline():
+                            entries += 1
+                        lines.append("%5d %s" % (entries, filename))
+                    else:
+                        empty_files += fn + " "
+
+            # Sort the lines based on the numeric value
+            sorted_lines = sorted(lines, key=lambda x: int(x.split()[0]),
+                                  reverse=True)
+            if sorted_lines:
+                for line in sorted_lines:
+                    logger.info(line)
+            else:
+                sys.exit("no plugin data found ; "
+                         "nothing to correlate ... exiting")
+            if empty_files:
+                logger.info("")
+                logger.info("... nothing found by plugins: %s" % empty_files)
+        else:
+            logger.error("Error: Plugin output dir missing: %s" %
+                         plugin_output_dir)
+            sys.exit("... exiting")
+
+        # Running the correlator and printing the output from it
+        self.run_correlator(output_dir, plugin_output_dir)
+
+    def run_plugins(self, plugins, plugin_output_dir, dropped_logs_file,
+                    cache=None):
+        """Run the work units of a list of plugins
+
+        Puts the records of each output in the event store and writes
+        the output files, without summarizing or correlating them.
+
+        Parameters:
+            plugins (Plugin list): List of plugins to run
+            plugin_output_dir (string): directory to put output files
+            dropped_logs_file (string): file to track non utf-8 logs in
+            cache (ScanCache): substring scan results to reuse ; None to
+                               scan the logs
+        """
+        units = self._plan_units(plugins, plugin_output_dir,
+                                 dropped_logs_file, cache)
+        jobs = getattr(self.opts, "jobs", 1)
+        if jobs > 1 and len(units) > 1:
+            logger.info("Running %d plugin work units with %d jobs",
+                        len(units), jobs)
+        for outputs in self._run_units(units, jobs):
+            for filename, events, processing in outputs:
+                self.events.put(filename, events)
+                self._create_output_file(filename, plugin_output_dir,
+                                         [event.text for event in events],
+                                         processing)
+
+    def _plan_units(self, plugins, plugin_output_dir, dropped_logs_file,
+                    cache=None):
+        """Split the plugins into independent work units.
+
+        Each unit is a (function, args) pair. The function returns a
+        list of (filename, events, processing) outputs that execute()
+        puts in the event store and writes to plugin_output_dir in unit
+        order, so files that more than one plugin writes end up the same
+        as in a serial run.
+
+        Substring plugins become one unit per host, sharing a scanner
+        so that each host log is read once for all of them; results
+        held in cache (a ScanCache) are reused instead of read. The
+        algorithms built on substring() share one scanner using cache
+        too. Audit and alarm run one unit per host; other algorithms
+        one unit each.
+        """
+        units = []
+        scanner = SubstringScanner(cache)
+        substring_requests = {}   # hostname -> [(substr, files, exclude)]
         for plugin in plugins:
             processing = "Processing plugin: " + os.path.basename(plugin.file)
             hosts = {}
@@ -214,43 +318,22 @@ class ExecutionEngine:
                         hosts.update(self.hosts[h])
 
                 for hostname, folderpath in hosts.items():
-
-                    events = []
                     if plugin.state["algorithm"] == algorithms.SUBSTRING:
-                        events = substring(
-                            self.opts.start, self.opts.end,
+                        requests = substring_requests.get(hostname)
+                        if requests is None:
+                            requests = substring_requests[hostname] = []
+                            units.append((_substring_unit,
+                                          (hostname, self.opts.start,
+                                           self.opts.end, requests,
+                                           dropped_logs_file, cache)))
+                        requests.append((
                             plugin.state["substring"],
                             [
                                 os.path.join(folderpath, file)
                                 for file in plugin.state["files"]
                             ],
                             plugin.state["exclude"],
-                            dropped_logs=dropped_logs_file,
-                        )
-
-                        # creating output file
-                        output_file = os.path.join(
-                            plugin_output_dir,
-                            f"substring_{hostname}",
-                        )
-                        if self.opts.verbose:
-                            logger.info("... output at " +
-                                        os.path.abspath(output_file))
-                        if events:
-                            with open(output_file, "w") as file:
-                                file.write(
-                                    f"Date range: {self.opts.start} until "
-                                    f"{self.opts.end}\n"
-                                )
-                                file.write(
-                                    f"substrings: "
-                                    f"{' '.join(plugin.state['substring'])}\n"
-                                )
-                                for line in events:
-                                    if line[-1] == "\n":
-                                        file.write(line)
-                                    else:
-                                        file.write(line + "\n")
+                        ))
             else:
                 alg = plugin.state["algorithm"]
 
@@ -274,64 +357,32 @@ class ExecutionEngine:
                 }
 
                 if alg in standard_algorithms:
-                    func = standard_algorithms[alg]
-                    self._create_output_file(
-                        alg, plugin_output_dir,
-                        func(self.hosts, self.opts.start,
-                             self.opts.end,
-                             dropped_logs=dropped_logs_file),
-                        processing
-                    )
+                    # puppet_errors greps the logs itself, without a scanner
+                    units.append((_algorithm_unit,
+                                  (alg, standard_algorithms[alg],
+                                   (self.hosts, self.opts.start,
+                                    self.opts.end),
+                                   dropped_logs_file, processing,
+                                   None if alg == algorithms.PUPPET_ERRORS
+                                   else scanner)))
 
                 elif alg in exclude_algorithms:
                     output_name, func = exclude_algorithms[alg]
-                    self._create_output_file(
-                        output_name, plugin_output_dir,
-                        func(self.hosts, self.opts.start,
-                             self.opts.end,
-                             plugin.state["exclude"],
-                             dropped_logs=dropped_logs_file),
-                        processing
-                    )
+                    units.append((_algorithm_unit,
+                                  (output_name, func,
+                                   (self.hosts, self.opts.start,
+                                    self.opts.end, plugin.state["exclude"]),
+                                   dropped_logs_file, processing, scanner)))
 
                 # Special cases: these have unique orchestration logic
                 # that doesn't fit the standard pattern.
 
                 elif alg == algorithms.SYSTEM_INFO:
-                    system_info_output = os.path.join(plugin_output_dir,
-                                                      "system_info")
-                    if os.path.exists(system_info_output):
-                        os.remove(system_info_output)
-
-                    hostname = None
-                    host_dir = None
-                    if self.active_controller_directory is None:
-                        hostname = re.sub(regex_chop_bundle_date, "",
-                                          os.path.basename(
-                                              self.host_dirs[0]))
-                        host_dir = self.host_dirs[0]
-                    else:
-                        hostname = self.active_controller_hostname
-                        host_dir = self.active_controller_directory
-
-                    system_info(hostname, host_dir,
-                                system_info_output,
-                                self.hosts, True)
-
-                    start_index = (
-                        self.active_controller_directory is None)
-
-                    for host_dir in self.host_dirs[start_index:]:
-                        if host_dir != \
-                                self.active_controller_directory:
-                            hostname = re.sub(
-                                regex_chop_bundle_date, "",
-                                os.path.basename(host_dir))
-                            system_info(hostname,
-                                        host_dir,
-                                        system_info_output,
-                                        None,
-                                        False)
+                    units.append((_system_info_unit,
+                                  (self.host_dirs, self.hosts,
+                                   self.active_controller_directory,
+                                   self.active_controller_hostname,
+                                   plugin_output_dir)))
 
                 elif alg == algorithms.AUDIT:
                     hosts = {}
@@ -340,102 +391,34 @@ class ExecutionEngine:
                     hosts.update(self.hosts["controllers"])
 
                     for hostname, folderpath in hosts.items():
-                        self._create_output_file(
-                            f"{hostname}_audit",
-                            plugin_output_dir,
-                            audit(
-                                plugin.state["start"],
-                                plugin.state["end"],
-                                os.path.join(
-                                    folderpath, "var", "log",
-                                    "dcmanager", "audit.log"
-                                ),
-                            ),
-                            processing,
-                        )
+                        units.append((_audit_unit,
+                                      (hostname, folderpath,
+                                       plugin.state["start"],
+                                       plugin.state["end"], processing)))
 
                 elif alg == algorithms.ALARM:
                     for host_dir in self.host_dirs:
-
-                        alarms, logs = alarm(
-                            host_dir,
-                            self.opts.start, self.opts.end,
-                            plugin.state["alarm_exclude"],
-                            plugin.state["entity_exclude"]
-                        )
-                        if alarms is None and logs is None:
-                            continue
-
-                        alarm_output = os.path.join(
-                            plugin_output_dir, "alarm")
-                        log_output = os.path.join(
-                            plugin_output_dir, "log")
-
-                        with open(alarm_output, "w") as file:
-                            for k, v in alarms.items():
-                                file.write(f"{k}:\n")
-                                for date in v["dates"]:
-                                    file.write(f"   {date}\n")
-                        with open(log_output, "w") as file:
-                            for k, v in logs.items():
-                                file.write(
-                                    f"{k}: {v['count']}\n")
-                            file.write("\n")
-                            for k, v in logs.items():
-                                file.write(f"{k}:\n")
-                                for date in v["dates"]:
-                                    file.write(f"   {date}\n")
-                        if self.opts.verbose:
-                            logger.info(processing)
-                        elif self.opts.debug:
-                            logger.debug(
-                                processing + ", output at " +
-                                os.path.abspath(alarm_output) +
-                                ", " +
-                                os.path.abspath(log_output))
-
-        # Dump a summary of data found by the plugins
-        if os.path.exists(plugin_output_dir):
-
-            # Print a summary of the logs/data gathers by the plugins
-            empty_files = ""
-            logger.info("")
-            logger.info("Plugin Results:")
-            logger.info("")
-            lines = []
-            for fn in os.listdir(plugin_output_dir):
-                filename = os.path.join(plugin_output_dir, fn)
-                with open(filename, "r+") as f:
-                    # Show how much data is in each plugins output file
-                    if os.path.isfile(filename) and os.path.getsize(filename):
-                        buf = mmap.mmap(f.fileno(), 0)
-                        entries = 0
-                        readline = buf.readline
-                        while readline():
-                            entries += 1
-                        lines.append("%5d %s" % (entries, filename))
-                    else:
-                        empty_files += fn + " "
-
-            # Sort the lines based on the numeric value
-            sorted_lines = sorted(lines, key=lambda x: int(x.split()[0]),
-                                  reverse=True)
-            if sorted_lines:
-                for line in sorted_lines:
-                    logger.info(line)
-            else:
-                sys.exit("no plugin data found ; "
-                         "nothing to correlate ... exiting")
-            if empty_files:
-                logger.info("")
-                logger.info("... nothing found by plugins: %s" % empty_files)
-        else:
-            logger.error("Error: Plugin output dir missing: %s" %
-                         plugin_output_dir)
-            sys.exit("... exiting")
-
-        # Running the correlator and printing the output from it
-        self.run_correlator(output_dir, plugin_output_dir)
+                        units.append((_alarm_unit,
+                                      (host_dir, self.opts.start,
+                                       self.opts.end,
+                                       plugin.state["alarm_exclude"],
+                                       plugin.state["entity_exclude"],
+                                       processing)))
+        return units
+
+    def _run_units(self, units, jobs=1):
+        """Run work units and return their outputs in unit order.
+
+        With jobs > 1 the units run on a pool of that many forked worker
+        processes; otherwise they run one after another in-process.
+        """
+        if jobs <= 1 or len(units) <= 1:
+            return [func(*args) for func, args in units]
+        mp_context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=min(jobs, len(units)),
+                                 mp_context=mp_context) as pool:
+            futures = [pool.submit(func, *args) for func, args in units]
+            return [future.result() for future in futures]
 
     # -----------------------------------
 
@@ -449,7 +432,7 @@ class ExecutionEngine:
             plugin_output_dir (string) : directory with output files from
                                          plugins
         """
-        correlator = Correlator(plugin_output_dir)
+        correlator = Correlator(plugin_output_dir, self.events)
         failures, events, alarms, state_changes = correlator.run(
             self.opts.hostname)
         failures_len, events_len = len(failures), len(events)
@@ -555,12 +538,17 @@ class ExecutionEngine:
         return hostname, subfunction
 
     def _create_output_file(self, filename, directory, data, processing):
-        with open(os.path.join(directory, filename), "w") as file:
+        # Write to a temporary file and rename it into place so the
+        # output file is never seen partially written
+        path = os.path.join(directory, filename)
+        tmp_path = os.path.join(directory, f".{filename}.tmp")
+        with open(tmp_path, "w") as file:
             for i in data:
                 if i[-1] == "\n":
                     file.write(i)
                 else:
                     file.write(i + "\n")
+        os.replace(tmp_path, path)
         if self.opts.verbose:
             output = ("... output at " +
                       os.path.abspath(os.path.join(directory, filename)))
@@ -568,3 +556,110 @@ class ExecutionEngine:
                 logger.info(output)
             else:
                 logger.info(processing + ", " + output)
+
+
+# Work units run by ExecutionEngine.execute(), possibly in worker
+# processes. Each returns a list of (filename, events, processing)
+# outputs, the events being the Event records of the output lines, for
+# the engine to store and write into the plugin output directory.
+
+def _substring_unit(hostname, start, end, requests, dropped_logs,
+                    cache=None):
+    """Run the substring plugins of one host with a shared scanner."""
+    scanner = SubstringScanner(cache)
+    for substr, files, _ in requests:
+        scanner.register(substr, files)
+    outputs = []
+    for substr, files, exclude in requests:
+        events = substring(start, end, substr, files, exclude,
+                           dropped_logs=dropped_logs, scanner=scanner)
+        if events:
+            outputs.append((
+                f"substring_{hostname}",
+                to_events([f"Date range: {start} until {end}\n",
+                           f"substrings: {' '.join(substr)}\n"] + events),
+                "",
+            ))
+    return outputs
+
+
+def _algorithm_unit(output_name, func, args, dropped_logs, processing,
+                    scanner=None):
+    """Run an algorithm that returns the lines of one output file.
+
+    scanner is passed on to algorithms that search with substring().
+    """
+    kwargs = {"dropped_logs": dropped_logs}
+    if scanner is not None:
+        kwargs["scanner"] = scanner
+    return [(output_name, to_events(func(*args, **kwargs)), processing)]
+
+
+def _audit_unit(hostname, folderpath, start, end, processing):
+    """Run the audit algorithm on one host."""
+    return [(
+        f"{hostname}_audit",
+        to_events(audit(start, end,
+                        os.path.join(folderpath, "var", "log", "dcmanager",
+                                     "audit.log"))),
+        processing,
+    )]
+
+
+def _alarm_unit(host_dir, start, end, alarm_exclude, entity_exclude,
+                processing):
+    """Run the alarm algorithm on one host."""
+    alarms, logs = alarm(host_dir, start, end, alarm_exclude, entity_exclude)
+    if alarms is None and logs is None:
+        return []
+
+    alarm_data = []
+    for k, v in alarms.items():
+        alarm_data.append(f"{k}:\n")
+        for date in v["dates"]:
+            alarm_data.append(f"   {date}\n")
+    log_data = []
+    for k, v in logs.items():
+        log_data.append(f"{k}: {v['count']}\n")
+    log_data.append("\n")
+    for k, v in logs.items():
+        log_data.append(f"{k}:\n")
+        for date in v["dates"]:
+            log_data.append(f"   {date}\n")
+    return [("alarm", to_events(alarm_data), processing),
+            ("log", to_events(log_data), "")]
+
+
+def _system_info_unit(host_dirs, hosts, active_controller_directory,
+                      active_controller_hostname, plugin_output_dir):
+    """Gather system info from the active controller, then the others."""
+    # system_info() appends as it goes; collect into a private file
+    system_info_output = os.path.join(plugin_output_dir,
+                                      f".system_info.{os.getpid()}")
+    if os.path.exists(system_info_output):
+        os.remove(system_info_output)
+
+    if active_controller_directory is None:
+        hostname = re.sub(regex_chop_bundle_date, "",
+                          os.path.basename(host_dirs[0]))
+        host_dir = host_dirs[0]
+    else:
+        hostname = active_controller_hostname
+        host_dir = active_controller_directory
+
+    try:
+        system_info(hostname, host_dir, system_info_output, hosts, True)
+
+        start_index = active_controller_directory is None
+        for host_dir in host_dirs[start_index:]:
+            if host_dir != active_controller_directory:
+                hostname = re.sub(regex_chop_bundle_date, "",
+                                  os.path.basename(host_dir))
+                system_info(hostname, host_dir, system_info_output, None,
+                            False)
+
+        with open(system_info_output) as file:
+            return [("system_info", to_events(file.readlines()), "")]
+    finally:
+        if os.path.exists(system_info_output):
+            os.remove(system_info_output)
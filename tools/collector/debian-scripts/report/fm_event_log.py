@@ -0,0 +1,149 @@
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# This file contains the EventLog class.
+#
+# The fm database dump (var/extra/database/fm.db.sql.txt) holds the
+# alarm and customer log history in the event_log table, one tab
+# separated row per event between its COPY line and the '\.' line that
+# ends the table. The dump of a large system runs to hundreds of MB,
+# most of it in other tables, so the COPY line is found with a single
+# search of the memory mapped file and only the event_log rows are
+# read and split.
+#
+# The rows are streamed in file order rather than kept, so memory
+# stays at the size of the selection however long the history is.
+# Exclusion lists are matched once per distinct id rather than once
+# per row.
+#
+########################################################################
+
+from collections import namedtuple
+import io
+import logging
+import mmap
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+EVENT_LOG_FILE = os.path.join("var", "extra", "database", "fm.db.sql.txt")
+
+# The fields of an event_log row the report uses ; date is as in the
+# dump, "YYYY-MM-DD HH:MM:SS[.ffffff]"
+EventLogRow = namedtuple("EventLogRow",
+                         ["alarm_id", "action", "entity_id", "date",
+                          "severity"])
+
+# event_log columns ; see the COPY line of fm.db.sql.txt
+INDEX_ALARM_ID = 5
+INDEX_ACTION = 6
+INDEX_ENTITY_ID = 8
+INDEX_ALARM_DATE = 9
+INDEX_SEVERITY = 10
+
+_COPY_EVENT_LOG = re.compile(rb"COPY (public\.)?event_log")
+_END_OF_TABLE = "\\.\n"
+
+
+def _find_event_log(path):
+    """Returns the offset of the first event_log row in path, or None"""
+    with open(path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            return None
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            match = _COPY_EVENT_LOG.search(buf)
+            if match is None:
+                return None
+            end = buf.find(b"\n", match.end())
+            return len(buf) if end < 0 else end + 1
+
+
+def _exclusion(exclude):
+    """Returns a function telling whether an id contains any of the
+    exclude strings, deciding once per distinct id"""
+    if not exclude:
+        return lambda i: False
+    regex = re.compile("|".join(re.escape(e) for e in exclude))
+    decisions = {}
+
+    def excluded(i):
+        decision = decisions.get(i)
+        if decision is None:
+            decision = decisions[i] = regex.search(i) is not None
+        return decision
+    return excluded
+
+
+class EventLog:
+    def __init__(self, path):
+        """Constructor for the EventLog class
+
+        Locates the event_log rows of a fm database dump ; they are
+        read each time the EventLog is iterated.
+
+        Parameters:
+            path (string): the fm.db.sql.txt file
+
+        Errors:
+            FileNotFoundError
+        """
+        self.path = path
+        self.offset = _find_event_log(path)
+        if self.offset is None:
+            logger.debug("no event_log table in %s", path)
+
+    @classmethod
+    def from_host_dir(cls, host_dir):
+        """Returns the EventLog of a host directory, or None if the host
+        has no fm database dump"""
+        path = os.path.join(host_dir, EVENT_LOG_FILE)
+        if not os.path.exists(path):
+            return None
+        return cls(path)
+
+    def __iter__(self):
+        """Yields the EventLogRow of each event_log row in file order"""
+        if self.offset is None:
+            return
+        raw = open(self.path, "rb")
+        raw.seek(self.offset)
+        with io.TextIOWrapper(raw, errors="replace") as file:
+            for line in file:
+                if line == _END_OF_TABLE:
+                    break
+                entry = line.split("\t")
+                if len(entry) <= INDEX_SEVERITY:
+                    continue
+                yield EventLogRow(entry[INDEX_ALARM_ID],
+                                  entry[INDEX_ACTION],
+                                  entry[INDEX_ENTITY_ID],
+                                  entry[INDEX_ALARM_DATE],
+                                  entry[INDEX_SEVERITY])
+
+    def select(self, start, end, alarm_exclude=None, entity_exclude=None):
+        """Yields the rows from start to end, in file order
+
+        Parameters:
+            start          (string): earliest "YYYY-MM-DDTHH:MM:SS" date
+            end            (string): latest "YYYY-MM-DDTHH:MM:SS" date
+            alarm_exclude  (string list): drop rows whose alarm id
+                                          contains any of these
+            entity_exclude (string list): drop rows whose entity id
+                                          contains any of these
+        """
+        # Row dates have a space where start and end have a 'T'
+        start = start.replace("T", " ")
+        end = end.replace("T", " ")
+        alarm_excluded = _exclusion(alarm_exclude)
+        entity_excluded = _exclusion(entity_exclude)
+        for row in self:
+            if start <= row.date <= end and \
+                    not alarm_excluded(row.alarm_id) and \
+                    not entity_excluded(row.entity_id):
+                yield row
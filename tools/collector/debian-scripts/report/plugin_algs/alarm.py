@@ -13,8 +13,7 @@
 #
 ########################################################################
 
-import os
-import re
+from fm_event_log import EventLog
 
 
 def alarm(host_dir, start, end, alarm_exclude=None,
@@ -33,86 +32,25 @@ def alarm(host_dir, start, end, alarm_exclude=None,
     alarm_data = {}
     log_data = {}
 
-    fm_database = os.path.join(
-        host_dir, "var", "extra", "database", "fm.db.sql.txt")
-    if not os.path.exists(fm_database):
+    event_log = EventLog.from_host_dir(host_dir)
+    if event_log is None:
         return None, None
 
-    if alarm_exclude is None:
-        alarm_exclude = []
-    if entity_exclude is None:
-        entity_exclude = []
-
-    with open(fm_database) as file:
-        alarms_start = False
-        for line in file:
-            # start of event log
-            if re.search(r"COPY (public\.)?event_log", line):
-                alarms_start = True
-            elif alarms_start and line == "\\.\n":
-                break
-            elif alarms_start:
-                entry = re.split(r"\t", line)
-
-                INDEX_ALARM_ID = 5
-                INDEX_ACTION = 6
-                INDEX_ENTITY_ID = 8
-                INDEX_ALARM_DATE = 9
-                INDEX_SEVERITY = 10
-
-                alarm_id = entry[INDEX_ALARM_ID]
-                entity_id = entry[INDEX_ENTITY_ID]
-                action = entry[INDEX_ACTION]
-                severity = entry[INDEX_SEVERITY]
-                alarm_date = entry[INDEX_ALARM_DATE]
-
-                entry_date = alarm_date.replace(
-                    " ", "T"
-                )  # making time format of alarm the same
-                if start <= entry_date and entry_date <= end:
-                    cont = True
-                    # Checks if the alarm is in the user specified list of
-                    # alarm or entity ids
-                    for id in alarm_exclude:
-                        if id in alarm_id:
-                            cont = False
-                            break
-
-                    for entity in entity_exclude:
-                        if entity in entity_id:
-                            cont = False
-                            break
-
-                    if not cont:
-                        continue
-
-                    try:
-                        if action == "log":
-                            log_info = log_data[
-                                f"{alarm_id} {entity_id} {severity}"
-                            ]
-                            log_info["count"] += 1
-                            log_info["dates"].append(alarm_date)
-                        else:
-                            alarm_info = alarm_data[
-                                f"{alarm_id} {entity_id} {severity}"
-                            ]
-                            alarm_info["dates"].append(
-                                f"{alarm_date} {action}")
-                    except KeyError:
-                        if entry[6] != "log":
-                            alarm_data[
-                                f"{alarm_id} {entity_id} {severity}"
-                            ] = {
-                                "dates": [f"{alarm_date} {action}"],
-                            }
-                        else:
-                            log_data[
-                                f"{alarm_id} {entity_id} {severity}"
-                            ] = {
-                                "count": 1,
-                                "dates": [alarm_date],
-                            }
+    for row in event_log.select(start, end, alarm_exclude, entity_exclude):
+        key = f"{row.alarm_id} {row.entity_id} {row.severity}"
+        if row.action == "log":
+            log_info = log_data.get(key)
+            if log_info is None:
+                log_data[key] = {"count": 1, "dates": [row.date]}
+            else:
+                log_info["count"] += 1
+                log_info["dates"].append(row.date)
+        else:
+            alarm_info = alarm_data.get(key)
+            if alarm_info is None:
+                alarm_data[key] = {"dates": [f"{row.date} {row.action}"]}
+            else:
+                alarm_info["dates"].append(f"{row.date} {row.action}")
 
     for _, v in alarm_data.items():
         v["dates"] = sorted(v["dates"])
@@ -19,7 +19,8 @@ import os
 from plugin_algs.substring import substring
 
 
-def daemon_failures(hosts, start, end, exclude_list=None, dropped_logs=None):
+def daemon_failures(hosts, start, end, exclude_list=None, dropped_logs=None,
+                    scanner=None):
     """Daemon failures algorithm
     Presents all "Failed to run the puppet manifest" log messages in the system
 
@@ -29,6 +30,8 @@ def daemon_failures(hosts, start, end, exclude_list=None, dropped_logs=None):
         end (string): End time for analysis
         exclude_list (string list): list of strings to exclude from report
         dropped_logs (string): path/filename to write dropped logs
+        scanner (SubstringScanner): scanner shared with other searches
+                                    (default: a new one)
     """
     data = []
     daemon_files = []
@@ -40,6 +43,6 @@ def daemon_failures(hosts, start, end, exclude_list=None, dropped_logs=None):
 
     daemon_substrings = ["Failed to run the puppet manifest"]
     data = substring(start, end, daemon_substrings, daemon_files, exclude_list,
-                     dropped_logs=dropped_logs)
+                     dropped_logs=dropped_logs, scanner=scanner)
 
     return sorted(data)
@@ -19,7 +19,7 @@ import os
 from plugin_algs.substring import substring
 
 
-def heartbeat_loss(hosts, start, end, dropped_logs=None):
+def heartbeat_loss(hosts, start, end, dropped_logs=None, scanner=None):
     """Heartbeat loss algorithm
     Presents all "Heartbeat Loss" error messages in the system
 
@@ -28,6 +28,8 @@ def heartbeat_loss(hosts, start, end, dropped_logs=None):
         start (string): Start time for analysis
         end (string): End time for analysis
         dropped_logs (string): path/filename to write dropped logs
+        scanner (SubstringScanner): scanner shared with other searches
+                                    (default: a new one)
     """
     data = []
     hb_files = []
@@ -38,6 +40,6 @@ def heartbeat_loss(hosts, start, end, dropped_logs=None):
 
     hb_substrings = ["Heartbeat Loss"]
     data = substring(start, end, hb_substrings, hb_files,
-                     dropped_logs=dropped_logs)
+                     dropped_logs=dropped_logs, scanner=scanner)
 
     return sorted(data)
@@ -21,7 +21,8 @@ from plugin_algs.substring import substring
 
 def maintenance_errors(hosts, start, end,
                        exclude_list=None,
-                       dropped_logs=None):
+                       dropped_logs=None,
+                       scanner=None):
     """Maintenance errors algorithm
     Presents maintenance errors and other relevant log messages in system,
     such as "Configuration failure"
@@ -32,6 +33,8 @@ def maintenance_errors(hosts, start, end,
         end (string): End time for analysis
         exclude_list (string list): list of strings to exclude from report
         dropped_logs (string): path/filename to write dropped logs
+        scanner (SubstringScanner): scanner shared with other searches
+                                    (default: a new one)
     """
     data = []
     mtc_files = []
@@ -56,6 +59,6 @@ def maintenance_errors(hosts, start, end,
                       "Graceful Recovery Failed",
                       "MNFA ENTER", "MNFA EXIT", "MNFA POOL"]
     data = substring(start, end, mtc_substrings, mtc_files, exclude_list,
-                     dropped_logs=dropped_logs)
+                     dropped_logs=dropped_logs, scanner=scanner)
 
     return sorted(data)
@@ -19,7 +19,7 @@ import os
 from plugin_algs.substring import substring
 
 
-def process_failures(hosts, start, end, dropped_logs=None):
+def process_failures(hosts, start, end, dropped_logs=None, scanner=None):
     """Process failures algorithm
         Presents all "Error : " log messages from pmond
 
@@ -28,6 +28,8 @@ def process_failures(hosts, start, end, dropped_logs=None):
         start (string): Start time for analysis
         end (string): End time for analysis
         dropped_logs (string): path/filename to write dropped logs
+        scanner (SubstringScanner): scanner shared with other searches
+                                    (default: a new one)
     """
     data = []
     files = []
@@ -36,6 +38,7 @@ def process_failures(hosts, start, end, dropped_logs=None):
             pmond = os.path.join(folder, "var", "log", "pmond.log")
             files.append(pmond)
 
-    data = substring(start, end, ["Error :"], files, dropped_logs=dropped_logs)
+    data = substring(start, end, ["Error :"], files, dropped_logs=dropped_logs,
+                     scanner=scanner)
 
     return sorted(data)
@@ -19,7 +19,7 @@ import os
 from plugin_algs.substring import substring
 
 
-def state_changes(hosts, start, end, dropped_logs=None):
+def state_changes(hosts, start, end, dropped_logs=None, scanner=None):
     """State changes algorithm
     Presents all messages in the system regarding the state of hosts, such
     as "is ENABLED"
@@ -29,6 +29,8 @@ def state_changes(hosts, start, end, dropped_logs=None):
         start (string): Start time for analysis
         end (string): End time for analysis
         dropped_logs (string): path/filename to write dropped logs
+        scanner (SubstringScanner): scanner shared with other searches
+                                    (default: a new one)
     """
     data = []
     sc_files = []
@@ -39,6 +41,6 @@ def state_changes(hosts, start, end, dropped_logs=None):
 
     sc_substrings = ["is ENABLED", "allStateChange (.+)locked-disabled"]
     data = substring(start, end, sc_substrings, sc_files,
-                     dropped_logs=dropped_logs)
+                     dropped_logs=dropped_logs, scanner=scanner)
 
     return sorted(data)
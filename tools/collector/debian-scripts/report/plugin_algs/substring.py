@@ -1,6 +1,6 @@
 ########################################################################
 #
-# Copyright (c) 2022 - 2023 Wind River Systems, Inc.
+# Copyright (c) 2022 - 2026 Wind River Systems, Inc.
 #
 # SPDX-License-Identifier: Apache-2.0
 #
@@ -11,20 +11,384 @@
 # The substring plugin algorithm looks for a set of substrings within
 # a list of log files and extracts those log messages.
 #
+# Substrings are extended regular expressions, as with grep -E. The
+# search runs in-process: a SubstringScanner reads each file once for
+# every substring set registered against it, reads .gz rotations
+# directly, bisects plain-text files to the start/end window and
+# compares timestamps as text on fixed line slices.
+#
+# With a ScanCache the lines each file yields for each substring set
+# and start/end window are kept on disk across report runs, keyed by
+# the file identity and the substring set; a later run reuses them, and
+# answers a window inside a cached one by filtering the cached lines.
+#
 ########################################################################
 
-from datetime import datetime
 import gzip
+import hashlib
+import json
 import logging
 import os
 import re
 import subprocess
+import tempfile
 
 
 logger = logging.getLogger(__name__)
 
+# Shape of a log timestamp ("YYYY-MM-DDTHH:MM:SS"); lines carry it at
+# offset 0, or at offset 2 (sm-customer.log "| " prefix)
+_TIMESTAMP_SHAPE = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\Z")
+_TIMESTAMP_SHAPE_BYTES = re.compile(rb"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\Z")
+
+# Bytes read per chunk while scanning a log file
+_SCAN_CHUNK = 4 * 1024 * 1024
+
+# Lines a bisect probe reads looking for a timestamped line
+_PROBE_LINES = 64
+
+# Bump when the cached scan results change meaning
+_SCAN_CACHE_VERSION = 1
+
+
+def _log_date(line):
+    """Return the timestamp slice of a log line (str or bytes), or None
+    if neither timestamp position holds one."""
+    shape = (_TIMESTAMP_SHAPE_BYTES if isinstance(line, bytes)
+             else _TIMESTAMP_SHAPE)
+    for date in (line[0:19], line[2:21]):
+        if shape.match(date):
+            return date
+    return None
+
+
+def _in_window(start, end, line):
+    """True if line (str or bytes) has no timestamp or one after start
+    and before end, as _append_in_window decides."""
+    date = _log_date(line)
+    if date is None:
+        return True
+    if isinstance(date, bytes):
+        start, end = start.encode("utf-8"), end.encode("utf-8")
+    return start < date < end
+
+
+def _append_in_window(start, end, data, line):
+    """Append line to data if its timestamp is after start and before
+    end. Lines without a timestamp are always appended."""
+    date = _log_date(line)
+    if date is None:
+        data.append(line)
+    elif date > start and date < end:
+        if line[0] == "|":  # sm-customer.log edge case
+            line = line[1:].strip()
+            line = re.sub("\\s+", " ", line)
+        data.append(line)
+
+
+def _compile_substring(pattern):
+    """Compile one substring (an extended regular expression) for
+    searching a byte buffer line by line. Patterns Python cannot
+    compile are searched for literally."""
+    try:
+        return re.compile(pattern.encode("utf-8"), re.MULTILINE)
+    except re.error as e:
+        logger.error("substring %r: %s ; searching literally", pattern, e)
+        return re.compile(re.escape(pattern).encode("utf-8"))
+
+
+def _line_start(f, pos):
+    """Seek f to the first line starting at or after pos; return it."""
+    if pos == 0:
+        f.seek(0)
+        return 0
+    f.seek(pos - 1)
+    f.readline()
+    return f.tell()
+
+
+def _probe_date(f, pos):
+    """Timestamp of the first timestamped line at or after pos, None if
+    none is found within _PROBE_LINES lines."""
+    _line_start(f, pos)
+    for _ in range(_PROBE_LINES):
+        line = f.readline()
+        if not line:
+            return None
+        date = _log_date(line)
+        if date is not None:
+            return date
+    return None
+
+
+def _bisect_date(f, size, date, unknown_is_after):
+    """Offset of the first line of time ordered file f timestamped at
+    or after date. Probes that find no timestamp count as after date
+    when unknown_is_after, else as before it, so that they only ever
+    widen the window that gets scanned."""
+    lo, hi = 0, size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        probe = _probe_date(f, mid)
+        if probe is None:
+            after = unknown_is_after
+        else:
+            after = probe >= date
+        if after:
+            hi = mid
+        else:
+            lo = mid + 1
+    return _line_start(f, lo)
+
+
+class ScanCache:
+    """Substring scan results kept on disk across report runs.
+
+    An entry holds, for one file and one substring list, the matching
+    lines of each start/end window scanned and the lines of those that
+    went to dropped_logs. Entries are content addressed by the file
+    path, size and modification time and the substring list, so a log
+    or plugin that changed gets new entries. A window inside a cached
+    one is answered by filtering the cached lines.
+    """
+
+    def __init__(self, directory):
+        """Parameters:
+            directory (string): where to keep the entries
+        """
+        self.directory = directory
+
+    def _path(self, file, group):
+        stat = os.stat(file)
+        identity = json.dumps([_SCAN_CACHE_VERSION, os.path.abspath(file),
+                               stat.st_size, stat.st_mtime_ns, list(group)])
+        digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[0:2], digest + ".json")
+
+    def _load(self, path):
+        try:
+            with open(path, "r") as f:
+                return json.load(f)["windows"]
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug("ignoring scan cache entry %s: %s", path, e)
+            return []
+
+    def get(self, file, group, start, end):
+        """Return (lines, dropped) of file for substring list group in the
+        start/end window, or None if no cached window covers it."""
+        for window in self._load(self._path(file, group)):
+            if window["start"] <= start and window["end"] >= end:
+                lines = window["lines"]
+                # dropped lines are not utf-8 ; latin-1 keeps their bytes
+                dropped = [line.encode("latin-1")
+                           for line in window["dropped"]]
+                if (window["start"], window["end"]) != (start, end):
+                    lines = [line for line in lines
+                             if _in_window(start, end, line)]
+                    dropped = [line for line in dropped
+                               if _in_window(start, end, line)]
+                return lines, dropped
+        return None
+
+    def put(self, file, group, start, end, lines, dropped):
+        """Add the lines and dropped lines of file for substring list
+        group in the start/end window, replacing the windows it covers."""
+        path = self._path(file, group)
+        windows = [window for window in self._load(path)
+                   if not (start <= window["start"] and
+                           end >= window["end"])]
+        windows.append({"start": start, "end": end, "lines": lines,
+                        "dropped": [line.decode("latin-1")
+                                    for line in dropped]})
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write and rename so that parallel work units never read a
+            # partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "w") as f:
+                json.dump({"windows": windows}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("scan cache entry %s not written: %s", path, e)
+
+
+class SubstringScanner:
+    """In-process substring search over log files.
+
+    Each (file, start, end) is scanned once for every substring list
+    registered against the file plus the one asked for; later searches
+    for a registered list are answered from the results of that pass.
+    The execution engine shares one scanner between all substring
+    plugins of a run. Substring lists the ScanCache holds results for
+    are not scanned again.
+    """
+
+    def __init__(self, cache=None):
+        """Parameters:
+            cache (ScanCache): scan results kept across runs ; None to
+                               always scan
+        """
+        self._registered = {}   # base file -> [substring tuple]
+        self._results = {}      # (file, start, end) -> {tuple: [lines]}
+        self._dropped = {}      # file -> dropped lines written
+        self._cache = cache
+
+    def register(self, substr, files):
+        """Register a substring list to be matched whenever one of files
+        (or one of its rotations) is scanned."""
+        key = tuple(substr)
+        for file in files:
+            groups = self._registered.setdefault(file, [])
+            if key not in groups:
+                groups.append(key)
+
+    def search(self, start, end, substr, file, base=None, compressed=False,
+               dropped_logs=None):
+        """Return the lines of file matching substr and inside the
+        start/end window, as _evaluate_substring would add them.
+
+        Parameters:
+            base (string): file whose registrations apply (default: file)
+            compressed (boolean): file is gzip compressed
+            dropped_logs (string): path/filename to write dropped logs
+        """
+        key = tuple(substr)
+        results = self._results.get((file, start, end))
+        if results is None:
+            results = self._results[(file, start, end)] = {}
+            groups = [key] + [g for g in self._registered.get(base or file,
+                                                              ())
+                              if g != key]
+        elif key not in results:
+            groups = [key]
+        else:
+            return results[key]
+
+        dropped = {}
+        missing = []
+        for group in groups:
+            cached = self._cache and self._cache.get(file, group, start, end)
+            if cached:
+                results[group], dropped[group] = cached
+            else:
+                missing.append(group)
+        if missing:
+            found, found_dropped = _scan_file(start, end, missing, file,
+                                              compressed)
+            results.update(found)
+            dropped.update(found_dropped)
+            if self._cache:
+                for group in missing:
+                    self._cache.put(file, group, start, end, found[group],
+                                    found_dropped[group])
+        self._write_dropped(file, dropped, dropped_logs)
+        return results[key]
+
+    def _write_dropped(self, file, dropped, dropped_logs):
+        """Append the dropped lines of file to dropped_logs, each once."""
+        if dropped_logs is None:
+            return
+        written = self._dropped.setdefault(file, set())
+        lines = []
+        for group_lines in dropped.values():
+            for line in group_lines:
+                if line not in written:
+                    written.add(line)
+                    lines.append(line)
+        if lines:
+            with open(dropped_logs, "ab") as f:
+                f.writelines(lines)
+
 
-def substring(start, end, substr, files, exclude_list=None, dropped_logs=None):
+def _scan_file(start, end, groups, file, compressed=False):
+    """Scan file once for every substring list in groups.
+
+    Returns two dicts mapping each group to its matching lines that fall
+    in the start/end window, each line ending with a newline as grep
+    prints it, and to those of its matching lines that are not valid
+    utf-8 (for dropped_logs), as bytes.
+    """
+    # Each distinct substring is searched on its own: a pattern with a
+    # literal prefix is then a fast C-level scan, which one alternation
+    # of all of them is not.
+    patterns = {}   # substring -> indexes of the groups using it
+    for index, group in enumerate(groups):
+        for pattern in group or ("",):
+            patterns.setdefault(pattern, set()).add(index)
+    matchers = [(_compile_substring(pattern), indexes)
+                for pattern, indexes in patterns.items()]
+    found = {group: [] for group in groups}
+    dropped = {group: [] for group in groups}
+    start_bytes = start.encode("utf-8")
+    end_bytes = end.encode("utf-8")
+
+    def scan_buffer(buf):
+        hits = {}   # line start -> [line end, group indexes]
+        for matcher, indexes in matchers:
+            pos = 0
+            while True:
+                m = matcher.search(buf, pos)
+                if m is None or m.start() == len(buf):
+                    break
+                line_start = buf.rfind(b"\n", 0, m.start()) + 1
+                pos = buf.find(b"\n", m.start()) + 1
+                # grep matches line by line; drop matches that ran into
+                # the next line (e.g. over '\s') unless the line matches
+                # by itself
+                if (b"\n" in m.group() and
+                        not matcher.search(buf, line_start, pos - 1)):
+                    continue
+                hit = hits.setdefault(line_start, [pos, set()])
+                hit[1].update(indexes)
+
+        for line_start in sorted(hits):
+            line_end, indexes = hits[line_start]
+            raw = buf[line_start:line_end]
+            date = _log_date(raw)
+            if date is not None and not (start_bytes < date < end_bytes):
+                continue
+            try:
+                line = raw.decode("utf-8")
+            except UnicodeDecodeError:
+                for index in indexes:
+                    dropped[groups[index]].append(raw)
+                continue
+            for index in indexes:
+                _append_in_window(start, end, found[groups[index]], line)
+
+    opener = gzip.open if compressed else open
+    with opener(file, "rb") as f:
+        remaining = None
+        if not compressed:
+            size = os.fstat(f.fileno()).st_size
+            hi = _bisect_date(f, size, end_bytes, unknown_is_after=False)
+            lo = _bisect_date(f, hi, start_bytes, unknown_is_after=True)
+            f.seek(lo)
+            remaining = hi - lo
+        carry = b""
+        while True:
+            size = _SCAN_CHUNK if remaining is None else min(_SCAN_CHUNK,
+                                                             remaining)
+            chunk = f.read(size) if size else b""
+            if remaining is not None:
+                remaining -= len(chunk)
+            if not chunk:
+                if carry:
+                    scan_buffer(carry if carry.endswith(b"\n")
+                                else carry + b"\n")
+                break
+            buf = carry + chunk
+            cut = buf.rfind(b"\n") + 1
+            buf, carry = buf[:cut], buf[cut:]
+            if buf:
+                scan_buffer(buf)
+    return found, dropped
+
+
+def substring(start, end, substr, files, exclude_list=None, dropped_logs=None,
+              scanner=None):
     """Substring algorithm
     Looks for all substrings in substr within files
 
@@ -35,6 +399,8 @@ def substring(start, end, substr, files, exclude_list=None, dropped_logs=None):
         files  (string list): List of absolute filepaths to search in
         exclude_list (string list): list of strings to exclude from report
         dropped_logs (string): path/filename to write dropped logs
+        scanner (SubstringScanner): scanner shared with other searches of
+                                    the same files (default: a new one)
     Errors:
         FileNotFoundError
     """
@@ -43,6 +409,9 @@ def substring(start, end, substr, files, exclude_list=None, dropped_logs=None):
     # analyze older files, continue with current file
     CONTINUE_CURRENT_OLD = 1
 
+    if scanner is None:
+        scanner = SubstringScanner()
+
     data = []
     for file in files:
         try:
@@ -55,8 +424,6 @@ def substring(start, end, substr, files, exclude_list=None, dropped_logs=None):
                     continue
             cont = True
             # Searching through file
-            command = (f"""grep -Ea "{'|'.join(s for s in substr)}" """
-                       f"""{file} 2>/dev/null""")
             status = _continue(start, end, file)
 
             if (status == CONTINUE_CURRENT or
@@ -64,28 +431,26 @@ def substring(start, end, substr, files, exclude_list=None, dropped_logs=None):
                 # continue with current file
                 if status == CONTINUE_CURRENT:
                     cont = False
-                _evaluate_substring(start, end, data, command, dropped_logs)
+                data.extend(scanner.search(start, end, substr, file,
+                                           dropped_logs=dropped_logs))
 
             # Searching through rotated log files that aren't compressed
             n = 1
             while os.path.exists(f"{file}.{n}") and cont:
-                command = (f"""grep -Ea "{'|'.join(s for s in substr)}" """
-                           f"""{file}.{n} 2>/dev/null""")
                 status = _continue(start, end, f"{file}.{n}")
 
                 if (status == CONTINUE_CURRENT or
                         status == CONTINUE_CURRENT_OLD):
                     if status == CONTINUE_CURRENT:
                         cont = False
-                    _evaluate_substring(start, end, data, command,
-                                        dropped_logs)
+                    data.extend(scanner.search(start, end, substr,
+                                               f"{file}.{n}", base=file,
+                                               dropped_logs=dropped_logs))
 
                 n += 1
 
             # Searching through rotated log files
             while os.path.exists(f"{file}.{n}.gz") and cont:
-                command = (f"""zgrep -E "{'|'.join(s for s in substr)}" """
-                           f"""{file}.{n}.gz 2>/dev/null""")
                 status = _continue(start, end, f"{file}.{n}.gz",
                                    compressed=True)
 
@@ -93,8 +458,10 @@ def substring(start, end, substr, files, exclude_list=None, dropped_logs=None):
                         status == CONTINUE_CURRENT_OLD):
                     if status == CONTINUE_CURRENT:
                         cont = False
-                    _evaluate_substring(start, end, data, command,
-                                        dropped_logs)
+                    data.extend(scanner.search(start, end, substr,
+                                               f"{file}.{n}.gz", base=file,
+                                               compressed=True,
+                                               dropped_logs=dropped_logs))
 
                 n += 1
 
@@ -138,18 +505,11 @@ def _continue(start, end, file, compressed=False):
     # start, end dates
     first = ""
 
-    if not compressed:
-        with open(file) as f:
-            line = f.readline()
-            first = line[0:19]
-    else:
-        with gzip.open(file, "rb") as f:
-            line = f.readline().decode("utf-8")
-            first = line[0:19]
-    try:
-        datetime.strptime(line[0:19], "%Y-%m-%dT%H:%M:%S")
-        first = line[0:19]
-    except ValueError:
+    opener = gzip.open if compressed else open
+    with opener(file, "rb") as f:
+        # only the timestamp needs to decode; the rest may not be utf-8
+        first = f.readline()[0:19].decode("utf-8", errors="replace")
+    if not _TIMESTAMP_SHAPE.match(first):
         return CONTINUE_CURRENT_OLD
 
     if first < start:
@@ -182,17 +542,4 @@ def _evaluate_substring(start, end, data, command, dropped_logs=None):
                     file.write(raw_line)
             continue
 
-        # different date locations for log events
-        dates = [line[0:19], line[2:21]]
-        for date in dates:
-            try:
-                datetime.strptime(date, "%Y-%m-%dT%H:%M:%S")
-                if date > start and date < end:
-                    if line[0] == "|":  # sm-customer.log edge case
-                        line = line[1:].strip()
-                        line = re.sub("\\s+", " ", line)
-                    data.append(line)
-                break
-            except ValueError:
-                if date == dates[-1]:
-                    data.append(line)
+        _append_in_window(start, end, data, line)
@@ -20,7 +20,7 @@ import os
 from plugin_algs.substring import substring
 
 
-def swact_activity(hosts, start, end, dropped_logs=None):
+def swact_activity(hosts, start, end, dropped_logs=None, scanner=None):
     """Swact activity algorithm
     Presents all log messages about swacting activity in the system, such as
     "Uncontrolled swact"
@@ -30,6 +30,8 @@ def swact_activity(hosts, start, end, dropped_logs=None):
         start (string): Start time for analysis
         end (string): End time for analysis
         dropped_logs (string): path/filename to write dropped logs
+        scanner (SubstringScanner): scanner shared with other searches
+                                    (default: a new one)
     Returns:
         data (list): a list of logs that represent evidence of swact activity
     """
@@ -52,7 +54,7 @@ def swact_activity(hosts, start, end, dropped_logs=None):
                      "Service (.+) has reached max failures",
                      "Swact update"]
     data = substring(start, end, sm_substrings, sm_files,
-                     dropped_logs=dropped_logs)
+                     dropped_logs=dropped_logs, scanner=scanner)
 
     for i, line in enumerate(data):
         if "Swact has started," in line and not swact_in_progress:
@@ -69,6 +71,7 @@ def swact_activity(hosts, start, end, dropped_logs=None):
         "swact", "active-failed\\s+\\| disabling-failed\\s+\\|"
     ]
     data += substring(start, end, sm_customer_substrings,
-                      sm_customer_files, dropped_logs=dropped_logs)
+                      sm_customer_files, dropped_logs=dropped_logs,
+                      scanner=scanner)
 
     return sorted(data)
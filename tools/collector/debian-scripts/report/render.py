@@ -10,12 +10,20 @@
 # The Rendering tool visualizes the collect bundle and generates
 # an index.html file
 #
+# The html is written to the output files as it is generated. Plugin
+# and correlated output files and collect bundle files are shown in
+# iframes that only load when their item is selected, and the collect
+# bundle tree of each host is a page of its own, collect_<host>.html,
+# opened from the Collect Bundle menu.
+#
 ########################################################################
 
 from datetime import datetime
 import os
 from pathlib import Path
 import re
+import shutil
+import tempfile
 
 
 def exclude_path():
@@ -128,9 +136,12 @@ def controller_sort(x):
     return x[0] != 'controller-0'
 
 
-def html_css():
+def html_css(title="Report Analysis"):
     """Static css code of the rendering tool
 
+    Parameters:
+    title (string): the page title
+
     iframe, textarea: the content panel showing information
     #show-worker: the show more worker button
     .container-menu: the overall layout of the page
@@ -141,7 +152,7 @@ def html_css():
     <!DOCTYPE html>
     <html>
     <head>
-        <title>Report Analysis</title>
+        <title>{title}</title>
         <style>
             html, body {{
                 overflow-x: hidden;
@@ -284,7 +295,7 @@ def html_css():
         </style>
     </head>
     """
-    return html_content_css
+    return html_content_css.format(title=title)
 
 
 def html_script():
@@ -297,6 +308,8 @@ def html_script():
     showContentStorage: display content of selected storage item
     showContentWorker: display content of selected worker item
     showContentTwo: display content of result section
+    showContentThree: display content of collect bundle file
+    loadFrame: load the iframe of a content item on first display
     toggleTree: show the collect bundle
     """
     html_content_script = """
@@ -373,6 +386,13 @@ def html_script():
         }}
     }}
 
+    function loadFrame(content) {{
+        const frame = content.querySelector('iframe[data-src]');
+        if (frame && !frame.src) {{
+            frame.src = frame.dataset.src;
+        }}
+    }}
+
     function showContentTwo(event, contentId) {{
         event.preventDefault();
 
@@ -383,6 +403,7 @@ def html_script():
 
         const selectedContent = document.getElementById(contentId);
         if (selectedContent) {{
+            loadFrame(selectedContent);
             selectedContent.style.display = 'block';
         }}
     }}
@@ -397,6 +418,7 @@ def html_script():
 
         const selectedContent = document.getElementById(contentId);
         if (selectedContent) {{
+            loadFrame(selectedContent);
             selectedContent.style.display = 'block';
         }}
     }}
@@ -494,30 +516,6 @@ def html_script():
     // Call the function when the page loads to initialize the tree behavior
     toggleTree();
 
-    document.addEventListener("DOMContentLoaded", function() {{
-    var hash = window.location.hash;
-    var sectionA = document.getElementById('content-one');
-    var sectionB = document.getElementById('content-two');
-    var sectionC = document.getElementById('content-three');
-    var collectSections = document.querySelectorAll('[id*="collect"]');
-
-    collectSections.forEach(function(section) {{
-        section.classList.add('hidden');
-    }});
-
-    sectionC.classList.add('hidden');
-
-    if (hash.includes("collect")) {{
-        sectionA.classList.add('hidden');
-        sectionB.classList.add('hidden');
-        sectionC.classList.remove('hidden');
-        var matchingElement = document.querySelector(hash);
-        if (matchingElement) {{
-            matchingElement.classList.remove('hidden');
-        }}
-    }}
-    }});
-
     document.addEventListener("DOMContentLoaded", function() {{
         const containers = document.querySelectorAll('.container-menu');
 
@@ -544,13 +542,6 @@ def html_script():
         }});
     }});
 
-    window.onload = function() {{
-        var hash = window.location.hash;
-        if (hash.includes("collect")) {{
-            document.title = hash.substring(8, hash.length - 14);
-        }}
-    }};
-
     </script>
     </html>
     """
@@ -661,12 +652,13 @@ def html_info(sys_section):
     return html_content_one
 
 
-def html_result(log_contents, output_dir):
+def html_result(out, log_contents, output_dir):
     """Result part generation in the menu-content style
     generates correlated results, plugin results, and the items under them
     subitems for plugins and correlated results under separate menus
 
     Parameters:
+    out (file): where to write the html
     log_contents (string): content of the summary
     output_dir (string): the location of output
     """
@@ -694,99 +686,121 @@ def html_result(log_contents, output_dir):
         if os.path.isfile(file) and file != "system_info":
             plugin_items.append({'name': file, 'id': f'content-item-{file}'})
 
-    html_content_two = ""
-
-    html_content_two += """
+    out.write("""
     <div id="content-two" class="container-menu">
         <div class="menu">
         <ul>
         <li>
         <a href="#" onclick="toggleMenu(event, 'correlated-results-submenu')" class="menuTitle"> <span id="correlated-results-toggle" onclick="toggleSub(event, 'correlated-results-submenu', 'correlated-results-toggle')">- </span>
         Correlated Results</a>
-            <ul id="correlated-results-submenu" style="display: block">"""
+            <ul id="correlated-results-submenu" style="display: block">""")
 
     for item in correlated_items:
-        html_content_two += f'<li><a href="#" class="toggle-sign" onclick="showContentTwo(event, \'{item["id"]}\')">{item["name"]}</a></li>'
+        out.write(f'<li><a href="#" class="toggle-sign" onclick="showContentTwo(event, \'{item["id"]}\')">{item["name"]}</a></li>')
 
-    html_content_two += """ </ul>
+    out.write(""" </ul>
         </li>
         <hr>
         <li>
         <a href="#" onclick="toggleMenu(event, 'plugin-results-submenu')" class="menuTitle"> <span id="plugin-results-toggle" onclick="toggleSub(event, 'plugin-results-submenu', 'plugin-results-toggle')">+ </span>
         Plugin Results</a>
-        <ul id="plugin-results-submenu" style="display: none">"""
+        <ul id="plugin-results-submenu" style="display: none">""")
 
     for item in plugin_items:
-        html_content_two += f'<li><a href="#" class="toggle-sign" onclick="showContentTwo(event, \'{item["id"]}\')">{item["name"]}</a></li>'
+        out.write(f'<li><a href="#" class="toggle-sign" onclick="showContentTwo(event, \'{item["id"]}\')">{item["name"]}</a></li>')
 
-    html_content_two += "</ul></li><hr>" + generate_collect() + "</ul></div><div class='resizer'></div>"
-    html_content_two += """<div class="content">"""
+    out.write("</ul></li><hr>" + generate_collect() + "</ul></div><div class='resizer'></div>")
+    out.write("""<div class="content">""")
 
+    # the iframes load when their item is shown ; see loadFrame()
     for item in correlated_items:
-        html_content_two += f'<div class="content-itemtwo" id="{item["id"]}"><h2>{item["name"].capitalize()}</h2><iframe src="{item["name"]}"></iframe></div>'
+        out.write(f'<div class="content-itemtwo" id="{item["id"]}"><h2>{item["name"].capitalize()}</h2><iframe data-src="{item["name"]}"></iframe></div>')
 
     for item in plugin_items:
-        html_content_two += f'<div class="content-itemtwo" id="{item["id"]}"><h2>{item["name"].capitalize()}</h2><iframe src="plugins/{item["name"]}"></iframe></div>'
+        out.write(f'<div class="content-itemtwo" id="{item["id"]}"><h2>{item["name"].capitalize()}</h2><iframe data-src="plugins/{item["name"]}"></iframe></div>')
 
-    html_content_two += f'<div class="content-itemtwo" id="content-item-correlated_results" style="display:block"><h2>Correlated Results</h2><textarea>{correlated_section}</textarea></div>'
-    html_content_two += f'<div class="content-itemtwo" id="content-item-plugin_results"><h2>Plugin Results</h2><textarea>{plugin_section}</textarea></div>'
-    html_content_two += """
+    out.write(f'<div class="content-itemtwo" id="content-item-correlated_results" style="display:block"><h2>Correlated Results</h2><textarea>{correlated_section}</textarea></div>')
+    out.write(f'<div class="content-itemtwo" id="content-item-plugin_results"><h2>Plugin Results</h2><textarea>{plugin_section}</textarea></div>')
+    out.write("""
     </div>
     </div>
+    """)
+
+
+def collect_page_name(host_dir_name):
+    """Return the file name of the collect bundle page of a host
+
+    Parameters:
+    host_dir_name (string): the name of the host directory
     """
+    return "collect_" + re.sub(r'[^a-zA-Z0-9]', '', host_dir_name) + ".html"
 
-    return html_content_two
+
+def collect_host_dirs():
+    """Return the host directories of the collect bundle, the current
+    directory
+    """
+    return [item for item in Path('.').iterdir()
+            if item.is_dir() and item.name != "report_analysis"]
 
 
 def generate_collect():
     os.chdir('../../')
-    current_directory = Path('.')
     finalstr = """<li><a href="#" class="menuTitle">
         <span id="bundle-toggle" onclick="toggleSub(event, 'bundle-submenu', 'bundle-toggle')">+ </span>
         Collect Bundle</a><ul id="bundle-submenu" style="display: none">"""
-    for item in current_directory.iterdir():
-        if item.is_dir() and item.name != "report_analysis":
-            temp_item = re.sub(r'[^a-zA-Z0-9]', '', item.name)
-            finalstr += f'<a href="#collect{temp_item}" target="_blank">{item.name}</a>'
+    for item in collect_host_dirs():
+        finalstr += f'<a href="{collect_page_name(item.name)}" target="_blank">{item.name}</a>'
     finalstr += "</ul></li>"
     return finalstr
 
 
-def html_collect():
+def html_collect(output_dir):
     """Collect bundle code generation
 
-    Calls a helper function to to generate the collect bundle
+    Writes the collect bundle page of each host to output_dir, calling a
+    helper function to generate its directory tree. The tree and file
+    content parts are written as the tree is walked, the content part
+    through a temporary file, so neither is held in memory.
+
+    Parameters:
+    output_dir (string): the absolute path of the report output
     """
     current_directory = Path('.')
-    tree_html = ""
-    content_html = "<div class='content'>"
     target_dir = current_directory.resolve()
-    newtree_html, newcontent_html = generate_directory_tree(current_directory, exclude_path(), target_dir, 0)
-    tree_html += newtree_html
-    content_html += newcontent_html
-    content_html += "</div>"
-    html_content_three = """<div class="container-menu" id="content-three"><div class="menu" style="max-height: 90vh">
-        """ + tree_html + "</div><div class='resizer'></div>" + content_html + "</div></body>"
-    return html_content_three
-
-
-def generate_directory_tree(directory_path, exclude_path, target_dir, is_top_level):
+    excludes = exclude_path()
+    for host_dir in collect_host_dirs():
+        page = os.path.join(output_dir, collect_page_name(host_dir.name))
+        with open(page, "w") as out, tempfile.TemporaryFile("w+") as content:
+            out.write(html_css(host_dir.name))
+            out.write("""<body><div class="container-menu" id="content-three"><div class="menu" style="max-height: 90vh">
+        """)
+            generate_directory_tree(host_dir, excludes, target_dir, 1,
+                                    out, content)
+            out.write("</div><div class='resizer'></div><div class='content'>")
+            content.seek(0)
+            shutil.copyfileobj(content, out)
+            out.write("</div></div></body>")
+            out.write(html_script())
+
+
+def generate_directory_tree(directory_path, exclude_path, target_dir, is_top_level, tree_out, content_out):
     """Helper function for Collect bundle generation
 
     Parameters:
     directory_path(Path): the path of the directory in each call
     target_dir(string): the path of the file/folder
     is_top_level(bool): if the level is the top level of the collect bundle
+    tree_out(file): where to write the tree html
+    content_out(file): where to write the file content html
     """
     directory_name = directory_path.name
-    tree_html = ""
-    content_html = ""
     approved_list = ['.log', '.conf', '.info', '.json', '.alarm', '.pid', '.list', '.lock', '.txt']
     if is_top_level == 1:
         temp_name = re.sub(r'[^a-zA-Z0-9]', '', directory_name)
-        tree_html = f'<li id=collect{temp_name}><div class="menuTitle">{directory_name}</div><ul>'
+        tree_out.write(f'<li id=collect{temp_name}><div class="menuTitle">{directory_name}</div><ul>')
     if is_top_level > 1:
-        tree_html = f'<li><span class="caret">{directory_name}</span><ul class="nested">'
+        tree_out.write(f'<li><span class="caret">{directory_name}</span><ul class="nested">')
     for item in directory_path.iterdir():
         # write to a file called 'exclude', all the files including the full path
         # if item in exclude, do not add to html
@@ -795,26 +809,22 @@ def generate_directory_tree(directory_path, exclude_path, target_dir, is_top_lev
         if not any(exclude_item in item_path for exclude_item in exclude_path):
             try:
                 if item.is_dir() and item.name != "report_analysis":
-                    nested_tree_html, nested_content_html = generate_directory_tree(item, exclude_path, target_dir, is_top_level + 1)
-                    tree_html += nested_tree_html
-                    content_html += nested_content_html
+                    generate_directory_tree(item, exclude_path, target_dir, is_top_level + 1, tree_out, content_out)
                 elif item.is_file():
                     if not can_open_file(item):
-                        tree_html += f'<li><a style="color: #808080">{item}</a></li>'
+                        tree_out.write(f'<li><a style="color: #808080">{item}</a></li>')
                     else:
                         if item.name.endswith(tuple(approved_list)):
-                            tree_html += f'<li><a href="#" class="toggle-sign" onclick="showContentThree(event, \'{item}\')">{item.name}</a></li>'
-                            content_html += f'<div class="content-itemthree" id="{item}"><h2>{item.name}</h2><iframe src="{target_dir}/{item}"></iframe></div>'
+                            tree_out.write(f'<li><a href="#" class="toggle-sign" onclick="showContentThree(event, \'{item}\')">{item.name}</a></li>')
+                            content_out.write(f'<div class="content-itemthree" id="{item}"><h2>{item.name}</h2><iframe data-src="{target_dir}/{item}"></iframe></div>')
                         else:
                             if not item.name.endswith(".tgz") and not item.name.endswith(".gz"):
-                                tree_html += f'<li><a href="../{item}" target="_blank">{item}</a></li>'
+                                tree_out.write(f'<li><a href="../{item}" target="_blank">{item}</a></li>')
             # if it's permission error, just skip reading the file or folder
             except PermissionError as e:
                 continue
     if is_top_level:
-        tree_html += '</ul></li>'
-
-    return tree_html, content_html
+        tree_out.write('</ul></li>')
 
 
 # main
@@ -828,13 +838,17 @@ def main(input_dir, output_dir):
         sysinfo_contents = file.read()
 
     # pre-set html file path
-    html_file = os.path.abspath(os.path.join(output_dir, 'index.html'))
+    output_dir = os.path.abspath(output_dir)
+    html_file = os.path.join(output_dir, 'index.html')
 
     sys_section = sysinfo_contents.strip().split("\n\n")
-    html_content = html_css() + html_info(sys_section) + html_result(log_contents, output_dir)
-    html_content = html_content.format()
-    html_content += html_collect() + html_script()
 
-    # write the HTML content to file
-    with open(html_file, "w") as file:
-        file.write(html_content)
+    # write the HTML content to file as it is generated
+    with open(html_file, "w") as out:
+        out.write(html_css())
+        out.write(html_info(sys_section))
+        html_result(out, log_contents, output_dir)
+        out.write("</body>")
+        out.write(html_script())
+
+    html_collect(output_dir)
@@ -95,6 +95,9 @@
 # > report.py -f /path/to/bundle.tar  - specify path to a bundle tar file
 # > report.py -d <dir> [plugin ...]   - Run only specified plugins
 # > report.py -d <dir> <algs> [labels]- Run algorithm with labels
+# > report.py -d <dir> --jobs 8       - Run plugins on 8 processes
+# > report.py -d <dir> --extract-all  - Extract host tarballs in full
+# > report.py -d <dir> --no-cache     - Do not reuse earlier scan results
 # > report.py <algorithm> --help      - algorithm specific help
 #
 #    See --help output for a complete list of full and abbreviated
@@ -111,7 +114,6 @@ import logging
 import os
 import re
 import shutil
-import subprocess
 import sys
 import tarfile
 import tempfile
@@ -119,6 +121,7 @@ import time
 
 # internal imports
 import algorithms
+import bundle_reader
 from execution_engine import ExecutionEngine
 from plugin import Plugin
 import render
@@ -339,18 +342,19 @@ class BundleObject:
         if not os.path.exists(bundle_tar):
             logger.error("Error: No collect tar bundle found: %s", bundle_tar)
             sys.exit()
+        output = []
         try:
-            result = subprocess.run(["tar", "tf", bundle_tar],
-                                    stdout=subprocess.PIPE)
-            output = result.stdout.decode('utf-8').splitlines()
+            output = bundle_reader.list_members(bundle_tar)
             logger.debug("... bundle info: %s", output)
-        except subprocess.CalledProcessError as e:
+        except tarfile.TarError as e:
             logger.error(e)
-        except subprocess.PermissionError as e:
+        except PermissionError as e:
             logger.error(e)
 
         if output != []:
             for item in output:
+                if "/" not in item:
+                    continue
                 dir, file = item.split("/", 1)
                 if dir is None:
                     continue
@@ -391,11 +395,10 @@ class BundleObject:
                 sys.exit("Collect bundle must be writable for analysis.")
             try:
                 logger.info("extracting %s", bundle_tar)
-                untar_data = subprocess.run(
-                    ["tar", "xfC", bundle_tar, self.input_dir],
-                    check=True, stdout=subprocess.PIPE)
-                logger.debug(untar_data)
-            except subprocess.CalledProcessError as e:
+                for message in bundle_reader.extract_tar(bundle_tar,
+                                                         self.input_dir):
+                    logger.error(message.rstrip())
+            except tarfile.TarError as e:
                 logger.error(e)
             except PermissionError as e:
                 logger.error(e)
@@ -552,6 +555,13 @@ def parse_args():
         "(default: current date)",
     )
 
+    parser.add_argument(
+        "--extract-all",
+        action="store_true",
+        help="Extract the host tarballs in full rather than only the files "
+        "the plugins read",
+    )
+
     parser.add_argument(
         "--hostname",
         default="all",
@@ -559,6 +569,21 @@ def parse_args():
         "(default: all hosts)",
     )
 
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Specify the number of plugin work units and host tarball "
+        "extractions to run in parallel processes (default: 1)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Scan the logs again rather than reuse the substring search "
+        "results of earlier runs on the same bundle",
+    )
+
     parser.add_argument(
         "--plugin", "-p",
         default=None,
@@ -718,6 +743,9 @@ def parse_args():
 def validate_args(args):
     """Validate arguments and return (input_dir, output_dir)."""
 
+    if args.jobs < 1:
+        sys.exit("Error: --jobs must be 1 or more")
+
     if args.file:
         if not os.path.exists(args.file):
             sys.exit("Error: Specified file (" + args.file +
@@ -732,15 +760,9 @@ def validate_args(args):
                      ") is not a tar file.\nPlease specify a tar file "
                      "using the --file option.")
         else:
-            try:
-                input_dir = os.path.dirname(args.file)
-                output_dir = os.path.join(input_dir, analysis_folder_name)
-                subprocess.run(["tar", "xfC", args.file], check=True)
-            except subprocess.CalledProcessError as e:
-                print(e)
-            except PermissionError as e:
-                print(e)
-                sys.exit("Permission Error: Unable to extract bundle")
+            # the bundle is extracted by process_bundle
+            input_dir = os.path.dirname(args.file)
+            output_dir = os.path.join(input_dir, analysis_folder_name)
 
     elif args.directory:
         output_dir = os.path.join(args.directory, analysis_folder_name)
@@ -892,7 +914,9 @@ def run_tests(with_cov=False):
         source_modules = [
             'report',
             'execution_engine',
-            'correlator', 'plugin',
+            'bundle_reader',
+            'correlator', 'event_store', 'fm_event_log', 'plugin',
+            'render',
             'algorithms',
             'plugin_algs.substring',
             'plugin_algs.alarm',
@@ -918,39 +942,43 @@ def run_tests(with_cov=False):
     sys.exit(0 if result.wasSuccessful() else 1)
 
 
-def run_conftool(hostnames, bundle_dir):
+def run_conftool(hostnames, bundle_dir, jobs=1, timeout=120):
     """Run conftool for each discovered host to extract config summaries.
 
-    Non-fatal: if conftool fails for any host, log and continue.
-    Output goes to <bundle_dir>/config/<hostname>/
+    The hosts are processed by the conftool library, jobs at a time,
+    each on a worker process that is allowed timeout seconds.
+    Non-fatal: if conftool fails or times out for any host, log and
+    continue.
+    Output goes to <bundle_dir>/config/<hostname>/, with a bundle index
+    in <bundle_dir>/config/index.json
     """
     conftool_dir = os.path.join(report_dir, "conftool")
-    conftool_path = os.path.join(conftool_dir, "conftool")
 
-    if not os.path.exists(conftool_path):
-        logger.debug("conftool not found at %s — skipping", conftool_path)
+    if not os.path.exists(os.path.join(conftool_dir,
+                                       "conftool_runner.py")):
+        logger.debug("conftool not found at %s — skipping", conftool_dir)
+        return
+
+    if conftool_dir not in sys.path:
+        sys.path.insert(0, conftool_dir)
+    try:
+        import conftool_runner
+        results = conftool_runner.process_bundle(
+            bundle_dir, hostnames, jobs=jobs, timeout=timeout)
+    except Exception as e:
+        logger.debug("conftool error: %s", e)
         return
 
     completed_hosts = []
-    for hostname in hostnames:
-        try:
-            result = subprocess.run(
-                [sys.executable, conftool_path,
-                 '-b', bundle_dir, '-H', hostname],
-                capture_output=True, text=True, timeout=120,
-                cwd=conftool_dir
-            )
-            if result.returncode in (0, 1):
-                logger.debug("conftool: %s completed", hostname)
-                completed_hosts.append(hostname)
-            else:
-                logger.debug("conftool: %s failed (rc=%d): %s",
-                             hostname, result.returncode,
-                             result.stderr.strip())
-        except subprocess.TimeoutExpired:
-            logger.warning("conftool: %s timed out (120s)", hostname)
-        except Exception as e:
-            logger.debug("conftool: %s error: %s", hostname, e)
+    for result in results:
+        hostname = result["hostname"]
+        if result.get("error"):
+            logger.debug("conftool: %s failed: %s", hostname, result["error"])
+        elif result["host_dir"] is None:
+            logger.debug("conftool: %s has no host directory", hostname)
+        else:
+            logger.debug("conftool: %s completed", hostname)
+            completed_hosts.append(hostname)
 
     if completed_hosts:
         config_dir = os.path.join(bundle_dir, "config")
@@ -1013,15 +1041,6 @@ def main():
     logger.info("Report: %s ", output_dir)
     logger.info("")
 
-    # Initialize the execution engine
-    try:
-        engine = ExecutionEngine(args, obj.input_dir, output_dir)
-    except ValueError as e:
-        logger.error(str(e))
-        logger.error("Confirm you are running the report tool on a "
-                     "collect bundle")
-        sys.exit("Error: Failed to initialize execution engine")
-
     # Load plugins
     builtin_plugins_path = os.path.join(report_dir, "plugins")
     localhost_plugins_path = os.path.join("/etc/collect", "plugins")
@@ -1033,11 +1052,25 @@ def main():
     plugins = load_plugins(args, obj, builtin_plugins_path,
                            localhost_plugins_path)
 
+    # Only extract the host tarball files the plugins read
+    members = None
+    if not args.extract_all:
+        members = bundle_reader.plugin_members(plugins)
+
+    # Initialize the execution engine
+    try:
+        engine = ExecutionEngine(args, obj.input_dir, output_dir, members)
+    except ValueError as e:
+        logger.error(str(e))
+        logger.error("Confirm you are running the report tool on a "
+                     "collect bundle")
+        sys.exit("Error: Failed to initialize execution engine")
+
     # Run analysis
     engine.execute(plugins, output_dir)
 
     # Run conftool to extract host configuration summaries
-    run_conftool(engine.hostnames, obj.input_dir)
+    run_conftool(engine.hostnames, obj.input_dir, args.jobs)
 
     # Generate HTML report
     render.main(input_dir, output_dir)
@@ -30,13 +30,23 @@ TEST_FILES = [
     'test_correlator.py',
     'test_plugin.py',
     'test_alarm.py',
+    'test_execution_engine.py',
+    'test_bundle_reader.py',
+    'test_event_store.py',
+    'test_fm_event_log.py',
+    'test_render.py',
+    'test_benchmark.py',
 ]
 
 SOURCE_MODULES = [
     'report',
     'execution_engine',
+    'bundle_reader',
     'correlator',
+    'event_store',
+    'fm_event_log',
     'plugin',
+    'render',
     'algorithms',
     'plugin_algs.substring',
     'plugin_algs.alarm',
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# Tests for the benchmark bundle generator and harness (benchmark/).
+#
+########################################################################
+
+import gzip
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import unittest
+
+REPORT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPORT_DIR)
+sys.path.insert(0, os.path.join(REPORT_DIR, "benchmark"))
+
+from fm_event_log import EventLog  # noqa: E402
+from make_bundle import make_bundle  # noqa: E402
+import run_benchmark  # noqa: E402
+
+
+class TestMakeBundle(unittest.TestCase):
+    """Synthetic collect bundles."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _make(self, **options):
+        return make_bundle(self.temp_dir, controllers=1, workers=1,
+                           rate=2, period=60, rotations=1, fm_rows=10,
+                           match_every=5, **options)
+
+    def test_host_tarballs(self):
+        """One host tgz per host with rotated logs and a fm database."""
+        bundle_dir = self._make()
+        self.assertEqual(sorted(os.listdir(bundle_dir)),
+                         ["compute-0_20250101.120000.tgz",
+                          "controller-0_20250101.120000.tgz"])
+        with tarfile.open(os.path.join(
+                bundle_dir, "controller-0_20250101.120000.tgz")) as tar:
+            tar.extractall(self.temp_dir)
+        host_dir = os.path.join(self.temp_dir,
+                                "controller-0_20250101.120000")
+        log = os.path.join(host_dir, "var", "log", "sm.log")
+        with open(log) as file:
+            live = file.readlines()
+        with gzip.open(log + ".1.gz", "rt") as file:
+            rotated = file.readlines()
+        self.assertEqual(len(live), 120)
+        self.assertEqual(len(rotated), 120)
+        # the rotated generation holds the period before the live log
+        self.assertTrue(rotated[0].startswith("2025-01-01T11:58:00.000 "))
+        self.assertTrue(live[0].startswith("2025-01-01T11:59:00.000 "))
+        self.assertTrue(live[-1].startswith("2025-01-01T11:59:59.500 "))
+        self.assertEqual(len(list(EventLog.from_host_dir(host_dir))), 10)
+
+    def test_deterministic(self):
+        """The same options and seed give the same logs."""
+        bundle_dir = self._make()
+        tgz = os.path.join(bundle_dir, "compute-0_20250101.120000.tgz")
+        with tarfile.open(tgz) as tar:
+            first = tar.extractfile(
+                "compute-0_20250101.120000/var/log/pmond.log").read()
+        shutil.rmtree(bundle_dir)
+        self._make()
+        with tarfile.open(tgz) as tar:
+            second = tar.extractfile(
+                "compute-0_20250101.120000/var/log/pmond.log").read()
+        self.assertEqual(first, second)
+
+    def test_needs_a_controller(self):
+        """A bundle without controllers is refused."""
+        with self.assertRaises(ValueError):
+            make_bundle(self.temp_dir, controllers=0)
+
+
+def _fail():
+    raise RuntimeError("stage failed")
+
+
+class TestHarness(unittest.TestCase):
+    """Stage measurements and result comparison."""
+
+    def test_measure(self):
+        """A stage reports its time, peak RSS and bytes read."""
+        result = run_benchmark.measure(sum, [1, 2])
+        self.assertGreaterEqual(result["wall_s"], 0)
+        self.assertGreater(result["peak_rss_kb"], 0)
+        self.assertIn("read_bytes", result)
+        result = run_benchmark.measure(_fail)
+        self.assertIn("RuntimeError: stage failed", result["error"])
+
+    def test_compare(self):
+        """Increases over the threshold are regressions."""
+        baseline = {"bundle": {"rate": 2}, "stages": {
+            "render": {"wall_s": 1.0, "peak_rss_kb": 1000,
+                       "read_bytes": 100},
+            "correlator": {"wall_s": 0.01, "peak_rss_kb": 1000,
+                           "read_bytes": None},
+        }}
+        current = {"bundle": {"rate": 2}, "stages": {
+            "render": {"wall_s": 1.5, "peak_rss_kb": 1050,
+                       "read_bytes": 100},
+            # doubled, but by less than MIN_WALL_S_CHANGE
+            "correlator": {"wall_s": 0.02, "peak_rss_kb": 1000,
+                           "read_bytes": 10},
+            "extract": {"error": "stage process died"},
+        }}
+        lines, regressions = run_benchmark.compare(baseline, current, 10)
+        self.assertEqual(regressions, ["render wall_s"])
+        self.assertEqual(len(lines), 5)
+        current["bundle"] = {"rate": 4}
+        lines, _ = run_benchmark.compare(baseline, current, 10)
+        self.assertIn("different bundles", lines[0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
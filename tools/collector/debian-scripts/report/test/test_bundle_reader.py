@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# Tests for the streaming collect bundle reader (bundle_reader.py).
+#
+########################################################################
+
+import glob
+import io
+import json
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bundle_reader  # noqa: E402
+from bundle_reader import MemberFilter  # noqa: E402
+from plugin import Plugin  # noqa: E402
+
+PLUGINS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "plugins")
+
+HOST_FILES = [
+    "var/extra/host.info",
+    "var/extra/sm.info",
+    "var/extra/database/fm.db.sql.txt",
+    "var/extra/database/sysinv.db.sql.txt",
+    "var/log/mtcAgent.log",
+    "var/log/mtcAgent.log.1",
+    "var/log/mtcAgent.log.2.gz",
+    "var/log/mtcAgent.log.old",
+    "var/log/kern.log",
+    "var/log/puppet/latest/puppet.log",
+    "etc/platform/platform.conf",
+    "etc/hosts",
+    "etc/ssh/sshd_config",
+]
+
+
+def _add_file(tar, name, data):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    tar.addfile(info, io.BytesIO(data))
+
+
+def _host_files(host_dir):
+    """Paths of the regular files below host_dir, relative to it"""
+    return sorted(os.path.relpath(os.path.join(root, name), host_dir)
+                  for root, _, names in os.walk(host_dir)
+                  for name in names
+                  if name != bundle_reader.MEMBERS_MARKER)
+
+
+class TestMemberFilter(unittest.TestCase):
+    """Member selection by host relative path."""
+
+    def test_files_match_their_rotations(self):
+        members = MemberFilter(["var/log/mtcAgent.log"])
+        self.assertTrue(members.match("var/log/mtcAgent.log"))
+        self.assertTrue(members.match("var/log/mtcAgent.log.1"))
+        self.assertTrue(members.match("var/log/mtcAgent.log.12.gz"))
+        self.assertFalse(members.match("var/log/mtcAgent.log.old"))
+        self.assertFalse(members.match("var/log/mtcAgent.log2"))
+
+    def test_dirs_and_patterns(self):
+        members = MemberFilter(dirs=["var/log/puppet"],
+                               patterns=[r"var/extra/[^/]+\.info"])
+        self.assertTrue(members.match("var/log/puppet/latest/puppet.log"))
+        self.assertFalse(members.match("var/log/puppet"))
+        self.assertTrue(members.match("var/extra/sm.info"))
+        self.assertFalse(members.match("var/extra/platform/x.info"))
+        self.assertFalse(MemberFilter().match("var/log/kern.log"))
+
+    def test_covers_and_union(self):
+        small = MemberFilter(["a"], ["d"])
+        large = small.union(MemberFilter(["b"]))
+        self.assertTrue(large.covers(small))
+        self.assertFalse(small.covers(large))
+        self.assertEqual(MemberFilter.from_dict(large.to_dict()).to_dict(),
+                         large.to_dict())
+
+    def test_plugin_members(self):
+        plugins = [Plugin(path)
+                   for path in sorted(glob.glob(
+                       os.path.join(PLUGINS_DIR, "*")))
+                   if not path.endswith("__init__.py")]
+        members = bundle_reader.plugin_members(plugins)
+        for path in ("var/log/mtcAgent.log", "var/log/sm.log.3.gz",
+                     "var/log/puppet/latest/puppet.log",
+                     "var/extra/database/fm.db.sql.txt",
+                     "var/extra/coredump.info", "etc/build.info",
+                     "etc/hosts", "var/extra/software/software.json"):
+            self.assertTrue(members.match(path), path)
+        for path in ("var/log/kern.log", "etc/ssh/sshd_config",
+                     "var/extra/database/sysinv.db.sql.txt"):
+            self.assertFalse(members.match(path), path)
+
+
+class TestExtraction(unittest.TestCase):
+    """Bundle and host tarball extraction."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.bundle = os.path.join(self.temp_dir, "bundle")
+        os.makedirs(self.bundle)
+        self.hostnames = ["controller-0", "controller-1", "compute-0"]
+        for hostname in self.hostnames:
+            self._add_host(hostname)
+        self.members = MemberFilter(
+            ["var/extra/host.info", "var/extra/database/fm.db.sql.txt",
+             "var/log/mtcAgent.log"], ["var/log/puppet"])
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _host_dir(self, hostname):
+        return os.path.join(self.bundle, f"{hostname}_20250101.120000")
+
+    def _add_host(self, hostname):
+        top = os.path.basename(self._host_dir(hostname))
+        with tarfile.open(self._host_dir(hostname) + ".tgz", "w:gz") as tar:
+            info = tarfile.TarInfo(top)
+            info.type = tarfile.DIRTYPE
+            tar.addfile(info)
+            for name in HOST_FILES:
+                _add_file(tar, f"{top}/{name}",
+                          f"{hostname} {name}\n".encode())
+
+    def _extract(self, members, jobs=1):
+        tarballs = sorted(glob.glob(os.path.join(self.bundle, "*.tgz")))
+        with open(os.path.join(self.temp_dir, "untar.log"), "a") as logfile:
+            bundle_reader.extract_hosts(tarballs, self.bundle, members,
+                                        jobs, logfile)
+
+    def test_selective_extraction(self):
+        self._extract(self.members)
+        self.assertEqual(_host_files(self._host_dir("compute-0")), [
+            "var/extra/database/fm.db.sql.txt",
+            "var/extra/host.info",
+            "var/log/mtcAgent.log",
+            "var/log/mtcAgent.log.1",
+            "var/log/mtcAgent.log.2.gz",
+            "var/log/puppet/latest/puppet.log",
+        ])
+        with open(os.path.join(self._host_dir("compute-0"),
+                               "var/log/mtcAgent.log")) as f:
+            self.assertEqual(f.read(), "compute-0 var/log/mtcAgent.log\n")
+        with open(os.path.join(self._host_dir("compute-0"),
+                               bundle_reader.MEMBERS_MARKER)) as f:
+            self.assertEqual(json.load(f), self.members.to_dict())
+
+    def test_parallel_matches_serial(self):
+        self._extract(self.members, jobs=3)
+        parallel = {h: _host_files(self._host_dir(h)) for h in self.hostnames}
+        for hostname in self.hostnames:
+            shutil.rmtree(self._host_dir(hostname))
+        self._extract(self.members)
+        self.assertEqual(
+            {h: _host_files(self._host_dir(h)) for h in self.hostnames},
+            parallel)
+
+    def test_later_runs_extend_selection(self):
+        self._extract(self.members)
+        host_dir = self._host_dir("controller-0")
+        marker_mtime = os.path.getmtime(
+            os.path.join(host_dir, bundle_reader.MEMBERS_MARKER))
+
+        # Covered by what is already extracted: left alone
+        self._extract(MemberFilter(["var/log/mtcAgent.log"]))
+        self.assertEqual(marker_mtime, os.path.getmtime(
+            os.path.join(host_dir, bundle_reader.MEMBERS_MARKER)))
+
+        self._extract(MemberFilter(["etc/hosts"]))
+        files = _host_files(host_dir)
+        self.assertIn("etc/hosts", files)
+        self.assertIn("var/log/mtcAgent.log", files)
+        self.assertNotIn("var/log/kern.log", files)
+
+        # --extract-all completes the host dir and drops the marker
+        self._extract(None)
+        self.assertEqual(_host_files(host_dir), sorted(HOST_FILES))
+        self.assertFalse(os.path.exists(
+            os.path.join(host_dir, bundle_reader.MEMBERS_MARKER)))
+
+    def test_full_host_dir_left_alone(self):
+        host_dir = self._host_dir("compute-0")
+        os.makedirs(host_dir)
+        self._extract(self.members)
+        self.assertEqual(_host_files(host_dir), [])
+
+    def test_bundle_tar(self):
+        bundle_tar = os.path.join(self.temp_dir, "bundle_20250101.120000.tar")
+        with tarfile.open(bundle_tar, "w") as tar:
+            tar.add(self.bundle, arcname="bundle_20250101.120000")
+            _add_file(tar, "../escape", b"x\n")
+        names = bundle_reader.list_members(bundle_tar)
+        self.assertIn("bundle_20250101.120000/", names)
+        self.assertIn(
+            "bundle_20250101.120000/compute-0_20250101.120000.tgz", names)
+
+        dest = os.path.join(self.temp_dir, "dest")
+        os.makedirs(dest)
+        messages = bundle_reader.extract_tar(bundle_tar, dest)
+        self.assertEqual(len(messages), 1)
+        self.assertIn("../escape", messages[0])
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir,
+                                                     "escape")))
+        tgz = os.path.join(dest, "bundle_20250101.120000",
+                           "compute-0_20250101.120000.tgz")
+        self.assertTrue(tarfile.is_tarfile(tgz))
+
+        # Extracting again skips files already present with the same size
+        with open(tgz, "r+b") as f:
+            f.write(b"\0")
+        bundle_reader.extract_tar(bundle_tar, dest)
+        with open(tgz, "rb") as f:
+            self.assertEqual(f.read(1), b"\0")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
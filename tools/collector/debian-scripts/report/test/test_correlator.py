@@ -20,6 +20,8 @@ import unittest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from correlator import Correlator  # noqa: E402
+from event_store import EventStore  # noqa: E402
+from event_store import to_events  # noqa: E402
 
 
 class TestCorrelatorRun(unittest.TestCase):
@@ -192,5 +194,112 @@ class TestCorrelatorMtcErrors(unittest.TestCase):
         self.assertIn("compute-0", failures[0])
 
 
+class TestCorrelatorEventStore(unittest.TestCase):
+    """Failure causes found by time window searches of the event store."""
+
+    SWACT = [
+        "2025-01-01T10:00:00.000 controller-0 sm: Uncontrolled swact start",
+        "2025-01-01T10:00:05.000 controller-1 sm: Neighbor (controller-0) received event down-timeout: Neighbor controller-0 is now in the down state",  # noqa: E501
+        "2025-01-01T10:00:30.000 controller-1 sm: Swact update: done",
+    ]
+    CONFIG = [
+        "2025-01-01T10:00:00.000 controller-0 mtcAgent Error : compute-0 configuration failed or incomplete",  # noqa: E501
+        "2025-01-01T10:00:20.000 controller-0 mtcAgent Info : compute-0 Task: Configuration failure, threshold reached",  # noqa: E501
+    ]
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _run(self, outputs):
+        """Correlate outputs from an in-memory store and from files."""
+        store = EventStore()
+        for name, lines in outputs.items():
+            store.put(name, to_events(lines))
+            with open(os.path.join(self.temp_dir, name), 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+        failures, _, _, _ = Correlator(self.temp_dir, store).run("all")
+        self.assertEqual(Correlator(self.temp_dir).run("all")[0], failures)
+        return failures
+
+    def test_swact_heartbeat_loss_in_window(self):
+        failures = self._run({
+            "swact_activity": self.SWACT,
+            "heartbeat_loss": [
+                "2025-01-01T09:58:00.000 controller-1 hbsAgent Error : controller-0 Mgmt Heartbeat Loss early",  # noqa: E501
+                "2025-01-01T09:59:30.000 controller-1 hbsAgent Error : controller-0 Mgmt Heartbeat Loss (timeout)",  # noqa: E501
+            ]})
+        self.assertEqual(failures, [
+            "2025-01-01T10:00:00 to 2025-01-01T10:00:30 Uncontrolled swact "
+            "due to spontaneous reset of active controller controller-0\n"])
+
+    def test_swact_heartbeat_loss_out_of_window(self):
+        failures = self._run({
+            "swact_activity": self.SWACT,
+            "heartbeat_loss": [
+                "2025-01-01T09:58:00.000 controller-1 hbsAgent Error : controller-0 Mgmt Heartbeat Loss early",  # noqa: E501
+                "2025-01-01T10:00:10.000 controller-1 hbsAgent Error : controller-1 Mgmt Heartbeat Loss other host",  # noqa: E501
+            ]})
+        self.assertEqual(len(failures), 1)
+        self.assertIn("likely due to spontaneous reset", failures[0])
+
+    def test_configuration_failure_puppet_error(self):
+        failures = self._run({
+            "maintenance_errors": self.CONFIG,
+            "daemon_failures": [
+                "2025-01-01T09:59:55.000 compute-0 puppet-apply: Failed to run the puppet manifest",  # noqa: E501
+            ],
+            "puppet_errors": [
+                "2025-01-01T09:59:00.000 Error: too early",
+                "2025-01-01T10:00:01.000 Error: Could not apply class",
+            ]})
+        self.assertEqual(failures, [
+            "2025-01-01T10:00:00 to 2025-01-01T10:00:20 Configuration "
+            "failure on compute-0 due to:\n"
+            "2025-01-01T10:00:01.000 Error: Could not apply class\n"])
+
+    def test_many_swacts_use_host_index(self):
+        swact, heartbeat = [], []
+        for minute in range(200):
+            ts = f"2025-01-01T{10 + minute // 60:02d}:{minute % 60:02d}"
+            host = f"controller-{minute % 2}"
+            swact += [
+                f"{ts}:00.000 controller-0 sm: Uncontrolled swact start",
+                f"{ts}:05.000 controller-1 sm: Neighbor ({host}) received event down-timeout: Neighbor {host} is now in the down state",  # noqa: E501
+                f"{ts}:30.000 controller-1 sm: Swact update: done",
+            ]
+            if minute % 4 < 2:
+                heartbeat.append(f"{ts}:10.000 controller-1 hbsAgent Error : {host} Mgmt Heartbeat Loss (timeout)")  # noqa: E501
+        store = EventStore()
+        store.put("swact_activity", to_events(swact))
+        store.put("heartbeat_loss", to_events(heartbeat))
+        failures, _, _, _ = Correlator(self.temp_dir, store).run("all")
+        self.assertEqual(len(failures), 200)
+        self.assertEqual(len([f for f in failures if "likely" in f]), 100)
+        self.assertEqual(len(store._index["heartbeat_loss"]), 1)
+
+    def test_configuration_failure_other_host_daemon_failure(self):
+        failures = self._run({
+            "maintenance_errors": self.CONFIG,
+            "daemon_failures": [
+                "2025-01-01T10:00:05.000 compute-1 puppet-apply: Failed to run the puppet manifest",  # noqa: E501
+            ]})
+        self.assertEqual(len(failures), 1)
+        self.assertIn("Possible configuration failure on compute-0",
+                      failures[0])
+
+    def test_configuration_failure_without_daemon_failure(self):
+        failures = self._run({
+            "maintenance_errors": self.CONFIG,
+            "daemon_failures": [
+                "2025-01-01T09:59:00.000 compute-0 puppet-apply: Failed to run the puppet manifest",  # noqa: E501
+            ]})
+        self.assertEqual(len(failures), 1)
+        self.assertIn("Possible configuration failure on compute-0",
+                      failures[0])
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
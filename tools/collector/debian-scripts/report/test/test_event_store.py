@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# Tests for the plugin output event store (event_store.py).
+#
+########################################################################
+
+from datetime import datetime
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event_store import Event  # noqa: E402
+from event_store import EventStore  # noqa: E402
+from event_store import to_events  # noqa: E402
+
+
+class TestEventStore(unittest.TestCase):
+    """Event records of plugin outputs."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_to_events_splits_lines(self):
+        events = to_events([
+            "2025-01-01T10:00:00.000 a\n SWACT TOOK 0:00:05 \n",
+            "| 2025-01-01T10:00:01.000 | b",
+            "2025-13-01T10:00:00.000 bad month\n",
+        ])
+        self.assertEqual(events, [
+            Event(datetime(2025, 1, 1, 10), "2025-01-01T10:00:00.000 a\n"),
+            Event(None, " SWACT TOOK 0:00:05 \n"),
+            Event(None, "| 2025-01-01T10:00:01.000 | b\n"),
+            Event(None, "2025-13-01T10:00:00.000 bad month\n"),
+        ])
+
+    def test_window(self):
+        store = EventStore()
+        store.put("heartbeat_loss", to_events([
+            "2025-01-01T10:00:00.000 first\n",
+            "2025-01-01T10:00:10.000 second\n",
+            "2025-01-01T10:00:10.000 third\n",
+            "no timestamp\n",
+            "2025-01-01T10:00:20.000 fourth\n",
+        ]))
+        window = store.window("heartbeat_loss",
+                              datetime(2025, 1, 1, 10, 0, 5),
+                              datetime(2025, 1, 1, 10, 0, 20))
+        self.assertEqual([event.text.split()[1] for event in window],
+                         ["second", "third", "fourth"])
+        self.assertEqual(store.window("missing", datetime.min,
+                                      datetime.max), [])
+
+        # Putting a source again replaces its records and index
+        store.put("heartbeat_loss", to_events(
+            ["2025-01-01T10:00:30.000 later\n"]))
+        self.assertEqual(store.window("heartbeat_loss",
+                                      datetime(2025, 1, 1, 10, 0, 5),
+                                      datetime(2025, 1, 1, 10, 0, 20)), [])
+
+    def test_keyed_window(self):
+        store = EventStore()
+        store.put("daemon_failures", to_events([
+            "2025-01-01T10:00:00.000 compute-0 a\n",
+            "2025-01-01T10:00:01.000 compute-1 b\n",
+            "2025-01-01T10:00:02.000 compute-0 c\n",
+        ]))
+        calls = []
+
+        def hosts(text):
+            calls.append(text)
+            return {text.split()[1]}
+
+        for _ in range(3):
+            window = store.window("daemon_failures",
+                                  datetime(2025, 1, 1, 10),
+                                  datetime(2025, 1, 1, 10, 0, 1),
+                                  "compute-0", hosts)
+            self.assertEqual([event.text[-2] for event in window], ["a"])
+        # The keyed index is built once
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(store.window("daemon_failures", datetime.min,
+                                      datetime.max, "compute-9", hosts), [])
+        self.assertEqual(len(store.window("daemon_failures", datetime.min,
+                                          datetime.max)), 3)
+
+    def test_sources_from_directory(self):
+        with open(os.path.join(self.temp_dir, "state_changes"), "w") as f:
+            f.write("2025-01-01T10:00:00.000 x is ENABLED\n")
+        store = EventStore(self.temp_dir)
+        self.assertIn("state_changes", store)
+        self.assertNotIn("alarm", store)
+        self.assertEqual(store.lines("state_changes"),
+                         ["2025-01-01T10:00:00.000 x is ENABLED\n"])
+        self.assertEqual(store.get("alarm"), [])
+        self.assertNotIn("state_changes", EventStore())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
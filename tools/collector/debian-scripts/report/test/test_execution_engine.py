@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# Tests for running plugins in work units (execution_engine.py).
+#
+########################################################################
+
+import filecmp
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execution_engine import _substring_unit  # noqa: E402
+from execution_engine import ExecutionEngine  # noqa: E402
+from plugin import Plugin  # noqa: E402
+from plugin_algs import substring as substring_module  # noqa: E402
+
+PLUGINS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "plugins")
+
+LOG_FILES = ["mtcAgent.log", "mtcClient.log", "sm.log", "pmond.log",
+             "hbsClient.log", "lmond.log"]
+
+
+class TestExecutionUnits(unittest.TestCase):
+    """Plugins run as work units, serially or with --jobs."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.bundle = os.path.join(self.temp_dir, "bundle")
+        self._add_host("controller-0", "controller", active=True)
+        self._add_host("controller-1", "controller")
+        self._add_host("compute-0", "worker")
+        self.plugins = [Plugin(path)
+                        for path in sorted(glob.glob(
+                            os.path.join(PLUGINS_DIR, "*")))
+                        if not path.endswith("__init__.py")]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _add_host(self, hostname, subfunction, active=False):
+        host_dir = os.path.join(self.bundle, f"{hostname}_20250101.120000")
+        for subdir in ("var/extra", "var/log", "etc/platform"):
+            os.makedirs(os.path.join(host_dir, subdir))
+        with open(os.path.join(host_dir, "var/extra/host.info"), "w") as f:
+            f.write(f'  hostname => "{hostname}",\n'
+                    f'  subfunction => "{subfunction}",\n')
+        with open(os.path.join(host_dir, "etc/platform/platform.conf"),
+                  "w") as f:
+            f.write("system_type=All-in-one\nsw_version=25.09\n")
+        if active:
+            os.makedirs(os.path.join(host_dir, "var/extra/database"))
+            with open(os.path.join(host_dir, "var/extra/database/db"),
+                      "w") as f:
+                f.write("db\n")
+        for log in LOG_FILES:
+            with open(os.path.join(host_dir, "var/log", log), "w") as f:
+                for i in range(30):
+                    f.write(f"2025-01-01T10:{i:02d}:00.000 {hostname} {log} "
+                            f"operation failed {i} FAILED Failed to send "
+                            f"message\n")
+
+    def _run(self, jobs):
+        output_dir = os.path.join(self.temp_dir, f"out{jobs}")
+        os.makedirs(output_dir)
+        opts = types.SimpleNamespace(
+            start="2000-01-01T00:00:00", end="2030-01-01T00:00:00",
+            verbose=False, debug=False, hostname="all", jobs=jobs)
+        engine = ExecutionEngine(opts, self.bundle, output_dir)
+        engine.execute(self.plugins, output_dir)
+        return engine, output_dir
+
+    def test_parallel_output_matches_serial(self):
+        """--jobs produces the same files as a serial run."""
+        _, serial = self._run(1)
+        _, parallel = self._run(3)
+        for subdir in ("", "plugins"):
+            serial_dir = os.path.join(serial, subdir)
+            names = sorted(name for name in os.listdir(serial_dir)
+                           if name != "untar.log")
+            self.assertEqual(
+                names,
+                sorted(name for name in
+                       os.listdir(os.path.join(parallel, subdir))
+                       if name != "untar.log"))
+            for name in names:
+                path = os.path.join(serial_dir, name)
+                if os.path.isfile(path):
+                    self.assertTrue(filecmp.cmp(
+                        path, os.path.join(parallel, subdir, name),
+                        shallow=False), name)
+        plugin_files = os.listdir(os.path.join(parallel, "plugins"))
+        self.assertIn("substring_controller-0", plugin_files)
+        self.assertIn("system_info", plugin_files)
+        # Outputs are renamed into place; no temporary files remain
+        self.assertFalse([name for name in plugin_files
+                          if name.startswith(".")])
+
+    def test_substring_plugins_grouped_per_host(self):
+        """All substring plugins of a host share one work unit."""
+        engine, output_dir = self._run(1)
+        units = engine._plan_units(self.plugins,
+                                   os.path.join(output_dir, "plugins"), None)
+        substring_units = [args for func, args in units
+                           if func is _substring_unit]
+        self.assertEqual(sorted(args[0] for args in substring_units),
+                         ["compute-0", "controller-0", "controller-1"])
+        requests = {args[0]: args[3] for args in substring_units}
+
+        def targeting(host_types):
+            return len([p for p in self.plugins
+                        if p.state["algorithm"] == "substring" and
+                        set(p.state["hosts"]) & host_types])
+
+        self.assertEqual(len(requests["controller-0"]),
+                         targeting({"all", "controllers"}))
+        self.assertEqual(len(requests["compute-0"]),
+                         targeting({"all", "workers"}))
+        self.assertGreater(len(requests["controller-0"]), 1)
+
+    def test_rerun_reads_no_logs(self):
+        """A rerun answers substring plugins and algorithms from cache."""
+        engine, output_dir = self._run(1)
+        with patch.object(substring_module, "_scan_file",
+                          wraps=substring_module._scan_file) as scan:
+            engine.execute(self.plugins, output_dir)
+        self.assertEqual(scan.call_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
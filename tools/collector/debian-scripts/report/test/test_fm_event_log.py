@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# Tests for the fm database event_log reader (fm_event_log.py).
+#
+########################################################################
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fm_event_log import EventLog  # noqa: E402
+from fm_event_log import EventLogRow  # noqa: E402
+
+
+def make_row(alarm_id, action, entity_id, date, severity, idx=1):
+    """Build a tab-separated event_log row."""
+    return (f"2025-01-01\t\\N\t\\N\t{idx}\tuuid{idx}\t"
+            f"{alarm_id}\t{action}\thost\t{entity_id}\t{date}\t{severity}\n")
+
+
+class TestEventLog(unittest.TestCase):
+    """event_log rows read from a fm database dump."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "fm.db.sql.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, text):
+        with open(self.path, "w") as f:
+            f.write(text)
+
+    def test_reads_only_event_log_table(self):
+        """Rows of other tables and after the end marker are ignored."""
+        self._write(
+            "COPY public.alarm (id) FROM stdin;\n" +
+            make_row("999.999", "set", "host=x", "2025-06-01 09:00:00",
+                     "major") +
+            "\\.\n\n"
+            "COPY public.event_log (created_at) FROM stdin;\n" +
+            make_row("200.001", "set", "host=controller-0",
+                     "2025-06-01 10:00:00", "major") +
+            "short\trow\n" +
+            make_row("200.001", "clear", "host=controller-0",
+                     "2025-06-01 11:00:00", "major", 2) +
+            "\\.\n" +
+            make_row("300.001", "log", "host=x", "2025-06-01 12:00:00",
+                     "minor"))
+        event_log = EventLog(self.path)
+        self.assertEqual(list(event_log), [
+            EventLogRow("200.001", "set", "host=controller-0",
+                        "2025-06-01 10:00:00", "major\n"),
+            EventLogRow("200.001", "clear", "host=controller-0",
+                        "2025-06-01 11:00:00", "major\n"),
+        ])
+        # rows are read again on each iteration
+        self.assertEqual(len(list(event_log)), 2)
+
+    def test_no_event_log_table(self):
+        """A dump without the table, or an empty one, has no rows."""
+        self._write("COPY public.alarm (id) FROM stdin;\n\\.\n")
+        self.assertEqual(list(EventLog(self.path)), [])
+        self._write("")
+        self.assertEqual(list(EventLog(self.path)), [])
+
+    def test_select_window_and_exclusions(self):
+        """select() keeps rows in the window not matching an exclusion."""
+        self._write(
+            "COPY event_log (created_at) FROM stdin;\n" +
+            make_row("200.001", "set", "host=controller-0",
+                     "2025-06-01 10:00:00.123", "major", 1) +
+            make_row("100.101", "set", "host=compute-0",
+                     "2025-06-02 10:00:00", "minor", 2) +
+            make_row("401.005", "log", "host=controller-1",
+                     "2025-06-03 10:00:00", "minor", 3) +
+            make_row("200.011", "clear", "host=controller-0",
+                     "2025-07-01 10:00:00", "major", 4) +
+            "\\.\n")
+        event_log = EventLog(self.path)
+        selected = list(event_log.select("2025-06-01T00:00:00",
+                                         "2025-06-30T00:00:00"))
+        self.assertEqual([row.alarm_id for row in selected],
+                         ["200.001", "100.101", "401.005"])
+        selected = list(event_log.select("2025-06-01T00:00:00",
+                                         "2025-12-31T00:00:00",
+                                         alarm_exclude=["200."],
+                                         entity_exclude=["compute"]))
+        self.assertEqual([row.alarm_id for row in selected], ["401.005"])
+
+    def test_from_host_dir(self):
+        """from_host_dir() reads var/extra/database/fm.db.sql.txt."""
+        self.assertIsNone(EventLog.from_host_dir(self.temp_dir))
+        database = os.path.join(self.temp_dir, "var", "extra", "database")
+        os.makedirs(database)
+        shutil.copy(os.devnull, os.path.join(database, "fm.db.sql.txt"))
+        self.assertEqual(list(EventLog.from_host_dir(self.temp_dir)), [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+#
+# Tests for the html report renderer (render.py).
+#
+########################################################################
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import render  # noqa: E402
+
+HOSTS = {"controller-0": "controller", "controller-1": "controller",
+         "compute-0": "worker"}
+
+
+class TestRender(unittest.TestCase):
+    """index.html and the collect bundle pages of each host."""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        self.bundle = os.path.join(self.temp_dir, "bundle")
+        self.output_dir = os.path.join(self.bundle, "report_analysis")
+        os.makedirs(os.path.join(self.output_dir, "plugins"))
+        system_info = []
+        for hostname, node_type in HOSTS.items():
+            host_dir = os.path.join(self.bundle,
+                                    f"{hostname}_20250101.120000")
+            os.makedirs(os.path.join(host_dir, "var", "log"))
+            os.makedirs(os.path.join(host_dir, "etc", "apt"))
+            self._write(os.path.join(host_dir, "var", "log", "sm.log"),
+                        "2025-01-01T10:00:00.000 {swact}\n")
+            self._write(os.path.join(host_dir, "var", "log", "empty.log"),
+                        "")
+            self._write(os.path.join(host_dir, "etc", "apt", "x.conf"),
+                        "excluded\n")
+            system_info.append(f"{hostname}\nNode Type: {node_type}\n")
+        self._write(os.path.join(self.output_dir, "plugins", "system_info"),
+                    "\n".join(system_info))
+        self._write(os.path.join(self.output_dir, "plugins", "swact_activity"),
+                    "2025-01-01T10:00:00 {swact}\n")
+        self._write(os.path.join(self.output_dir, "failures"), "none\n")
+        self._write(os.path.join(self.output_dir, "report.log"),
+                    "2025-01-01T10:00:00 Plugin Results:\n"
+                    "2025-01-01T10:00:00     1 swact_activity {x}\n"
+                    "\n"
+                    "2025-01-01T10:00:00 Correlated Results:\n"
+                    "2025-01-01T10:00:00 Failures : 0\n")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, path, text):
+        with open(path, "w") as f:
+            f.write(text)
+
+    def _read(self, name):
+        with open(os.path.join(self.output_dir, name)) as f:
+            return f.read()
+
+    def test_index(self):
+        """index.html links the plugin outputs and host pages."""
+        render.main(self.bundle, self.output_dir)
+        index = self._read("index.html")
+        self.assertIn("<title>Report Analysis</title>", index)
+        self.assertIn('<iframe data-src="plugins/swact_activity">', index)
+        self.assertIn('<iframe data-src="failures">', index)
+        self.assertIn("swact_activity {x}", index)
+        self.assertNotIn("<iframe src=", index)
+        self.assertNotIn('class="content-itemthree"', index)
+        self.assertIn('href="collect_controller020250101120000.html"', index)
+
+    def test_collect_pages(self):
+        """Each host gets a page with its own directory tree."""
+        render.main(self.bundle, self.output_dir)
+        pages = sorted(name for name in os.listdir(self.output_dir)
+                       if name.startswith("collect_"))
+        self.assertEqual(pages, ["collect_compute020250101120000.html",
+                                 "collect_controller020250101120000.html",
+                                 "collect_controller120250101120000.html"])
+        page = self._read("collect_compute020250101120000.html")
+        self.assertIn("<title>compute-0_20250101.120000</title>", page)
+        self.assertIn('<li id=collectcompute020250101120000>', page)
+        self.assertNotIn("controller-0_20250101.120000", page)
+        frames = re.findall(r'<iframe data-src="([^"]+)">', page)
+        self.assertEqual(frames, [
+            os.path.realpath(self.bundle) +
+            "/compute-0_20250101.120000/var/log/sm.log"])
+        # empty files are listed but not shown ; render.exclude dirs
+        # are left out
+        self.assertIn('style="color: #808080">'
+                      'compute-0_20250101.120000/var/log/empty.log', page)
+        self.assertNotIn("x.conf", page)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -11,16 +11,21 @@
 #
 ########################################################################
 
+import gzip
 import os
 import shutil
 import sys
 import tempfile
 import unittest
+from unittest.mock import patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from plugin_algs import substring as substring_module  # noqa: E402
 from plugin_algs.substring import _continue  # noqa: E402
+from plugin_algs.substring import ScanCache  # noqa: E402
 from plugin_algs.substring import substring  # noqa: E402
+from plugin_algs.substring import SubstringScanner  # noqa: E402
 
 
 class TestSubstringSearch(unittest.TestCase):
@@ -131,6 +136,204 @@ class TestSubstringSearch(unittest.TestCase):
         self.assertIn("third", result[2])
 
 
+class TestSubstringScanner(unittest.TestCase):
+    """Test the in-process scanner behind substring()."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.temp_dir, "test.log")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, path, lines, compressed=False):
+        data = ('\n'.join(lines) + '\n').encode("utf-8")
+        if compressed:
+            with gzip.open(path, 'wb') as f:
+                f.write(data)
+        else:
+            with open(path, 'wb') as f:
+                f.write(data)
+
+    def _hourly(self, day, message):
+        return [f"2025-01-{day:02d}T{hour:02d}:00:00.000 {message} {hour}"
+                for hour in range(24)]
+
+    def test_extended_regex_substrings(self):
+        """Substrings are matched as grep -E expressions, line by line."""
+        self._write(self.log_file, [
+            "2025-01-01T10:00:00.000 Neighbor node-1 is now in the down",
+            "2025-01-01T10:00:01.000 active-failed   | disabling-failed  |",
+            "2025-01-01T10:00:02.000 tail active-failed",
+            "| disabling-failed |",
+        ])
+        result = substring(
+            "2025-01-01T00:00:00", "2025-01-02T00:00:00",
+            ["Neighbor (.+) is now in the down",
+             "active-failed\\s+\\| disabling-failed\\s+\\|"],
+            [self.log_file])
+        self.assertEqual(len(result), 2)
+        self.assertIn("Neighbor node-1", result[0])
+        self.assertIn("active-failed", result[1])
+
+    def test_rotated_and_compressed_files(self):
+        """Rotated plain and .gz files older than the current one are read."""
+        self._write(self.log_file, self._hourly(3, "Error : current"))
+        self._write(f"{self.log_file}.1", self._hourly(2, "Error : rotated"))
+        self._write(f"{self.log_file}.2.gz", self._hourly(1, "Error : gz"),
+                    compressed=True)
+        result = substring(
+            "2025-01-01T12:00:00", "2025-01-03T06:00:00",
+            ["Error :"], [self.log_file])
+        self.assertEqual(len(result), 11 + 24 + 6)
+        self.assertTrue(result[0].startswith("2025-01-01T13:00:00.000"))
+        self.assertTrue(result[-1].startswith("2025-01-03T05:00:00.000"))
+        self.assertTrue(all(line.endswith("\n") for line in result))
+
+    def test_sm_customer_prefix(self):
+        """'| '-prefixed timestamps are windowed and the line compacted."""
+        self._write(self.log_file, [
+            "| 2024-01-01T10:00:00.000 |  swact   | b |",
+            "| 2025-01-01T10:00:00.000 |  swact   | a |",
+        ])
+        result = substring(
+            "2025-01-01T00:00:00", "2025-01-02T00:00:00",
+            ["swact"], [self.log_file])
+        self.assertEqual(result, ["2025-01-01T10:00:00.000 | swact | a |"])
+
+    def test_bisect_skips_lines_outside_window(self):
+        """Plain files are only read inside the start/end window, so an
+        untimestamped match far before it is not reported."""
+        lines = ["Error : untimestamped, before the window"]
+        for day in range(1, 29):
+            lines += self._hourly(day, "Error : x")
+        self._write(self.log_file, lines)
+        result = substring(
+            "2025-01-10T00:00:00", "2025-01-11T00:00:00",
+            ["Error :"], [self.log_file])
+        self.assertEqual(len(result), 23)
+        self.assertTrue(all(line.startswith("2025-01-10T") for line in result))
+
+    def test_bisect_date_offsets(self):
+        """_bisect_date finds the first line at or after a timestamp."""
+        lines = self._hourly(1, "x") + ["no timestamp"] + self._hourly(2, "y")
+        self._write(self.log_file, lines)
+        with open(self.log_file, 'rb') as f:
+            size = os.path.getsize(self.log_file)
+            offset = substring_module._bisect_date(
+                f, size, b"2025-01-02T03:00:00", unknown_is_after=True)
+            f.seek(offset)
+            self.assertTrue(f.readline().startswith(b"2025-01-02T03:00:00"))
+            self.assertEqual(substring_module._bisect_date(
+                f, size, b"2026-01-01T00:00:00", unknown_is_after=False), size)
+            self.assertEqual(substring_module._bisect_date(
+                f, size, b"2024-01-01T00:00:00", unknown_is_after=True), 0)
+
+    def test_shared_scanner_reads_file_once(self):
+        """Registered substring lists are all matched in one pass."""
+        self._write(self.log_file, [
+            "2025-01-01T10:00:00.000 Error : one",
+            "2025-01-01T10:00:01.000 FAILED two",
+            "2025-01-01T10:00:02.000 Error : FAILED three",
+        ])
+        scanner = SubstringScanner()
+        scanner.register(["Error :"], [self.log_file])
+        scanner.register(["FAILED"], [self.log_file])
+        with patch.object(substring_module, "_scan_file",
+                          wraps=substring_module._scan_file) as scan:
+            errors = substring("2025-01-01T00:00:00", "2025-01-02T00:00:00",
+                               ["Error :"], [self.log_file], scanner=scanner)
+            failed = substring("2025-01-01T00:00:00", "2025-01-02T00:00:00",
+                               ["FAILED"], [self.log_file], scanner=scanner)
+        self.assertEqual(scan.call_count, 1)
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(len(failed), 2)
+        self.assertIn("three", failed[1])
+
+    def test_invalid_utf8_goes_to_dropped_logs(self):
+        """Matching lines that are not utf-8 are written to dropped_logs."""
+        dropped = os.path.join(self.temp_dir, "dropped_logs")
+        with open(self.log_file, 'wb') as f:
+            f.write(b"2025-01-01T10:00:00.000 Error : good\n")
+            f.write(b"2025-01-01T10:00:01.000 Error : \xff bad\n")
+        result = substring(
+            "2025-01-01T00:00:00", "2025-01-02T00:00:00",
+            ["Error :"], [self.log_file], dropped_logs=dropped)
+        self.assertEqual(len(result), 1)
+        with open(dropped, 'rb') as f:
+            self.assertEqual(f.read(),
+                             b"2025-01-01T10:00:01.000 Error : \xff bad\n")
+
+
+class TestScanCache(unittest.TestCase):
+    """Test substring scan results kept across runs."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.temp_dir, "test.log")
+        self.cache = ScanCache(os.path.join(self.temp_dir, "cache"))
+        with open(self.log_file, 'wb') as f:
+            for day in range(1, 4):
+                f.write(f"2025-01-0{day}T10:00:00.000 Error : {day}\n"
+                        .encode())
+            f.write(b"2025-01-03T11:00:00.000 Error : \xff bad\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _search(self, start, end, dropped_logs=None):
+        """Run a search with a new scanner, as a new report run does;
+        returns the result and the number of files scanned."""
+        with patch.object(substring_module, "_scan_file",
+                          wraps=substring_module._scan_file) as scan:
+            result = substring(start, end, ["Error :"], [self.log_file],
+                               dropped_logs=dropped_logs,
+                               scanner=SubstringScanner(self.cache))
+        return result, scan.call_count
+
+    def test_later_run_reuses_results(self):
+        """A second run over the same window does not scan the file."""
+        first, scans = self._search("2025-01-01T00:00:00",
+                                    "2025-01-04T00:00:00")
+        self.assertEqual((len(first), scans), (3, 1))
+        self.assertEqual(self._search("2025-01-01T00:00:00",
+                                      "2025-01-04T00:00:00"), (first, 0))
+
+    def test_narrower_window_filters_cached_lines(self):
+        """A window inside a cached one matches a fresh search."""
+        self._search("2025-01-01T00:00:00", "2025-01-04T00:00:00")
+        result, scans = self._search("2025-01-02T00:00:00",
+                                     "2025-01-03T00:00:00")
+        self.assertEqual(scans, 0)
+        self.assertEqual(result, substring(
+            "2025-01-02T00:00:00", "2025-01-03T00:00:00",
+            ["Error :"], [self.log_file]))
+        # A wider window is not covered and scans again
+        self.assertEqual(self._search("2024-12-01T00:00:00",
+                                      "2025-01-04T00:00:00")[1], 1)
+
+    def test_changed_file_scanned_again(self):
+        """Entries are keyed by file size and modification time."""
+        self._search("2025-01-01T00:00:00", "2025-01-04T00:00:00")
+        with open(self.log_file, 'ab') as f:
+            f.write(b"2025-01-03T12:00:00.000 Error : new\n")
+        result, scans = self._search("2025-01-01T00:00:00",
+                                     "2025-01-04T00:00:00")
+        self.assertEqual((len(result), scans), (4, 1))
+        self.assertIn("new", result[-1])
+
+    def test_cached_dropped_lines_replayed(self):
+        """Lines cached for dropped_logs are written on a cache hit."""
+        self._search("2025-01-01T00:00:00", "2025-01-04T00:00:00")
+        dropped = os.path.join(self.temp_dir, "dropped_logs")
+        _, scans = self._search("2025-01-01T00:00:00",
+                                "2025-01-04T00:00:00", dropped)
+        self.assertEqual(scans, 0)
+        with open(dropped, 'rb') as f:
+            self.assertEqual(f.read(),
+                             b"2025-01-03T11:00:00.000 Error : \xff bad\n")
+
+
 class TestContinueFunction(unittest.TestCase):
     """Test the _continue() date range check."""
 
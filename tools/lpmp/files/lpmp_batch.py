@@ -34,6 +34,13 @@ combined-alternation, first-match-wins semantics as the mainline engine.
 Window blocks emit every timestamped line whose timestamp falls inside
 the run's window — matching the mainline window behaviour.
 
+With --jobs N the physical log files of all hosts are read by N forked
+worker processes (see `_run_file_reads_parallel`). Files are handed out
+largest first so one big daemon.log does not start last and straggle,
+and each (host, run) is written as soon as every file it reads from is
+done. Matches are merged in the same file order as the serial loop, so
+both produce identical output.
+
 Output for each run is written into the batch-specific layout
     <output_root>/lpmp_batch_<lab>/<YYYYMMDD_HHMMSS>/[<start_date_time>_]<model_base>[_<end_date_time>][/<host>]
 
@@ -64,10 +71,12 @@ lpmp_graph is unaffected).
 """
 
 from collections import defaultdict
+from concurrent.futures import as_completed
+from concurrent.futures import ProcessPoolExecutor
 import copy
 from datetime import datetime
-import gzip
 import json
+import multiprocessing
 import os
 import re
 import sys
@@ -79,10 +88,17 @@ sys.dont_write_bytecode = True  # noqa: E402
 
 from lpmp_engine import _bisect_seek_to_timestamp              # noqa: E402
 from lpmp_engine import apply_variable_substitution            # noqa: E402
+from lpmp_gzip import lookup_gzip_index                        # noqa: E402
+from lpmp_gzip import open_gzip_text                           # noqa: E402
 from lpmp_output import merge_timeline_profiles                # noqa: E402
 from lpmp_output import write_context_files                    # noqa: E402
 from lpmp_output import write_timeline_block_profile           # noqa: E402
 from lpmp_output import write_timeline_csv                     # noqa: E402
+from lpmp_profile import count_file_read                       # noqa: E402
+from lpmp_profile import get_self_profiler                     # noqa: E402
+from lpmp_profile import profile_phase                         # noqa: E402
+from lpmp_profile import stream_offset                         # noqa: E402
+from lpmp_profile import write_self_profile                    # noqa: E402
 from lpmp_utils import apply_timeline_variable_substitution    # noqa: E402
 from lpmp_utils import create_output_directory                 # noqa: E402
 from lpmp_utils import detect_bundle_hosts                     # noqa: E402
@@ -93,9 +109,10 @@ from lpmp_utils import format_duration                         # noqa: E402
 from lpmp_utils import format_log_line_for_output              # noqa: E402
 from lpmp_utils import format_long_listing                     # noqa: E402
 from lpmp_utils import get_file_date_range                     # noqa: E402
+from lpmp_utils import get_timestamp_parser                    # noqa: E402
 from lpmp_utils import get_verbose_level                       # noqa: E402
 from lpmp_utils import load_model                              # noqa: E402
-from lpmp_utils import parse_timestamp                         # noqa: E402
+from lpmp_utils import prefetch_file_date_ranges               # noqa: E402
 from lpmp_utils import ProgressType                            # noqa: E402
 from lpmp_utils import resolve_timeline_patterns               # noqa: E402
 from lpmp_utils import set_verbose_level                       # noqa: E402
@@ -305,7 +322,8 @@ def _load_all_models(runs):
         name = run["model"]
         if name not in models:
             path = _resolve_model_path(name)
-            blocks, settings, _model_type = load_model(path)
+            with profile_phase("model_load"):
+                blocks, settings, _model_type = load_model(path)
             models[name] = (blocks, settings, path)
     return models
 
@@ -435,9 +453,10 @@ def _build_file_groups(runs, models, classified, logs_dir, hostname):
 
         variables = {"hostname": hostname}
         apply_variable_substitution(blocks, variables)
-        expand_wildcards_in_blocks(
-            blocks, logs_dir, run["_start"], run["_stop"]
-        )
+        with profile_phase("wildcard_expansion"):
+            expand_wildcards_in_blocks(
+                blocks, logs_dir, run["_start"], run["_stop"]
+            )
 
         for block in blocks:
             label = block.get("label", "<unlabeled>")
@@ -520,12 +539,13 @@ def _single_pass_read(filepath, targets):
             return results
 
     is_gzipped = filepath.endswith(".gz")
-    open_func = gzip.open if is_gzipped else open
-    mode = "rt" if is_gzipped else "r"
 
     try:
-        with open_func(filepath, mode, encoding="utf-8",
-                       errors="ignore") as f:
+        if is_gzipped:
+            f = open_gzip_text(filepath, relpath, earliest_start)
+        else:
+            f = open(filepath, "r", encoding="utf-8", errors="ignore")
+        with f:
             if not is_gzipped:
                 try:
                     file_size = os.path.getsize(filepath)
@@ -536,37 +556,52 @@ def _single_pass_read(filepath, targets):
                 except OSError:
                     pass
 
-            while True:
-                line = f.readline()
-                if not line:
-                    break
-                timestamp = parse_timestamp(line, relpath)
-                if not timestamp:
-                    continue
-                if timestamp > latest_stop:
-                    break
-
-                for target in targets:
-                    if timestamp <= target["start"] \
-                            or timestamp > target["stop"]:
-                        continue
-                    # Window blocks: regex is None, emit every line in
-                    # window. Timeline blocks: regex.search must match.
-                    regex = target["regex"]
-                    if regex is not None and not regex.search(line):
+            parse_line_timestamp = get_timestamp_parser(relpath).parse
+            line_count = 0
+            ts_count = 0
+            regex_count = 0
+            start_offset = stream_offset(f)
+            try:
+                while True:
+                    line = f.readline()
+                    if not line:
+                        break
+                    line_count += 1
+                    timestamp = parse_line_timestamp(line)
+                    if not timestamp:
                         continue
-                    # Match mainline (lpmp_engine.process_*): full
-                    # strip so trailing spaces and CR bytes from CRLF
-                    # log files don't leak into the CSV cells.
-                    formatted = format_log_line_for_output(
-                        line.strip(), target["filename"]
-                    )
-                    results[target["run_idx"]].append((
-                        timestamp,
-                        formatted,
-                        target["filename"],
-                        target["block_label"],
-                    ))
+                    ts_count += 1
+                    if timestamp > latest_stop:
+                        break
+
+                    for target in targets:
+                        if timestamp <= target["start"] \
+                                or timestamp > target["stop"]:
+                            continue
+                        # Window blocks: regex is None, emit every line in
+                        # window. Timeline blocks: regex.search must match.
+                        regex = target["regex"]
+                        if regex is not None:
+                            regex_count += 1
+                            if not regex.search(line):
+                                continue
+                        # Match mainline (lpmp_engine.process_*): full
+                        # strip so trailing spaces and CR bytes from CRLF
+                        # log files don't leak into the CSV cells.
+                        formatted = format_log_line_for_output(
+                            line.strip(), target["filename"]
+                        )
+                        results[target["run_idx"]].append((
+                            timestamp,
+                            formatted,
+                            target["filename"],
+                            target["block_label"],
+                        ))
+            finally:
+                count_file_read(relpath, reads=1, lines_parsed=line_count,
+                                timestamps_parsed=ts_count,
+                                regex_evaluations=regex_count,
+                                bytes_read=stream_offset(f) - start_offset)
     except (IOError, OSError) as e:
         print(f"Error reading {filepath}: {e}", file=sys.stderr)
     except Exception as e:  # gzip.BadGzipFile, decode errors etc.
@@ -575,6 +610,67 @@ def _single_pass_read(filepath, targets):
     return results
 
 
+# ---------------------------------------------------------------------------
+# Parallel file-read scheduler (--jobs)
+# ---------------------------------------------------------------------------
+
+def _file_read_cost(filepath):
+    """Bytes _single_pass_read() has to get through for filepath.
+
+    A .gz file counts its uncompressed size when its gzip index is
+    already built, otherwise its size on disk.
+    """
+    if filepath.endswith(".gz"):
+        gz_index = lookup_gzip_index(filepath)
+        if gz_index is not None:
+            return gz_index.uncompressed_size
+    try:
+        return os.path.getsize(filepath)
+    except OSError:
+        return 0
+
+
+def _run_file_reads_parallel(reads, jobs):
+    """Run _single_pass_read() for every (filepath, targets) in reads in
+    a pool of `jobs` forked worker processes.
+
+    Reads are submitted largest first, so the pool is never left
+    waiting on one large file that was picked up last. Yields
+    (read_idx, results) in completion order. Workers inherit the
+    verbose level, index settings and any gzip indexes already built
+    in the parent through fork; only targets and results are pickled.
+    """
+    if not reads:
+        return
+    order = sorted(range(len(reads)),
+                   key=lambda i: _file_read_cost(reads[i][0]),
+                   reverse=True)
+    mp_context = multiprocessing.get_context("fork")
+    workers = min(jobs, len(reads))
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=mp_context) as pool:
+        futures = {pool.submit(_profiled_single_pass_read, *reads[i]): i
+                   for i in order}
+        for future in as_completed(futures):
+            file_results, file_counters = future.result()
+            if file_counters:
+                get_self_profiler().merge_files(file_counters)
+            yield futures[future], file_results
+
+
+def _profiled_single_pass_read(filepath, targets):
+    """--jobs worker entry point: _single_pass_read() plus the
+    worker's --profile-self file counters for the parent to merge
+    (None when profiling is off)."""
+    profiler = get_self_profiler()
+    if profiler is None:
+        return _single_pass_read(filepath, targets), None
+    # Drop counters inherited through fork or sent back already
+    profiler.take_files()
+    results = _single_pass_read(filepath, targets)
+    return results, profiler.take_files()
+
+
 # ---------------------------------------------------------------------------
 # Per-run output writer
 # ---------------------------------------------------------------------------
@@ -782,6 +878,120 @@ def _batch_progress_type(args):
     return ProgressType.NONE
 
 
+def _write_host_run(args, run_idx, run, classified, hostname, matches,
+                    run_start_time, run_host_profiles, run_totals):
+    """Write one run's output for one host and record it for the
+    per-run summary. Returns the number of matches written."""
+    if not matches:
+        return 0
+    model_name = run["model"]
+    # Reuse the once-per-batch classification result rather
+    # than re-classifying (and re-warning) per host.
+    blocks_for_writers = classified.get(model_name) or []
+    with profile_phase("output"):
+        profile_path = _write_run_output(
+            args, run, model_name, hostname, matches,
+            blocks_for_writers, run_start_time,
+        )
+    if not profile_path:
+        return 0
+    run_host_profiles[run_idx].append((profile_path, hostname))
+    run_totals[run_idx] += len(matches)
+    vlog2(f"    ran '{model_name}' -> {len(matches)} matches")
+    return len(matches)
+
+
+def _scan_hosts_parallel(args, runs, models, classified, hosts, jobs,
+                         run_start_time, run_host_profiles, run_totals,
+                         progress_enabled):
+    """Read the files of every host with `jobs` worker processes.
+
+    hosts is a list of (host_idx, hostname, logs_dir). The file groups
+    of all hosts go into one shared queue (see
+    _run_file_reads_parallel); a (host, run) is written as soon as the
+    last file it reads from completes, with its matches merged in file
+    group order as in the serial loop. Returns the number of host
+    names printed on the progress line.
+    """
+    verbose = get_verbose_level() >= 1
+    total_hosts = len(hosts)
+    reads = []                    # (filepath, targets)
+    read_runs = []                # (host position, run_idx list) per read
+    host_reads = []               # host position -> read indexes
+    pending_runs = {}             # (host position, run_idx) -> unread files
+    for pos, (_host_idx, hostname, logs_dir) in enumerate(hosts):
+        file_groups = _build_file_groups(
+            runs, models, classified, logs_dir, hostname)
+        host_reads.append([])
+        for filepath, targets in file_groups.items():
+            run_ids = sorted({t["run_idx"] for t in targets})
+            for run_idx in run_ids:
+                key = (pos, run_idx)
+                pending_runs[key] = pending_runs.get(key, 0) + 1
+            host_reads[pos].append(len(reads))
+            read_runs.append((pos, run_ids))
+            reads.append((filepath, targets))
+
+    # Rotated .gz files: build date ranges and gzip indexes once in the
+    # parent so every forked worker starts with them
+    prefetch_file_date_ranges(
+        (filepath, os.path.basename(filepath)) for filepath, _ in reads)
+
+    host_totals = [0] * total_hosts
+    hosts_pending = [len(reads_of_host) for reads_of_host in host_reads]
+    hosts_done = 0
+    host_names_printed = 0
+    results = [None] * len(reads)
+    batch_start = time.time()
+
+    def host_done(pos):
+        nonlocal hosts_done, host_names_printed
+        hosts_done += 1
+        hostname = hosts[pos][1]
+        if verbose:
+            elapsed = time.time() - batch_start
+            print(f"  [{hosts_done}/{total_hosts}] {hostname:<16} "
+                  f" {host_totals[pos]:>6} matches ({elapsed:.1f}s)")
+        elif progress_enabled:
+            sep = ', ' if host_names_printed else ''
+            print(f"{sep}{hostname}", end='', flush=True)
+            host_names_printed += 1
+        for read_idx in host_reads[pos]:
+            results[read_idx] = None
+
+    vlog1(f"Batch mode: reading {len(reads)} file(s) from "
+          f"{total_hosts} host(s) with {jobs} jobs")
+    for pos, reads_of_host in enumerate(host_reads):
+        if not reads_of_host:
+            host_done(pos)
+
+    for read_idx, file_results in _run_file_reads_parallel(reads, jobs):
+        results[read_idx] = file_results
+        pos, run_ids = read_runs[read_idx]
+        hostname = hosts[pos][1]
+        for run_idx in run_ids:
+            pending_runs[(pos, run_idx)] -= 1
+            if pending_runs[(pos, run_idx)]:
+                continue
+            matches = []
+            for host_read in host_reads[pos]:
+                if results[host_read] is not None:
+                    matches.extend(results[host_read].get(run_idx, []))
+            host_totals[pos] += _write_host_run(
+                args, run_idx, runs[run_idx], classified, hostname,
+                matches, run_start_time, run_host_profiles, run_totals)
+        hosts_pending[pos] -= 1
+        if not hosts_pending[pos]:
+            host_done(pos)
+
+    # Writes happened in completion order; keep the host order of the
+    # serial loop for the system profile merge
+    host_order = {hostname: pos for pos, (_, hostname, _) in enumerate(hosts)}
+    for host_files in run_host_profiles.values():
+        host_files.sort(key=lambda entry: host_order[entry[1]])
+    return host_names_printed
+
+
 def run_batch(args):
     """Main entry point for batch mode execution."""
     set_verbose_level(getattr(args, "verbose", 0) or 0)
@@ -851,6 +1061,7 @@ def run_batch(args):
 
     batch_start = time.time()
     host_names_printed = 0
+    hosts = []
     for host_idx, (hostname, dated_dir) in enumerate(
             zip(bundle_host_list, bundle_host_list_dated), 1):
         logs_dir = os.path.join(args.bundle, dated_dir, logs_dir_rel)
@@ -858,7 +1069,20 @@ def run_batch(args):
             print(f"Warning: {logs_dir} not found, skipping {hostname}",
                   file=sys.stderr)
             continue
-
+        hosts.append((host_idx, hostname, logs_dir))
+
+    # --jobs N: read the files of all hosts in N worker processes
+    jobs = getattr(args, "jobs", 1) or os.cpu_count() or 1
+    if jobs > 1 and hosts:
+        # Writes interleave with the reads, so "output" nests in "scan"
+        with profile_phase("scan"):
+            host_names_printed = _scan_hosts_parallel(
+                args, runs, models, classified, hosts, jobs,
+                run_start_time, run_host_profiles, run_totals,
+                progress_enabled)
+        hosts = []
+
+    for host_idx, hostname, logs_dir in hosts:
         if verbose:
             print(f"  [{host_idx}/{total_hosts}] {hostname:<16} ",
                   end='', flush=True)
@@ -871,31 +1095,22 @@ def run_batch(args):
         file_groups = _build_file_groups(
             runs, models, classified, logs_dir, hostname)
         host_matches = defaultdict(list)
-        for filepath, targets in file_groups.items():
-            file_results = _single_pass_read(filepath, targets)
-            for run_idx, matches in file_results.items():
-                host_matches[run_idx].extend(matches)
+        # _single_pass_read() needs each file's date range; decompress
+        # the rotated .gz files for them concurrently up front
+        prefetch_file_date_ranges(
+            (filepath, os.path.basename(filepath)) for filepath in file_groups)
+        with profile_phase("scan"):
+            for filepath, targets in file_groups.items():
+                file_results = _single_pass_read(filepath, targets)
+                for run_idx, matches in file_results.items():
+                    host_matches[run_idx].extend(matches)
 
         host_total = 0
         for run_idx, run in enumerate(runs):
-            matches = host_matches.get(run_idx, [])
-            if not matches:
-                continue
-            model_name = run["model"]
-            # Reuse the once-per-batch classification result rather
-            # than re-classifying (and re-warning) per host.
-            blocks_for_writers = classified.get(model_name) or []
-            profile_path = _write_run_output(
-                args, run, model_name, hostname, matches,
-                blocks_for_writers, run_start_time,
-            )
-            if profile_path:
-                run_host_profiles[run_idx].append(
-                    (profile_path, hostname))
-                run_totals[run_idx] += len(matches)
-                host_total += len(matches)
-                vlog2(f"    ran '{model_name}' -> "
-                      f"{len(matches)} matches")
+            host_total += _write_host_run(
+                args, run_idx, run, classified, hostname,
+                host_matches.get(run_idx, []), run_start_time,
+                run_host_profiles, run_totals)
 
         if verbose:
             elapsed = time.time() - host_start
@@ -935,6 +1150,11 @@ def run_batch(args):
           f"{len(runs)} runs, {total_hosts} host(s) in {total_elapsed:.1f}s")
 
     runtime_root = _batch_runtime_root(args, run_start_time)
+    # --profile-self report for the whole batch, in the runtime root
+    # (or the current directory when that is the output directory)
+    profile_dir = runtime_root or os.getcwd()
+    if get_self_profiler() and os.path.isdir(profile_dir):
+        write_self_profile(profile_dir)
     if runtime_root:
         print(f"Output: {runtime_root}")
         for line in format_long_listing(runtime_root):
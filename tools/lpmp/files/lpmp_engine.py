@@ -25,11 +25,20 @@ sys.dont_write_bytecode = True  # noqa: E402
 
 # Import utilities
 
+from lpmp_gzip import open_gzip_text                         # noqa: E402
+from lpmp_index import get_file_index                        # noqa: E402
+from lpmp_index import seek_to_timestamp                     # noqa: E402
+from lpmp_profile import count_file_read                     # noqa: E402
+from lpmp_profile import profile_block                       # noqa: E402
+from lpmp_profile import stream_offset                       # noqa: E402
+from lpmp_scan import literal_prefilter                      # noqa: E402
+from lpmp_scan import scan_literal_matches                   # noqa: E402
 from lpmp_utils import apply_timeline_variable_substitution  # noqa: E402
 from lpmp_utils import discover_window_files                 # noqa: E402
 from lpmp_utils import format_duration                       # noqa: E402
 from lpmp_utils import format_log_line_for_output            # noqa: E402
 from lpmp_utils import format_result_line                    # noqa: E402
+from lpmp_utils import get_timestamp_parser                  # noqa: E402
 from lpmp_utils import get_verbose_level                     # noqa: E402
 from lpmp_utils import load_model                            # noqa: E402
 from lpmp_utils import manage_peer_controller                # noqa: E402
@@ -37,6 +46,7 @@ from lpmp_utils import ModelType                             # noqa: E402
 from lpmp_utils import PairResult                            # noqa: E402
 from lpmp_utils import parse_timestamp                       # noqa: E402
 from lpmp_utils import PatternResult                         # noqa: E402
+from lpmp_utils import prefetch_file_date_ranges             # noqa: E402
 from lpmp_utils import resolve_timeline_patterns             # noqa: E402
 from lpmp_utils import substitute_variables                  # noqa: E402
 from lpmp_utils import TimelineResult                        # noqa: E402
@@ -46,6 +56,9 @@ from lpmp_utils import vlog3                                 # noqa: E402
 from lpmp_utils import vlog4                                 # noqa: E402
 from lpmp_utils import vlog5                                 # noqa: E402
 
+# Text-mode tell() values at or above this carry decoder state
+_TEXT_COOKIE_FLAGS = 1 << 64
+
 
 def find_pattern_in_files(log_dir,
                           filenames,
@@ -61,7 +74,8 @@ def find_pattern_in_files(log_dir,
     Supports both regular and gzipped (.gz) log files.
 
     Note: For .gz files, position tracking is unreliable due to compression.
-    Use timestamp filtering (after_timestamp) for chronological ordering with .gz files.
+    Use timestamp filtering (after_timestamp) for chronological ordering with .gz files;
+    reading then resumes at the gzip index checkpoint before after_timestamp.
 
     Searches files in the order provided (newest first) until pattern is found.
     Uses smart date-range filtering to skip files outside the target date range.
@@ -99,6 +113,19 @@ def find_pattern_in_files(log_dir,
         compiled_pattern = None
         use_compiled = False
 
+    # Substring every match contains; plain-text files are then searched
+    # for it in a memory map instead of decoding every line
+    literal = None
+    if not (getattr(args, 'no_mmap_scan', False) if args else False):
+        literal = literal_prefilter(pattern)
+
+    # Decompress rotated .gz files whose date range is needed below
+    # concurrently instead of one at a time
+    if after_timestamp:
+        prefetch_file_date_ranges(
+            (os.path.join(search_log_dir, filename), filename)
+            for filename in filenames)
+
     for filename in filenames:
         filepath = os.path.join(search_log_dir, filename)
         vlog3(f"Checking file: {filepath}")
@@ -133,12 +160,10 @@ def find_pattern_in_files(log_dir,
 
         # Open file based on extension (.gz or regular)
         is_gzipped = filename.endswith('.gz')
-        if is_gzipped:
-            open_func = gzip.open
-            mode = 'rt'  # text mode for gzip
-        else:
-            open_func = open
-            mode = 'r'
+        tolerance = getattr(args, 'block_time_tolerance', 5.0) if args else 5.0
+        read_pos = 0
+        if not is_gzipped:
+            read_pos = start_pos
 
             # File position caching optimization (only for non-compressed files)
             if hasattr(args, '_file_position_cache'):
@@ -146,106 +171,101 @@ def find_pattern_in_files(log_dir,
                 cached_pos = args._file_position_cache.get(cache_key, start_pos)
                 if cached_pos > start_pos:
                     start_pos = cached_pos
+                    read_pos = start_pos
                     vlog3(f"Using cached position {start_pos} for {filename}")
 
+            # Persistent file index: jump past everything that the
+            # timestamp filter below would skip anyway (lines more
+            # than block_time_tolerance before after_timestamp).
+            if after_timestamp:
+                index = get_file_index(filepath, filename)
+                if index is not None:
+                    index_pos = index.seek_offset(
+                        after_timestamp - timedelta(seconds=tolerance))
+                    if index_pos > read_pos:
+                        vlog3(f"Using file index position {index_pos} for {filename}")
+                        read_pos = index_pos
+        elif start_pos > 0:
+            # For gzipped files, seeking is unreliable, so start from beginning
+            # and rely on timestamp filtering
+            vlog4("Warning: Position tracking not reliable for .gz files, using timestamp filtering")
+
+        # Multi-pattern scan: answer from the file's recorded match stream
+        # when this pattern was planned for it, otherwise read the file.
+        scanner = getattr(args, '_pattern_scanner', None) if args else None
+        recorded = None
+        if scanner is not None:
+            recorded = scanner.matches(filepath, filename, pattern, read_pos)
+        if recorded is not None:
+            vlog3(f"Using multi-pattern scan results for {filename}")
+            candidates = _recorded_pattern_matches(
+                recorded, is_gzipped, after_timestamp, tolerance)
+        else:
+            if use_compiled:
+                line_matches = compiled_pattern.search
+            else:
+                def line_matches(line):
+                    return pattern in line
+            # After a line ending in a lone carriage return the text
+            # reader's tell() is an opaque cookie, not a byte offset
+            if literal is not None and not is_gzipped \
+                    and read_pos < _TEXT_COOKIE_FLAGS:
+                candidates = _scan_pattern_matches(
+                    filepath, filename, read_pos, literal, line_matches,
+                    after_timestamp, tolerance)
+            else:
+                candidates = _read_pattern_matches(
+                    filepath, filename, is_gzipped, read_pos, line_matches,
+                    after_timestamp, tolerance)
+
         try:
-            with open_func(filepath, mode, encoding='utf-8', errors='ignore') as f:
-                # For gzipped files, seeking is unreliable, so start from beginning
-                # and rely on timestamp filtering
-                if not is_gzipped:
-                    f.seek(start_pos)
-                elif start_pos > 0:
-                    vlog4("Warning: Position tracking not reliable for .gz files, using timestamp filtering")
-
-                # Search line by line for pattern
-                line_count = 0
-                while True:
-                    line = f.readline()
-                    if not line:  # EOF reached
-                        break
-
-                    line_count += 1
-                    if line_count <= 5:
-                        vlog5(f"Sample line {line_count}: {line.strip()[:100]}")
-
-                    # Parse timestamp FIRST to skip lines before start_date
-                    timestamp = parse_timestamp(line, filename)
-                    if timestamp:
-                        # Skip lines before after_timestamp (start_date) to avoid unnecessary pattern matching
-                        if after_timestamp:
-                            tolerance = getattr(args, 'block_time_tolerance', 5.0) if args else 5.0
-                            time_diff = (after_timestamp - timestamp).total_seconds()
-
-                            # Skip lines that are before after_timestamp minus tolerance
-                            # but allow same-timestamp matches (different blocks/patterns
-                            # can legitimately share the same timestamp)
-                            if time_diff > tolerance:
-                                if line_count <= 5:
-                                    vlog3(f"DEBUG: Skipping line due to timestamp filter: "
-                                          f"time_diff={time_diff:.1f}s > tolerance={tolerance}s")
-                                continue
-                            # Note: previously had 'elif timestamp == after_timestamp: continue'
-                            # which prevented re-finding same timestamp between loops, but
-                            # also broke legitimate same-timestamp matches between blocks
-                            # (e.g. Pod Drain Complete and Lazy Reboot Start at same time).
-                            # Loop advancement is handled by lpmptool's 500ms time advance.
-
-                    # Now try pattern matching only on lines that pass timestamp filter
-                    if use_compiled:
-                        matched = compiled_pattern.search(line)
+            for timestamp, line, new_position in candidates:
+                # Virtual EOF: Skip if timestamp exceeds stop_date
+                if (
+                    hasattr(args, 'stop_date_parsed')
+                    and args.stop_date_parsed
+                    and timestamp > args.stop_date_parsed
+                ):
+                    vlog4(
+                        f"Virtual EOF reached at {timestamp} "
+                        f"(exceeds stop_date {args.stop_date_parsed})"
+                    )
+                    return None
+
+                # Skip if timestamp exceeds max_time_delta from after_timestamp
+                if max_time_delta is not None and after_timestamp:
+                    if max_time_delta == 0.0:
+                        if timestamp != after_timestamp:
+                            vlog4(
+                                f"Skipping match at {timestamp} "
+                                f"(zero tolerance, not exact match with {after_timestamp})"
+                            )
+                            continue
                     else:
-                        matched = pattern in line
-
-                    if matched:
-                        if timestamp:
-                            # Virtual EOF: Skip if timestamp exceeds stop_date
-                            if (
-                                hasattr(args, 'stop_date_parsed')
-                                and args.stop_date_parsed
-                                and timestamp > args.stop_date_parsed
-                            ):
-                                vlog4(
-                                    f"Virtual EOF reached at {timestamp} "
-                                    f"(exceeds stop_date {args.stop_date_parsed})"
-                                )
-                                return None
-
-                            # Skip if timestamp exceeds max_time_delta from after_timestamp
-                            if max_time_delta is not None and after_timestamp:
-                                if max_time_delta == 0.0:
-                                    if timestamp != after_timestamp:
-                                        vlog4(
-                                            f"Skipping match at {timestamp} "
-                                            f"(zero tolerance, not exact match with {after_timestamp})"
-                                        )
-                                        continue
-                                else:
-                                    time_diff = (timestamp - after_timestamp).total_seconds()
-                                    if time_diff > max_time_delta:
-                                        vlog4(
-                                            f"Skipping match at {timestamp} for block '{block_label}' "
-                                            f"(time_diff={time_diff:.1f}s > max_time_delta={max_time_delta}s, "
-                                            f"after_timestamp={after_timestamp})"
-                                        )
-                                        continue
-
-                            vlog1(f"Found pattern at {timestamp} in {filename}")
-                            formatted_line = format_log_line_for_output(line.strip(), filename)
-                            new_position = 0 if is_gzipped else f.tell()
-
-                            # Update file position cache if enabled and not compressed
-                            if hasattr(args, '_file_position_cache') and not is_gzipped:
-                                cache_key = f"{search_log_dir}/{filename}"
-                                args._file_position_cache[cache_key] = new_position
-                                vlog4(f"Updated cache position to {new_position} for {filename}")
-
-                            return timestamp, new_position, formatted_line, filename
-                        else:
-                            # Pattern matched but no valid timestamp - skip this line
+                        time_diff = (timestamp - after_timestamp).total_seconds()
+                        if time_diff > max_time_delta:
+                            vlog4(
+                                f"Skipping match at {timestamp} for block '{block_label}' "
+                                f"(time_diff={time_diff:.1f}s > max_time_delta={max_time_delta}s, "
+                                f"after_timestamp={after_timestamp})"
+                            )
                             continue
+
+                vlog1(f"Found pattern at {timestamp} in {filename}")
+                formatted_line = format_log_line_for_output(line.strip(), filename)
+
+                # Update file position cache if enabled and not compressed
+                if hasattr(args, '_file_position_cache') and not is_gzipped:
+                    cache_key = f"{search_log_dir}/{filename}"
+                    args._file_position_cache[cache_key] = new_position
+                    vlog4(f"Updated cache position to {new_position} for {filename}")
+
+                return timestamp, new_position, formatted_line, filename
         except (IOError, OSError, gzip.BadGzipFile) as e:
             vlog3(f"DEBUG: Error reading {filename}: {e}")
             continue
+        finally:
+            candidates.close()
 
     # Pattern not found in any file
     if not suppress_error:
@@ -255,18 +275,132 @@ def find_pattern_in_files(log_dir,
     return None
 
 
+def _read_pattern_matches(filepath, filename, is_gzipped, read_pos,
+                          line_matches, after_timestamp, tolerance):
+    """Read a log file from read_pos and yield its timestamped matches.
+
+    Yields (timestamp, line, new_position) for each line that carries a
+    timestamp, is not more than `tolerance` seconds before
+    after_timestamp and satisfies line_matches. new_position is the
+    offset after the line (always 0 for .gz files).
+    """
+    if is_gzipped:
+        # Lines more than tolerance before after_timestamp are skipped
+        # below, so the gzip index may resume past them
+        f = open_gzip_text(
+            filepath, filename,
+            after_timestamp - timedelta(seconds=tolerance)
+            if after_timestamp else None)
+    else:
+        f = open(filepath, 'r', encoding='utf-8', errors='ignore')
+    with f:
+        if not is_gzipped:
+            f.seek(read_pos)
+
+        # Search line by line for pattern
+        parse_line_timestamp = get_timestamp_parser(filename).parse
+        line_count = 0
+        ts_count = 0
+        regex_count = 0
+        start_offset = stream_offset(f)
+        try:
+            while True:
+                line = f.readline()
+                if not line:  # EOF reached
+                    break
+
+                line_count += 1
+                if line_count <= 5:
+                    vlog5(f"Sample line {line_count}: {line.strip()[:100]}")
+
+                # Parse timestamp FIRST to skip lines before start_date
+                timestamp = parse_line_timestamp(line)
+                if not timestamp:
+                    # Lines without a valid timestamp are never reported as matches
+                    continue
+                ts_count += 1
+                # Skip lines before after_timestamp (start_date) to avoid unnecessary pattern matching
+                if after_timestamp:
+                    time_diff = (after_timestamp - timestamp).total_seconds()
+
+                    # Skip lines that are before after_timestamp minus tolerance
+                    # but allow same-timestamp matches (different blocks/patterns
+                    # can legitimately share the same timestamp)
+                    if time_diff > tolerance:
+                        if line_count <= 5:
+                            vlog3(f"DEBUG: Skipping line due to timestamp filter: "
+                                  f"time_diff={time_diff:.1f}s > tolerance={tolerance}s")
+                        continue
+                    # Note: previously had 'elif timestamp == after_timestamp: continue'
+                    # which prevented re-finding same timestamp between loops, but
+                    # also broke legitimate same-timestamp matches between blocks
+                    # (e.g. Pod Drain Complete and Lazy Reboot Start at same time).
+                    # Loop advancement is handled by lpmptool's 500ms time advance.
+
+                # Now try pattern matching only on lines that pass timestamp filter
+                regex_count += 1
+                if line_matches(line):
+                    yield timestamp, line, 0 if is_gzipped else f.tell()
+        finally:
+            count_file_read(filename, reads=1, lines_parsed=line_count,
+                            timestamps_parsed=ts_count,
+                            regex_evaluations=regex_count,
+                            bytes_read=stream_offset(f) - start_offset)
+
+
+def _scan_pattern_matches(filepath, filename, read_pos, literal,
+                          line_matches, after_timestamp, tolerance):
+    """Byte-level variant of _read_pattern_matches() for plain-text files.
+
+    Only lines containing `literal` are decoded and checked; yields the
+    same (timestamp, line, new_position) tuples.
+    """
+    vlog3(f"Memory-mapped search of {filename} for {literal!r}")
+    for timestamp, line, end in scan_literal_matches(
+            filepath, filename, read_pos, literal, line_matches):
+        if after_timestamp and \
+                (after_timestamp - timestamp).total_seconds() > tolerance:
+            continue
+        yield timestamp, line, end
+
+
+def _recorded_pattern_matches(recorded, is_gzipped, after_timestamp, tolerance):
+    """Yield (timestamp, line, new_position) from a multi-pattern scan.
+
+    Applies the same after_timestamp tolerance filter as
+    _read_pattern_matches() to the already-matched lines.
+    """
+    for _start, end, timestamp, line in recorded:
+        if after_timestamp and \
+                (after_timestamp - timestamp).total_seconds() > tolerance:
+            continue
+        yield timestamp, line, 0 if is_gzipped else end
+
+
 def _bisect_seek_to_timestamp(f, target_timestamp, file_size, filename=None):
     """Binary search within a plain-text file to position near target_timestamp.
 
     Seeks to the approximate file position where lines with timestamps
     >= target_timestamp begin, avoiding a linear scan from the start.
-    After return the caller should readline() to consume the partial
-    line left by the seek, then continue reading.
+    On return f is at the start of a full line: the caller reads lines
+    from there and must not readline() to skip a partial one.
+
+    When the persistent file index is enabled the seek goes straight
+    to the indexed checkpoint before target_timestamp and no bisect is
+    performed. Otherwise the bisect result is aligned to the next line
+    start before returning.
     """
+    filepath = getattr(f, 'name', None)
+    if isinstance(filepath, str) and seek_to_timestamp(
+            f, filepath, target_timestamp, filename):
+        return
+
     lo, hi = 0, file_size
     best = 0  # best known position that is still before target
+    steps = 0
 
     while lo < hi:
+        steps += 1
         mid = (lo + hi) // 2
         f.seek(mid)
         f.readline()  # skip partial line
@@ -295,6 +429,7 @@ def _bisect_seek_to_timestamp(f, target_timestamp, file_size, filename=None):
 
     f.seek(best)
     f.readline()  # align to next full line
+    count_file_read(filename or filepath, bisect_steps=steps)
 
 
 def find_pattern_in_files_all_matches(log_dir,
@@ -318,6 +453,11 @@ def find_pattern_in_files_all_matches(log_dir,
         compiled_pattern = None
         use_compiled = False
 
+    if after_timestamp:
+        prefetch_file_date_ranges(
+            (os.path.join(log_dir, filename), filename)
+            for filename in filenames)
+
     for filename in filenames:
         filepath = os.path.join(log_dir, filename)
         if not os.path.exists(filepath):
@@ -331,11 +471,13 @@ def find_pattern_in_files_all_matches(log_dir,
                 continue
 
         is_gzipped = filename.endswith('.gz')
-        open_func = gzip.open if is_gzipped else open
-        mode = 'rt' if is_gzipped else 'r'
 
         try:
-            with open_func(filepath, mode, encoding='utf-8', errors='ignore') as f:
+            if is_gzipped:
+                f = open_gzip_text(filepath, filename, after_timestamp)
+            else:
+                f = open(filepath, 'r', encoding='utf-8', errors='ignore')
+            with f:
                 # Binary-search seek for plain-text files when we have a
                 # start timestamp, so we skip the bulk of lines before the
                 # time window instead of reading them one by one.
@@ -346,34 +488,48 @@ def find_pattern_in_files_all_matches(log_dir,
                     if file_size > 32768:
                         _bisect_seek_to_timestamp(f, after_timestamp, file_size, filename)
 
-                while True:
-                    line = f.readline()
-                    if not line:
-                        break
-
-                    # Parse timestamp FIRST to skip lines outside date range
-                    timestamp = parse_timestamp(line, filename)
-                    if timestamp:
-                        if after_timestamp and timestamp <= after_timestamp:
-                            continue
-                        # Virtual EOF: break when past stop_date
-                        if (
-                            hasattr(args, 'stop_date_parsed')
-                            and args.stop_date_parsed
-                            and timestamp > args.stop_date_parsed
-                        ):
+                parse_line_timestamp = get_timestamp_parser(filename).parse
+                line_count = 0
+                ts_count = 0
+                regex_count = 0
+                start_offset = stream_offset(f)
+                try:
+                    while True:
+                        line = f.readline()
+                        if not line:
                             break
+                        line_count += 1
 
-                    # Pattern matching on lines that pass timestamp filter
-                    if use_compiled:
-                        matched = compiled_pattern.search(line)
-                    else:
-                        matched = pattern in line
+                        # Parse timestamp FIRST to skip lines outside date range
+                        timestamp = parse_line_timestamp(line)
+                        if timestamp:
+                            ts_count += 1
+                            if after_timestamp and timestamp <= after_timestamp:
+                                continue
+                            # Virtual EOF: break when past stop_date
+                            if (
+                                hasattr(args, 'stop_date_parsed')
+                                and args.stop_date_parsed
+                                and timestamp > args.stop_date_parsed
+                            ):
+                                break
 
-                    if matched and timestamp:
-                        formatted_line = format_log_line_for_output(
-                            line.strip(), filename)
-                        matches.append((timestamp, formatted_line, filename))
+                        # Pattern matching on lines that pass timestamp filter
+                        regex_count += 1
+                        if use_compiled:
+                            matched = compiled_pattern.search(line)
+                        else:
+                            matched = pattern in line
+
+                        if matched and timestamp:
+                            formatted_line = format_log_line_for_output(
+                                line.strip(), filename)
+                            matches.append((timestamp, formatted_line, filename))
+                finally:
+                    count_file_read(filename, reads=1, lines_parsed=line_count,
+                                    timestamps_parsed=ts_count,
+                                    regex_evaluations=regex_count,
+                                    bytes_read=stream_offset(f) - start_offset)
         except (IOError, OSError, gzip.BadGzipFile) as e:
             print(f"Error reading {filename}: {e}")
 
@@ -477,53 +633,38 @@ def apply_variable_substitution(blocks, variables):
                 )
 
 
-def process_pattern_block(args, block, start_date, max_time_delta=None):
-    """Process a single pattern block (uses 'patterns:' field).
-
-    With stacked pattern expansion, this function now only processes single patterns.
-    Each pattern block contains exactly one pattern in its 'patterns' list.
-
-    Override Feature: If block has 'override' field, searches patterns in the
-    specified hostname's log directory instead of current hostname's logs.
+def _find_override_logs_dir(args, block):
+    """Return the logs directory of a block's override host in the bundle.
 
-    Returns a list with one tuple: [(timestamp, log_line, actual_filename, output_hostname)]
-    or None if the block failed.
+    Always checks all available hosts in the bundle directory, not just
+    the filtered bundle_host_list, so overrides work even when using
+    --include/--exclude filtering. Returns None when the block has no
+    override, no bundle is being processed or the host is not found.
     """
-    if not block.get('patterns'):
+    if not (block.get('override') and hasattr(args, 'bundle_name') and args.bundle_name != '/'):
         return None
+    override_hostname = block['override']  # Should already be substituted by apply_variable_substitution
+    try:
+        for entry in os.listdir(args.bundle_name):
+            if (
+                entry.startswith(override_hostname + '_')
+                and os.path.isdir(os.path.join(args.bundle_name, entry))
+            ):
+                return os.path.join(
+                    args.bundle_name, entry,
+                    getattr(args, 'original_logs_dir', 'var/log')
+                )
+    except OSError:
+        pass
+    return None
 
-    # Skip controller-only blocks if hostname doesn't contain 'controller'
-    current_hostname = getattr(args, 'current_processing_hostname', getattr(args, 'hostname', 'controller-0'))
-    # Check block-level controller setting, fall back to model-level setting
-    controller_only = block.get('controller', getattr(args, 'controller_setting', False))
-    if controller_only and 'controller' not in current_hostname:
-        vlog2(f"Skipping controller-only block '{block['label']}' for non-controller host {current_hostname}")
-        return None
 
-    # Override Feature: Check for override hostname in block configuration
-    # This allows searching patterns in a different hostname's log directory
-    override_logs_dir = None
-    if block.get('override') and hasattr(args, 'bundle_name') and args.bundle_name != '/':
-        override_hostname = block['override']  # Should already be substituted by apply_variable_substitution
-        # Always check all available hosts in bundle directory, not just filtered bundle_host_list
-        # This ensures overrides work even when using --include/--exclude filtering
-        if hasattr(args, 'bundle_name'):
-            try:
-                bundle_entries = os.listdir(args.bundle_name)
-                for entry in bundle_entries:
-                    if (
-                        entry.startswith(override_hostname + '_')
-                        and os.path.isdir(os.path.join(args.bundle_name, entry))
-                    ):
-                        override_logs_dir = os.path.join(
-                            args.bundle_name, entry,
-                            getattr(args, 'original_logs_dir', 'var/log')
-                        )
-                        break
-            except OSError:
-                pass
+def _block_pattern_variables(args, block):
+    """Build the variables used to substitute a pattern/pair block's patterns.
 
-    # Override Feature: Create variables for pattern substitution with override hostname
+    Override Feature: When the block has an override, {hostname} and
+    {peer_controller} are calculated for the override hostname.
+    """
     current_hostname = getattr(args, 'current_processing_hostname', getattr(args, 'hostname', 'controller-0'))
     pattern_variables = {'hostname': current_hostname, 'label': block.get('label', '')}
     if hasattr(args, 'host') and args.host:
@@ -537,8 +678,6 @@ def process_pattern_block(args, block, start_date, max_time_delta=None):
     # Add peer_controller variable
     manage_peer_controller(pattern_variables)
 
-    # Override Feature: If this block has an override, use the override hostname for pattern substitution
-    output_hostname = current_hostname  # Default to current hostname
     if block.get('override'):
         pattern_variables['hostname'] = block['override']
         # Recalculate peer_controller based on the override hostname value
@@ -547,7 +686,83 @@ def process_pattern_block(args, block, start_date, max_time_delta=None):
                 pattern_variables['peer_controller'] = 'controller-1'
             elif block['override'] == 'controller-1':
                 pattern_variables['peer_controller'] = 'controller-0'
-        output_hostname = block['override']  # Use override hostname for output
+    return pattern_variables
+
+
+def _block_search_patterns(args, block):
+    """Return the substituted patterns a pattern or pair block searches for.
+
+    Pattern blocks return [pattern]; pair blocks return [start, stop].
+    Each entry is a string or an OR list, exactly as passed on to
+    find_pattern_in_files. Pattern blocks are always substituted with
+    the block's local variables; pair blocks only when they have an
+    override (otherwise apply_variable_substitution already did it).
+    """
+    if 'patterns' in block:
+        pattern = block['patterns'][0]  # Always exactly one pattern after expansion
+        return [_substitute_pattern_or_list(pattern, _block_pattern_variables(args, block))]
+    if block.get('override'):
+        pattern_variables = _block_pattern_variables(args, block)
+        return [_substitute_pattern_or_list(block['start'], pattern_variables),
+                _substitute_pattern_or_list(block['stop'], pattern_variables)]
+    return [block['start'], block['stop']]
+
+
+def _plan_pattern_scan(args, blocks, scanner):
+    """Register every (log file, pattern) the pattern/pair blocks may search.
+
+    Called once per pass so the MultiPatternScanner reads each log file
+    once for all blocks, OR alternatives and pair start/stop patterns.
+    """
+    current_hostname = getattr(args, 'current_processing_hostname', getattr(args, 'hostname', 'controller-0'))
+    entries = []
+    for block in blocks:
+        if not block.get('file') or 'timeline' in block:
+            continue
+        if not (block.get('patterns') or (block.get('start') and block.get('stop'))):
+            continue
+        controller_only = block.get('controller', getattr(args, 'controller_setting', False))
+        if controller_only and 'controller' not in current_hostname:
+            continue
+        search_dir = _find_override_logs_dir(args, block) or args.logs_dir
+        filenames = block['file'] if isinstance(block['file'], list) else [block['file']]
+        for pattern in _block_search_patterns(args, block):
+            alternatives = pattern if isinstance(pattern, list) else [pattern]
+            for filename in filenames:
+                filepath = os.path.join(search_dir, filename)
+                entries.extend((filepath, alt) for alt in alternatives)
+    scanner.plan(entries)
+
+
+def process_pattern_block(args, block, start_date, max_time_delta=None):
+    """Process a single pattern block (uses 'patterns:' field).
+
+    With stacked pattern expansion, this function now only processes single patterns.
+    Each pattern block contains exactly one pattern in its 'patterns' list.
+
+    Override Feature: If block has 'override' field, searches patterns in the
+    specified hostname's log directory instead of current hostname's logs.
+
+    Returns a list with one tuple: [(timestamp, log_line, actual_filename, output_hostname)]
+    or None if the block failed.
+    """
+    if not block.get('patterns'):
+        return None
+
+    # Skip controller-only blocks if hostname doesn't contain 'controller'
+    current_hostname = getattr(args, 'current_processing_hostname', getattr(args, 'hostname', 'controller-0'))
+    # Check block-level controller setting, fall back to model-level setting
+    controller_only = block.get('controller', getattr(args, 'controller_setting', False))
+    if controller_only and 'controller' not in current_hostname:
+        vlog2(f"Skipping controller-only block '{block['label']}' for non-controller host {current_hostname}")
+        return None
+
+    # Override Feature: Check for override hostname in block configuration
+    # This allows searching patterns in a different hostname's log directory
+    override_logs_dir = _find_override_logs_dir(args, block)
+
+    # Override Feature: If this block has an override, use the override hostname for output
+    output_hostname = block['override'] if block.get('override') else current_hostname
 
     search_path = override_logs_dir if override_logs_dir else args.logs_dir
 
@@ -566,15 +781,10 @@ def process_pattern_block(args, block, start_date, max_time_delta=None):
         )
 
     # Process single pattern (stacked patterns have been expanded into individual blocks)
-    pattern = block['patterns'][0]  # Always exactly one pattern after expansion
+    # with variable substitution applied using the block's local variables
+    pattern = _block_search_patterns(args, block)[0]
     after_timestamp = start_date
 
-    # Apply variable substitution to the pattern using local variables
-    if isinstance(pattern, list):
-        pattern = [substitute_variables(p, pattern_variables) for p in pattern]
-    else:
-        pattern = substitute_variables(pattern, pattern_variables)
-
     if isinstance(pattern, list):
         # OR pattern - try each alternative
         result = None
@@ -637,59 +847,11 @@ def process_pair_block(args, block, after_timestamp, global_max_time_delta=45):
 
     # Override Feature: Check for override hostname in block configuration
     # This allows searching start/stop patterns in a different hostname's log directory
-    override_logs_dir = None
-    if block.get('override') and hasattr(args, 'bundle_name') and args.bundle_name != '/':
-        override_hostname = block['override']  # Should already be substituted by apply_variable_substitution
-        # Always check all available hosts in bundle directory, not just filtered bundle_host_list
-        # This ensures overrides work even when using --include/--exclude filtering
-        if hasattr(args, 'bundle_name'):
-            try:
-                bundle_entries = os.listdir(args.bundle_name)
-                for entry in bundle_entries:
-                    if (
-                        entry.startswith(override_hostname + '_')
-                        and os.path.isdir(os.path.join(args.bundle_name, entry))
-                    ):
-                        override_logs_dir = os.path.join(
-                            args.bundle_name, entry,
-                            getattr(args, 'original_logs_dir', 'var/log')
-                        )
-                        break
-            except OSError:
-                pass
-
-    # Override Feature: Create variables for pattern substitution with override hostname
-    # When override is specified, recalculate variables based on override hostname
-    pattern_variables = {'hostname': current_hostname, 'label': block.get('label', '')}
-    if hasattr(args, 'host') and args.host:
-        pattern_variables['host'] = args.host
-    if hasattr(args, 'variables') and args.variables:
-        for var_pair in args.variables:
-            if '=' in var_pair:
-                key, value = var_pair.split('=', 1)
-                pattern_variables[key] = value
-
-    # Add peer_controller variable
-    manage_peer_controller(pattern_variables)
-
-    # Override Feature: If this block has an override, use the override hostname for pattern substitution
-    # This ensures variables like {hostname} and {peer_controller} are calculated correctly
-    if block.get('override'):
-        pattern_variables['hostname'] = block['override']
-        # Recalculate peer_controller based on the override hostname value
-        if 'controller' in block['override']:
-            if block['override'] == 'controller-0':
-                pattern_variables['peer_controller'] = 'controller-1'
-            elif block['override'] == 'controller-1':
-                pattern_variables['peer_controller'] = 'controller-0'
+    override_logs_dir = _find_override_logs_dir(args, block)
 
     # Override Feature: Apply variable substitution to start/stop patterns if block has override
     # (patterns were skipped during apply_variable_substitution for override blocks)
-    start_pattern = block['start']
-    stop_pattern = block['stop']
-    if block.get('override'):
-        start_pattern = _substitute_pattern_or_list(block['start'], pattern_variables)
-        stop_pattern = _substitute_pattern_or_list(block['stop'], pattern_variables)
+    start_pattern, stop_pattern = _block_search_patterns(args, block)
 
     search_path = override_logs_dir if override_logs_dir else args.logs_dir
 
@@ -897,6 +1059,11 @@ def process_blocks_auto_detect(args,
     # Get current hostname for controller filtering
     current_hostname = getattr(args, 'current_processing_hostname', getattr(args, 'hostname', 'controller-0'))
 
+    # Multi-pattern scan: read each log file once for every pattern/pair block
+    scanner = getattr(args, '_pattern_scanner', None)
+    if scanner is not None:
+        _plan_pattern_scan(args, blocks, scanner)
+
     for block in blocks:
         if not block.get('file'):
             continue
@@ -913,7 +1080,9 @@ def process_blocks_auto_detect(args,
         # Auto-detect block type and process accordingly
         if 'timeline' in block:
             # Timeline block - process all matches and merge
-            timeline_matches = process_timeline_block(args, block, start_date, settings, variables)
+            with profile_block(block['label']):
+                timeline_matches = process_timeline_block(
+                    args, block, start_date, settings, variables)
             if timeline_matches:
                 patterns_found += len(timeline_matches)
                 # Add all timeline matches to temp_results
@@ -946,12 +1115,13 @@ def process_blocks_auto_detect(args,
             else:
                 # Use block-level max_time_delta if explicitly set, otherwise use global max_time_delta
                 block_max_time_delta = block.get('max_time_delta', max_time_delta)
-            result = process_pair_block(
-                args,
-                block,
-                prev_timestamp
-                if prev_timestamp
-                else start_date, block_max_time_delta)
+            with profile_block(block['label']):
+                result = process_pair_block(
+                    args,
+                    block,
+                    prev_timestamp
+                    if prev_timestamp
+                    else start_date, block_max_time_delta)
             block_type = 'pair'
         elif 'patterns' in block:
             # Pattern block - use block-level max_time_delta if present, otherwise global
@@ -962,10 +1132,11 @@ def process_blocks_auto_detect(args,
             else:
                 # Use block-level max_time_delta if explicitly set, otherwise use global max_time_delta
                 block_max_time_delta = block.get('max_time_delta', max_time_delta)
-            result = process_pattern_block(
-                args, block, prev_timestamp if prev_timestamp else start_date,
-                block_max_time_delta
-            )
+            with profile_block(block['label']):
+                result = process_pattern_block(
+                    args, block, prev_timestamp if prev_timestamp else start_date,
+                    block_max_time_delta
+                )
             block_type = 'pattern'
 
             # Pattern blocks return a single result (one pattern per block after expansion)
@@ -1063,23 +1234,7 @@ def process_blocks_auto_detect(args,
             attempted_file = block['file'][0] if isinstance(block['file'], list) else block['file']
 
             # Determine which logs directory was used for search (for error reporting)
-            override_logs_dir = None
-            if block.get('override') and hasattr(args, 'bundle_name') and args.bundle_name != '/':
-                override_hostname = block['override']
-                try:
-                    bundle_entries = os.listdir(args.bundle_name)
-                    for entry in bundle_entries:
-                        if (
-                            entry.startswith(override_hostname + '_')
-                            and os.path.isdir(os.path.join(args.bundle_name, entry))
-                        ):
-                            override_logs_dir = os.path.join(
-                                args.bundle_name, entry,
-                                getattr(args, 'original_logs_dir', 'var/log')
-                            )
-                            break
-                except OSError:
-                    pass
+            override_logs_dir = _find_override_logs_dir(args, block)
 
             search_logs_dir = override_logs_dir if override_logs_dir else args.logs_dir
             full_file_path = os.path.join(search_logs_dir, attempted_file)
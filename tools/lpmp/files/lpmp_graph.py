@@ -30,7 +30,15 @@ Outputs:
     <prefix>.csv  - CSV of the extracted samples
     <prefix>.png  - Rendered graph image
 
-Dependencies: pandas (CSV/timestamp parsing), matplotlib (graph rendering).
+Line-style profiles are loaded column-wise: load_usage_columns() streams
+the profile and converts the matched timestamps and values to NumPy
+arrays in bulk. Series longer than the image is wide are reduced to one
+time bucket per pixel column (mean line plus a min/max band) before
+plotting, so week-long multi-host timelines render in bounded time and
+memory. The CSV always keeps every sample.
+
+Dependencies: numpy (columnar loading, downsampling), pandas (CSV/timestamp
+parsing), matplotlib (graph rendering).
 """
 
 import argparse
@@ -50,6 +58,12 @@ from lpmp_utils import vlog1                # noqa: E402
 from lpmp_utils import vlog2                # noqa: E402
 from lpmp_utils import vlog3                # noqa: E402
 
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy is required for graph function. Install and retry", file=sys.stderr)
+    sys.exit(1)
+
 try:
     import pandas as pd
 except ImportError:
@@ -62,6 +76,20 @@ except ImportError:
     print("Error: matplotlib is required for graph function. Install and retry", file=sys.stderr)
     sys.exit(1)
 
+# Resolution graphs are saved at; downsampling targets one time bucket
+# per pixel column of the figure width
+GRAPH_DPI = 300
+
+# Matched rows converted to arrays at a time by load_usage_columns()
+COLUMN_CHUNK_ROWS = 100000
+
+# Row patterns shared by the usage extractors (see extract_usage_data)
+_TIMESTAMP_RE = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3})')
+_DEBOUNCE_RE = re.compile(r'debounce.*?\((\d+\.?\d*)\)')
+_READING_RE = re.compile(r'reading: (\d+\.?\d*) % usage')
+_PLATFORM_MEM_RE = re.compile(r'platform memory (?:usage:|dispatch) Usage: (\d+\.?\d*)%')
+_PLATFORM_CPU_RE = re.compile(r'platform cpu (?:usage plugin|dispatch) Usage: (\d+\.?\d*)%')
+
 
 def parse_bound_date(raw, kind):
     """Parse a -s/-e bound date string the same way lpmptool does.
@@ -243,6 +271,164 @@ def create_csv(usage_data, output_file, usage_type):
     vlog2(f"CSV file written: {output_file}")
 
 
+def _usage_value_patterns(usage_type):
+    """Value patterns tried in order for usage_type's rows."""
+    patterns = [_DEBOUNCE_RE, _READING_RE]
+    if 'platform mem' in usage_type.lower():
+        patterns.append(_PLATFORM_MEM_RE)
+    if 'platform cpu' in usage_type.lower():
+        patterns.append(_PLATFORM_CPU_RE)
+    return patterns
+
+
+def _to_datetime64(ts_str):
+    """Parse one timestamp string to datetime64[ms], NaT if invalid."""
+    try:
+        return np.datetime64(ts_str, 'ms')
+    except ValueError:
+        return np.datetime64('NaT', 'ms')
+
+
+def _timestamp_column(ts_strs):
+    """Convert ISO timestamp strings to a datetime64[ms] array in bulk."""
+    try:
+        return np.array(ts_strs, dtype='datetime64[ms]')
+    except ValueError:
+        # A malformed date somewhere in the chunk; only then go row by row
+        return np.array([_to_datetime64(ts) for ts in ts_strs],
+                        dtype='datetime64[ms]')
+
+
+def load_usage_columns(input_file, usage_type,
+                       start_date=None, stop_date=None):
+    """Columnar counterpart of extract_usage_data() for large profiles.
+
+    Streams the profile, keeping only the timestamp and value strings
+    of matched rows, and converts them COLUMN_CHUNK_ROWS at a time to
+    NumPy arrays (datetime64[ms] and float64); no per-row datetime or
+    tuple objects are built. The -s/-e bounds (inclusive) are applied
+    to each chunk as an array mask.
+
+    Yields the rows extract_usage_data() returns, in the same order,
+    except that a timestamp NumPy cannot parse is dropped even without
+    bounds. Returns (timestamps, values) arrays of equal length.
+    """
+    value_patterns = _usage_value_patterns(usage_type)
+    start = np.datetime64(start_date, 'ms') if start_date is not None else None
+    stop = np.datetime64(stop_date, 'ms') if stop_date is not None else None
+
+    ts_chunks = []
+    value_chunks = []
+    ts_strs = []
+    value_strs = []
+    line_count = 0
+
+    def convert_chunk():
+        timestamps = _timestamp_column(ts_strs)
+        values = np.array(value_strs, dtype=np.float64)
+        keep = ~np.isnat(timestamps)
+        if start is not None:
+            keep &= timestamps >= start
+        if stop is not None:
+            keep &= timestamps <= stop
+        ts_chunks.append(timestamps[keep])
+        value_chunks.append(values[keep])
+        ts_strs.clear()
+        value_strs.clear()
+
+    vlog2(f"Loading '{usage_type}' columns from {input_file}")
+    with open(input_file, 'r') as f:
+        for line in f:
+            line_count += 1
+            # Timeline format: Delta\tHostname\tBlock Label\tLog File\tData
+            parts = line.split('\t')
+            if len(parts) < 5 or usage_type not in parts[2]:
+                continue
+            log_data = parts[4]
+            timestamp_match = _TIMESTAMP_RE.search(log_data)
+            if not timestamp_match:
+                continue
+            for pattern in value_patterns:
+                value_match = pattern.search(log_data)
+                if value_match:
+                    break
+            else:
+                continue
+            ts_strs.append(timestamp_match.group(1))
+            value_strs.append(value_match.group(1))
+            if len(ts_strs) >= COLUMN_CHUNK_ROWS:
+                convert_chunk()
+    if ts_strs:
+        convert_chunk()
+
+    if not ts_chunks:
+        return np.array([], dtype='datetime64[ms]'), np.array([], dtype=np.float64)
+    timestamps = np.concatenate(ts_chunks)
+    values = np.concatenate(value_chunks)
+    vlog2(f"Processed {line_count} lines, {len(values)} data points loaded")
+    return timestamps, values
+
+
+def write_usage_csv(timestamps, values, output_file, usage_type):
+    """Write the CSV create_csv() writes, from load_usage_columns() arrays."""
+    column_name = usage_type.replace(' ', '_') + '_Usage'
+
+    vlog2(f"Creating CSV with column '{column_name}'")
+
+    with open(output_file, 'w') as f:
+        f.write(f"Timestamp,{column_name}\n")
+        for begin in range(0, len(values), COLUMN_CHUNK_ROWS):
+            end = begin + COLUMN_CHUNK_ROWS
+            ts_text = np.datetime_as_string(timestamps[begin:end], unit='ms')
+            f.writelines(f"{timestamp},{value}\n" for timestamp, value
+                         in zip(ts_text.tolist(), values[begin:end].tolist()))
+
+    vlog2(f"CSV file written: {output_file}")
+
+
+def downsample_series(timestamps, values, buckets):
+    """Reduce a time series to at most `buckets` equal-width time buckets.
+
+    Returns (times, minimums, maximums, means) arrays with one entry per
+    non-empty bucket; times are the bucket centers as datetime64[ms].
+    Unsorted input is sorted by time first.
+    """
+    ts = np.asarray(timestamps, dtype='datetime64[ms]').astype(np.int64)
+    values = np.asarray(values, dtype=np.float64)
+    if ts.size > 1 and np.any(ts[1:] < ts[:-1]):
+        order = np.argsort(ts, kind='stable')
+        ts = ts[order]
+        values = values[order]
+    first = ts[0]
+    span = max(int(ts[-1] - first), 1)
+    bucket = np.minimum((ts - first) * buckets // span, buckets - 1)
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    counts = np.diff(np.r_[starts, ts.size])
+    minimums = np.minimum.reduceat(values, starts)
+    maximums = np.maximum.reduceat(values, starts)
+    means = np.add.reduceat(values, starts) / counts
+    centers = first + ((2 * bucket[starts] + 1) * span) // (2 * buckets)
+    return centers.astype('datetime64[ms]'), minimums, maximums, means
+
+
+def plot_usage_series(timestamps, values, pixel_columns, **plot_kwargs):
+    """Plot one usage series with plt.plot(**plot_kwargs).
+
+    Series with more samples than pixel_columns are downsampled first
+    and drawn as the per-bucket mean with a shaded min/max band, so
+    short spikes stay visible.
+    """
+    if len(values) <= pixel_columns:
+        plt.plot(timestamps, values, **plot_kwargs)
+        return
+    vlog2(f"Downsampling {len(values)} points to {pixel_columns} buckets")
+    times, minimums, maximums, means = downsample_series(
+        timestamps, values, pixel_columns)
+    plt.fill_between(times, minimums, maximums, color=plot_kwargs.get('color'),
+                     alpha=0.2, linewidth=0)
+    plt.plot(times, means, **plot_kwargs)
+
+
 def create_graph(csv_file, output_image, usage_type, y_range):
     """Create graph from CSV data."""
     vlog2(f"Reading CSV file: {csv_file}")
@@ -260,7 +446,8 @@ def create_graph(csv_file, output_image, usage_type, y_range):
     vlog2(f"Y-range: {y_range}")
 
     plt.figure(figsize=(12, 6))
-    plt.plot(df['Timestamp'], df[column_name], linewidth=1, color='blue')
+    plot_usage_series(df['Timestamp'], df[column_name], 12 * GRAPH_DPI,
+                      linewidth=1, color='blue')
     plt.title(f'{usage_type} Usage Over Time')
     plt.xlabel('Time')
     plt.ylabel('Usage (%)')
@@ -269,7 +456,7 @@ def create_graph(csv_file, output_image, usage_type, y_range):
     plt.xticks(rotation=45)
     plt.tight_layout()
 
-    plt.savefig(output_image, dpi=300, bbox_inches='tight')
+    plt.savefig(output_image, dpi=GRAPH_DPI, bbox_inches='tight')
     plt.close()
 
     vlog2(f"Graph saved: {output_image}")
@@ -497,7 +684,7 @@ def create_state_graph(state_data, output_image, usage_type):
     plt.xticks(rotation=45, ha='right')
     plt.tight_layout()
 
-    plt.savefig(output_image, dpi=300, bbox_inches='tight')
+    plt.savefig(output_image, dpi=GRAPH_DPI, bbox_inches='tight')
     plt.close()
 
     vlog2(f"State graph saved: {output_image}")
@@ -569,7 +756,8 @@ def create_system_graph(host_csvs, output_image, usage_type, y_range):
 
     # Scale figure height slightly with host count so legends stay readable.
     height = 6 + max(0, len(present) - 6) * 0.15
-    plt.figure(figsize=(14, height))
+    width = 14
+    plt.figure(figsize=(width, height))
 
     plotted = 0
     for (hostname, csv_path), color in zip(present, colors):
@@ -579,8 +767,8 @@ def create_system_graph(host_csvs, output_image, usage_type, y_range):
             if column_name not in df.columns:
                 vlog3(f"{hostname}: column '{column_name}' missing in {csv_path}; skipping")
                 continue
-            plt.plot(df['Timestamp'], df[column_name],
-                     linewidth=1, color=color, label=hostname, alpha=0.85)
+            plot_usage_series(df['Timestamp'], df[column_name], width * GRAPH_DPI,
+                              linewidth=1, color=color, label=hostname, alpha=0.85)
             plotted += 1
             vlog3(f"Plotted {hostname} ({len(df)} points)")
         except Exception as e:
@@ -601,7 +789,7 @@ def create_system_graph(host_csvs, output_image, usage_type, y_range):
     plt.legend(loc='best', framealpha=0.9, title='Host')
     plt.tight_layout()
 
-    plt.savefig(output_image, dpi=300, bbox_inches='tight')
+    plt.savefig(output_image, dpi=GRAPH_DPI, bbox_inches='tight')
     plt.close()
 
     vlog2(f"System graph saved: {output_image}")
@@ -715,11 +903,11 @@ def main():
 
     # Default: line-style numeric usage extraction
     print(f"Extracting {args.name} usage data from {args.input}...")
-    usage_data = extract_usage_data(args.input, args.name,
-                                    start_date=start_date,
-                                    stop_date=stop_date)
+    timestamps, values = load_usage_columns(args.input, args.name,
+                                            start_date=start_date,
+                                            stop_date=stop_date)
 
-    if not usage_data:
+    if not len(values):
         print(f"No {args.name} usage data found in the input file")
         if get_verbose_level() >= 2:
             vlog2("Checking first 10 lines of input file:")
@@ -734,8 +922,8 @@ def main():
         return
 
     # Create CSV
-    create_csv(usage_data, csv_file, args.name)
-    print(f"Created CSV with {len(usage_data)} data points: {csv_file}")
+    write_usage_csv(timestamps, values, csv_file, args.name)
+    print(f"Created CSV with {len(values)} data points: {csv_file}")
 
     # Create graph
     create_graph(csv_file, png_file, args.name, y_range)
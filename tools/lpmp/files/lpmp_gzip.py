@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+"""
+LPMP Gzip Access Module
+
+Seekable access to rotated .gz logs. A gzip stream cannot be entered
+part way, so every search used to decompress daemon.log.N.gz from its
+start and get_file_date_range() ran `zcat | tail -50` to find the last
+timestamp.
+
+build_gzip_index() decompresses a file once and keeps zran-style
+checkpoints: every CHECKPOINT_SPAN bytes of uncompressed data it
+records the compressed and uncompressed offsets, a copy of the zlib
+decompressor state (which carries the 32 KiB history window) and the
+first timestamped line after that point. GzipIndex.open_at() resumes
+decompression from a checkpoint, so a search with a start time begins
+at the last checkpoint before it instead of at offset 0. The same pass
+keeps the last lines of the file, which give its last timestamp.
+
+zlib offers no way to export or re-prime a decompressor from Python,
+so checkpoints live for the current run only; the date range itself
+is still persisted by lpmp_index. prefetch_gzip_indexes() builds the
+indexes of several rotated files concurrently in a thread pool; zlib
+releases the GIL while inflating, so the files decompress in parallel.
+
+A checkpoint whose first lines contain carriage returns is dropped,
+since the text reader splits lines on them differently. A truncated
+file is indexed up to where its data ends, like `zcat` output was.
+"""
+
+from bisect import bisect_left
+from collections import deque
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import io
+import os
+import sys
+import zlib
+
+# Don't produce a __pycache__ dir
+sys.dont_write_bytecode = True  # noqa: E402
+# cspell:ignore lpmp zran
+
+from lpmp_utils import TimestampParser                       # noqa: E402
+from lpmp_utils import vlog2                                 # noqa: E402
+from lpmp_utils import vlog3                                 # noqa: E402
+
+CHECKPOINT_SPAN = 8 * 1024 * 1024   # uncompressed bytes between checkpoints
+CHECKPOINT_PROBE = 64 * 1024        # bytes searched for a checkpoint's first line
+READ_SIZE = 128 * 1024              # compressed bytes read per step
+TAIL_LINES = 50                     # lines kept for the last timestamp
+MAX_CACHED_INDEXES = 64             # in-process LRU bound
+PREFETCH_WORKERS = min(4, os.cpu_count() or 1)
+
+# gzip member decoder (zlib header detection limited to gzip)
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+# In-process cache: path -> GzipIndex (least recently used first)
+_gzip_indexes = OrderedDict()
+
+
+class GzipCheckpoint:
+    """Resumable decompressor state at one point of a .gz file."""
+
+    __slots__ = ('in_offset', 'out_offset', 'decompressor',
+                 'line_offset', 'timestamp')
+
+    def __init__(self, in_offset, out_offset, decompressor):
+        self.in_offset = in_offset
+        self.out_offset = out_offset
+        self.decompressor = decompressor
+        # Uncompressed offset and timestamp of the first timestamped
+        # line at or after out_offset
+        self.line_offset = None
+        self.timestamp = None
+
+
+class GzipIndex:
+    """Checkpoints and last timestamp of one .gz file."""
+
+    def __init__(self, path, identity):
+        self.path = path
+        self.identity = identity
+        self.checkpoints = []
+        self.checkpoint_ts = []
+        self.last_ts = None
+        self.uncompressed_size = 0
+
+    def checkpoint_before(self, target):
+        """Return the latest checkpoint whose timestamp is before
+        `target`, or None when reading has to start at offset 0.
+
+        Reading from it never skips a line with a timestamp at or
+        after `target`, provided the log is in time order.
+        """
+        if not self.checkpoint_ts or target is None:
+            return None
+        idx = bisect_left(self.checkpoint_ts, target) - 1
+        if idx < 0:
+            return None
+        return self.checkpoints[idx]
+
+    def open_at(self, checkpoint):
+        """Open a text stream starting at checkpoint's first line.
+
+        The stream decodes like gzip.open(path, 'rt', encoding='utf-8',
+        errors='ignore') would from that line on.
+        """
+        raw = _CheckpointReader(self.path, checkpoint)
+        return io.TextIOWrapper(io.BufferedReader(raw, READ_SIZE),
+                                encoding='utf-8', errors='ignore')
+
+
+def _inflate(f, decompressor):
+    """Decompress f from its current position.
+
+    Yields (output, decompressor) per compressed read, where
+    decompressor is the state after consuming everything read so far
+    (a new object once a following gzip member starts).
+    """
+    while True:
+        data = f.read(READ_SIZE)
+        if not data:
+            return
+        output = []
+        while data:
+            if decompressor.eof:
+                # Next member; zero padding after a member is ignored
+                # the same way gzip.open() does.
+                data = data.lstrip(b'\x00')
+                if not data:
+                    break
+                decompressor = zlib.decompressobj(_GZIP_WBITS)
+            output.append(decompressor.decompress(data))
+            data = decompressor.unused_data
+        yield b''.join(output), decompressor
+
+
+class _CheckpointReader(io.RawIOBase):
+    """Raw byte stream of a .gz file's content from a checkpoint on."""
+
+    def __init__(self, path, checkpoint):
+        super().__init__()
+        self._file = open(path, 'rb')
+        self._file.seek(checkpoint.in_offset)
+        self._decompressor = checkpoint.decompressor.copy()
+        self._chunks = _inflate(self._file, self._decompressor)
+        self._skip = checkpoint.line_offset - checkpoint.out_offset
+        self._buffer = memoryview(b'')
+        self._pos = checkpoint.line_offset
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            try:
+                output, self._decompressor = next(self._chunks)
+            except StopIteration:
+                if not self._decompressor.eof:
+                    # Truncated file, reported as gzip.open() does
+                    raise EOFError("Compressed file ended before the "
+                                   "end-of-stream marker was reached")
+                return 0
+            except zlib.error as e:
+                raise gzip.BadGzipFile(str(e)) from e
+            if self._skip:
+                skipped = min(self._skip, len(output))
+                output = output[skipped:]
+                self._skip -= skipped
+            self._buffer = memoryview(output)
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        self._pos += n
+        return n
+
+    def tell(self):
+        """Offset in the uncompressed content."""
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            self._chunks.close()
+            self._file.close()
+        super().close()
+
+
+def _resolve_checkpoint(checkpoint, probe, at_line_start, parse):
+    """Fill in the checkpoint's first timestamped line from probe.
+
+    probe holds the output following checkpoint.out_offset. Returns
+    False if no complete timestamped line was found in it.
+    """
+    if b'\r' in probe:
+        return False
+    pos = 0 if at_line_start else probe.find(b'\n') + 1
+    if not at_line_start and pos == 0:
+        return False
+    while True:
+        end = probe.find(b'\n', pos)
+        if end < 0:
+            return False
+        timestamp = parse(probe[pos:end + 1].decode('utf-8', 'ignore'))
+        if timestamp is not None:
+            checkpoint.line_offset = checkpoint.out_offset + pos
+            checkpoint.timestamp = timestamp
+            return True
+        pos = end + 1
+
+
+def _last_timestamp(tail, parse):
+    """Last timestamp within the last TAIL_LINES lines (zcat | tail)."""
+    lines = b''.join(output for output, _newlines in tail).split(b'\n')
+    if lines and not lines[-1]:
+        lines.pop()
+    text = b'\n'.join(lines[-TAIL_LINES:]).decode('utf-8', 'ignore')
+    for line in reversed(text.splitlines()):
+        timestamp = parse(line)
+        if timestamp:
+            return timestamp
+    return None
+
+
+def build_gzip_index(path, relpath=None):
+    """Decompress path once and return its GzipIndex, or None on error.
+
+    Safe to run in worker threads: it uses its own TimestampParser and
+    does not touch the in-process cache.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    index = GzipIndex(path, (st.st_size, st.st_mtime_ns))
+    parse = TimestampParser(relpath).parse
+
+    out_offset = 0
+    next_checkpoint = CHECKPOINT_SPAN
+    at_line_start = True
+    pending = None          # (checkpoint, probe, at_line_start)
+    tail = deque()          # (output, newline count)
+    tail_newlines = 0
+
+    def resolve(pending):
+        checkpoint, probe, line_start = pending
+        if _resolve_checkpoint(checkpoint, bytes(probe), line_start, parse):
+            index.checkpoints.append(checkpoint)
+            index.checkpoint_ts.append(checkpoint.timestamp)
+
+    try:
+        with open(path, 'rb') as f:
+            for output, decompressor in _inflate(
+                    f, zlib.decompressobj(_GZIP_WBITS)):
+                if output:
+                    if pending is not None:
+                        pending[1].extend(output[:CHECKPOINT_PROBE])
+                        if len(pending[1]) >= CHECKPOINT_PROBE:
+                            resolve(pending)
+                            pending = None
+
+                    newlines = output.count(b'\n')
+                    tail.append((output, newlines))
+                    tail_newlines += newlines
+                    while len(tail) > 1 and \
+                            tail_newlines - tail[0][1] > TAIL_LINES:
+                        tail_newlines -= tail.popleft()[1]
+
+                    out_offset += len(output)
+                    at_line_start = output.endswith(b'\n')
+
+                if out_offset >= next_checkpoint:
+                    if pending is not None:
+                        resolve(pending)
+                    pending = (GzipCheckpoint(f.tell(), out_offset,
+                                              decompressor.copy()),
+                               bytearray(), at_line_start)
+                    next_checkpoint = out_offset + CHECKPOINT_SPAN
+    except (OSError, EOFError, zlib.error) as e:
+        vlog3(f"Gzip index of {path} failed: {e}")
+        return None
+
+    if pending is not None:
+        resolve(pending)
+    index.uncompressed_size = out_offset
+    index.last_ts = _last_timestamp(tail, parse)
+    vlog3(f"Gzip index of {path}: {out_offset} bytes, "
+          f"{len(index.checkpoints)} checkpoint(s)")
+    return index
+
+
+def _store(index):
+    _gzip_indexes[index.path] = index
+    _gzip_indexes.move_to_end(index.path)
+    while len(_gzip_indexes) > MAX_CACHED_INDEXES:
+        _gzip_indexes.popitem(last=False)
+
+
+def lookup_gzip_index(path):
+    """Return the cached GzipIndex for path if still valid, else None."""
+    index = _gzip_indexes.get(path)
+    if index is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is None or index.identity != (st.st_size, st.st_mtime_ns):
+        del _gzip_indexes[path]
+        return None
+    _gzip_indexes.move_to_end(path)
+    return index
+
+
+def get_gzip_index(path, relpath=None):
+    """Return the GzipIndex for path, building it if needed."""
+    index = lookup_gzip_index(path)
+    if index is None:
+        index = build_gzip_index(path, relpath)
+        if index is not None:
+            _store(index)
+    return index
+
+
+def prefetch_gzip_indexes(entries):
+    """Build the indexes of several .gz files concurrently.
+
+    entries is an iterable of (path, relpath). Files already indexed
+    are skipped; a single file is left to be built on first use.
+    """
+    todo = [(path, relpath) for path, relpath in entries
+            if path.endswith('.gz') and lookup_gzip_index(path) is None]
+    if len(todo) < 2 or PREFETCH_WORKERS < 2:
+        return
+    workers = min(PREFETCH_WORKERS, len(todo))
+    vlog2(f"Decompressing {len(todo)} .gz file(s) with {workers} threads")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for index in pool.map(lambda entry: build_gzip_index(*entry), todo):
+            if index is not None:
+                _store(index)
+
+
+def open_gzip_text(path, relpath=None, after_timestamp=None):
+    """Open a .gz log for text reading, as close to after_timestamp as
+    its cached index allows (from the start when there is none).
+
+    Only an already built index is used; opening never triggers a
+    full decompression of its own.
+    """
+    if after_timestamp is not None:
+        index = lookup_gzip_index(path)
+        if index is not None:
+            checkpoint = index.checkpoint_before(after_timestamp)
+            if checkpoint is not None:
+                vlog3(f"Gzip index: resuming {relpath or path} at "
+                      f"offset {checkpoint.line_offset} for {after_timestamp}")
+                return index.open_at(checkpoint)
+    return gzip.open(path, 'rt', encoding='utf-8', errors='ignore')
@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+"""
+LPMP File Index Module
+
+Persistent, per-log-file index of sparse timestamp -> byte-offset
+checkpoints plus the file's first/last timestamp. Repeated lpmptool
+runs over the same collect bundle use it to seek straight to the
+start_date window instead of re-bisecting and re-parsing the file,
+and to answer get_file_date_range() without re-reading .gz files.
+
+Each index is a small JSON file stored in the index directory
+(default ~/.cache/lpmp/index or $LPMP_INDEX_DIR, see --index-dir /
+--no-index), named after a hash of the log file's real path. An entry is only trusted
+while the log file's identity (device, inode, size, mtime) matches
+what was recorded:
+
+  - same inode, larger size : the file grew; existing checkpoints
+                              are kept and indexing resumes from the
+                              last checkpoint (incremental update)
+  - anything else           : the entry is discarded and rebuilt
+
+Checkpoints are taken every INDEX_STRIDE bytes by seeking to the
+stride boundary and parsing the first timestamped line after it, so
+building an index costs O(file_size / INDEX_STRIDE) seeks rather than
+a full read. Only plain-text files get checkpoints; .gz files carry
+just their date range.
+
+Index files are touched whenever they are used. set_index_dir()
+evicts those unused for INDEX_MAX_AGE_DAYS, then the least recently
+used ones beyond INDEX_MAX_FILES, so the directory does not grow with
+every bundle analysed.
+
+The index is disabled (every lookup returns None) until
+set_index_dir() is called, so library callers and unit tests see no
+persistent state unless they opt in.
+"""
+
+from bisect import bisect_left
+from datetime import datetime
+import hashlib
+import json
+import os
+import sys
+import time
+
+# Don't produce a __pycache__ dir
+sys.dont_write_bytecode = True  # noqa: E402
+# cspell:ignore lpmp
+
+from lpmp_utils import parse_timestamp                       # noqa: E402
+from lpmp_utils import vlog2                                 # noqa: E402
+from lpmp_utils import vlog3                                 # noqa: E402
+
+INDEX_VERSION = 1
+INDEX_STRIDE = 1024 * 1024      # bytes between checkpoints
+INDEX_MIN_FILE_SIZE = 32768     # smaller files are scanned linearly
+INDEX_PROBE_LINES = 10          # lines tried after each stride boundary
+INDEX_MAX_FILES = 2000          # index files kept in the index directory
+INDEX_MAX_AGE_DAYS = 30         # index files unused this long are evicted
+
+# Directory holding the index files; None disables the index.
+_index_dir = None
+
+# In-process cache: realpath -> FileIndex
+_index_cache = {}
+
+
+def default_index_dir():
+    """Return the default index directory: $LPMP_INDEX_DIR, else the
+    XDG cache location."""
+    if os.environ.get('LPMP_INDEX_DIR'):
+        return os.environ['LPMP_INDEX_DIR']
+    cache_home = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'lpmp', 'index')
+
+
+def prune_index_dir(path, max_files=INDEX_MAX_FILES,
+                    max_age_days=INDEX_MAX_AGE_DAYS):
+    """Evict index files unused for max_age_days, then the least
+    recently used ones beyond max_files. Returns the number removed.
+    """
+    cutoff = time.time() - max_age_days * 86400
+    entries = []
+    removed = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if not entry.name.endswith(('.json', '.tmp')):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                # .tmp files are left behind by interrupted writers
+                if mtime < cutoff or (entry.name.endswith('.tmp')
+                                      and mtime < time.time() - 3600):
+                    removed += _remove(entry.path)
+                elif entry.name.endswith('.json'):
+                    entries.append((mtime, entry.path))
+    except OSError as e:
+        vlog2(f"File index: cannot prune {path}: {e}")
+        return removed
+    if len(entries) > max_files:
+        entries.sort()
+        for _mtime, filepath in entries[:len(entries) - max_files]:
+            removed += _remove(filepath)
+    if removed:
+        vlog2(f"File index: evicted {removed} entries from {path}")
+    return removed
+
+
+def _remove(filepath):
+    """Unlink filepath; return 1 if it was removed, else 0."""
+    try:
+        os.unlink(filepath)
+    except OSError:
+        return 0
+    return 1
+
+
+def set_index_dir(path):
+    """Enable the persistent index under `path`, or disable it with None.
+
+    Returns the directory actually in use (None if it could not be
+    created, in which case the index stays disabled).
+    """
+    global _index_dir
+    _index_cache.clear()
+    if not path:
+        _index_dir = None
+        return None
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError as e:
+        vlog2(f"File index disabled: cannot create {path}: {e}")
+        _index_dir = None
+        return None
+    _index_dir = path
+    vlog2(f"File index directory: {path}")
+    prune_index_dir(path)
+    return path
+
+
+def get_index_dir():
+    """Return the active index directory (None when disabled)."""
+    return _index_dir
+
+
+def _file_identity(filepath):
+    """Return (dev, ino, size, mtime_ns) for filepath, or None."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _index_path(realpath):
+    """Return the on-disk index filename for a log file's real path."""
+    digest = hashlib.sha1(realpath.encode('utf-8', 'surrogateescape')).hexdigest()
+    return os.path.join(_index_dir, f"{digest}.json")
+
+
+def _ts_to_str(ts):
+    return ts.isoformat() if ts else None
+
+
+def _str_to_ts(value):
+    return datetime.fromisoformat(value) if value else None
+
+
+class FileIndex:
+    """Sparse timestamp checkpoints and date range for one log file."""
+
+    def __init__(self, realpath, identity):
+        self.path = realpath
+        self.identity = identity
+        self.has_range = False
+        self.first_ts = None
+        self.last_ts = None
+        self.checkpoint_ts = []     # ascending datetimes
+        self.checkpoint_off = []    # byte offsets of line starts
+        self.checkpointed = False   # checkpoints built for this file
+        self.indexed_to = 0         # bytes covered by checkpoints
+
+    @property
+    def size(self):
+        return self.identity[2]
+
+    def seek_offset(self, target):
+        """Return the byte offset of the latest checkpoint whose
+        timestamp is before `target` (0 if there is none).
+
+        Reading from that offset never skips a line with a timestamp
+        at or after `target`, provided the log is in time order.
+        """
+        if not self.checkpoint_ts or target is None:
+            return 0
+        idx = bisect_left(self.checkpoint_ts, target) - 1
+        if idx < 0:
+            return 0
+        return self.checkpoint_off[idx]
+
+    def to_dict(self):
+        return {
+            'version': INDEX_VERSION,
+            'path': self.path,
+            'identity': list(self.identity),
+            'has_range': self.has_range,
+            'first_ts': _ts_to_str(self.first_ts),
+            'last_ts': _ts_to_str(self.last_ts),
+            'stride': INDEX_STRIDE,
+            'checkpointed': self.checkpointed,
+            'indexed_to': self.indexed_to,
+            'checkpoints': [
+                [_ts_to_str(ts), off]
+                for ts, off in zip(self.checkpoint_ts, self.checkpoint_off)
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a FileIndex from its JSON form; None if unusable."""
+        if not isinstance(data, dict) or data.get('version') != INDEX_VERSION:
+            return None
+        if data.get('stride') != INDEX_STRIDE:
+            return None
+        try:
+            index = cls(data['path'], tuple(data['identity']))
+            index.has_range = bool(data.get('has_range'))
+            index.first_ts = _str_to_ts(data.get('first_ts'))
+            index.last_ts = _str_to_ts(data.get('last_ts'))
+            index.checkpointed = bool(data.get('checkpointed'))
+            index.indexed_to = int(data.get('indexed_to', 0))
+            for ts_str, off in data.get('checkpoints', []):
+                index.checkpoint_ts.append(_str_to_ts(ts_str))
+                index.checkpoint_off.append(int(off))
+        except (KeyError, TypeError, ValueError):
+            return None
+        return index
+
+
+def _load(realpath):
+    """Read the persisted index for realpath (no identity check).
+
+    The index file is touched so eviction sees it as recently used.
+    """
+    path = _index_path(realpath)
+    try:
+        with open(path, 'r') as f:
+            index = FileIndex.from_dict(json.load(f))
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return index
+
+
+def _save(index):
+    """Persist index atomically (write temp file, then rename)."""
+    if _index_dir is None:
+        return
+    target = _index_path(index.path)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'w') as f:
+            json.dump(index.to_dict(), f)
+        os.replace(tmp, target)
+    except OSError as e:
+        vlog2(f"File index: cannot write {target}: {e}")
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def _read_timestamp_at(f, offset, relpath, align=True):
+    """Return (timestamp, line_start) of the first timestamped line at
+    or after `offset` in binary file f, or (None, None).
+
+    With align=True the (possibly partial) line at `offset` is skipped
+    first, which is what stride-boundary probing needs.
+    """
+    f.seek(offset)
+    if align and offset > 0:
+        f.readline()
+    for _ in range(INDEX_PROBE_LINES):
+        line_start = f.tell()
+        raw = f.readline()
+        if not raw:
+            break
+        ts = parse_timestamp(raw.decode('utf-8', errors='ignore'), relpath)
+        if ts is not None:
+            return ts, line_start
+    return None, None
+
+
+def _extend_checkpoints(index, filepath, relpath):
+    """Add checkpoints from index.indexed_to up to the current size."""
+    size = index.size
+    index.checkpointed = True
+    if size < INDEX_MIN_FILE_SIZE:
+        index.indexed_to = size
+        return
+    try:
+        with open(filepath, 'rb') as f:
+            pos = index.indexed_to
+            if not index.checkpoint_off:
+                ts, line_start = _read_timestamp_at(f, 0, relpath, align=False)
+                if ts is not None:
+                    index.checkpoint_ts.append(ts)
+                    index.checkpoint_off.append(line_start)
+                pos = 0
+            while True:
+                pos += INDEX_STRIDE
+                if pos >= size:
+                    break
+                ts, line_start = _read_timestamp_at(f, pos, relpath)
+                if ts is None:
+                    continue
+                # Keep checkpoints monotonic so bisect over them is
+                # valid; an out-of-order line just doesn't become a
+                # checkpoint.
+                if index.checkpoint_ts and (
+                        ts < index.checkpoint_ts[-1]
+                        or line_start <= index.checkpoint_off[-1]):
+                    continue
+                index.checkpoint_ts.append(ts)
+                index.checkpoint_off.append(line_start)
+            index.indexed_to = (size // INDEX_STRIDE) * INDEX_STRIDE
+    except OSError as e:
+        vlog3(f"File index: cannot read {filepath}: {e}")
+
+
+def _prefix_unchanged(index, filepath, relpath):
+    """True if the last recorded checkpoint still reads the same.
+
+    Used when a file has grown in place: a matching checkpoint means
+    the old content was appended to rather than rewritten.
+    """
+    if not index.checkpoint_off:
+        return True
+    try:
+        with open(filepath, 'rb') as f:
+            ts, line_start = _read_timestamp_at(
+                f, index.checkpoint_off[-1], relpath, align=False)
+    except OSError:
+        return False
+    return (ts == index.checkpoint_ts[-1]
+            and line_start == index.checkpoint_off[-1])
+
+
+def lookup_file_index(filepath, relpath=None):
+    """Return the valid FileIndex for filepath without building it.
+
+    An index recorded for a smaller version of the same file (same
+    inode, file appended since) is updated incrementally: its
+    checkpoints are extended to the new size and its date range is
+    cleared so the caller re-derives the last timestamp.
+
+    Returns None when the index is disabled or no usable entry exists.
+    """
+    if _index_dir is None:
+        return None
+    identity = _file_identity(filepath)
+    if identity is None:
+        return None
+    realpath = os.path.realpath(filepath)
+
+    index = _index_cache.get(realpath)
+    if index is None or index.identity != identity:
+        loaded = _load(realpath)
+        if loaded is not None and loaded.path == realpath:
+            index = loaded
+        elif index is None:
+            return None
+
+    if index.identity == identity:
+        _index_cache[realpath] = index
+        return index
+
+    old_dev, old_ino, old_size, _old_mtime = index.identity
+    dev, ino, size, _mtime = identity
+    if (old_dev, old_ino) == (dev, ino) and size >= old_size \
+            and not realpath.endswith('.gz') \
+            and _prefix_unchanged(index, filepath, relpath):
+        vlog3(f"File index: {filepath} grew {old_size} -> {size} bytes, "
+              f"extending from offset {index.indexed_to}")
+        index.identity = identity
+        index.has_range = False
+        index.last_ts = None
+        if index.checkpointed:
+            _extend_checkpoints(index, filepath, relpath)
+        _index_cache[realpath] = index
+        _save(index)
+        return index
+
+    vlog3(f"File index: {filepath} changed, discarding stale entry")
+    _index_cache.pop(realpath, None)
+    return None
+
+
+def get_file_index(filepath, relpath=None):
+    """Return a FileIndex with checkpoints for a plain-text log file,
+    building (and persisting) it when no valid entry exists.
+
+    Returns None when the index is disabled, the file is gzipped or
+    too small to benefit, or the file cannot be read.
+    """
+    if _index_dir is None or filepath.endswith('.gz'):
+        return None
+    index = lookup_file_index(filepath, relpath)
+    if index is not None and index.checkpointed:
+        return index if index.size >= INDEX_MIN_FILE_SIZE else None
+
+    identity = _file_identity(filepath)
+    if identity is None or identity[2] < INDEX_MIN_FILE_SIZE:
+        return None
+
+    realpath = os.path.realpath(filepath)
+    if index is None:
+        index = FileIndex(realpath, identity)
+    vlog2(f"File index: building checkpoints for {filepath}")
+    _extend_checkpoints(index, filepath, relpath)
+    _index_cache[realpath] = index
+    _save(index)
+    return index
+
+
+def record_date_range(filepath, first_ts, last_ts):
+    """Store a file's (first_ts, last_ts) in its persistent index."""
+    if _index_dir is None:
+        return
+    index = lookup_file_index(filepath)
+    if index is None:
+        identity = _file_identity(filepath)
+        if identity is None:
+            return
+        index = FileIndex(os.path.realpath(filepath), identity)
+    index.has_range = True
+    index.first_ts = first_ts
+    index.last_ts = last_ts
+    _index_cache[index.path] = index
+    _save(index)
+
+
+def lookup_date_range(filepath, relpath=None):
+    """Return the persisted (first_ts, last_ts) for filepath, or None."""
+    index = lookup_file_index(filepath, relpath)
+    if index is None or not index.has_range:
+        return None
+    return index.first_ts, index.last_ts
+
+
+def seek_to_timestamp(f, filepath, target, relpath=None):
+    """Seek text-mode file f to the indexed checkpoint before target.
+
+    Returns True if the index positioned f (the caller reads from a
+    line start; no partial-line skip needed), False if no index is
+    available and the caller should fall back to its own positioning.
+    """
+    index = get_file_index(filepath, relpath)
+    if index is None:
+        return False
+    offset = index.seek_offset(target)
+    f.seek(offset)
+    vlog3(f"File index: seeking {filepath} to offset {offset} for {target}")
+    return True
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+"""
+LPMP Self-Profiling Module
+
+Timing and counter instrumentation behind --profile-self. When enabled
+a SelfProfiler records:
+
+  - per-phase wall and CPU time (model_load, wildcard_expansion,
+    date_range_probe, scan, output)
+  - per-block wall and CPU time, keyed by block label
+  - per-file counters: reads, bytes read, lines parsed, timestamps
+    parsed, regex evaluations and bisect steps
+
+and write_self_profile() saves them as self_profile.json next to
+summary.timing, blocks and files sorted with the most expensive first.
+
+Profiling is off by default; profile_phase() and profile_block() are
+then no-op context managers and count_file_read() returns at once, so
+the readers can call them unconditionally once per file. Hot loops
+keep plain local counters and report them once per file.
+
+Timers of the same phase or block do not nest: an inner timer of a
+name already running is not counted again. Different phases may nest
+(date range probes run inside wildcard expansion), so phase times are
+inclusive and do not add up to the run's total.
+
+This module has no lpmp imports so that any other module can use it.
+"""
+
+from contextlib import contextmanager
+from contextlib import nullcontext
+import json
+import os
+import sys
+import time
+
+# Don't produce a __pycache__ dir
+sys.dont_write_bytecode = True  # noqa: E402
+# cspell:ignore lpmp
+
+SELF_PROFILE_FILENAME = 'self_profile.json'
+
+# Per-file counters, in report order
+FILE_COUNTERS = ('reads', 'bytes_read', 'lines_parsed', 'timestamps_parsed',
+                 'regex_evaluations', 'bisect_steps')
+
+
+class SelfProfiler:
+    """Phase and block timers plus per-file read counters of one run."""
+
+    def __init__(self):
+        self.started = time.time()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self.phases = {}   # name -> [calls, wall, cpu]
+        self.blocks = {}   # label -> [calls, wall, cpu]
+        self.files = {}    # relpath -> {counter: value}
+        self.hosts = {}    # hostname -> {'wall_seconds', 'cpu_seconds'}
+        self._running = {}  # (table, name) -> (wall, cpu) at start
+
+    def _start(self, table, name):
+        key = (id(table), name)
+        if key in self._running:
+            return False
+        self._running[key] = (time.perf_counter(), time.process_time())
+        return True
+
+    def _stop(self, table, name):
+        wall_start, cpu_start = self._running.pop((id(table), name))
+        totals = table.setdefault(name, [0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += time.perf_counter() - wall_start
+        totals[2] += time.process_time() - cpu_start
+
+    @contextmanager
+    def _timed(self, table, name):
+        started = self._start(table, name)
+        try:
+            yield
+        finally:
+            if started:
+                self._stop(table, name)
+
+    def phase(self, name):
+        """Context manager timing one phase."""
+        return self._timed(self.phases, name)
+
+    def block(self, label):
+        """Context manager timing one model block."""
+        return self._timed(self.blocks, label)
+
+    def begin_phase(self, name):
+        """Start a phase timer for a region too long for a with block."""
+        if not self._start(self.phases, name):
+            raise RuntimeError(f"phase {name!r} is already running")
+
+    def end_phase(self, name):
+        """Stop a timer started with begin_phase()."""
+        self._stop(self.phases, name)
+
+    def count_file(self, relpath, **counters):
+        """Add counters (see FILE_COUNTERS) to relpath's totals."""
+        totals = self.files.get(relpath)
+        if totals is None:
+            totals = self.files[relpath] = dict.fromkeys(FILE_COUNTERS, 0)
+        for name, value in counters.items():
+            totals[name] += value
+
+    def merge_files(self, files):
+        """Add per-file counters collected elsewhere (e.g. a worker)."""
+        for relpath, counters in files.items():
+            self.count_file(relpath, **counters)
+
+    def take_files(self):
+        """Return the per-file counters and start new ones."""
+        files, self.files = self.files, {}
+        return files
+
+    def add_host(self, hostname, report):
+        """Record a bundle host's totals from its own report()."""
+        self.hosts[hostname] = {'wall_seconds': report['wall_seconds'],
+                                'cpu_seconds': report['cpu_seconds']}
+
+    def report(self):
+        """Return the profile as a JSON-serializable dict."""
+        def timers(table, key):
+            return [{key: name, 'calls': calls,
+                     'wall_seconds': round(wall, 6),
+                     'cpu_seconds': round(cpu, 6)}
+                    for name, (calls, wall, cpu) in table.items()]
+
+        blocks = sorted(timers(self.blocks, 'label'),
+                        key=lambda b: b['wall_seconds'], reverse=True)
+        files = sorted(({'file': relpath, **counters}
+                        for relpath, counters in self.files.items()),
+                       key=lambda f: (f['bytes_read'], f['lines_parsed']),
+                       reverse=True)
+        report = {
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S',
+                                     time.localtime(self.started)),
+            'wall_seconds': round(time.perf_counter() - self._wall_start, 6),
+            'cpu_seconds': round(time.process_time() - self._cpu_start, 6),
+            'phases': {p['label']: {k: p[k] for k in p if k != 'label'}
+                       for p in timers(self.phases, 'label')},
+            'blocks': blocks,
+            'files': files,
+        }
+        if self.hosts:
+            report['hosts'] = self.hosts
+        return report
+
+
+# Profiler of the current run; None unless --profile-self was given
+_self_profiler = None
+
+
+def enable_self_profile():
+    """Turn on self-profiling for this process and return the profiler."""
+    global _self_profiler
+    _self_profiler = SelfProfiler()
+    return _self_profiler
+
+
+def get_self_profiler():
+    """Return the active SelfProfiler, or None when profiling is off."""
+    return _self_profiler
+
+
+@contextmanager
+def separate_self_profile():
+    """Profile the body with a fresh SelfProfiler, then restore the
+    outer one. Yields the fresh profiler, or None when profiling is off.
+
+    Bundle mode uses this to give each host its own report.
+    """
+    global _self_profiler
+    outer = _self_profiler
+    if outer is None:
+        yield None
+        return
+    _self_profiler = SelfProfiler()
+    try:
+        yield _self_profiler
+    finally:
+        _self_profiler = outer
+
+
+def profile_phase(name):
+    """Context manager timing a phase; a no-op when profiling is off."""
+    if _self_profiler is None:
+        return nullcontext()
+    return _self_profiler.phase(name)
+
+
+def profile_block(label):
+    """Context manager timing a model block; a no-op when profiling is off."""
+    if _self_profiler is None:
+        return nullcontext()
+    return _self_profiler.block(label)
+
+
+def count_file_read(relpath, **counters):
+    """Add per-file counters when profiling is on."""
+    if _self_profiler is not None:
+        _self_profiler.count_file(relpath, **counters)
+
+
+def stream_offset(f):
+    """Return the byte offset of the file under text or binary stream f,
+    or 0 when it cannot be told. Used for bytes-read deltas."""
+    if _self_profiler is None:
+        return 0
+    try:
+        return getattr(f, 'buffer', f).tell()
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def write_self_profile(output_dir, report=None):
+    """Write report (default: the active profiler's) to
+    output_dir/self_profile.json. Returns the path, or None when
+    profiling is off or the file cannot be written.
+    """
+    if report is None:
+        if _self_profiler is None:
+            return None
+        report = _self_profiler.report()
+    path = os.path.join(output_dir, SELF_PROFILE_FILENAME)
+    try:
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+    except OSError as e:
+        print(f"Warning: could not write {path}: {e}", file=sys.stderr)
+        return None
+    return path
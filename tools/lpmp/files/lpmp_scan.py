@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+"""
+LPMP Multi-Pattern Scan Module
+
+Single-pass scanning for sequential pattern and pair models. Without
+it every find_pattern_in_files() call re-opens and re-reads the log
+file from its start position, so a model with N blocks on daemon.log
+reads daemon.log N times per loop.
+
+Before a pass, process_blocks_auto_detect() plans the scan: every
+(log file, pattern) pair the pass can search for is registered with
+the MultiPatternScanner stored on args._pattern_scanner. The first
+search that touches a planned file reads it once, testing each line
+against a combined alternation prefilter and then against each
+pattern, and keeps the timestamped matching lines per pattern. All
+later searches on that file (later blocks, pair stop patterns, OR
+alternatives and later --loops passes) are answered from the
+recorded match stream; find_pattern_in_files() still applies the
+same tolerance, stop_date and max_time_delta rules to it, so results
+are identical to the per-pattern read.
+
+A file is re-read when it changed size or mtime since it was scanned,
+or when a search needs to start before the offset the scan started
+from. Files containing carriage returns are left to the per-pattern
+reader, which splits lines on them differently.
+
+The per-pattern reader itself has a byte-level backend for plain-text
+files: literal_prefilter() extracts a substring every match of the
+pattern must contain and scan_literal_matches() memory-maps the file
+and finds that substring with mmap.find(), decoding and timestamping
+only the lines around the hits. Lines are split and decoded the way
+the text reader does it (universal newlines, utf-8 with errors
+ignored); the one exception is a literal interrupted by invalid utf-8
+bytes, which the text reader would drop and the byte search does not
+see.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+import gzip
+import mmap
+import os
+import re
+import sys
+
+# Don't produce a __pycache__ dir
+sys.dont_write_bytecode = True  # noqa: E402
+# cspell:ignore lpmp
+
+from lpmp_profile import count_file_read                     # noqa: E402
+from lpmp_utils import get_timestamp_parser                  # noqa: E402
+from lpmp_utils import vlog2                                 # noqa: E402
+from lpmp_utils import vlog3                                 # noqa: E402
+
+# Backreferences are numbered across the whole combined prefilter and
+# would refer to another pattern's group, so they disable it.
+_BACKREF_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+# Regex characters that end a run of literal characters
+_REGEX_SPECIAL = frozenset('.^$*+?{}[]()|\\')
+
+
+def _compile_line_matcher(pattern):
+    """Return (search, prefilter_fragment) for one pattern.
+
+    Mirrors find_pattern_in_files: a pattern that does not compile as
+    a regex is matched as a plain substring.
+    """
+    try:
+        compiled = re.compile(pattern)
+    except re.error:
+        return (lambda line: pattern in line), re.escape(pattern)
+    if _BACKREF_RE.search(pattern):
+        return compiled.search, None
+    return compiled.search, f'(?:{pattern})'
+
+
+def _build_prefilter(fragments):
+    """Combine per-pattern fragments into one alternation search, or None."""
+    if not fragments or any(f is None for f in fragments):
+        return None
+    try:
+        return re.compile('|'.join(fragments)).search
+    except re.error:
+        return None
+
+
+class _ScannedFile:
+    """Recorded match stream of one log file for a set of patterns."""
+
+    def __init__(self, identity, start_offset, patterns):
+        self.identity = identity
+        self.start_offset = start_offset
+        self.patterns = frozenset(patterns)
+        # pattern -> (line start offsets, [(start, end, timestamp, line)])
+        self.matches = {p: ([], []) for p in patterns}
+
+
+class MultiPatternScanner:
+    """Read each planned log file once for all patterns of a pass.
+
+    plan() registers the (filepath, pattern) pairs of a pass and
+    evicts recorded streams that no longer cover them; matches()
+    returns the recorded stream for one pattern, scanning the file on
+    first use. files_scanned and lines_scanned count the actual reads.
+    """
+
+    def __init__(self):
+        self._planned = {}
+        self._scanned = {}
+        self.files_scanned = 0
+        self.lines_scanned = 0
+
+    def plan(self, entries):
+        """Register the (filepath, pattern) pairs the next pass may search."""
+        planned = defaultdict(set)
+        for filepath, pattern in entries:
+            planned[filepath].add(pattern)
+        for filepath in list(self._scanned):
+            patterns = planned.get(filepath)
+            if not patterns or not patterns <= self._scanned[filepath].patterns:
+                del self._scanned[filepath]
+        self._planned = dict(planned)
+        vlog3(f"Multi-pattern scan planned for {len(self._planned)} file(s)")
+
+    def matches(self, filepath, relpath, pattern, read_pos=0):
+        """Return the timestamped matches of pattern from read_pos on.
+
+        Each match is (line_start, line_end, timestamp, line) in file
+        order; line is decoded exactly as the per-pattern reader
+        returns it. Returns None when the pair was not planned or the
+        file cannot be scanned, in which case the caller reads the
+        file itself.
+        """
+        patterns = self._planned.get(filepath)
+        if not patterns or pattern not in patterns:
+            return None
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        identity = (st.st_size, st.st_mtime_ns)
+        if filepath.endswith('.gz'):
+            read_pos = 0
+
+        scanned = self._scanned.get(filepath)
+        if scanned is None or scanned.identity != identity \
+                or read_pos < scanned.start_offset:
+            # Rescanning because an earlier position is needed starts
+            # from the top so it can only happen once per file.
+            start = 0 if scanned is not None \
+                and scanned.identity == identity else read_pos
+            scanned = self._scan(filepath, relpath, patterns, start, identity)
+            if scanned is None:
+                self._planned[filepath] = set()
+                return None
+            self._scanned[filepath] = scanned
+
+        starts, records = scanned.matches[pattern]
+        first = bisect_left(starts, read_pos) if read_pos else 0
+        return records[first:]
+
+    def _scan(self, filepath, relpath, patterns, start, identity):
+        """Read filepath once from start and record matches per pattern."""
+        matchers = []
+        fragments = []
+        for pattern in sorted(patterns):
+            search, fragment = _compile_line_matcher(pattern)
+            matchers.append((pattern, search))
+            fragments.append(fragment)
+        prefilter = _build_prefilter(fragments)
+
+        scanned = _ScannedFile(identity, start, patterns)
+        is_gzipped = filepath.endswith('.gz')
+        open_func = gzip.open if is_gzipped else open
+        vlog2(f"Multi-pattern scan of {relpath} from offset {start} "
+              f"for {len(matchers)} pattern(s)")
+        parse_line_timestamp = get_timestamp_parser(relpath).parse
+        offset = start
+        line_count = 0
+        ts_count = 0
+        regex_count = 0
+        try:
+            with open_func(filepath, 'rb') as f:
+                if not is_gzipped:
+                    f.seek(start)
+                for raw in f:
+                    line_start = offset
+                    offset += len(raw)
+                    line_count += 1
+                    if b'\r' in raw:
+                        vlog3(f"Multi-pattern scan: {relpath} has carriage "
+                              f"returns, using per-pattern search")
+                        return None
+                    line = raw.decode('utf-8', 'ignore')
+                    if prefilter is not None:
+                        regex_count += 1
+                        if not prefilter(line):
+                            continue
+                    regex_count += len(matchers)
+                    hits = [p for p, search in matchers if search(line)]
+                    if not hits:
+                        continue
+                    timestamp = parse_line_timestamp(line)
+                    if timestamp is None:
+                        continue
+                    ts_count += 1
+                    record = (line_start, offset, timestamp, line)
+                    for p in hits:
+                        starts, records = scanned.matches[p]
+                        starts.append(line_start)
+                        records.append(record)
+        except (OSError, EOFError, gzip.BadGzipFile) as e:
+            vlog3(f"Multi-pattern scan of {relpath} failed: {e}")
+            return None
+        finally:
+            self.lines_scanned += line_count
+            count_file_read(relpath, reads=1, bytes_read=offset - start,
+                            lines_parsed=line_count,
+                            timestamps_parsed=ts_count,
+                            regex_evaluations=regex_count)
+        self.files_scanned += 1
+        return scanned
+
+
+def literal_prefilter(pattern):
+    """Return a bytes substring every line matching pattern contains.
+
+    A pattern that does not compile as a regex is matched as a plain
+    substring, so it is its own literal. For a regex the longest run of
+    literal characters at the top level is used; alternation at the top
+    level, case-insensitive or verbose flags and runs that contain a
+    line break give None (no usable literal).
+    """
+    try:
+        compiled = re.compile(pattern)
+    except re.error:
+        literal = pattern
+    else:
+        if compiled.flags & (re.IGNORECASE | re.VERBOSE):
+            return None
+        literal = _longest_literal_run(pattern)
+    if not literal or '\n' in literal or '\r' in literal:
+        return None
+    return literal.encode('utf-8')
+
+
+def _longest_literal_run(pattern):
+    """Longest run of required literal characters outside any group,
+    character class or repetition, or None if the pattern has
+    top-level alternation. Unsure cases end a run, never extend it.
+    """
+    runs = []
+    run = []
+    depth = 0
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '\\' and i + 1 < n:
+            nxt = pattern[i + 1]
+            i += 2
+            if depth or nxt.isalnum():
+                # Class escape, backreference or \x.. style escape;
+                # skip its argument as well
+                runs.append(''.join(run))
+                run = []
+                while not depth and i < n and \
+                        (pattern[i].isalnum() or pattern[i] in '{}'):
+                    i += 1
+            else:
+                run.append(nxt)
+            continue
+        if c == '[':
+            # Character class, closing ']' may come first or be escaped
+            runs.append(''.join(run))
+            run = []
+            i += 1
+            if i < n and pattern[i] == '^':
+                i += 1
+            if i < n and pattern[i] == ']':
+                i += 1
+            while i < n and pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            i += 1
+            continue
+        i += 1
+        if c == '(':
+            depth += 1
+        elif c == ')':
+            depth = max(depth - 1, 0)
+        elif depth:
+            continue
+        elif c == '|':
+            return None
+        elif c in '*?{':
+            if run:
+                # The repeated character is optional
+                run.pop()
+            if c == '{':
+                # Skip the {m,n} counts
+                i = pattern.find('}', i) + 1 or n
+        elif c not in _REGEX_SPECIAL:
+            run.append(c)
+            continue
+        runs.append(''.join(run))
+        run = []
+    runs.append(''.join(run))
+    return max(runs, key=len)
+
+
+def scan_literal_matches(filepath, relpath, read_pos, literal, line_matches):
+    """Yield (timestamp, line, line_end) for matching lines of a plain-text
+    file from read_pos on, found through a memory-mapped literal search.
+
+    Only lines containing `literal` are decoded, timestamped and tested
+    with line_matches; lines without a timestamp are not yielded. line
+    and line_end are what readline() and tell() on the text reader give
+    for the same line.
+    """
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= read_pos:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            parse_line_timestamp = get_timestamp_parser(relpath).parse
+            pos = read_pos
+            line_count = 0
+            ts_count = 0
+            try:
+                while True:
+                    hit = mm.find(literal, pos)
+                    if hit < 0:
+                        pos = size
+                        return
+                    start, end, line = _text_line_at(mm, pos, hit, size)
+                    pos = end
+                    line_count += 1
+                    timestamp = parse_line_timestamp(line)
+                    if timestamp is not None:
+                        ts_count += 1
+                        if line_matches(line):
+                            yield timestamp, line, end
+            finally:
+                # bytes_read is the span mmap.find() covered; line_matches()
+                # runs once per timestamped line
+                count_file_read(relpath, reads=1, bytes_read=pos - read_pos,
+                                lines_parsed=line_count,
+                                timestamps_parsed=ts_count,
+                                regex_evaluations=ts_count)
+
+
+def _text_line_at(mm, lo, pos, size):
+    """Return (start, end, line) of the text-mode line holding pos.
+
+    lo is the start of the line the search resumed from; a line ends
+    at \\n, \\r or \\r\\n and its terminator reads as \\n.
+    """
+    start = mm.rfind(b'\n', lo, pos) + 1 or lo
+    start = mm.rfind(b'\r', start, pos) + 1 or start
+    lf = mm.find(b'\n', pos)
+    cr = mm.find(b'\r', pos, size if lf < 0 else lf)
+    if cr >= 0:
+        end = cr + 2 if mm[cr + 1:cr + 2] == b'\n' else cr + 1
+        return start, end, mm[start:cr].decode('utf-8', 'ignore') + '\n'
+    end = size if lf < 0 else lf + 1
+    return start, end, mm[start:end].decode('utf-8', 'ignore')
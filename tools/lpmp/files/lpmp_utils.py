@@ -22,8 +22,6 @@ import glob
 from io import StringIO
 import os
 import re
-from shlex import quote as shquote
-import subprocess
 import sys
 import threading
 import time
@@ -620,25 +618,6 @@ def is_ignored_path(relpath):
     return False
 
 
-def _parse_custom_timestamp(line, relpath):
-    """Try custom timestamp formats for a file matching relpath.
-    Pattern can be a string or list of strings.
-    Returns datetime or None.
-    """
-    for entry in _custom_timestamp_formats:
-        patterns = entry['pattern']
-        if isinstance(patterns, str):
-            patterns = [patterns]
-        if any(fnmatch.fnmatch(relpath, p) for p in patterns):
-            match = entry['regex'].search(line)
-            if match:
-                try:
-                    return datetime.strptime(match.group(1), entry['format'])
-                except (ValueError, IndexError):
-                    pass
-    return None
-
-
 # Pre-compiled timestamp regexes (avoids per-line re.compile overhead)
 _RE_SYSINV_TS = re.compile(r'sysinv (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})')
 _RE_ISO_TS = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{3})?)')
@@ -649,58 +628,229 @@ _RE_ISO_TS = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{3})?)')
 # Anchored with `^` so in-message dates inside a log line don't match.
 _RE_SPACE_TS = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})')
 
+# Whole-second part of the space form checked by the TimestampParser
+# fast paths. ASCII-only so it never accepts a digit strptime rejects.
+_RE_SPACE_SECOND = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', re.ASCII)
 
-def parse_timestamp(line, relpath=None):
-    """Extract timestamp from log line supporting sysinv, ISO and space formats.
+# Returned by a fast path that cannot decide a line on its own
+_UNDECIDED = object()
 
-    Formats supported (in order):
-    - sysinv: "sysinv 2024-01-06 12:30:45.123 message"
-    - ISO:    "2024-01-06T12:30:45.123 message"
-    - space:  "2024-01-06 12:30:45.123 message"   (line-anchored)
 
-    Returns datetime object or None if no valid timestamp found.
-    Falls back to file-pattern-driven custom formats when relpath is given.
+class TimestampParser:
+    """Timestamp parser bound to one log file.
+
+    Gives exactly the result of the full format chain (sysinv, ISO
+    anywhere in the line, line-anchored space form, then the custom
+    timestamp_formats matching relpath) but remembers which form the
+    file's last timestamped line used and tries that form first:
+
+    - sysinv and space lines are checked with slicing and built from
+      cached fields of the last whole second instead of strptime.
+    - custom formats matching relpath are resolved once instead of an
+      fnmatch per entry per line, and the last parsed value is reused.
+    - ISO lines go straight to the regex + fromisoformat step, which is
+      already the cheapest route for them.
+
+    Lines a fast path cannot prove equivalent go through the full chain,
+    which re-detects the form.
     """
-    # cspell:ignore sysinv
-    if not line:
-        return None
 
-    # Cheap prefix guard for built-in formats: sysinv starts with 's',
-    # ISO/space both start with a digit.
+    def __init__(self, relpath=None):
+        self.relpath = relpath
+        self._fast = None
+        self._space_second = None
+        self._space_fields = None
+        self._custom_entries = []
+        self._custom_count = 0
+        self._custom_key = None
+        self._custom_value = None
+
+    def parse(self, line):
+        if not line:
+            return None
+        fast = self._fast
+        if fast is not None:
+            timestamp = fast(line)
+            if timestamp is not _UNDECIDED:
+                return timestamp
+
+        # Parse sysinv format: "sysinv YYYY-MM-DD HH:MM:SS.fff"
+        if line[0] == 's' and line.startswith('sysinv '):
+            match = _RE_SYSINV_TS.search(line)
+            if match:
+                try:
+                    timestamp = datetime.strptime(
+                        match.group(1), '%Y-%m-%d %H:%M:%S.%f')
+                    self._fast = self._fast_sysinv
+                    return timestamp
+                except (ValueError, AttributeError):
+                    pass
+
+        # Parse ISO format: "YYYY-MM-DDTHH:MM:SS.fff" — search anywhere in line
+        match = _RE_ISO_TS.search(line)
+        if match:
+            try:
+                timestamp = datetime.fromisoformat(match.group(1))
+                if fast is not None:
+                    self._fast = None
+                return timestamp
+            except (ValueError, AttributeError):
+                pass
 
-    # Parse sysinv format: "sysinv YYYY-MM-DD HH:MM:SS.fff"
-    if line[0] == 's' and line.startswith('sysinv '):
-        match = _RE_SYSINV_TS.search(line)
+        # Parse space-separated form: "YYYY-MM-DD HH:MM:SS.fff" — only
+        # accepted when it leads the line, which avoids matching in-message
+        # date strings.
+        match = _RE_SPACE_TS.match(line)
         if match:
             try:
-                return datetime.strptime(
+                timestamp = datetime.strptime(
                     match.group(1), '%Y-%m-%d %H:%M:%S.%f')
+                self._fast = self._fast_space
+                return timestamp
             except (ValueError, AttributeError):
                 pass
 
-    # Parse ISO format: "YYYY-MM-DDTHH:MM:SS.fff" — search anywhere in line
-    match = _RE_ISO_TS.search(line)
-    if match:
-        try:
-            return datetime.fromisoformat(match.group(1))
-        except (ValueError, AttributeError):
-            pass
+        # Fallback: try custom timestamp formats if relpath provided
+        if self.relpath and _custom_timestamp_formats:
+            timestamp = self._parse_custom(line)
+            if timestamp is not None:
+                self._fast = self._fast_custom
+            return timestamp
+        return None
 
-    # Parse space-separated form: "YYYY-MM-DD HH:MM:SS.fff" — only
-    # accepted when it leads the line, which avoids matching in-message
-    # date strings.
-    match = _RE_SPACE_TS.match(line)
-    if match:
+    def _fast_space(self, line):
+        # An ISO timestamp anywhere in the line takes precedence
+        if 'T' in line and _RE_ISO_TS.search(line):
+            return _UNDECIDED
+        return self._space_form(line, 0)
+
+    def _fast_sysinv(self, line):
+        if not line.startswith('sysinv '):
+            return _UNDECIDED
+        return self._space_form(line, 7)
+
+    def _space_form(self, line, offset):
+        """Parse "YYYY-MM-DD HH:MM:SS.fff" at offset like strptime would."""
+        end = offset + 19
+        second = line[offset:end]
+        if second == self._space_second:
+            fields = self._space_fields
+        elif _RE_SPACE_SECOND.fullmatch(second):
+            fields = (int(second[0:4]), int(second[5:7]), int(second[8:10]),
+                      int(second[11:13]), int(second[14:16]),
+                      int(second[17:19]))
+        else:
+            return _UNDECIDED
+        fraction = line[end:end + 4]
+        if len(fraction) != 4 or fraction[0] != '.' \
+                or not fraction[1:].isdecimal() or not fraction.isascii():
+            return _UNDECIDED
         try:
-            return datetime.strptime(
-                match.group(1), '%Y-%m-%d %H:%M:%S.%f')
-        except (ValueError, AttributeError):
-            pass
+            timestamp = datetime(*fields, int(fraction[1:]) * 1000)
+        except ValueError:
+            return _UNDECIDED
+        self._space_second = second
+        self._space_fields = fields
+        return timestamp
+
+    def _fast_custom(self, line):
+        # Built-in formats take precedence over custom ones
+        if line.startswith('sysinv ') or _RE_SPACE_TS.match(line) \
+                or ('T' in line and _RE_ISO_TS.search(line)):
+            return _UNDECIDED
+        return self._parse_custom(line)
+
+    def _parse_custom(self, line):
+        """Try the custom timestamp formats whose pattern matches relpath.
+        Pattern can be a string or list of strings.
+        Returns datetime or None.
+
+        Formats ending in ".%f" or ",%f" parse the whole-second part once
+        per second and only convert the fraction for the other lines.
+        """
+        if self._custom_count != len(_custom_timestamp_formats):
+            self._custom_entries = []
+            for entry in _custom_timestamp_formats:
+                patterns = entry['pattern']
+                if isinstance(patterns, str):
+                    patterns = [patterns]
+                if any(fnmatch.fnmatch(self.relpath, p) for p in patterns):
+                    fmt = entry['format']
+                    second_fmt = None
+                    if len(fmt) > 3 and fmt.endswith(('.%f', ',%f')) \
+                            and fmt[-4] != '%':
+                        second_fmt = fmt[:-3]
+                    self._custom_entries.append(
+                        (entry['regex'], fmt, second_fmt))
+            self._custom_count = len(_custom_timestamp_formats)
+
+        for regex, fmt, second_fmt in self._custom_entries:
+            match = regex.search(line)
+            if match:
+                try:
+                    text = match.group(1)
+                    if second_fmt is not None:
+                        timestamp = self._custom_second(text, fmt, second_fmt)
+                        if timestamp is not None:
+                            return timestamp
+                    return datetime.strptime(text, fmt)
+                except (ValueError, IndexError):
+                    pass
+        return None
 
-    # Fallback: try custom timestamp formats if relpath provided
-    if relpath and _custom_timestamp_formats:
-        return _parse_custom_timestamp(line, relpath)
-    return None
+    def _custom_second(self, text, fmt, second_fmt):
+        """strptime(text, fmt) via the cached whole second, or None."""
+        second_text, sep, fraction = text.rpartition(fmt[-3])
+        # strptime's %f takes 1-6 ASCII digits, right-padded with zeros
+        if not sep or not 0 < len(fraction) <= 6 \
+                or not fraction.isdigit() or not fraction.isascii():
+            return None
+        key = (second_fmt, second_text)
+        if key == self._custom_key:
+            second = self._custom_value
+        else:
+            try:
+                second = datetime.strptime(second_text, second_fmt)
+            except ValueError:
+                return None
+            self._custom_key = key
+            self._custom_value = second
+        return second.replace(microsecond=int(fraction.ljust(6, '0')))
+
+
+# relpath -> TimestampParser
+_timestamp_parsers = {}
+
+
+def get_timestamp_parser(relpath=None):
+    """Return the TimestampParser for relpath (shared per relpath).
+
+    Hot loops fetch it once per file and call it per line instead of
+    going through parse_timestamp().
+    """
+    parser = _timestamp_parsers.get(relpath)
+    if parser is None:
+        parser = _timestamp_parsers[relpath] = TimestampParser(relpath)
+    return parser
+
+
+def parse_timestamp(line, relpath=None):
+    """Extract timestamp from log line supporting sysinv, ISO and space formats.
+
+    Formats supported (in order):
+    - sysinv: "sysinv 2024-01-06 12:30:45.123 message"
+    - ISO:    "2024-01-06T12:30:45.123 message"
+    - space:  "2024-01-06 12:30:45.123 message"   (line-anchored)
+
+    Returns datetime object or None if no valid timestamp found.
+    Falls back to file-pattern-driven custom formats when relpath is given.
+    Parsing is done by the TimestampParser bound to relpath.
+    """
+    # cspell:ignore sysinv
+    parser = _timestamp_parsers.get(relpath)
+    if parser is None:
+        parser = get_timestamp_parser(relpath)
+    return parser.parse(line)
 
 
 def manage_peer_controller(variables):
@@ -747,24 +897,8 @@ def apply_settings_variable_substitution(settings, variables):
 _file_date_range_cache = {}
 
 
-def get_file_date_range(filepath, relpath=None):
-    """Get the date range (first and last timestamps) from a log file.
-    Returns (first_timestamp, last_timestamp) or (None, None) if unable to parse.
-    Reads first 10 and last 50 lines for efficiency.
-
-    Args:
-        filepath: Absolute path to the log file
-        relpath: Optional relative path for custom timestamp format matching
-
-    Results are cached to avoid repeated expensive operations on .gz files.
-    """
-    # Check cache first (skip cache if result was None and we now have
-    # relpath for custom format retry)
-    if filepath in _file_date_range_cache:
-        cached = _file_date_range_cache[filepath]
-        if cached[0] is not None or not relpath or not _custom_timestamp_formats:
-            return cached
-
+def _probe_file_date_range(filepath, relpath):
+    """Read the first and last timestamps of a log file (uncached)."""
     first_ts = None
     last_ts = None
 
@@ -809,31 +943,79 @@ def get_file_date_range(filepath, relpath=None):
                 except (OSError, IOError):
                     pass
             else:
-                # For gzipped files, use zcat|tail to read last lines
-                # instead of decompressing the entire file in Python.
-                try:
-                    proc = subprocess.run(
-                        ['sh', '-c', f'zcat {shquote(filepath)} | tail -50'],
-                        capture_output=True, text=True, timeout=30,
-                    )
-                    if proc.returncode == 0 and proc.stdout:
-                        for line in reversed(proc.stdout.splitlines()):
-                            ts = parse_timestamp(line, relpath)
-                            if ts:
-                                last_ts = ts
-                                break
-                except (subprocess.TimeoutExpired, OSError):
-                    pass
+                # For gzipped files the gzip index pass decompresses the
+                # file once, keeping its last lines and the checkpoints
+                # later searches resume from.
+                from lpmp_gzip import get_gzip_index
+                gz_index = get_gzip_index(filepath, relpath)
+                if gz_index is not None:
+                    last_ts = gz_index.last_ts
 
     except (IOError, OSError):
         pass
 
+    return first_ts, last_ts
+
+
+def get_file_date_range(filepath, relpath=None):
+    """Get the date range (first and last timestamps) from a log file.
+    Returns (first_timestamp, last_timestamp) or (None, None) if unable to parse.
+    Reads first 10 and last 50 lines for efficiency.
+
+    Args:
+        filepath: Absolute path to the log file
+        relpath: Optional relative path for custom timestamp format matching
+
+    Results are cached to avoid repeated expensive operations on .gz files,
+    in-process and, when enabled, in the persistent file index so later
+    runs over the same bundle skip the probe entirely.
+    """
+    from lpmp_index import lookup_date_range
+    from lpmp_index import record_date_range
+    from lpmp_profile import profile_phase
+
+    # Check cache first (skip cache if result was None and we now have
+    # relpath for custom format retry)
+    if filepath in _file_date_range_cache:
+        cached = _file_date_range_cache[filepath]
+        if cached[0] is not None or not relpath or not _custom_timestamp_formats:
+            return cached
+
+    persisted = lookup_date_range(filepath, relpath)
+    if persisted is not None:
+        if persisted[0] is not None or not relpath or not _custom_timestamp_formats:
+            _file_date_range_cache[filepath] = persisted
+            return persisted
+
+    with profile_phase('date_range_probe'):
+        first_ts, last_ts = _probe_file_date_range(filepath, relpath)
+
     # Cache the result
     _file_date_range_cache[filepath] = (first_ts, last_ts)
+    record_date_range(filepath, first_ts, last_ts)
 
     return first_ts, last_ts
 
 
+def prefetch_file_date_ranges(entries):
+    """Decompress the .gz files among entries concurrently ahead of the
+    get_file_date_range() calls on them.
+
+    entries is an iterable of (filepath, relpath). Files whose range is
+    already cached in-process or in the persistent index are skipped.
+    """
+    from lpmp_gzip import prefetch_gzip_indexes
+    from lpmp_index import lookup_date_range
+    from lpmp_profile import profile_phase
+
+    with profile_phase('date_range_probe'):
+        prefetch_gzip_indexes(
+            (filepath, relpath) for filepath, relpath in entries
+            if filepath.endswith('.gz')
+            and filepath not in _file_date_range_cache
+            and lookup_date_range(filepath, relpath) is None)
+
+
 def expand_and_sort_log_files(log_dir,
                               file_pattern,
                               start_date=None):
@@ -861,6 +1043,10 @@ def expand_and_sort_log_files(log_dir,
 
     # Get relative paths, mtimes, and date ranges
     # cspell:ignore mtimes
+    if start_date:
+        prefetch_file_date_ranges(
+            (filepath, os.path.relpath(filepath, log_dir))
+            for filepath in matched_files)
     file_info = []
     for filepath in matched_files:
         try:
@@ -1843,6 +2029,8 @@ def expand_wildcards_in_blocks(blocks,
         # Prune files outside the global date window
         if start_date or stop_date:
             file_list = block['file'] if isinstance(block['file'], list) else [block['file']]
+            prefetch_file_date_ranges(
+                (os.path.join(log_dir, f), f) for f in file_list)
             pruned = []
             for f in file_list:
                 filepath = os.path.join(log_dir, f)
@@ -2204,6 +2392,12 @@ def discover_window_files(log_dir, file_patterns, start_date=None,
     matched = []
     skipped = []
 
+    prefetch_file_date_ranges(
+        (filepath, os.path.relpath(filepath, log_dir))
+        for filepath in all_files
+        if filepath in pruned_set and not is_ignored_path(
+            os.path.relpath(filepath, log_dir)))
+
     for filepath in all_files:
         relname = os.path.relpath(filepath, log_dir)
 
@@ -2264,6 +2458,9 @@ def auto_detect_time_range(log_dir, file_patterns, minutes_back=5):
     all_files = _expand_window_globs(log_dir, file_patterns)
 
     latest_ts = None
+    prefetch_file_date_ranges(
+        (filepath, os.path.relpath(filepath, log_dir))
+        for filepath in all_files if not os.path.isdir(filepath))
 
     for filepath in all_files:
         if os.path.isdir(filepath) or _is_skippable_file(filepath):
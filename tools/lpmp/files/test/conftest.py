@@ -0,0 +1,21 @@
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+
+"""pytest fixtures shared by the LPMP tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope='session')
+def lpmp_index_dir(tmp_path_factory):
+    """Keep the persistent log file index out of the user's cache when
+    the tests are run with plain pytest (run_tests.py sets it itself)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('LPMP_INDEX_DIR',
+                  str(tmp_path_factory.mktemp('lpmp_index')))
+        yield
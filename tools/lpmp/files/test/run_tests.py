@@ -24,11 +24,14 @@ Usage:
 """
 
 import argparse
+import atexit
 from contextlib import redirect_stdout
 import io
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 import unittest
 
 # Don't produce a __pycache__ dir
@@ -631,6 +634,13 @@ def main():
         os.environ['LPMP_TEST_MODEL'] = os.path.abspath(args.model)
         print(f"Model regression tests enabled: {args.model}")
 
+    # Keep the persistent log file index of lpmptool runs made by the
+    # tests (in-process and subprocess) out of the user's cache
+    if not os.environ.get('LPMP_INDEX_DIR'):
+        index_dir = tempfile.mkdtemp(prefix='lpmp_test_index_')
+        os.environ['LPMP_INDEX_DIR'] = index_dir
+        atexit.register(shutil.rmtree, index_dir, True)
+
     # Test the test runner itself
     if args.test:
         success = test_runner_arguments()
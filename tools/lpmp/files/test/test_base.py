@@ -54,7 +54,8 @@ class LPMPTestBase(unittest.TestCase):
             '--output', output_dir,
             '--loops', str(loops),
             '--hostname', hostname,
-            '--progress', 'none'  # Avoid progress indicators in tests
+            '--progress', 'none',  # Avoid progress indicators in tests
+            '--no-index'  # Keep the persistent index out of the user's cache
         ]
 
         # Run the subprocess
@@ -115,6 +116,7 @@ class LPMPTestBase(unittest.TestCase):
                 self.block_time_tolerance = 5.0
                 self.max_log_length = 180
                 self.file_position_tracking = False
+                self.no_index = True
                 self.progress = 'none'
                 self.version = False
                 self.help = False
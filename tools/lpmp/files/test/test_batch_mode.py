@@ -17,6 +17,7 @@ LPMP_TEST_BUNDLE is set (via run_tests.py --bundle).
 """
 
 import argparse
+from concurrent.futures import Future
 from datetime import datetime
 import gzip
 import io
@@ -1407,6 +1408,118 @@ class TestBatchRunBatchIntegration(LPMPTestBase):
         self.assertIn('not found', '\n'.join(captured))
 
 
+class TestBatchParallelReads(LPMPTestBase):
+    """--jobs: files of all hosts read by worker processes."""
+
+    HOSTS = ['controller-0', 'controller-1', 'compute-0']
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.bundle = os.path.join(self.tmp, 'bundle')
+        for i, host in enumerate(self.HOSTS):
+            logs = os.path.join(self.bundle, f'{host}_20260701.100000',
+                                'var', 'log')
+            os.makedirs(logs)
+            # Different file sizes per host; same-second lines across
+            # files exercise the merge order of tied timestamps
+            for name, count in (('a.log', 40 * (i + 1)), ('b.log', 15)):
+                _write_log(os.path.join(logs, name), [
+                    f'2026-07-01T10:{n // 60:02d}:{n % 60:02d}.000 '
+                    f'{name} anchor {n} on {host}'
+                    for n in range(count)])
+            with gzip.open(os.path.join(logs, 'c.log.1.gz'), 'wt') as f:
+                f.write('2026-07-01T09:59:59.000 rotated anchor\n')
+
+        self.model_a = os.path.join(self.tmp, 'model_a.yaml')
+        with open(self.model_a, 'w') as f:
+            f.write("description: Test model.\nblocks:\n"
+                    "  - label: 'Anchor'\n"
+                    "    file: ['a.log', 'b.log', 'c.log.1.gz']\n"
+                    "    timeline:\n"
+                    "      - 'anchor [0-9]*5 '\n")
+        self.model_w = os.path.join(self.tmp, 'model_w.yaml')
+        with open(self.model_w, 'w') as f:
+            f.write("description: Test model.\nblocks:\n"
+                    "  - label: 'All Logs'\n"
+                    "    file: '*.log'\n"
+                    "    window: true\n")
+        self.spec_path = os.path.join(self.tmp, 'spec.json')
+        with open(self.spec_path, 'w') as f:
+            json.dump({'runs': [
+                {'model': self.model_a},
+                {'model': self.model_w,
+                 'start_date': '2026-07-01T10:00:10',
+                 'stop_date': '2026-07-01T10:01:30'},
+            ]}, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _run(self, jobs):
+        out = os.path.join(self.tmp, f'out_{jobs}')
+        os.makedirs(out)
+        args = _make_args(batch=self.spec_path, bundle=self.bundle,
+                          bundle_name=self.bundle, output=out, jobs=jobs)
+        captured, capture = _capture_prints()
+        with patch('builtins.print', side_effect=capture):
+            run_batch(args)
+        runtime_root = os.path.join(out, 'lpmp_lab')
+        runtime_dir, = os.listdir(runtime_root)
+        return os.path.join(runtime_root, runtime_dir), captured
+
+    def _tree(self, root):
+        tree = {}
+        for dirpath, _dirs, files in os.walk(root):
+            for name in files:
+                path = os.path.join(dirpath, name)
+                with open(path) as f:
+                    tree[os.path.relpath(path, root)] = f.read()
+        return tree
+
+    def test_parallel_output_identical_to_serial(self):
+        serial_root, serial_out = self._run(1)
+        parallel_root, parallel_out = self._run(3)
+        serial = self._tree(serial_root)
+        self.assertIn(os.path.join('model_a', 'lab_system_profile.timeline.log'),
+                      serial)
+        self.assertEqual(self._tree(parallel_root), serial)
+        summary = [line for line in serial_out if 'Run ' in line]
+        self.assertEqual(
+            [line for line in parallel_out if 'Run ' in line], summary)
+
+    def test_largest_file_submitted_first(self):
+        submitted = []
+
+        class InlineExecutor:
+            def __init__(self, max_workers, mp_context):
+                self.max_workers = max_workers
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def submit(self, fn, filepath, targets):
+                submitted.append(os.path.basename(filepath))
+                future = Future()
+                future.set_result(fn(filepath, targets))
+                return future
+
+        logs = os.path.join(self.bundle, 'compute-0_20260701.100000',
+                            'var', 'log')
+        target = {'run_idx': 0, 'block_label': 'All', 'filename': 'x',
+                  'start': datetime.min, 'stop': datetime.max,
+                  'regex': None}
+        reads = [(os.path.join(logs, name), [dict(target, filename=name)])
+                 for name in ('b.log', 'a.log')]
+        with patch.object(lpmp_batch, 'ProcessPoolExecutor', InlineExecutor):
+            results = dict(lpmp_batch._run_file_reads_parallel(reads, 4))
+        self.assertEqual(submitted, ['a.log', 'b.log'])
+        self.assertEqual(len(results[0][0]), 15)
+        self.assertEqual(len(results[1][0]), 120)
+
+
 # =========================================================================
 # Phase 5: Bundle regression tests (opt-in via LPMP_TEST_BUNDLE)
 # =========================================================================
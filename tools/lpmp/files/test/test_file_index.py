@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+
+"""
+Tests for lpmp_index.py (persistent log file index).
+
+Covers checkpoint building, seek offsets, persistence across
+processes (simulated by clearing the in-process cache), incremental
+extension when a file grows, invalidation when a file is replaced,
+and the date-range integration with get_file_date_range.
+"""
+
+from datetime import datetime
+from datetime import timedelta
+import gzip
+import os
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+sys.dont_write_bytecode = True
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import lpmp_index                                             # noqa: E402
+from lpmp_engine import _bisect_seek_to_timestamp             # noqa: E402
+from lpmp_engine import find_pattern_in_files                 # noqa: E402
+from lpmp_index import get_file_index                         # noqa: E402
+from lpmp_index import lookup_date_range                      # noqa: E402
+from lpmp_index import set_index_dir                          # noqa: E402
+from lpmp_utils import _file_date_range_cache                 # noqa: E402
+from lpmp_utils import get_file_date_range                    # noqa: E402
+
+BASE_TS = datetime(2026, 1, 1, 0, 0, 0)
+
+
+def _write_log(path, start_line, count, mode='w'):
+    """Write `count` one-second-apart log lines of ~100 bytes each."""
+    with open(path, mode) as f:
+        for i in range(start_line, start_line + count):
+            ts = BASE_TS + timedelta(seconds=i)
+            f.write(f"{ts.isoformat()}.000 daemon[1]: event number {i:08d} "
+                    f"{'x' * 50}\n")
+
+
+class TestFileIndexBase(unittest.TestCase):
+    """Common fixture: temp log dir + temp index dir, small stride."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.index_dir = os.path.join(self.temp_dir, 'index')
+        self.log_path = os.path.join(self.temp_dir, 'daemon.log')
+        stride_patch = patch.object(lpmp_index, 'INDEX_STRIDE', 64 * 1024)
+        stride_patch.start()
+        self.addCleanup(stride_patch.stop)
+        set_index_dir(self.index_dir)
+        _file_date_range_cache.clear()
+
+    def tearDown(self):
+        set_index_dir(None)
+        _file_date_range_cache.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _forget_in_process_state(self):
+        """Simulate a new lpmptool run: drop in-process caches only."""
+        lpmp_index._index_cache.clear()
+        _file_date_range_cache.clear()
+
+
+class TestFileIndexBuild(TestFileIndexBase):
+    """Checkpoint building and seek offsets."""
+
+    def test_disabled_index_returns_none(self):
+        set_index_dir(None)
+        _write_log(self.log_path, 0, 5000)
+        self.assertIsNone(get_file_index(self.log_path))
+
+    def test_small_file_not_indexed(self):
+        _write_log(self.log_path, 0, 10)
+        self.assertIsNone(get_file_index(self.log_path))
+
+    def test_gz_file_not_checkpointed(self):
+        gz_path = self.log_path + '.1.gz'
+        with gzip.open(gz_path, 'wt') as f:
+            f.write('2026-01-01T00:00:00.000 line\n' * 5000)
+        self.assertIsNone(get_file_index(gz_path))
+
+    def test_checkpoints_are_line_starts_in_time_order(self):
+        _write_log(self.log_path, 0, 5000)
+        index = get_file_index(self.log_path)
+        self.assertIsNotNone(index)
+        self.assertGreater(len(index.checkpoint_off), 3)
+        self.assertEqual(index.checkpoint_ts, sorted(index.checkpoint_ts))
+        with open(self.log_path, 'rb') as f:
+            for ts, off in zip(index.checkpoint_ts, index.checkpoint_off):
+                f.seek(off)
+                line = f.readline().decode()
+                self.assertTrue(line.startswith(ts.isoformat()))
+
+    def test_seek_offset_never_skips_target(self):
+        _write_log(self.log_path, 0, 5000)
+        index = get_file_index(self.log_path)
+        target = BASE_TS + timedelta(seconds=3210)
+        offset = index.seek_offset(target)
+        self.assertGreater(offset, 0)
+        with open(self.log_path, 'r') as f:
+            f.seek(offset)
+            first = f.readline()
+        self.assertLess(first[:19], target.isoformat())
+
+    def test_seek_offset_before_first_checkpoint_is_zero(self):
+        _write_log(self.log_path, 0, 5000)
+        index = get_file_index(self.log_path)
+        self.assertEqual(index.seek_offset(BASE_TS - timedelta(days=1)), 0)
+
+
+class TestFileIndexPersistence(TestFileIndexBase):
+    """On-disk persistence and invalidation."""
+
+    def test_index_reused_across_runs_without_rebuild(self):
+        _write_log(self.log_path, 0, 5000)
+        first = get_file_index(self.log_path)
+        self._forget_in_process_state()
+        with patch.object(lpmp_index, '_extend_checkpoints') as mock_extend:
+            second = get_file_index(self.log_path)
+        mock_extend.assert_not_called()
+        self.assertEqual(first.checkpoint_off, second.checkpoint_off)
+        self.assertEqual(first.checkpoint_ts, second.checkpoint_ts)
+
+    def test_grown_file_extends_incrementally(self):
+        _write_log(self.log_path, 0, 5000)
+        before = get_file_index(self.log_path)
+        old_offsets = list(before.checkpoint_off)
+        old_indexed_to = before.indexed_to
+        _write_log(self.log_path, 5000, 5000, mode='a')
+        self._forget_in_process_state()
+
+        after = get_file_index(self.log_path)
+        self.assertEqual(after.checkpoint_off[:len(old_offsets)], old_offsets)
+        self.assertGreater(len(after.checkpoint_off), len(old_offsets))
+        self.assertGreater(after.indexed_to, old_indexed_to)
+        self.assertEqual(after.size, os.path.getsize(self.log_path))
+
+    def test_replaced_file_is_rebuilt(self):
+        _write_log(self.log_path, 0, 5000)
+        get_file_index(self.log_path)
+        os.unlink(self.log_path)
+        _write_log(self.log_path, 100000, 3000)
+        self._forget_in_process_state()
+
+        index = get_file_index(self.log_path)
+        self.assertEqual(index.checkpoint_ts[0],
+                         BASE_TS + timedelta(seconds=100000))
+
+    def test_date_range_persisted_for_gz(self):
+        gz_path = self.log_path + '.1.gz'
+        with gzip.open(gz_path, 'wt') as f:
+            f.write('2026-01-01T00:00:00.000 first\n')
+            f.write('2026-01-01T01:00:00.000 last\n')
+        expected = (datetime(2026, 1, 1, 0, 0), datetime(2026, 1, 1, 1, 0))
+        self.assertEqual(get_file_date_range(gz_path), expected)
+        self._forget_in_process_state()
+
+        self.assertEqual(lookup_date_range(gz_path), expected)
+        with patch('subprocess.run') as mock_run:
+            self.assertEqual(get_file_date_range(gz_path), expected)
+        mock_run.assert_not_called()
+
+    def test_date_range_dropped_when_file_grows(self):
+        _write_log(self.log_path, 0, 10)
+        get_file_date_range(self.log_path)
+        _write_log(self.log_path, 10, 10, mode='a')
+        self._forget_in_process_state()
+
+        self.assertIsNone(lookup_date_range(self.log_path))
+        _first, last = get_file_date_range(self.log_path)
+        self.assertEqual(last, BASE_TS + timedelta(seconds=19))
+
+    def test_corrupt_index_file_ignored(self):
+        _write_log(self.log_path, 0, 5000)
+        index = get_file_index(self.log_path)
+        with open(lpmp_index._index_path(index.path), 'w') as f:
+            f.write('{not json')
+        self._forget_in_process_state()
+        self.assertIsNotNone(get_file_index(self.log_path))
+
+
+class TestFileIndexEviction(TestFileIndexBase):
+    """Size and age bounds of the index directory."""
+
+    def _write_entries(self, count, age_days):
+        mtime = time.time() - age_days * 86400
+        for i in range(count):
+            path = os.path.join(self.index_dir, f"{age_days}_{i}.json")
+            with open(path, 'w') as f:
+                f.write('{}')
+            os.utime(path, (mtime, mtime))
+
+    def test_old_entries_evicted(self):
+        self._write_entries(3, lpmp_index.INDEX_MAX_AGE_DAYS + 1)
+        self._write_entries(2, 0)
+        self.assertEqual(lpmp_index.prune_index_dir(self.index_dir), 3)
+        self.assertEqual(len(os.listdir(self.index_dir)), 2)
+
+    def test_least_recently_used_evicted_beyond_max_files(self):
+        self._write_entries(2, 2)
+        self._write_entries(2, 1)
+        self.assertEqual(
+            lpmp_index.prune_index_dir(self.index_dir, max_files=2), 2)
+        self.assertEqual(sorted(os.listdir(self.index_dir)),
+                         ['1_0.json', '1_1.json'])
+
+    def test_set_index_dir_prunes_and_load_touches(self):
+        _write_log(self.log_path, 0, 5000)
+        get_file_index(self.log_path)
+        entry = os.path.join(self.index_dir, os.listdir(self.index_dir)[0])
+        old = time.time() - 86400
+        os.utime(entry, (old, old))
+        self._forget_in_process_state()
+        self.assertIsNotNone(get_file_index(self.log_path))
+        self.assertGreater(os.path.getmtime(entry), old)
+        os.utime(entry, (0, 0))
+        set_index_dir(self.index_dir)
+        self.assertEqual(os.listdir(self.index_dir), [])
+
+    def test_default_dir_env_override(self):
+        with patch.dict(os.environ, {'LPMP_INDEX_DIR': self.index_dir}):
+            self.assertEqual(lpmp_index.default_index_dir(), self.index_dir)
+
+
+class TestFileIndexEngineIntegration(TestFileIndexBase):
+    """Engine search paths give the same answers with the index on."""
+
+    def test_bisect_seek_uses_index(self):
+        _write_log(self.log_path, 0, 5000)
+        target = BASE_TS + timedelta(seconds=4000)
+        size = os.path.getsize(self.log_path)
+        with open(self.log_path, 'r') as f:
+            with patch('lpmp_engine.parse_timestamp') as mock_parse:
+                _bisect_seek_to_timestamp(f, target, size, 'daemon.log')
+            mock_parse.assert_not_called()
+            line = f.readline()
+        self.assertLess(line[:19], target.isoformat())
+
+    def test_find_pattern_same_result_with_and_without_index(self):
+        _write_log(self.log_path, 0, 5000)
+        after = BASE_TS + timedelta(seconds=4000)
+        with_index = find_pattern_in_files(
+            self.temp_dir, ['daemon.log'], 'event number 00004002',
+            after_timestamp=after, suppress_error=True)
+        set_index_dir(None)
+        without_index = find_pattern_in_files(
+            self.temp_dir, ['daemon.log'], 'event number 00004002',
+            after_timestamp=after, suppress_error=True)
+        self.assertIsNotNone(with_index)
+        self.assertEqual(with_index, without_index)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+
+"""
+Tests for lpmp_gzip.py (seekable gzip checkpoint index).
+
+Covers checkpoint building (multi-member files, zero padding, corrupt
+input), resuming decompression from a checkpoint, the last timestamp
+that replaces `zcat | tail`, cache invalidation, concurrent prefetch
+and engine result parity with and without the index.
+"""
+
+from datetime import datetime
+from datetime import timedelta
+import gzip
+import os
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.dont_write_bytecode = True
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import lpmp_gzip                                              # noqa: E402
+from lpmp_engine import find_pattern_in_files                 # noqa: E402
+from lpmp_engine import find_pattern_in_files_all_matches     # noqa: E402
+from lpmp_gzip import build_gzip_index                        # noqa: E402
+from lpmp_gzip import get_gzip_index                          # noqa: E402
+from lpmp_gzip import lookup_gzip_index                       # noqa: E402
+from lpmp_gzip import open_gzip_text                          # noqa: E402
+from lpmp_utils import _file_date_range_cache                 # noqa: E402
+from lpmp_utils import get_file_date_range                    # noqa: E402
+from lpmp_utils import prefetch_file_date_ranges              # noqa: E402
+
+BASE_TS = datetime(2026, 1, 1, 0, 0, 0)
+
+
+def _log_bytes(start_line, count):
+    """`count` one-second-apart log lines of ~100 bytes each."""
+    return ''.join(
+        f"{(BASE_TS + timedelta(seconds=i)).isoformat()}.000 daemon[1]: "
+        f"event number {i:08d} {'x' * 50}\n"
+        for i in range(start_line, start_line + count)).encode()
+
+
+class TestGzipIndexBase(unittest.TestCase):
+    """Temp dir, small checkpoint span and a clean in-process cache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.gz_path = os.path.join(self.temp_dir, 'daemon.log.1.gz')
+        for name, value in (('CHECKPOINT_SPAN', 64 * 1024),
+                            ('READ_SIZE', 4 * 1024)):
+            value_patch = patch.object(lpmp_gzip, name, value)
+            value_patch.start()
+            self.addCleanup(value_patch.stop)
+        lpmp_gzip._gzip_indexes.clear()
+        _file_date_range_cache.clear()
+
+    def tearDown(self):
+        lpmp_gzip._gzip_indexes.clear()
+        _file_date_range_cache.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_gz(self, content, path=None):
+        with open(path or self.gz_path, 'wb') as f:
+            f.write(content)
+
+
+class TestGzipIndexBuild(TestGzipIndexBase):
+    """Checkpoints and resumed reads."""
+
+    def test_checkpoints_are_timestamped_line_starts(self):
+        data = _log_bytes(0, 5000)
+        self._write_gz(gzip.compress(data))
+        index = build_gzip_index(self.gz_path, 'daemon.log.1.gz')
+        self.assertGreater(len(index.checkpoints), 3)
+        self.assertEqual(index.checkpoint_ts, sorted(index.checkpoint_ts))
+        self.assertEqual(index.uncompressed_size, len(data))
+        for checkpoint in index.checkpoints:
+            self.assertEqual(data[checkpoint.line_offset - 1], ord('\n'))
+            line = data[checkpoint.line_offset:].split(b'\n', 1)[0].decode()
+            self.assertTrue(line.startswith(checkpoint.timestamp.isoformat()))
+
+    def test_open_at_resumes_mid_file(self):
+        data = _log_bytes(0, 5000)
+        self._write_gz(gzip.compress(data))
+        index = build_gzip_index(self.gz_path)
+        for checkpoint in index.checkpoints:
+            with index.open_at(checkpoint) as f:
+                self.assertEqual(f.read(),
+                                 data[checkpoint.line_offset:].decode())
+
+    def test_multi_member_and_zero_padding(self):
+        first, second = _log_bytes(0, 2500), _log_bytes(2500, 2500)
+        self._write_gz(gzip.compress(first) + gzip.compress(second)
+                       + b'\x00' * 16)
+        index = build_gzip_index(self.gz_path)
+        self.assertEqual(index.uncompressed_size, len(first + second))
+        self.assertEqual(index.last_ts, BASE_TS + timedelta(seconds=4999))
+        checkpoint = index.checkpoints[-1]
+        self.assertGreater(checkpoint.out_offset, len(first))
+        with index.open_at(checkpoint) as f:
+            self.assertEqual(
+                f.read(), (first + second)[checkpoint.line_offset:].decode())
+
+    def test_checkpoint_before(self):
+        self._write_gz(gzip.compress(_log_bytes(0, 5000)))
+        index = build_gzip_index(self.gz_path)
+        self.assertIsNone(index.checkpoint_before(BASE_TS))
+        target = BASE_TS + timedelta(seconds=4000)
+        checkpoint = index.checkpoint_before(target)
+        self.assertLess(checkpoint.timestamp, target)
+        self.assertIs(checkpoint, index.checkpoints[
+            sum(1 for ts in index.checkpoint_ts if ts < target) - 1])
+
+    def test_last_timestamp_skips_untimestamped_tail(self):
+        self._write_gz(gzip.compress(
+            _log_bytes(0, 100) + b'trailing line without timestamp\n'))
+        index = build_gzip_index(self.gz_path)
+        self.assertEqual(index.last_ts, BASE_TS + timedelta(seconds=99))
+
+    def test_truncated_file_indexed_up_to_its_end(self):
+        self._write_gz(gzip.compress(_log_bytes(0, 5000))[:-2000])
+        index = build_gzip_index(self.gz_path)
+        self.assertIsNotNone(index.last_ts)
+        self.assertLess(index.last_ts, BASE_TS + timedelta(seconds=4999))
+        with self.assertRaises(EOFError):
+            with index.open_at(index.checkpoints[-1]) as f:
+                f.read()
+
+    def test_invalid_file_returns_none(self):
+        self._write_gz(b'not a gzip file')
+        self.assertIsNone(build_gzip_index(self.gz_path))
+
+
+class TestGzipIndexCache(TestGzipIndexBase):
+    """In-process cache, date range integration and prefetch."""
+
+    def test_date_range_without_subprocess(self):
+        self._write_gz(gzip.compress(_log_bytes(0, 5000)))
+        with patch('subprocess.run') as mock_run:
+            first_ts, last_ts = get_file_date_range(self.gz_path)
+        mock_run.assert_not_called()
+        self.assertEqual(first_ts, BASE_TS)
+        self.assertEqual(last_ts, BASE_TS + timedelta(seconds=4999))
+        self.assertIsNotNone(lookup_gzip_index(self.gz_path))
+
+    def test_replaced_file_invalidates_index(self):
+        self._write_gz(gzip.compress(_log_bytes(0, 5000)))
+        get_gzip_index(self.gz_path)
+        self._write_gz(gzip.compress(_log_bytes(9000, 100)))
+        os.utime(self.gz_path, ns=(0, 0))
+        self.assertIsNone(lookup_gzip_index(self.gz_path))
+        self.assertEqual(get_gzip_index(self.gz_path).last_ts,
+                         BASE_TS + timedelta(seconds=9099))
+
+    def test_prefetch_builds_all_indexes(self):
+        paths = []
+        for n in range(1, 4):
+            path = os.path.join(self.temp_dir, f'daemon.log.{n}.gz')
+            self._write_gz(gzip.compress(_log_bytes(n * 1000, 1000)), path)
+            paths.append(path)
+        with patch.object(lpmp_gzip, 'PREFETCH_WORKERS', 3):
+            prefetch_file_date_ranges(
+                (path, os.path.basename(path)) for path in paths)
+        for path in paths:
+            self.assertIsNotNone(lookup_gzip_index(path))
+
+    def test_prefetch_skips_known_ranges(self):
+        self._write_gz(gzip.compress(_log_bytes(0, 100)))
+        other = os.path.join(self.temp_dir, 'daemon.log.2.gz')
+        self._write_gz(gzip.compress(_log_bytes(0, 100)), other)
+        _file_date_range_cache[self.gz_path] = (BASE_TS, BASE_TS)
+        _file_date_range_cache[other] = (BASE_TS, BASE_TS)
+        with patch.object(lpmp_gzip, 'build_gzip_index') as mock_build:
+            prefetch_file_date_ranges([(self.gz_path, 'a'), (other, 'b')])
+        mock_build.assert_not_called()
+
+    def test_open_without_index_reads_from_start(self):
+        data = _log_bytes(0, 5000)
+        self._write_gz(gzip.compress(data))
+        with open_gzip_text(self.gz_path, None,
+                            BASE_TS + timedelta(seconds=4000)) as f:
+            self.assertEqual(f.read(), data.decode())
+
+
+class TestGzipIndexEngineIntegration(TestGzipIndexBase):
+    """Engine searches give the same answers with the index."""
+
+    def _search(self):
+        return find_pattern_in_files(
+            self.temp_dir, ['daemon.log.1.gz'], 'event number 0000400[25]',
+            after_timestamp=BASE_TS + timedelta(seconds=4000),
+            suppress_error=True)
+
+    def test_find_pattern_same_result_with_index(self):
+        self._write_gz(gzip.compress(_log_bytes(0, 5000)))
+        without_index = self._search()
+        lpmp_gzip._gzip_indexes.clear()
+        get_gzip_index(self.gz_path)
+        with patch('gzip.open') as mock_open:
+            with_index = self._search()
+        mock_open.assert_not_called()
+        self.assertIsNotNone(with_index)
+        self.assertEqual(with_index, without_index)
+        self.assertIn('event number 00004002', with_index[2])
+
+    def test_all_matches_same_result_with_index(self):
+        self._write_gz(gzip.compress(_log_bytes(0, 5000)))
+        after = BASE_TS + timedelta(seconds=3000)
+        without_index = find_pattern_in_files_all_matches(
+            self.temp_dir, ['daemon.log.1.gz'], 'event number 00003', after)
+        get_gzip_index(self.gz_path)
+        with_index = find_pattern_in_files_all_matches(
+            self.temp_dir, ['daemon.log.1.gz'], 'event number 00003', after)
+        self.assertEqual(len(with_index), 999)
+        self.assertEqual(with_index, without_index)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,13 +28,17 @@ from lpmp_graph import create_graph
 from lpmp_graph import create_state_csv
 from lpmp_graph import create_state_graph
 from lpmp_graph import create_system_graph
+from lpmp_graph import downsample_series
 from lpmp_graph import extract_state_data
 from lpmp_graph import extract_usage_data
+from lpmp_graph import load_usage_columns
 from lpmp_graph import main as lpmp_graph_main
 from lpmp_graph import parse_bound_date
 from lpmp_graph import parse_timestamp_str
+from lpmp_graph import plot_usage_series
 from lpmp_graph import run_combine_mode
 from lpmp_graph import system_color_cycle
+from lpmp_graph import write_usage_csv
 from lpmp_utils import get_verbose_level
 from lpmp_utils import set_verbose_level
 from test_base import LPMPTestBase
@@ -582,6 +586,110 @@ class TestExtractUsageDataBounds(LPMPTestBase):
             self.assertEqual(len(data), 0)
 
 
+# =============================================================================
+# Tests for the columnar loader and downsampling
+# =============================================================================
+
+class TestUsageColumns(LPMPTestBase):
+    """load_usage_columns/write_usage_csv agree with the list-based path;
+    downsample_series/plot_usage_series bound what gets plotted."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_timeline_file = os.path.join(self.temp_dir, 'columns.log')
+        self._prev_verbose_level = get_verbose_level()
+        set_verbose_level(0)
+
+    def tearDown(self):
+        set_verbose_level(self._prev_verbose_level)
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def _write_mixed_timeline(self, count):
+        values = ["debounce (%d)", "reading: %d %% usage",
+                  "platform cpu dispatch Usage: %d%%", "no value %d"]
+        with open(self.test_timeline_file, 'w') as f:
+            f.write("Delta(HH:MM:SS)\tHostname\tBlock Label\tLog File\tData\n")
+            f.write("-------------\t--------\t-----------\t--------\t----\n")
+            for i in range(count):
+                label = 'Other Block' if i % 5 == 0 else 'Platform CPU'
+                f.write(f"00:00:01.000\tcontroller-0\t{label}\ttest.log\t"
+                        f"2026-06-08T{i // 3600:02d}:{i // 60 % 60:02d}:"
+                        f"{i % 60:02d}.{i % 1000:03d} "
+                        f"{values[i % 4] % (i % 100)}\n")
+
+    def test_columns_match_extract_usage_data(self):
+        self._write_mixed_timeline(2000)
+        bounds = [(None, None),
+                  (datetime(2026, 6, 8, 0, 10), datetime(2026, 6, 8, 0, 20))]
+        for start, stop in bounds:
+            expected = extract_usage_data(self.test_timeline_file,
+                                          'Platform CPU', start, stop)
+            with patch('lpmp_graph.COLUMN_CHUNK_ROWS', 100):
+                timestamps, values = load_usage_columns(
+                    self.test_timeline_file, 'Platform CPU', start, stop)
+            self.assertGreater(len(expected), 0)
+            self.assertEqual(values.tolist(), [v for _, v in expected])
+            self.assertEqual(timestamps.astype(object).tolist(),
+                             [parse_timestamp_str(t) for t, _ in expected])
+
+    def test_invalid_timestamp_dropped(self):
+        with open(self.test_timeline_file, 'w') as f:
+            for ts in ('2026-06-08T10:00:00.000', '2026-13-08T10:00:00.000'):
+                f.write(f"00:00:01.000\tcontroller-0\tPlatform CPU\ttest.log\t"
+                        f"{ts} platform cpu dispatch Usage: 5.5%\n")
+        timestamps, values = load_usage_columns(self.test_timeline_file,
+                                                'Platform CPU')
+        self.assertEqual(values.tolist(), [5.5])
+
+    def test_write_usage_csv_matches_create_csv(self):
+        self._write_mixed_timeline(300)
+        expected_csv = os.path.join(self.temp_dir, 'expected.csv')
+        columns_csv = os.path.join(self.temp_dir, 'columns.csv')
+        create_csv(extract_usage_data(self.test_timeline_file, 'Platform CPU'),
+                   expected_csv, 'Platform CPU')
+        timestamps, values = load_usage_columns(self.test_timeline_file,
+                                                'Platform CPU')
+        with patch('lpmp_graph.COLUMN_CHUNK_ROWS', 7):
+            write_usage_csv(timestamps, values, columns_csv, 'Platform CPU')
+        with open(expected_csv) as f1, open(columns_csv) as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    def test_downsample_series_buckets(self):
+        self._write_mixed_timeline(2000)
+        timestamps, values = load_usage_columns(self.test_timeline_file,
+                                                'Platform CPU')
+        times, minimums, maximums, means = downsample_series(
+            timestamps, values, 50)
+        self.assertLessEqual(len(times), 50)
+        self.assertEqual(len(times), len(means))
+        # Extremes survive; every mean lies inside its bucket's band
+        self.assertEqual(minimums.min(), values.min())
+        self.assertEqual(maximums.max(), values.max())
+        self.assertTrue(((minimums <= means) & (means <= maximums)).all())
+        self.assertTrue((times[1:] > times[:-1]).all())
+        self.assertTrue(timestamps[0] <= times[0] and times[-1] <= timestamps[-1])
+        # Input order does not matter
+        shuffled = downsample_series(timestamps[::-1], values[::-1], 50)
+        for got, want in zip(shuffled, (times, minimums, maximums, means)):
+            self.assertEqual(got.tolist(), want.tolist())
+
+    @patch('lpmp_graph.plt')
+    def test_plot_usage_series_downsamples_long_series(self, mock_plt):
+        self._write_mixed_timeline(2000)
+        timestamps, values = load_usage_columns(self.test_timeline_file,
+                                                'Platform CPU')
+        plot_usage_series(timestamps, values, 100, color='blue')
+        mock_plt.fill_between.assert_called_once()
+        plotted = mock_plt.plot.call_args[0]
+        self.assertLessEqual(len(plotted[0]), 100)
+
+        mock_plt.reset_mock()
+        plot_usage_series(timestamps, values, len(values), color='blue')
+        mock_plt.fill_between.assert_not_called()
+        self.assertEqual(len(mock_plt.plot.call_args[0][1]), len(values))
+
+
 # =============================================================================
 # Tests for system_color_cycle
 # =============================================================================
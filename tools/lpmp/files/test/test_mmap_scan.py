@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+
+"""
+Tests for the memory-mapped literal search in lpmp_scan.py.
+
+Covers literal extraction from regex patterns and checks that the
+byte-level reader yields exactly what the line-by-line text reader
+yields, including carriage returns, invalid utf-8 outside the literal,
+a missing final newline and start offsets, and that
+find_pattern_in_files gives the same answers with --no-mmap-scan.
+"""
+
+from datetime import datetime
+import os
+from pathlib import Path
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.dont_write_bytecode = True
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lpmp_engine import _read_pattern_matches        # noqa: E402
+from lpmp_engine import _scan_pattern_matches        # noqa: E402
+from lpmp_engine import find_pattern_in_files        # noqa: E402
+from lpmp_scan import literal_prefilter              # noqa: E402
+
+LOG_BYTES = (
+    b"2024-01-06T10:00:00.000 boot begin\n"
+    b"2024-01-06T10:00:01.000 service alpha starting\n"
+    b"continuation without timestamp service alpha starting\n"
+    b"2024-01-06T10:00:02.000 bad bytes \xff\xfe then service alpha ready\n"
+    b"2024-01-06T10:00:03.000 service alpha ready twice service alpha ready\n"
+    b"2024-01-06T10:00:04.000 dos line service beta starting\r\n"
+    b"2024-01-06T10:00:05.000 old mac line service beta ready\r"
+    b"2024-01-06T10:00:06.000 after cr service beta ready\n"
+    b"2024-01-06T10:00:07.000 caf\xc3\xa9 service gamma ready\n"
+    b"2024-01-06T10:00:08.000 last line service alpha ready"
+)
+
+PATTERNS = [
+    'service alpha starting',
+    'service alpha ready',
+    r'service (alpha|beta) ready',
+    r'beta \w+',
+    'service beta ready',
+    'café service',
+    'not present anywhere',
+    'service [',               # invalid regex, substring match
+]
+
+
+def _comparable(text, mapped):
+    """Blank the positions where the text reader's tell() is a cookie
+    (after a lone carriage return) rather than a byte offset; the
+    byte-level reader reports the real offset there."""
+    if len(text) != len(mapped):
+        return text, mapped
+    cookies = [end >= 1 << 64 for _ts, _line, end in text]
+    return tuple([(ts, line, None if cookie else end)
+                  for (ts, line, end), cookie in zip(results, cookies)]
+                 for results in (text, mapped))
+
+
+class MockArgs:
+    def __init__(self, logs_dir, no_mmap_scan=False):
+        self.logs_dir = logs_dir
+        self.verbose = 0
+        self.max_log_length = 180
+        self.block_time_tolerance = 1.0
+        self.no_mmap_scan = no_mmap_scan
+
+
+class TestLiteralPrefilter(unittest.TestCase):
+    """Literal extraction is conservative."""
+
+    def test_plain_and_invalid_patterns_are_literal(self):
+        self.assertEqual(literal_prefilter('Sending FIN'), b'Sending FIN')
+        self.assertEqual(literal_prefilter('service ['), b'service [')
+
+    def test_longest_required_run(self):
+        self.assertEqual(literal_prefilter(r'Node (\w+) is up'), b' is up')
+        self.assertEqual(literal_prefilter(r'sysinv.*compute-0 unlocked'),
+                         b'compute-0 unlocked')
+        self.assertEqual(literal_prefilter(r'evt: \[OK\]'), b'evt: [OK]')
+        self.assertEqual(literal_prefilter(r'\d+ abc'), b' abc')
+
+    def test_repetition_drops_optional_characters(self):
+        self.assertEqual(literal_prefilter('a{2}bc'), b'bc')
+        self.assertEqual(literal_prefilter('(foo)?barbaz?'), b'barba')
+        self.assertEqual(literal_prefilter('ab*'), b'a')
+
+    def test_no_literal(self):
+        for pattern in ('foo|bar', '(?i)abc', r'\d+', '[abc]+', '',
+                        'line\nbreak'):
+            self.assertIsNone(literal_prefilter(pattern), pattern)
+
+    def test_literal_is_in_every_match(self):
+        text = 'xx Node abc is up; a aa abc barbaz evt: [OK] 42 abc'
+        for pattern in (r'Node (\w+) is up', 'a{2}c', 'bar(baz)?',
+                        r'evt: \[OK\]', r'\d+ abc', 'ab*c'):
+            literal = literal_prefilter(pattern).decode()
+            for match in re.finditer(pattern, text):
+                self.assertIn(literal, match.group(0), pattern)
+
+
+class TestMmapScanParity(unittest.TestCase):
+    """Byte-level reader against the text reader."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.temp_dir, 'daemon.log')
+        with open(self.log_path, 'wb') as f:
+            f.write(LOG_BYTES)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _both(self, pattern, read_pos=0, after_timestamp=None):
+        try:
+            line_matches = re.compile(pattern).search
+        except re.error:
+            def line_matches(line):
+                return pattern in line
+        args = (self.log_path, 'daemon.log')
+        text = list(_read_pattern_matches(
+            *args, False, read_pos, line_matches, after_timestamp, 1.0))
+        mapped = list(_scan_pattern_matches(
+            *args, read_pos, literal_prefilter(pattern), line_matches,
+            after_timestamp, 1.0))
+        return _comparable(text, mapped)
+
+    def test_parity_for_patterns(self):
+        for pattern in PATTERNS:
+            text, mapped = self._both(pattern)
+            self.assertEqual(mapped, text, pattern)
+
+    def test_parity_from_offsets_and_times(self):
+        line_starts = [0] + [m.end() for m in re.finditer(b'\r\n|\r|\n',
+                                                          LOG_BYTES)]
+        after = datetime(2024, 1, 6, 10, 0, 5)
+        for read_pos in line_starts:
+            for pattern in PATTERNS[:5]:
+                text, mapped = self._both(pattern, read_pos, after)
+                self.assertEqual(mapped, text, (pattern, read_pos))
+
+    def test_carriage_return_lines(self):
+        mapped = _scan_pattern_matches(
+            self.log_path, 'daemon.log', 0, b'service beta ready',
+            lambda line: True, None, 1.0)
+        after_cr = LOG_BYTES.index(b'ready\r') + len(b'ready\r')
+        self.assertEqual([(line, end) for _ts, line, end in mapped], [
+            ('2024-01-06T10:00:05.000 old mac line service beta ready\n',
+             after_cr),
+            ('2024-01-06T10:00:06.000 after cr service beta ready\n',
+             LOG_BYTES.index(b'\n', after_cr) + 1)])
+
+    def test_only_lines_with_literal_decoded(self):
+        with patch('lpmp_scan.get_timestamp_parser') as mock_parser:
+            mock_parser.return_value.parse.return_value = None
+            list(_scan_pattern_matches(
+                self.log_path, 'daemon.log', 0, b'gamma',
+                lambda line: True, None, 1.0))
+        self.assertEqual(mock_parser.return_value.parse.call_count, 1)
+
+    def test_empty_file(self):
+        open(self.log_path, 'w').close()
+        self.assertEqual(self._both('boot'), ([], []))
+
+
+class TestMmapScanEngine(unittest.TestCase):
+    """find_pattern_in_files with and without the byte-level reader."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.temp_dir, 'daemon.log'), 'wb') as f:
+            f.write(LOG_BYTES)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _find(self, pattern, no_mmap_scan, **kwargs):
+        args = MockArgs(self.temp_dir, no_mmap_scan)
+        args._file_position_cache = {}
+        return find_pattern_in_files(
+            self.temp_dir, ['daemon.log'], pattern, suppress_error=True,
+            args=args, **kwargs)
+
+    def test_same_results(self):
+        after = datetime(2024, 1, 6, 10, 0, 4)
+        for pattern in PATTERNS:
+            for kwargs in ({}, {'after_timestamp': after},
+                           {'after_timestamp': after, 'max_time_delta': 1}):
+                mapped = self._find(pattern, False, **kwargs)
+                text = self._find(pattern, True, **kwargs)
+                self.assertEqual(mapped is None, text is None)
+                if mapped is not None:
+                    self.assertEqual(*_comparable(
+                        [(text[0], text[2], text[1])],
+                        [(mapped[0], mapped[2], mapped[1])]))
+                    self.assertEqual(mapped[3], text[3])
+
+    def test_text_cookie_position_uses_text_reader(self):
+        args = MockArgs(self.temp_dir)
+        args._file_position_cache = {
+            f"{self.temp_dir}/daemon.log": (1 << 128) + 380}
+        with patch('lpmp_engine.scan_literal_matches') as mock_scan:
+            find_pattern_in_files(
+                self.temp_dir, ['daemon.log'], 'service alpha ready',
+                suppress_error=True, args=args)
+        mock_scan.assert_not_called()
+
+    def test_no_mmap_scan_uses_text_reader(self):
+        with patch('lpmp_engine.scan_literal_matches') as mock_scan:
+            self._find('service alpha ready', True)
+        mock_scan.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
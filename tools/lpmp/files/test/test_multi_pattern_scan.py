@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+
+"""
+Tests for lpmp_scan.py (multi-pattern single-pass scan).
+
+Covers the MultiPatternScanner match streams (prefilter, substring
+fallback, OR alternatives, re-scan on growth/earlier position) and
+checks that process_blocks_auto_detect gives identical results with
+and without the scanner while reading each log file only once.
+"""
+
+from contextlib import redirect_stdout
+from datetime import datetime
+import gzip
+import io
+import os
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.dont_write_bytecode = True
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lpmp_engine import find_pattern_in_files        # noqa: E402
+from lpmp_engine import process_blocks_auto_detect   # noqa: E402
+from lpmp_scan import MultiPatternScanner            # noqa: E402
+
+LOG_CONTENT = """2024-01-06T10:00:00.000 boot begin
+2024-01-06T10:00:01.000 service alpha starting
+2024-01-06T10:00:02.000 noise line
+continuation line without timestamp service alpha ready
+2024-01-06T10:00:03.000 service alpha ready
+2024-01-06T10:00:04.000 service beta starting
+2024-01-06T10:00:06.000 service beta ready
+2024-01-06T10:00:07.000 value [x] literal brackets
+2024-01-06T10:00:08.000 boot complete
+2024-01-06T10:01:00.000 boot begin
+2024-01-06T10:01:01.000 service alpha starting
+2024-01-06T10:01:03.000 service alpha ready
+2024-01-06T10:01:04.000 service beta starting
+2024-01-06T10:01:06.000 service beta ready
+2024-01-06T10:01:08.000 boot complete
+"""
+
+
+class MockArgs:
+    def __init__(self, logs_dir):
+        self.logs_dir = logs_dir
+        self.verbose = 0
+        self.max_log_length = 180
+        self.block_time_tolerance = 1.0
+        self.all_optional_warnings = []
+
+
+class TestMultiPatternScanner(unittest.TestCase):
+    """MultiPatternScanner match streams."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.temp_dir, 'daemon.log')
+        with open(self.log_path, 'w') as f:
+            f.write(LOG_CONTENT)
+        self.scanner = MultiPatternScanner()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _lines(self, records):
+        return [line.strip()[24:] for _start, _end, _ts, line in records]
+
+    def test_unplanned_pattern_returns_none(self):
+        self.scanner.plan([(self.log_path, 'boot begin')])
+        self.assertIsNone(
+            self.scanner.matches(self.log_path, 'daemon.log', 'other'))
+        self.assertEqual(self.scanner.files_scanned, 0)
+
+    def test_one_read_serves_all_patterns(self):
+        patterns = ['boot begin', r'service \w+ ready', 'boot complete']
+        self.scanner.plan([(self.log_path, p) for p in patterns])
+        ready = self.scanner.matches(self.log_path, 'daemon.log', patterns[1])
+        begin = self.scanner.matches(self.log_path, 'daemon.log', patterns[0])
+        self.assertEqual(self.scanner.files_scanned, 1)
+        self.assertEqual(self._lines(begin), ['boot begin', 'boot begin'])
+        # Untimestamped continuation lines are never recorded
+        self.assertEqual(len(ready), 4)
+
+    def test_invalid_regex_matched_as_substring(self):
+        self.scanner.plan([(self.log_path, '[x'), (self.log_path, 'boot')])
+        records = self.scanner.matches(self.log_path, 'daemon.log', '[x')
+        self.assertEqual(self._lines(records), ['value [x] literal brackets'])
+
+    def test_backreference_pattern_without_prefilter(self):
+        pattern = r'(boot) begin|(\w+) \2'
+        self.scanner.plan([(self.log_path, pattern),
+                           (self.log_path, r'(service) alpha')])
+        records = self.scanner.matches(self.log_path, 'daemon.log', pattern)
+        self.assertEqual(len(records), 2)
+
+    def test_read_pos_skips_earlier_lines(self):
+        self.scanner.plan([(self.log_path, 'boot begin')])
+        first = self.scanner.matches(self.log_path, 'daemon.log', 'boot begin')
+        later = self.scanner.matches(self.log_path, 'daemon.log',
+                                     'boot begin', first[0][1])
+        self.assertEqual(later, first[1:])
+        self.assertEqual(self.scanner.files_scanned, 1)
+
+    def test_earlier_read_pos_rescans(self):
+        self.scanner.plan([(self.log_path, 'boot begin')])
+        self.scanner.matches(self.log_path, 'daemon.log', 'boot begin', 100)
+        records = self.scanner.matches(self.log_path, 'daemon.log',
+                                       'boot begin', 0)
+        self.assertEqual(len(records), 2)
+        self.assertEqual(self.scanner.files_scanned, 2)
+
+    def test_grown_file_rescanned(self):
+        self.scanner.plan([(self.log_path, 'boot begin')])
+        self.scanner.matches(self.log_path, 'daemon.log', 'boot begin')
+        with open(self.log_path, 'a') as f:
+            f.write('2024-01-06T10:02:00.000 boot begin\n')
+        records = self.scanner.matches(self.log_path, 'daemon.log',
+                                       'boot begin')
+        self.assertEqual(len(records), 3)
+
+    def test_carriage_returns_left_to_per_pattern_reader(self):
+        with open(self.log_path, 'w') as f:
+            f.write('2024-01-06T10:00:00.000 boot begin\r\n')
+        self.scanner.plan([(self.log_path, 'boot begin')])
+        self.assertIsNone(
+            self.scanner.matches(self.log_path, 'daemon.log', 'boot begin'))
+
+    def test_gz_file(self):
+        gz_path = self.log_path + '.1.gz'
+        with gzip.open(gz_path, 'wt') as f:
+            f.write(LOG_CONTENT)
+        self.scanner.plan([(gz_path, 'boot complete')])
+        records = self.scanner.matches(gz_path, 'daemon.log.1.gz',
+                                       'boot complete', 500)
+        self.assertEqual(len(records), 2)
+
+    def test_replan_keeps_covered_files(self):
+        entries = [(self.log_path, 'boot begin')]
+        self.scanner.plan(entries)
+        self.scanner.matches(self.log_path, 'daemon.log', 'boot begin')
+        self.scanner.plan(entries)
+        self.scanner.matches(self.log_path, 'daemon.log', 'boot begin')
+        self.assertEqual(self.scanner.files_scanned, 1)
+        self.scanner.plan(entries + [(self.log_path, 'boot complete')])
+        self.scanner.matches(self.log_path, 'daemon.log', 'boot complete')
+        self.assertEqual(self.scanner.files_scanned, 2)
+
+
+class TestMultiPatternScanEngine(unittest.TestCase):
+    """Engine results are unchanged when the scanner is enabled."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.temp_dir, 'daemon.log'), 'w') as f:
+            f.write(LOG_CONTENT)
+        with open(os.path.join(self.temp_dir, 'other.log'), 'w') as f:
+            f.write('2024-01-06T10:00:05.000 other event\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run(self, blocks, scanner=None, position_cache=False):
+        args = MockArgs(self.temp_dir)
+        if scanner is not None:
+            args._pattern_scanner = scanner
+        if position_cache:
+            args._file_position_cache = {}
+        results = []
+        start_date = datetime(2024, 1, 6, 9, 0, 0)
+        with redirect_stdout(io.StringIO()):
+            for _ in range(2):
+                outcome = process_blocks_auto_detect(
+                    args, [dict(b) for b in blocks], start_date, 45,
+                    {'hostname': 'controller-0'}, {})
+                results.append(outcome)
+                start_date = outcome[2]
+        self.assertGreater(results[0][3], 0)
+        return results
+
+    def test_pattern_model_parity(self):
+        blocks = [
+            {'label': 'Begin', 'file': 'daemon.log', 'patterns': ['boot begin']},
+            {'label': 'Alpha', 'file': 'daemon.log',
+             'patterns': [['service gamma ready', 'service alpha ready']]},
+            {'label': 'Other', 'file': 'other.log', 'patterns': ['other event']},
+            {'label': 'Beta', 'file': 'daemon.log', 'patterns': ['beta ready']},
+            {'label': 'Missing', 'file': 'daemon.log',
+             'patterns': ['never logged'], 'optional': True},
+            {'label': 'Done', 'file': 'daemon.log', 'patterns': ['boot complete']},
+        ]
+        scanner = MultiPatternScanner()
+        self.assertEqual(self._run(blocks), self._run(blocks, scanner))
+        # daemon.log and other.log, each read once across both passes
+        self.assertEqual(scanner.files_scanned, 2)
+
+    def test_pair_model_parity(self):
+        blocks = [
+            {'label': 'Alpha', 'file': 'daemon.log',
+             'start': 'alpha starting', 'stop': 'alpha ready'},
+            {'label': 'Beta', 'file': 'daemon.log',
+             'start': 'beta starting', 'stop': ['beta done', 'beta ready']},
+        ]
+        scanner = MultiPatternScanner()
+        self.assertEqual(self._run(blocks), self._run(blocks, scanner))
+        self.assertEqual(scanner.files_scanned, 1)
+
+    def test_position_cache_parity(self):
+        blocks = [
+            {'label': 'Begin', 'file': 'daemon.log', 'patterns': ['boot begin']},
+            {'label': 'Done', 'file': 'daemon.log', 'patterns': ['boot complete']},
+        ]
+        self.assertEqual(
+            self._run(blocks, position_cache=True),
+            self._run(blocks, MultiPatternScanner(), position_cache=True))
+
+    def test_stop_date_virtual_eof(self):
+        args = MockArgs(self.temp_dir)
+        args.stop_date_parsed = datetime(2024, 1, 6, 10, 0, 30)
+        args._pattern_scanner = MultiPatternScanner()
+        args._pattern_scanner.plan([
+            (os.path.join(self.temp_dir, 'daemon.log'), 'boot begin')])
+        result = find_pattern_in_files(
+            self.temp_dir, 'daemon.log', 'boot begin', 0,
+            datetime(2024, 1, 6, 10, 0, 30), suppress_error=True, args=args)
+        self.assertIsNone(result)
+        self.assertEqual(args._pattern_scanner.files_scanned, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
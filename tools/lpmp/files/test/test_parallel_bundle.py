@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+
+"""
+Tests for bundle mode --jobs (parallel per-host processing).
+
+Runs lpmptool against a small synthetic collect bundle serially and
+with several jobs and checks that every output file is identical, and
+that a negative job count is rejected.
+"""
+
+from datetime import datetime
+from datetime import timedelta
+import filecmp
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+sys.dont_write_bytecode = True
+
+LPMPTOOL = str(Path(__file__).parent.parent / 'lpmptool')
+HOSTS = ['controller-0', 'controller-1', 'compute-0', 'compute-1']
+
+PATTERN_MODEL = """description: Parallel bundle pattern model.
+blocks:
+  - label: Begin
+    file: daemon.log
+    patterns: ["{hostname} boot begin"]
+  - label: Up
+    file: daemon.log
+    patterns: ["service up"]
+  - label: Done
+    file: daemon.log
+    patterns: ["boot complete"]
+"""
+
+TIMELINE_MODEL = """description: Parallel bundle timeline model.
+blocks:
+  - label: Boot
+    file: daemon.log
+    timeline: ["boot begin", "boot complete"]
+"""
+
+
+def _write_host_log(path, hostname, offset):
+    """Write three boot cycles, ten minutes apart, for one host."""
+    base = datetime(2026, 1, 1, 10, 0, 0) + timedelta(seconds=offset)
+    with open(path, 'w') as f:
+        for cycle in range(3):
+            start = base + timedelta(minutes=10 * cycle)
+            for seconds, text in ((0, f'{hostname} boot begin'),
+                                  (1, 'noise'),
+                                  (4, 'service up'),
+                                  (9, 'boot complete')):
+                ts = start + timedelta(seconds=seconds)
+                f.write(f"{ts.isoformat(timespec='milliseconds')} {text}\n")
+
+
+class TestParallelBundle(unittest.TestCase):
+    """Serial and parallel bundle runs produce the same output."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.bundle = os.path.join(self.temp_dir, 'bundle')
+        for i, hostname in enumerate(HOSTS):
+            log_dir = os.path.join(self.bundle, f'{hostname}_20260101.120000',
+                                   'var', 'log')
+            os.makedirs(log_dir)
+            _write_host_log(os.path.join(log_dir, 'daemon.log'),
+                            hostname, 3 * (i + 1))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run(self, model_text, jobs):
+        model_file = os.path.join(self.temp_dir, 'model.yaml')
+        with open(model_file, 'w') as f:
+            f.write(model_text)
+        output_dir = os.path.join(self.temp_dir, f'out_j{jobs}')
+        result = subprocess.run(
+            ['python3', LPMPTOOL, '--model-file', model_file,
+             '--bundle', self.bundle, '--output', output_dir,
+             '--loops', '0', '--progress', 'none', '--no-index',
+             '--jobs', str(jobs)],
+            capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        # Single timestamped run directory under <output>/lpmp_lab
+        lab_dir = os.path.join(output_dir, 'lpmp_lab')
+        run_dirs = os.listdir(lab_dir)
+        self.assertEqual(len(run_dirs), 1)
+        return os.path.join(lab_dir, run_dirs[0])
+
+    def _assert_same_tree(self, left, right):
+        compared = filecmp.dircmp(left, right)
+        self.assertEqual(compared.left_only, [])
+        self.assertEqual(compared.right_only, [])
+        _match, mismatch, errors = filecmp.cmpfiles(
+            left, right, compared.common_files, shallow=False)
+        self.assertEqual(mismatch, [])
+        self.assertEqual(errors, [])
+        for sub in compared.common_dirs:
+            self._assert_same_tree(os.path.join(left, sub),
+                                   os.path.join(right, sub))
+
+    def test_pattern_model_output_identical(self):
+        serial = self._run(PATTERN_MODEL, 1)
+        parallel = self._run(PATTERN_MODEL, 3)
+        self.assertEqual(sorted(d for d in os.listdir(parallel)
+                                if os.path.isdir(os.path.join(parallel, d))),
+                         sorted(HOSTS))
+        self._assert_same_tree(serial, parallel)
+
+    def test_timeline_model_output_identical(self):
+        self._assert_same_tree(self._run(TIMELINE_MODEL, 1),
+                               self._run(TIMELINE_MODEL, 0))
+
+    def test_negative_jobs_rejected(self):
+        result = subprocess.run(
+            ['python3', LPMPTOOL, '--model-file', 'unused.yaml',
+             '--bundle', self.bundle, '--jobs', '-1'],
+            capture_output=True, text=True, timeout=30)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn('--jobs', result.stdout + result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+
+"""
+Tests for --profile-self (lpmp_profile.py).
+
+Covers the profiler being a no-op when off, phase timers, per-file
+counters from the text, memory-mapped and bisect readers, separate
+per-host profilers, and the self_profile.json written next to
+summary.timing by system and bundle runs.
+"""
+
+from datetime import datetime
+from datetime import timedelta
+import json
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.dont_write_bytecode = True
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import lpmp_index                                             # noqa: E402
+import lpmp_profile                                           # noqa: E402
+from lpmp_engine import find_pattern_in_files                 # noqa: E402
+from lpmp_engine import find_pattern_in_files_all_matches     # noqa: E402
+from lpmp_profile import count_file_read                      # noqa: E402
+from lpmp_profile import enable_self_profile                  # noqa: E402
+from lpmp_profile import FILE_COUNTERS                        # noqa: E402
+from lpmp_profile import get_self_profiler                    # noqa: E402
+from lpmp_profile import profile_phase                        # noqa: E402
+from lpmp_profile import separate_self_profile                # noqa: E402
+from lpmp_profile import write_self_profile                   # noqa: E402
+
+LPMPTOOL = str(Path(__file__).parent.parent / 'lpmptool')
+BASE_TS = datetime(2026, 1, 1, 10, 0, 0)
+
+PATTERN_MODEL = """description: Self-profile pattern model.
+blocks:
+  - label: Begin
+    file: daemon.log
+    patterns: ["boot begin"]
+  - label: Done
+    file: daemon.log
+    patterns: ["boot complete"]
+"""
+
+
+def _write_log(path, count):
+    """count boot cycles, one line per second."""
+    with open(path, 'w') as f:
+        for i in range(count):
+            for seconds, text in ((0, 'boot begin'), (1, 'noise'),
+                                  (2, 'boot complete')):
+                ts = BASE_TS + timedelta(seconds=3 * i + seconds)
+                f.write(f"{ts.isoformat(timespec='milliseconds')} "
+                        f"{text} {'x' * 40}\n")
+
+
+class MockArgs:
+    def __init__(self, logs_dir, no_mmap_scan=False):
+        self.logs_dir = logs_dir
+        self.verbose = 0
+        self.max_log_length = 180
+        self.block_time_tolerance = 1.0
+        self.no_mmap_scan = no_mmap_scan
+
+
+class SelfProfileTestCase(unittest.TestCase):
+    """Temp dir and a clean profiler per test."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        profiler_patch = patch.object(lpmp_profile, '_self_profiler', None)
+        profiler_patch.start()
+        self.addCleanup(profiler_patch.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class TestSelfProfiler(SelfProfileTestCase):
+    """Profiler API."""
+
+    def test_disabled_is_noop(self):
+        with profile_phase('scan'):
+            count_file_read('daemon.log', lines_parsed=3)
+        self.assertIsNone(get_self_profiler())
+        self.assertIsNone(write_self_profile(self.temp_dir))
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_phases_do_not_nest_with_themselves(self):
+        profiler = enable_self_profile()
+        with profile_phase('wildcard_expansion'):
+            with profile_phase('date_range_probe'):
+                with profile_phase('date_range_probe'):
+                    pass
+        profiler.begin_phase('output')
+        with self.assertRaises(RuntimeError):
+            profiler.begin_phase('output')
+        profiler.end_phase('output')
+        phases = profiler.report()['phases']
+        self.assertEqual(
+            {name: phase['calls'] for name, phase in phases.items()},
+            {'wildcard_expansion': 1, 'date_range_probe': 1, 'output': 1})
+
+    def test_files_sorted_by_bytes_read(self):
+        profiler = enable_self_profile()
+        count_file_read('small.log', reads=1, bytes_read=10)
+        count_file_read('big.log', reads=1, bytes_read=500)
+        count_file_read('small.log', reads=1, bytes_read=15, bisect_steps=4)
+        files = profiler.report()['files']
+        self.assertEqual([f['file'] for f in files], ['big.log', 'small.log'])
+        self.assertEqual(files[1], {'file': 'small.log', 'reads': 2,
+                                    'bytes_read': 25, 'lines_parsed': 0,
+                                    'timestamps_parsed': 0,
+                                    'regex_evaluations': 0,
+                                    'bisect_steps': 4})
+
+    def test_separate_profile_restores_outer(self):
+        outer = enable_self_profile()
+        with separate_self_profile() as inner:
+            count_file_read('daemon.log', reads=1)
+            self.assertIs(get_self_profiler(), inner)
+        self.assertIs(get_self_profiler(), outer)
+        self.assertEqual(outer.files, {})
+        self.assertEqual(inner.files['daemon.log']['reads'], 1)
+
+    def test_write_report(self):
+        enable_self_profile()
+        count_file_read('daemon.log', reads=1, lines_parsed=7)
+        path = write_self_profile(self.temp_dir)
+        with open(path) as f:
+            report = json.load(f)
+        self.assertEqual(os.path.basename(path), 'self_profile.json')
+        self.assertEqual(report['files'][0]['lines_parsed'], 7)
+        for key in ('wall_seconds', 'cpu_seconds', 'phases', 'blocks'):
+            self.assertIn(key, report)
+
+
+class TestReaderCounters(SelfProfileTestCase):
+    """The engine readers report their per-file counters."""
+
+    def setUp(self):
+        super().setUp()
+        # Bisect, not the persistent index, positions the --sort reader
+        index_patch = patch.object(lpmp_index, '_index_dir', None)
+        index_patch.start()
+        self.addCleanup(index_patch.stop)
+        self.log_path = os.path.join(self.temp_dir, 'daemon.log')
+        _write_log(self.log_path, 1000)
+        self.profiler = enable_self_profile()
+
+    def _find(self, no_mmap_scan):
+        return find_pattern_in_files(
+            self.temp_dir, ['daemon.log'], 'boot complete',
+            after_timestamp=BASE_TS + timedelta(seconds=1500),
+            suppress_error=True, args=MockArgs(self.temp_dir, no_mmap_scan))
+
+    def test_text_reader_counters(self):
+        self.assertIsNotNone(self._find(no_mmap_scan=True))
+        counters = self.profiler.files['daemon.log']
+        self.assertEqual(counters['reads'], 1)
+        # Stops at the first match within tolerance of the start time
+        self.assertEqual(counters['lines_parsed'], 1500)
+        self.assertEqual(counters['timestamps_parsed'], 1500)
+        self.assertEqual(counters['regex_evaluations'], 1)
+        self.assertGreater(counters['bytes_read'], 0)
+
+    def test_mmap_reader_decodes_only_hits(self):
+        self.assertIsNotNone(self._find(no_mmap_scan=False))
+        counters = self.profiler.files['daemon.log']
+        self.assertEqual(counters['reads'], 1)
+        self.assertEqual(counters['lines_parsed'], 500)
+        self.assertLess(counters['bytes_read'],
+                        os.path.getsize(self.log_path))
+
+    def test_all_matches_counts_bisect_steps(self):
+        matches = find_pattern_in_files_all_matches(
+            self.temp_dir, ['daemon.log'], 'boot begin',
+            BASE_TS + timedelta(seconds=2700))
+        self.assertEqual(len(matches), 99)
+        counters = self.profiler.files['daemon.log']
+        self.assertGreater(counters['bisect_steps'], 0)
+        self.assertLess(counters['lines_parsed'], 3000)
+        self.assertEqual(set(counters), set(FILE_COUNTERS))
+
+
+class TestSelfProfileReport(unittest.TestCase):
+    """lpmptool --profile-self writes self_profile.json."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.model_file = os.path.join(self.temp_dir, 'model.yaml')
+        with open(self.model_file, 'w') as f:
+            f.write(PATTERN_MODEL)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run(self, *extra):
+        output_dir = os.path.join(self.temp_dir, 'out')
+        result = subprocess.run(
+            ['python3', LPMPTOOL, '--model-file', self.model_file,
+             '--output', output_dir, '--progress', 'none', '--no-index',
+             '--profile-self', *extra],
+            capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        lab_dir = os.path.join(output_dir, 'lpmp_lab')
+        (run_dir,) = os.listdir(lab_dir)
+        return os.path.join(lab_dir, run_dir)
+
+    def _report(self, path):
+        self.assertTrue(os.path.exists(path), path)
+        with open(path) as f:
+            return json.load(f)
+
+    def test_system_mode_report_next_to_summary(self):
+        logs_dir = os.path.join(self.temp_dir, 'logs')
+        os.makedirs(logs_dir)
+        _write_log(os.path.join(logs_dir, 'daemon.log'), 5)
+        run_dir = self._run('--logs-dir', logs_dir, '--loops', '1',
+                            '--start-date', '2026-01-01')
+        self.assertTrue(os.path.exists(os.path.join(run_dir, 'summary.timing')))
+        report = self._report(os.path.join(run_dir, 'self_profile.json'))
+        for phase in ('model_load', 'wildcard_expansion', 'scan', 'output'):
+            self.assertIn(phase, report['phases'])
+        self.assertEqual({b['label'] for b in report['blocks']},
+                         {'Begin', 'Done'})
+        self.assertEqual(report['files'][0]['file'], 'daemon.log')
+
+    def test_bundle_mode_reports_per_host(self):
+        bundle = os.path.join(self.temp_dir, 'bundle')
+        hosts = ['controller-0', 'compute-0']
+        for hostname in hosts:
+            log_dir = os.path.join(bundle, f'{hostname}_20260101.120000',
+                                   'var', 'log')
+            os.makedirs(log_dir)
+            _write_log(os.path.join(log_dir, 'daemon.log'), 5)
+        for jobs in ('1', '2'):
+            run_dir = self._run('--bundle', bundle, '--loops', '1',
+                                '--jobs', jobs)
+            report = self._report(os.path.join(run_dir, 'self_profile.json'))
+            self.assertEqual(set(report['hosts']), set(hosts))
+            for hostname in hosts:
+                host_report = self._report(
+                    os.path.join(run_dir, hostname, 'self_profile.json'))
+                self.assertIn('scan', host_report['phases'])
+                self.assertEqual(host_report['files'][0]['file'], 'daemon.log')
+            shutil.rmtree(os.path.join(self.temp_dir, 'out'))
+
+
+if __name__ == '__main__':
+    unittest.main()
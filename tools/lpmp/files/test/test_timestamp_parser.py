@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+########################################################################
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+########################################################################
+
+"""
+Tests for the per-file TimestampParser in lpmp_utils.py.
+
+The fast paths must give exactly what the full format chain gives, so
+each case is checked against strptime/fromisoformat directly, including
+lines that have to fall back (format changes, precedence between forms,
+invalid fields) and custom timestamp_formats.
+"""
+
+from datetime import datetime
+from pathlib import Path
+import re
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.dont_write_bytecode = True
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import lpmp_utils                                             # noqa: E402
+from lpmp_utils import get_timestamp_parser                   # noqa: E402
+from lpmp_utils import parse_timestamp                        # noqa: E402
+from lpmp_utils import TimestampParser                        # noqa: E402
+
+CUSTOM_FORMATS = [
+    {'pattern': 'charon.log*',
+     'regex': re.compile(r'(\d{2}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})'),
+     'format': '%y-%m-%d %H:%M:%S.%f'},
+    {'pattern': ['tuned/tuned.log*'],
+     'regex': re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d+)'),
+     'format': '%Y-%m-%d %H:%M:%S,%f'},
+    {'pattern': 'lighttpd-error.log*',
+     'regex': re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}):'),
+     'format': '%Y-%m-%d %H:%M:%S'},
+]
+
+
+class TestTimestampParserBuiltinForms(unittest.TestCase):
+    """sysinv, ISO and space forms through a bound parser."""
+
+    def test_space_form_within_same_second(self):
+        parse = TimestampParser('sysinv.log').parse
+        self.assertEqual(parse('2024-01-06 12:30:45.123 INFO a\n'),
+                         datetime(2024, 1, 6, 12, 30, 45, 123000))
+        self.assertEqual(parse('2024-01-06 12:30:45.900 INFO b\n'),
+                         datetime(2024, 1, 6, 12, 30, 45, 900000))
+        self.assertEqual(parse('2024-01-06 12:30:46.001 INFO c\n'),
+                         datetime(2024, 1, 6, 12, 30, 46, 1000))
+
+    def test_sysinv_form(self):
+        parse = TimestampParser('sysinv.log').parse
+        for millis in ('123', '456'):
+            self.assertEqual(
+                parse(f'sysinv 2024-01-06 12:30:45.{millis} msg'),
+                datetime(2024, 1, 6, 12, 30, 45, int(millis) * 1000))
+
+    def test_iso_in_message_takes_precedence_over_space(self):
+        parse = TimestampParser('sysinv.log').parse
+        parse('2024-01-06 12:30:45.123 first\n')
+        self.assertEqual(
+            parse('2024-01-06 12:30:46.000 seen 2024-02-01T00:00:00.500'),
+            datetime(2024, 2, 1, 0, 0, 0, 500000))
+
+    def test_sysinv_takes_precedence_over_iso(self):
+        parse = TimestampParser('daemon.log').parse
+        parse('2024-01-06T12:30:45.123 first\n')
+        self.assertEqual(
+            parse('sysinv 2024-01-06 12:30:46.000 at 2024-02-01T00:00:00'),
+            datetime(2024, 1, 6, 12, 30, 46))
+
+    def test_invalid_fields_fall_back_to_full_chain(self):
+        parse = TimestampParser('sysinv.log').parse
+        parse('2024-01-06 12:30:45.123 first\n')
+        self.assertIsNone(parse('2024-01-06 24:00:00.000 bad hour\n'))
+        self.assertIsNone(parse('2024-01-06 12:30:60.000 leap second\n'))
+        self.assertIsNone(parse('2024-01-06 12:30:45.12 short millis\n'))
+        self.assertEqual(parse('2024-01-06 12:30:45.123 again\n'),
+                         datetime(2024, 1, 6, 12, 30, 45, 123000))
+
+    def test_form_change_within_file(self):
+        parse = TimestampParser('mixed.log').parse
+        self.assertEqual(parse('2024-01-06 12:30:45.123 space\n'),
+                         datetime(2024, 1, 6, 12, 30, 45, 123000))
+        self.assertEqual(parse('2024-01-06T12:30:46 iso, no millis\n'),
+                         datetime(2024, 1, 6, 12, 30, 46))
+        self.assertEqual(parse('sysinv 2024-01-06 12:30:47.000 x\n'),
+                         datetime(2024, 1, 6, 12, 30, 47))
+        self.assertIsNone(parse('no timestamp here\n'))
+        self.assertIsNone(parse(''))
+
+    def test_parse_timestamp_shares_parser_per_relpath(self):
+        self.assertIs(get_timestamp_parser('a.log'),
+                      get_timestamp_parser('a.log'))
+        self.assertEqual(parse_timestamp('2024-01-06 12:30:45.123 x', 'a.log'),
+                         datetime(2024, 1, 6, 12, 30, 45, 123000))
+
+
+class TestTimestampParserCustomFormats(unittest.TestCase):
+    """Custom timestamp_formats resolution and per-second reuse."""
+
+    def setUp(self):
+        formats_patch = patch.object(
+            lpmp_utils, '_custom_timestamp_formats', list(CUSTOM_FORMATS))
+        formats_patch.start()
+        self.addCleanup(formats_patch.stop)
+
+    def test_two_digit_year_format(self):
+        parse = TimestampParser('charon.log').parse
+        self.assertEqual(parse('26-02-27 16:27:59.202 05[LIB] x'),
+                         datetime(2026, 2, 27, 16, 27, 59, 202000))
+        self.assertEqual(parse('26-02-27 16:27:59.999 05[LIB] y'),
+                         datetime(2026, 2, 27, 16, 27, 59, 999000))
+
+    def test_variable_length_fraction_matches_strptime(self):
+        parse = TimestampParser('tuned/tuned.log').parse
+        for fraction in ('7', '703', '703123'):
+            text = f'2026-02-27 10:10:13,{fraction}'
+            self.assertEqual(
+                parse(f'(stevedore): {text} ERROR x'),
+                datetime.strptime(text, '%Y-%m-%d %H:%M:%S,%f'))
+        self.assertIsNone(parse('(stevedore): 2026-02-27 10:10:13,1234567 x'))
+
+    def test_format_without_fraction(self):
+        parse = TimestampParser('lighttpd-error.log').parse
+        self.assertEqual(parse('2026-02-27 09:12:54: (server.c.1488) up'),
+                         datetime(2026, 2, 27, 9, 12, 54))
+
+    def test_unmatched_relpath_ignores_custom_formats(self):
+        parse = TimestampParser('other.log').parse
+        self.assertIsNone(parse('26-02-27 16:27:59.202 05[LIB] x'))
+
+    def test_custom_patterns_resolved_once(self):
+        parse = TimestampParser('charon.log').parse
+        with patch('lpmp_utils.fnmatch.fnmatch',
+                   wraps=lpmp_utils.fnmatch.fnmatch) as mock_fnmatch:
+            for second in range(10):
+                parse(f'26-02-27 16:27:{second:02d}.202 05[LIB] x')
+        # One fnmatch per pattern, not per line
+        self.assertEqual(mock_fnmatch.call_count, len(CUSTOM_FORMATS))
+
+    def test_formats_loaded_later_are_picked_up(self):
+        parse = TimestampParser('late.log').parse
+        self.assertIsNone(parse('<10:00:05> x'))
+        lpmp_utils._custom_timestamp_formats.append(
+            {'pattern': 'late.log', 'regex': re.compile(r'<(\S+)>'),
+             'format': '%H:%M:%S'})
+        self.assertEqual(parse('<10:00:05> x'), datetime(1900, 1, 1, 10, 0, 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1541,7 +1541,7 @@ class TestRotationPrune(LPMPTestBase):
 
 
 class TestGzDateRange(LPMPTestBase):
-    """Test get_file_date_range with .gz files using zcat|tail"""
+    """Test get_file_date_range with .gz files (gzip index tail)"""
 
     def setUp(self):
         self.temp_dir = tempfile.mkdtemp()